@@ -17,6 +17,9 @@ from .scheduled_tasks import (
     cleanup_stale_sessions_workflow,
     reset_completed_roles_workflow,
     update_role_candidate_counts_workflow,
+    refresh_scraper_stats_snapshot_workflow,
+    recompute_job_posting_stats_workflow,
+    apply_data_retention_workflow,
     cleanup_stale_credentials_workflow,
     clear_credential_cooldowns_workflow,
     backfill_orphaned_job_roles_workflow
@@ -33,6 +36,9 @@ from .resume_parsing import (
     parse_candidate_resume_workflow,
     polish_candidate_resume_workflow
 )
+from .resume_export import (
+    prerender_tailored_resume_workflow
+)
 from .role_normalization import (
     normalize_candidate_roles_workflow
 )
@@ -45,7 +51,6 @@ from .email_sync import (
     sync_user_inbox_workflow,
     manual_sync_workflow,
     match_email_jobs_to_candidates_workflow,
-    cleanup_old_processed_emails_workflow,
     check_circuit_breaker_status_workflow
 )
 
@@ -66,6 +71,9 @@ INNGEST_FUNCTIONS = [
     cleanup_stale_sessions_workflow,
     reset_completed_roles_workflow,
     update_role_candidate_counts_workflow,
+    refresh_scraper_stats_snapshot_workflow,
+    recompute_job_posting_stats_workflow,
+    apply_data_retention_workflow,
     cleanup_stale_credentials_workflow,
     clear_credential_cooldowns_workflow,
     backfill_orphaned_job_roles_workflow,
@@ -82,6 +90,9 @@ INNGEST_FUNCTIONS = [
     parse_candidate_resume_workflow,
     polish_candidate_resume_workflow,
     
+    # Resume Export
+    prerender_tailored_resume_workflow,
+    
     # Role Normalization
     normalize_candidate_roles_workflow,
     
@@ -94,7 +105,6 @@ INNGEST_FUNCTIONS = [
     sync_user_inbox_workflow,
     manual_sync_workflow,
     match_email_jobs_to_candidates_workflow,
-    cleanup_old_processed_emails_workflow,
     check_circuit_breaker_status_workflow,
 ]
 
@@ -26,7 +26,7 @@ Architecture:
 
 import logging
 import math
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 import inngest
 
@@ -610,7 +610,7 @@ async def match_email_jobs_to_candidates_workflow(ctx):
             embedding_errors = []
 
             for job_id in job_ids:
-                job = db.session.get(JobPosting, job_id)
+                job = db.session.get(JobPosting, job_id, options=[JobPosting.with_embedding()])
                 if not job:
                     embedding_errors.append({
                         "job_id": job_id,
@@ -845,11 +845,13 @@ async def match_email_jobs_to_candidates_workflow(ctx):
                 candidates_map = {
                     c.id: c for c in db.session.scalars(
                         select(Candidate).where(Candidate.id.in_(cand_ids))
+                        .options(Candidate.with_embedding())
                     ).all()
                 }
                 jobs_map = {
                     j.id: j for j in db.session.scalars(
                         select(JobPosting).where(JobPosting.id.in_(jb_ids))
+                        .options(JobPosting.with_embedding())
                     ).all()
                 }
 
@@ -971,99 +973,6 @@ async def match_email_jobs_to_candidates_workflow(ctx):
     }
 
 
-# ============================================================================
-# ProcessedEmail Cleanup — Data Retention
-# ============================================================================
-
-@inngest_client.create_function(
-    fn_id="cleanup-old-processed-emails",
-    trigger=inngest.TriggerCron(cron="0 3 * * *"),
-    name="Cleanup Old Processed Emails",
-    retries=2,
-)
-async def cleanup_old_processed_emails_workflow(ctx):
-    """
-    Clean up old ProcessedEmail records to control table growth.
-
-    Runs daily at 3 AM. Deletes records older than 90 days.
-    """
-    logger.info("[INNGEST] Starting processed emails cleanup")
-
-    RETENTION_DAYS = 90
-
-    def cleanup_old_records():
-        from app import create_app
-        app = create_app()
-        with app.app_context():
-            from app import db
-            from app.models.processed_email import ProcessedEmail
-            from sqlalchemy import delete, select
-
-            cutoff_date = datetime.now(timezone.utc) - timedelta(
-                days=RETENTION_DAYS
-            )
-
-            # Count records to be deleted
-            count_to_delete = db.session.scalar(
-                select(db.func.count(ProcessedEmail.id)).where(
-                    ProcessedEmail.created_at < cutoff_date
-                )
-            ) or 0
-
-            if count_to_delete == 0:
-                return {"deleted": 0, "message": "No old records to delete"}
-
-            # Delete in batches to avoid long locks
-            batch_size = 10000
-            total_deleted = 0
-
-            while True:
-                # Get batch of IDs to delete
-                subquery = (
-                    select(ProcessedEmail.id)
-                    .where(ProcessedEmail.created_at < cutoff_date)
-                    .limit(batch_size)
-                    .subquery()
-                )
-
-                result = db.session.execute(
-                    delete(ProcessedEmail).where(
-                        ProcessedEmail.id.in_(
-                            select(subquery.c.id)
-                        )
-                    )
-                )
-
-                deleted_count = result.rowcount
-                total_deleted += deleted_count
-                db.session.commit()
-
-                logger.info(
-                    f"[INNGEST] Deleted batch of {deleted_count} processed emails"
-                )
-
-                if deleted_count < batch_size:
-                    break
-
-            return {
-                "deleted": total_deleted,
-                "cutoff_date": cutoff_date.isoformat(),
-                "retention_days": RETENTION_DAYS,
-            }
-
-    result = await ctx.step.run("cleanup-processed-emails", cleanup_old_records)
-
-    logger.info(
-        f"[INNGEST] Cleanup completed: deleted {result.get('deleted', 0)} old records"
-    )
-
-    return {
-        "status": "completed",
-        **result,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
-
-
 # ============================================================================
 # Circuit Breaker Status Check (for monitoring)
 # ============================================================================
@@ -6,6 +6,7 @@ Handles asynchronous job importing from external scrapers with multi-platform su
 Workflows:
 1. jobs/scraper.platform-import - Import jobs for a single platform
 2. jobs/scraper.complete - Finalize session and trigger matching
+   (waits for jobs/scraper.platform-batches-done if platforms are still importing)
 
 Benefits:
 - Non-blocking API response
@@ -15,11 +16,11 @@ Benefits:
 - Can handle large job batches without timeout
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from uuid import UUID
 import inngest
-from sqlalchemy import or_
+from sqlalchemy import or_, select, update
 from sqlalchemy.exc import IntegrityError
 
 from app import db
@@ -32,6 +33,9 @@ from app.models.session_platform_status import SessionPlatformStatus
 from app.models.scraper_platform import ScraperPlatform
 from app.inngest import inngest_client
 from app.services.resume_tailor.keyword_extractor import KeywordExtractorService
+from app.services.scraper_import_publisher import ScraperImportPublisher
+from app.services.scraper_service import ScraperService, PLATFORM_BATCHES_DONE_EVENT
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +64,8 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
         "scraper_key_id": 123,
         "platform_name": "linkedin",
         "platform_status_id": 456,
-        "jobs": [...],
+        "jobs": [...],              # Inline jobs, or
+        "jobs_ref": "scraper_import:jobs:...",  # Redis key holding the jobs
         "jobs_count": 47,
         "batch_index": 0,           # Optional: which batch this is (0-indexed)
         "total_batches": 1,         # Optional: total number of batches
@@ -72,17 +77,18 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
     scraper_key_id = event_data["scraper_key_id"]
     platform_name = event_data["platform_name"]
     platform_status_id = event_data["platform_status_id"]
-    jobs_data = event_data["jobs"]
+    jobs_ref = event_data.get("jobs_ref")
+    jobs_count = event_data.get("jobs_count", len(event_data.get("jobs") or []))
     
     # Batch metadata (defaults for backwards compatibility)
     batch_index = event_data.get("batch_index", 0)
     total_batches = event_data.get("total_batches", 1)
-    total_jobs_in_platform = event_data.get("total_jobs_in_platform", len(jobs_data))
+    total_jobs_in_platform = event_data.get("total_jobs_in_platform", jobs_count)
     
     logger.info(
         f"[JOB-IMPORT] Starting import for platform '{platform_name}' "
         f"in session {session_id} - batch {batch_index + 1}/{total_batches} "
-        f"with {len(jobs_data)} jobs"
+        f"with {jobs_count} jobs"
     )
     
     # Step 1: Validate session and platform status
@@ -96,10 +102,12 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
         return {"status": "error", "message": "Invalid session or platform"}
     
     # Step 2: Import jobs for this platform batch
-    import_result = await ctx.step.run(
-        f"import-jobs-batch-{batch_index}",
-        lambda: import_jobs_batch_for_platform(jobs_data, session_data, platform_name)
-    )
+    # Offloaded payloads are read inside the step so they never land in step state
+    def import_batch():
+        jobs_data = load_platform_jobs(event_data)
+        return import_jobs_batch_for_platform(jobs_data, session_data, platform_name, batch_index)
+    
+    import_result = await ctx.step.run(f"import-jobs-batch-{batch_index}", import_batch)
     
     # NOTE: Keyword extraction removed - scoring now uses Skills (45%), Semantic (35%), Experience (20%)
     
@@ -110,7 +118,7 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
             platform_status_id,
             session_id,
             scraper_key_id,
-            len(jobs_data),
+            jobs_count,
             import_result["imported"],
             import_result["skipped"],
             batch_index,
@@ -118,6 +126,12 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
         )
     )
     
+    if jobs_ref:
+        await ctx.step.run(
+            f"release-jobs-payload-{batch_index}",
+            lambda: ScraperImportPublisher.release_batch_payload(jobs_ref)
+        )
+    
     if completion_result.get("platform_completed"):
         logger.info(
             f"[JOB-IMPORT] ✅ Platform '{platform_name}' fully completed "
@@ -151,12 +165,20 @@ async def import_platform_jobs_fn(ctx: inngest.Context) -> dict:
     fn_id="job-import-complete",
     trigger=inngest.TriggerEvent(event="jobs/scraper.complete"),
     name="Complete Scrape Session",
-    retries=3
+    retries=3,
+    idempotency="event.data.session_id"
 )
 async def complete_scrape_session_fn(ctx: inngest.Context) -> dict:
     """
     Finalize a scrape session and trigger job matching.
     
+    Sent by POST /queue/complete. If platform batches are still importing, the
+    run sleeps on `jobs/scraper.platform-batches-done` (emitted by the batch
+    that finishes the session's last platform) instead of polling the DB.
+    Each wait is capped at settings.scraper_session_completion_recheck_seconds
+    and followed by a counter re-check, so a done event sent before the wait
+    started delays completion by at most one interval.
+    
     Event data:
     {
         "session_id": "uuid",
@@ -169,8 +191,38 @@ async def complete_scrape_session_fn(ctx: inngest.Context) -> dict:
     
     logger.info(f"[JOB-IMPORT] Completing session {session_id}")
     
-    # NOTE: This function is now triggered by the last batch to complete (not by HTTP endpoint)
-    # So all batches should already be done - no need to wait
+    # Step 0: Wait for outstanding platform batches (event-driven, re-checking the counters)
+    progress = await ctx.step.run(
+        "check-platforms-done",
+        lambda: get_session_platform_progress(session_id)
+    )
+    
+    recheck_seconds = max(1, settings.scraper_session_completion_recheck_seconds)
+    max_waits = max(1, -(-settings.scraper_session_completion_timeout // recheck_seconds))
+    wait_index = 0
+    while not progress["all_done"] and wait_index < max_waits:
+        # A done event sent before this wait started is not delivered to it;
+        # the short timeout and the re-check below pick that case up
+        done_event = await ctx.step.wait_for_event(
+            f"wait-platform-batches-done-{wait_index}",
+            event=PLATFORM_BATCHES_DONE_EVENT,
+            if_exp=f"async.data.session_id == '{session_id}'",
+            timeout=timedelta(seconds=recheck_seconds),
+        )
+        if done_event is not None:
+            break
+        wait_index += 1
+        progress = await ctx.step.run(
+            f"check-platforms-done-{wait_index}",
+            lambda: get_session_platform_progress(session_id)
+        )
+    else:
+        if not progress["all_done"]:
+            logger.warning(
+                f"[JOB-IMPORT] Timed out waiting for platform batches of session {session_id} "
+                f"({progress['platforms_completed']}/{progress['platforms_total']} platforms done). "
+                f"Finalizing with current results."
+            )
     
     # Step 1: Aggregate platform results (fresh read from DB)
     session_stats = await ctx.step.run(
@@ -268,10 +320,31 @@ def validate_session_for_platform(
 # HELPER FUNCTIONS - Job Import
 # ============================================================================
 
+def load_platform_jobs(event_data: Dict[str, Any]) -> List[Dict]:
+    """
+    Resolve the jobs for a platform-import event.
+
+    Events carry either the jobs inline ("jobs") or a Redis reference
+    ("jobs_ref") written by ScraperImportPublisher before the event was sent.
+
+    Raises:
+        inngest.NonRetriableError: If the referenced payload expired
+    """
+    jobs_ref = event_data.get("jobs_ref")
+    if not jobs_ref:
+        return event_data.get("jobs") or []
+
+    jobs_data = ScraperImportPublisher.load_batch_payload(jobs_ref)
+    if jobs_data is None:
+        raise inngest.NonRetriableError(f"Scraper job payload not found: {jobs_ref}")
+    return jobs_data
+
+
 def import_jobs_batch_for_platform(
     jobs_data: List[Dict],
     session_data: Dict[str, Any],
-    platform_name: str
+    platform_name: str,
+    batch_index: int = 0
 ) -> Dict[str, Any]:
     """
     Import batch of jobs for a specific platform with deduplication.
@@ -298,7 +371,8 @@ def import_jobs_batch_for_platform(
         Dict with imported count, skipped count, and job IDs
     """
     from app.services.job_import_service import JobImportService
-    from app.models.session_job_log import SessionJobLog
+    from app.services.job_posting_stats_service import JobPostingStatsService, JobStatsDelta
+    from app.services.session_job_log_service import SessionJobLogBatch
     
     job_import_service = JobImportService()
     scraper_key = db.session.get(ScraperApiKey, session_data["scraper_key_id"])
@@ -306,6 +380,13 @@ def import_jobs_batch_for_platform(
     imported_count = 0
     skipped_count = 0
     job_ids = []
+    stats_delta = JobStatsDelta()
+    job_logs = SessionJobLogBatch(
+        UUID(session_data["session_id"]),
+        platform_name,
+        batch_index,
+        session_data.get("platform_status_id")
+    )
     
     logger.info(
         f"[JOB-IMPORT] Processing {len(jobs_data)} jobs from {platform_name} "
@@ -339,14 +420,8 @@ def import_jobs_batch_for_platform(
         # This is critical - without this, one bad job rolls back ALL jobs in the batch
         savepoint = db.session.begin_nested()
         
-        # Create job log entry for tracking
-        job_log = SessionJobLog.log_job(
-            session_id=UUID(session_data["session_id"]),
-            platform_name=platform_name,
-            job_index=idx,
-            raw_job_data=job_data,
-            platform_status_id=session_data.get("platform_status_id")
-        )
+        # Start job log entry for tracking (written in bulk after the loop)
+        job_log = job_logs.entry(idx, job_data)
         
         try:
             # Map various field names to our internal names (different scrapers use different conventions)
@@ -382,7 +457,7 @@ def import_jobs_batch_for_platform(
                     reason="missing_required",
                     detail=f"Missing required field: {'title' if not title else 'company'}"
                 )
-                savepoint.commit()  # Commit the skip log entry
+                savepoint.commit()
                 skipped_count += 1
                 skip_reasons["missing_required"] += 1
                 continue
@@ -404,7 +479,7 @@ def import_jobs_batch_for_platform(
                         reason="duplicate_in_batch",
                         detail=f"Duplicate within same batch: platform '{platform}' and external_job_id '{external_id}'"
                     )
-                    savepoint.commit()  # Commit the skip log entry
+                    savepoint.commit()
                     skipped_count += 1
                     skip_reasons["duplicate_in_batch"] += 1
                     continue
@@ -423,7 +498,7 @@ def import_jobs_batch_for_platform(
                         detail=f"Exact duplicate: same platform '{platform}' and external_job_id '{external_id}'",
                         duplicate_job_id=existing.id
                     )
-                    savepoint.commit()  # Commit the skip log entry
+                    savepoint.commit()
                     skipped_count += 1
                     skip_reasons["duplicate_platform_id"] += 1
                     continue
@@ -444,7 +519,7 @@ def import_jobs_batch_for_platform(
                     reason="duplicate_in_batch",
                     detail=f"Duplicate within same batch: '{title}' at '{company}' in '{location}'"
                 )
-                savepoint.commit()  # Commit the skip log entry
+                savepoint.commit()
                 skipped_count += 1
                 skip_reasons["duplicate_in_batch"] += 1
                 continue
@@ -484,7 +559,7 @@ def import_jobs_batch_for_platform(
                     detail=f"Duplicate by title+company+location: '{title}' at '{company}' in '{location}'",
                     duplicate_job_id=existing_by_content.id
                 )
-                savepoint.commit()  # Commit the skip log entry
+                savepoint.commit()
                 skipped_count += 1
                 skip_reasons["duplicate_title_company_location"] += 1
                 continue
@@ -510,7 +585,7 @@ def import_jobs_batch_for_platform(
                         detail=f"Duplicate by title+company+description: '{title}' at '{company}' - same description prefix",
                         duplicate_job_id=existing_similar.id
                     )
-                    savepoint.commit()  # Commit the skip log entry
+                    savepoint.commit()
                     skipped_count += 1
                     skip_reasons["duplicate_title_company_description"] += 1
                     continue
@@ -603,6 +678,7 @@ def import_jobs_batch_for_platform(
             
             job_ids.append(job.id)
             imported_count += 1
+            stats_delta.add(job)
             
             # Commit the savepoint (releases the savepoint, keeps changes)
             savepoint.commit()
@@ -632,49 +708,17 @@ def import_jobs_batch_for_platform(
                 )
                 
                 # Log as skipped due to race condition duplicate
-                try:
-                    skip_savepoint = db.session.begin_nested()
-                    skip_job_log = SessionJobLog.log_job(
-                        session_id=UUID(session_data["session_id"]),
-                        platform_name=platform_name,
-                        job_index=idx,
-                        raw_job_data=job_data,
-                        platform_status_id=session_data.get("platform_status_id")
-                    )
-                    skip_job_log.mark_skipped(
-                        reason="duplicate_race_condition",
-                        detail=f"Duplicate detected via database constraint (parallel batch race): {job_data.get('title', 'Unknown')}"
-                    )
-                    skip_savepoint.commit()
-                except Exception as log_error:
-                    logger.warning(f"[JOB-IMPORT] Failed to log skip for job {idx+1}: {log_error}")
-                    try:
-                        skip_savepoint.rollback()
-                    except Exception:
-                        pass
+                job_logs.entry(idx, job_data).mark_skipped(
+                    reason="duplicate_race_condition",
+                    detail=f"Duplicate detected via database constraint (parallel batch race): {job_data.get('title', 'Unknown')}"
+                )
                 
                 skipped_count += 1
                 skip_reasons["duplicate_race_condition"] = skip_reasons.get("duplicate_race_condition", 0) + 1
             else:
                 # Other IntegrityError - log as error
                 logger.error(f"[JOB-IMPORT] IntegrityError for job {idx+1}: {error_msg}")
-                try:
-                    error_savepoint = db.session.begin_nested()
-                    error_job_log = SessionJobLog.log_job(
-                        session_id=UUID(session_data["session_id"]),
-                        platform_name=platform_name,
-                        job_index=idx,
-                        raw_job_data=job_data,
-                        platform_status_id=session_data.get("platform_status_id")
-                    )
-                    error_job_log.mark_error(error_msg)
-                    error_savepoint.commit()
-                except Exception as log_error:
-                    logger.warning(f"[JOB-IMPORT] Failed to log error for job {idx+1}: {log_error}")
-                    try:
-                        error_savepoint.rollback()
-                    except Exception:
-                        pass
+                job_logs.entry(idx, job_data).mark_error(error_msg)
                 
                 skipped_count += 1
                 skip_reasons["error"] += 1
@@ -691,30 +735,22 @@ def import_jobs_batch_for_platform(
                 # Savepoint might already be invalid, try full rollback as fallback
                 db.session.rollback()
             
-            # Create error log entry in a new savepoint
-            try:
-                error_savepoint = db.session.begin_nested()
-                error_job_log = SessionJobLog.log_job(
-                    session_id=UUID(session_data["session_id"]),
-                    platform_name=platform_name,
-                    job_index=idx,
-                    raw_job_data=job_data,
-                    platform_status_id=session_data.get("platform_status_id")
-                )
-                error_job_log.mark_error(error_msg)
-                error_savepoint.commit()
-            except Exception as log_error:
-                logger.warning(f"[JOB-IMPORT] Failed to log error for job {idx+1}: {log_error}")
-                try:
-                    error_savepoint.rollback()
-                except Exception:
-                    pass
+            # Replace the job log entry with an error entry
+            job_logs.entry(idx, job_data).mark_error(error_msg)
             
             skipped_count += 1
             skip_reasons["error"] += 1
     
-    # Commit any remaining successful jobs
+    # Write the batch's job logs in one INSERT; a logging failure must not lose the imported jobs
+    try:
+        with db.session.begin_nested():
+            job_logs.write()
+    except Exception as e:
+        logger.warning(f"[JOB-IMPORT] Failed to write job logs for {platform_name}: {e}")
+    
+    # Commit any remaining successful jobs (with their jobs-page stat counters)
     try:
+        JobPostingStatsService.record_imported_jobs(stats_delta)
         db.session.commit()
     except Exception as e:
         logger.error(f"[JOB-IMPORT] Failed to commit batch: {e}")
@@ -766,53 +802,50 @@ def extract_keywords_for_jobs(job_ids: List[int]) -> Dict[str, Any]:
     Returns:
         Dict with extracted count and failed count
     """
-    extracted_count = 0
-    failed_count = 0
-    
     try:
         keyword_extractor = KeywordExtractorService()
     except Exception as e:
         logger.error(f"[JOB-IMPORT] Failed to initialize KeywordExtractorService: {e}")
         return {"extracted": 0, "failed": len(job_ids), "error": str(e)}
     
-    for job_id in job_ids:
+    jobs = db.session.scalars(
+        select(JobPosting)
+        .where(JobPosting.id.in_(job_ids))
+        .options(JobPosting.with_description())
+    ).all()
+    found_ids = {job.id for job in jobs}
+    failed_count = len(set(job_ids) - found_ids)
+    if failed_count:
+        logger.warning(f"[JOB-IMPORT] {failed_count} jobs not found for keyword extraction")
+    
+    # Skip jobs whose keywords were already extracted
+    already_extracted = [job for job in jobs if job.extracted_keywords]
+    pending = {job.id: job for job in jobs if not job.extracted_keywords}
+    extracted_count = len(already_extracted)
+    
+    if pending:
         try:
-            job = db.session.get(JobPosting, job_id)
-            if not job:
-                logger.warning(f"[JOB-IMPORT] Job {job_id} not found for keyword extraction")
-                failed_count += 1
-                continue
-            
-            # Skip if keywords already extracted
-            if job.extracted_keywords:
-                extracted_count += 1
-                continue
-            
-            # Extract keywords using AI
-            job_keywords = keyword_extractor.extract_keywords_only(
-                job.description or ""
+            # Batched, de-duplicated and concurrent LLM extraction
+            keywords_by_job = keyword_extractor.extract_keywords_batch(
+                {job_id: job.description or "" for job_id, job in pending.items()}
             )
             
-            # Store as JSONB in the extracted_keywords field
-            job.extracted_keywords = {
-                "technical_keywords": job_keywords.technical_keywords,
-                "action_verbs": job_keywords.action_verbs,
-                "industry_terms": job_keywords.industry_terms,
-                "soft_skills": job_keywords.soft_skills
-            }
-            
-            extracted_count += 1
+            for job_id, job_keywords in keywords_by_job.items():
+                # Store as JSONB in the extracted_keywords field
+                pending[job_id].extracted_keywords = {
+                    "technical_keywords": job_keywords.technical_keywords,
+                    "action_verbs": job_keywords.action_verbs,
+                    "industry_terms": job_keywords.industry_terms,
+                    "soft_skills": job_keywords.soft_skills
+                }
+                extracted_count += 1
             
-            # Commit every 5 jobs to avoid long transactions
-            if extracted_count % 5 == 0:
-                db.session.commit()
-                
+            db.session.commit()
         except Exception as e:
-            logger.error(f"[JOB-IMPORT] Failed to extract keywords for job {job_id}: {e}")
-            failed_count += 1
-    
-    # Final commit
-    db.session.commit()
+            db.session.rollback()
+            logger.error(f"[JOB-IMPORT] Failed to extract keywords for {len(pending)} jobs: {e}")
+            extracted_count = len(already_extracted)
+            failed_count += len(pending)
     
     logger.info(
         f"[JOB-IMPORT] Keyword extraction complete: "
@@ -889,47 +922,30 @@ def update_platform_batch_status(
     # Check if all batches are complete
     all_batches_complete = current_completed_batches >= current_total_batches
     
-    should_trigger_session_complete = False
+    all_platforms_done = False
     
     if all_batches_complete and current_status != 'completed':
-        # Mark platform as completed - need to fetch and update the object
-        platform_status = db.session.get(SessionPlatformStatus, platform_status_id)
-        if platform_status:
-            platform_status.status = "completed"
-            platform_status.completed_at = datetime.utcnow()
+        # Claim platform completion with a conditional UPDATE so exactly one
+        # batch (even under concurrent workers or retries) counts it against the session
+        claimed = db.session.execute(
+            update(SessionPlatformStatus)
+            .where(
+                SessionPlatformStatus.id == platform_status_id,
+                SessionPlatformStatus.status != 'completed'
+            )
+            .values(status='completed', completed_at=datetime.utcnow())
+            .returning(SessionPlatformStatus.id)
+            .execution_options(synchronize_session=False)
+        ).first()
         
-            # Update session progress counters (only once when fully complete)
-            session = ScrapeSession.query.filter_by(
-                session_id=UUID(session_id),
-                scraper_key_id=scraper_key_id
-            ).first()
-            
-            if session:
-                session.platforms_completed = (session.platforms_completed or 0) + 1
-                session.jobs_found = (session.jobs_found or 0) + current_jobs_found
-                session.jobs_imported = (session.jobs_imported or 0) + current_jobs_imported
-                session.jobs_skipped = (session.jobs_skipped or 0) + current_jobs_skipped
-                
-                # Check if session is pending_completion and ALL platforms are now done
-                # This triggers session completion from the last batch to finish
-                if session.status == 'pending_completion':
-                    # Get all platform statuses for this session
-                    all_platform_statuses = SessionPlatformStatus.query.filter_by(
-                        session_id=session.session_id
-                    ).all()
-                    
-                    all_platforms_done = all(
-                        ps.status in ('completed', 'failed', 'skipped') or
-                        (ps.completed_batches or 0) >= (ps.total_batches or 1)
-                        for ps in all_platform_statuses
-                    )
-                    
-                    if all_platforms_done:
-                        should_trigger_session_complete = True
-                        logger.info(
-                            f"[JOB-IMPORT] All platforms done for session {session_id}. "
-                            f"Triggering session completion."
-                        )
+        if claimed:
+            # Atomic session counters; True when this was the session's last platform
+            all_platforms_done = ScraperService.record_platform_finished(
+                UUID(session_id),
+                jobs_found=current_jobs_found,
+                jobs_imported=current_jobs_imported,
+                jobs_skipped=current_jobs_skipped
+            )
             
             logger.info(
                 f"[JOB-IMPORT] Platform {platform_status_id} fully completed "
@@ -944,21 +960,9 @@ def update_platform_batch_status(
     
     db.session.commit()
     
-    # Trigger session completion AFTER commit (so the state is persisted)
-    if should_trigger_session_complete:
-        try:
-            inngest_client.send_sync(
-                inngest.Event(
-                    name="jobs/scraper.complete",
-                    data={
-                        "session_id": session_id,
-                        "scraper_key_id": scraper_key_id
-                    }
-                )
-            )
-            logger.info(f"[JOB-IMPORT] Session complete event sent for {session_id}")
-        except Exception as e:
-            logger.error(f"[JOB-IMPORT] Failed to send session complete event: {e}")
+    # Notify the session-completion workflow AFTER commit (so the state is persisted)
+    if all_platforms_done:
+        ScraperService.publish_platform_batches_done(UUID(session_id))
     
     return {
         "platform_completed": all_batches_complete,
@@ -966,7 +970,7 @@ def update_platform_batch_status(
         "total_batches": current_total_batches,
         "total_imported": current_jobs_imported,
         "total_skipped": current_jobs_skipped,
-        "session_complete_triggered": should_trigger_session_complete
+        "all_platforms_done": all_platforms_done
     }
 
 
@@ -997,128 +1001,32 @@ def complete_platform_status(
     )
 
 
-def mark_platform_failed(
-    platform_status_id: int,
-    session_id: str,
-    scraper_key_id: int,
-    error_message: str
-) -> None:
-    """Mark platform as failed with error message."""
-    platform_status = db.session.get(SessionPlatformStatus, platform_status_id)
-    
-    if platform_status:
-        platform_status.status = "failed"
-        platform_status.error_message = error_message
-        platform_status.completed_at = datetime.utcnow()
-        
-        # Update session failed counter
-        session = ScrapeSession.query.filter_by(
-            session_id=UUID(session_id),
-            scraper_key_id=scraper_key_id
-        ).first()
-        
-        if session:
-            session.platforms_failed = (session.platforms_failed or 0) + 1
-        
-        db.session.commit()
-        
-        logger.warning(
-            f"[JOB-IMPORT] Platform status {platform_status_id} failed: {error_message}"
-        )
-
-
 # ============================================================================
 # HELPER FUNCTIONS - Session Aggregation
 # ============================================================================
 
-def wait_for_platform_batches_complete(session_id: str, max_wait_seconds: int = 120) -> Dict[str, Any]:
+def get_session_platform_progress(session_id: str) -> Dict[str, Any]:
     """
-    Wait for all platform batches to complete before aggregating stats.
-    
-    This is necessary because:
-    1. POST /queue/jobs sends batch events to Inngest
-    2. POST /queue/complete is called immediately after
-    3. Batches might still be processing when complete_session runs
-    
-    We poll the database every 2 seconds to check if all platforms
-    have completed_batches >= total_batches.
-    
-    Args:
-        session_id: Session UUID string
-        max_wait_seconds: Maximum time to wait (default 120s)
+    Read the session's platform counters (maintained atomically as platforms finish).
     
     Returns:
-        Dict with all_complete flag and status details
+        Dict with platforms_completed, platforms_total and all_done flag
     """
-    import time
-    
-    poll_interval = 2  # seconds
-    elapsed = 0
+    row = db.session.execute(
+        select(ScrapeSession.platforms_completed, ScrapeSession.platforms_total)
+        .where(ScrapeSession.session_id == UUID(session_id))
+    ).first()
     
-    while elapsed < max_wait_seconds:
-        # Expire cached data to get fresh reads
-        db.session.expire_all()
-        
-        session = ScrapeSession.query.filter_by(session_id=UUID(session_id)).first()
-        if not session:
-            logger.error(f"[JOB-IMPORT] Session {session_id} not found during wait")
-            return {"all_complete": False, "error": "Session not found"}
-        
-        platform_statuses = SessionPlatformStatus.query.filter_by(
-            session_id=session.session_id
-        ).all()
-        
-        if not platform_statuses:
-            logger.warning(f"[JOB-IMPORT] No platform statuses found for session {session_id}")
-            return {"all_complete": True, "platforms": 0}
-        
-        all_done = True
-        pending_platforms = []
-        
-        for ps in platform_statuses:
-            # A platform is done if:
-            # 1. status is 'completed' or 'failed', OR
-            # 2. completed_batches >= total_batches
-            is_terminal_status = ps.status in ('completed', 'failed', 'skipped')
-            batches_done = (ps.completed_batches or 0) >= (ps.total_batches or 1)
-            
-            if not is_terminal_status and not batches_done:
-                all_done = False
-                pending_platforms.append({
-                    "platform": ps.platform_name,
-                    "status": ps.status,
-                    "completed_batches": ps.completed_batches or 0,
-                    "total_batches": ps.total_batches or 1
-                })
-        
-        if all_done:
-            logger.info(
-                f"[JOB-IMPORT] All {len(platform_statuses)} platforms completed "
-                f"for session {session_id} after {elapsed}s"
-            )
-            return {
-                "all_complete": True,
-                "platforms": len(platform_statuses),
-                "wait_time_seconds": elapsed
-            }
-        
-        logger.debug(
-            f"[JOB-IMPORT] Waiting for batches: {len(pending_platforms)} platforms pending. "
-            f"Elapsed: {elapsed}s. Pending: {pending_platforms}"
-        )
-        
-        time.sleep(poll_interval)
-        elapsed += poll_interval
+    if not row:
+        logger.error(f"[JOB-IMPORT] Session {session_id} not found while checking progress")
+        return {"platforms_completed": 0, "platforms_total": 0, "all_done": True}
     
-    # Timeout reached
-    logger.warning(
-        f"[JOB-IMPORT] Timeout waiting for batches after {max_wait_seconds}s. "
-        f"Session: {session_id}"
-    )
+    platforms_completed = row.platforms_completed or 0
+    platforms_total = row.platforms_total or 0
     return {
-        "all_complete": False,
-        "timeout": True,
-        "wait_time_seconds": elapsed
+        "platforms_completed": platforms_completed,
+        "platforms_total": platforms_total,
+        "all_done": platforms_completed >= platforms_total
     }
 
 
@@ -238,7 +238,7 @@ async def match_jobs_to_candidates_workflow(ctx) -> dict:
         embeddings_generated = 0
         
         for job_id in job_ids:
-            job = db.session.get(JobPosting, job_id)
+            job = db.session.get(JobPosting, job_id, options=[JobPosting.with_embedding()])
             if not job:
                 continue
             
@@ -267,27 +267,28 @@ async def match_jobs_to_candidates_workflow(ctx) -> dict:
             logger.warning("[INNGEST] No global_role_id in event, cannot find candidates")
             return []
         
-        # Find all candidates linked to this global role
-        candidate_links = db.session.scalars(
-            select(CandidateGlobalRole).where(
-                CandidateGlobalRole.global_role_id == global_role_id
+        # Approved/ready candidates with embeddings linked to this global role,
+        # filtered in SQL so neither links nor embedding vectors are loaded per row
+        rows = db.session.execute(
+            select(Candidate.id, Candidate.tenant_id, Candidate.first_name, Candidate.last_name)
+            .join(CandidateGlobalRole, CandidateGlobalRole.candidate_id == Candidate.id)
+            .where(
+                CandidateGlobalRole.global_role_id == global_role_id,
+                Candidate.status.in_(['approved', 'ready_for_assignment']),
+                Candidate.embedding.isnot(None)
             )
+            .distinct()
         ).all()
         
-        candidates_info = []
-        for link in candidate_links:
-            candidate = link.candidate
-            # Only match approved/ready candidates with embeddings
-            if candidate and candidate.status in ['approved', 'ready_for_assignment']:
-                if candidate.embedding is not None:
-                    candidates_info.append({
-                        "id": candidate.id,
-                        "tenant_id": candidate.tenant_id,
-                        "first_name": candidate.first_name,
-                        "last_name": candidate.last_name
-                    })
-        
-        return candidates_info
+        return [
+            {
+                "id": row.id,
+                "tenant_id": row.tenant_id,
+                "first_name": row.first_name,
+                "last_name": row.last_name
+            }
+            for row in rows
+        ]
     
     matching_candidates = await ctx.step.run("find-matching-candidates", find_matching_candidates)
     
@@ -313,12 +314,12 @@ async def match_jobs_to_candidates_workflow(ctx) -> dict:
         for candidate_info in matching_candidates:
             candidate_id = candidate_info["id"]
             
-            candidate = db.session.get(Candidate, candidate_id)
+            candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_embedding()])
             if not candidate or candidate.embedding is None:
                 continue
             
             for job_id in job_ids:
-                job = db.session.get(JobPosting, job_id)
+                job = db.session.get(JobPosting, job_id, options=[JobPosting.with_embedding()])
                 if not job or job.embedding is None:
                     continue
                 
@@ -473,7 +474,7 @@ def process_tenant_matches_step(tenant: Dict[str, Any]) -> Dict[str, Any]:
                 Candidate.tenant_id == tenant_id,
                 Candidate.status.in_(['approved', 'ready_for_assignment']),
                 Candidate.embedding.isnot(None),
-            )
+            ).options(Candidate.with_embedding())
         ).all()
         
         # Initialize unified scorer
@@ -516,7 +517,7 @@ def process_tenant_matches_step(tenant: Dict[str, Any]) -> Dict[str, Any]:
                         JobPosting.id.in_(matching_job_id_list),
                         JobPosting.embedding.isnot(None),
                         JobPosting.status == 'ACTIVE'
-                    )
+                    ).options(JobPosting.with_embedding())
                 ).all() if matching_job_id_list else []
                 
                 matching_job_ids = {job.id for job in matching_jobs}
@@ -637,7 +638,7 @@ def validate_candidate_step(candidate_id: int, tenant_id: int) -> Dict[str, Any]
 
 def ensure_candidate_embedding_step(candidate_id: int, tenant_id: int) -> Dict[str, Any]:
     """Ensure candidate has embedding, generate if missing"""
-    candidate = db.session.get(Candidate, candidate_id)
+    candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_embedding()])
     
     if not candidate:
         return {"has_embedding": False, "generated": False, "error": "Candidate not found"}
@@ -673,7 +674,7 @@ def generate_matches_step(candidate_id: int, tenant_id: int, min_score: float) -
     normalized_role_id matches one of the candidate's preferred global roles.
     """
     try:
-        candidate = db.session.get(Candidate, candidate_id)
+        candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_embedding()])
         if not candidate or candidate.embedding is None:
             return {
                 "success": False,
@@ -714,7 +715,7 @@ def generate_matches_step(candidate_id: int, tenant_id: int, min_score: float) -
                 JobPosting.id.in_(job_id_list),
                 JobPosting.embedding.isnot(None),
                 JobPosting.status == 'ACTIVE'
-            )
+            ).options(JobPosting.with_embedding())
         ).all() if job_id_list else []
         
         # Initialize unified scorer
@@ -792,7 +793,7 @@ def rescore_job_matches_step(job_id: int) -> Dict[str, Any]:
     (does NOT create new ones — that's the nightly refresh's job).
     """
     try:
-        job = db.session.get(JobPosting, job_id)
+        job = db.session.get(JobPosting, job_id, options=[JobPosting.with_embedding()])
         if not job or job.embedding is None:
             return {"rescored": 0, "error": "Job not found or has no embedding"}
         
@@ -812,7 +813,7 @@ def rescore_job_matches_step(job_id: int) -> Dict[str, Any]:
         
         for match in existing_matches:
             try:
-                candidate = db.session.get(Candidate, match.candidate_id)
+                candidate = db.session.get(Candidate, match.candidate_id, options=[Candidate.with_embedding()])
                 if not candidate or candidate.embedding is None:
                     continue
                 
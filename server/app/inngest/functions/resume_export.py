@@ -0,0 +1,81 @@
+"""
+Inngest Resume Export Workflow
+Pre-renders tailored resume exports so downloads are served from file storage
+"""
+import logging
+from datetime import datetime
+
+import inngest
+
+from app.inngest import inngest_client
+
+logger = logging.getLogger(__name__)
+
+
+@inngest_client.create_function(
+    fn_id="prerender-tailored-resume",
+    trigger=inngest.TriggerEvent(event="resume-tailor/completed"),
+    name="Pre-render Tailored Resume Exports",
+    retries=2
+)
+async def prerender_tailored_resume_workflow(ctx: inngest.Context) -> dict:
+    """
+    Render the PDF of a completed tailored resume for the configured templates.
+    
+    Triggered by ResumeTailorOrchestrator when tailoring completes. Artifacts are
+    stored by content hash, so a retry or a download that raced this function
+    reuses the same render instead of producing another.
+    
+    Event data:
+    {
+        "tailor_id": "uuid",
+        "tenant_id": 456
+    }
+    """
+    tailor_id = ctx.event.data.get("tailor_id")
+    
+    from config.settings import settings
+    templates = [t.strip() for t in settings.resume_export_prerender_templates.split(",") if t.strip()]
+    if not tailor_id or not templates:
+        return {"status": "skipped", "tailor_id": tailor_id}
+    
+    result = {}
+    for template in templates:
+        result[template] = await ctx.step.run(
+            f"render-pdf-{template}",
+            lambda t=template: prerender_pdf_step(tailor_id, t)
+        )
+    
+    logger.info(f"[RESUME-EXPORT] Pre-rendered tailored resume {tailor_id}: {result}")
+    return {
+        "status": "completed",
+        "tailor_id": tailor_id,
+        "templates": result,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+def prerender_pdf_step(tailor_id: str, template: str) -> dict:
+    """Render one template's PDF into the export cache"""
+    from sqlalchemy import select
+    from app import db
+    from app.models.tailored_resume import TailoredResume, TailoredResumeStatus
+    from app.services.export import resume_render_cache
+    
+    tailored_resume = db.session.scalar(
+        select(TailoredResume).where(TailoredResume.tailor_id == tailor_id)
+    )
+    if (
+        not tailored_resume
+        or tailored_resume.status != TailoredResumeStatus.COMPLETED
+        or not tailored_resume.tailored_resume_content
+    ):
+        return {"rendered": False, "reason": "not completed"}
+    
+    keys = resume_render_cache.prerender(
+        tailored_resume.tenant_id,
+        tailored_resume.tailored_resume_content,
+        [template],
+        export_format="pdf"
+    )
+    return {"rendered": True, "file_key": keys[template]}
@@ -310,6 +310,86 @@ async def update_role_candidate_counts_workflow(ctx: inngest.Context) -> dict:
     }
 
 
+@inngest_client.create_function(
+    fn_id="refresh-scraper-stats-snapshot",
+    trigger=inngest.TriggerCron(cron="* * * * *"),  # Every minute
+    name="Refresh Scraper Stats Snapshot"
+)
+async def refresh_scraper_stats_snapshot_workflow(ctx: inngest.Context) -> dict:
+    """
+    Recompute the scrape queue / scraper monitoring stats snapshot.
+    Runs every minute.
+    
+    Dashboard stats endpoints read this snapshot instead of running the
+    GROUP BY / COUNT DISTINCT aggregates on every poll.
+    """
+    computed_at = await ctx.step.run(
+        "refresh-stats-snapshot",
+        refresh_stats_snapshot_step
+    )
+    
+    return {
+        "computed_at": computed_at,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@inngest_client.create_function(
+    fn_id="recompute-job-posting-stats",
+    trigger=inngest.TriggerCron(cron="15 * * * *"),  # Every hour at :15
+    name="Recompute Job Posting Stats"
+)
+async def recompute_job_posting_stats_workflow(ctx: inngest.Context) -> dict:
+    """
+    Exactly recompute the jobs-page statistics.
+    Runs every hour.
+    
+    Rebuilds the per-segment counters, distinct-count snapshot and HyperLogLog
+    sketches that imports maintain incrementally, correcting drift from status
+    changes and deletions.
+    """
+    result = await ctx.step.run(
+        "recompute-job-posting-stats",
+        recompute_job_posting_stats_step
+    )
+    
+    return {
+        **result,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@inngest_client.create_function(
+    fn_id="apply-data-retention",
+    trigger=inngest.TriggerCron(cron="0 3 * * *"),  # Daily at 3 AM
+    name="Apply Data Retention",
+    retries=2
+)
+async def apply_data_retention_workflow(ctx: inngest.Context) -> dict:
+    """
+    Delete (and optionally archive) expired rows of log tables.
+    Runs daily at 3 AM.
+    
+    One step per retention policy (processed_emails, session_job_logs); each
+    deletes in committed id-range chunks within a time budget, see
+    RetentionService.
+    """
+    from app.services.retention_service import RETENTION_POLICIES
+    
+    results = []
+    for name in RETENTION_POLICIES:
+        results.append(await ctx.step.run(
+            f"purge-{name.replace('_', '-')}",
+            lambda n=name: apply_retention_policy_step(n)
+        ))
+    
+    return {
+        "status": "completed",
+        "tables": results,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 # Step Functions for Scrape Queue Tasks
 
 def cleanup_stale_sessions_step() -> dict:
@@ -367,6 +447,24 @@ def update_candidate_counts_step() -> int:
     return len(roles)
 
 
+def refresh_stats_snapshot_step() -> float:
+    """Recompute and publish the scraper stats snapshot"""
+    from app.services.scraper_stats_service import ScraperStatsService
+    return ScraperStatsService.refresh_snapshot()["computed_at"]
+
+
+def recompute_job_posting_stats_step() -> dict:
+    """Rebuild job posting stat counters, snapshot and sketches"""
+    from app.services.job_posting_stats_service import JobPostingStatsService
+    return JobPostingStatsService.recompute()
+
+
+def apply_retention_policy_step(name: str) -> dict:
+    """Purge expired rows of one retention policy"""
+    from app.services.retention_service import RetentionService
+    return RetentionService.purge(name)
+
+
 # ============================================================================
 # SCRAPER CREDENTIALS SCHEDULED TASKS
 # ============================================================================
@@ -456,9 +554,14 @@ async def backfill_orphaned_job_roles_workflow(ctx) -> dict:
     Find job postings with no normalized_role_id (orphaned during email import
     when role normalization failed) and retry normalization.
 
-    Runs every 3 hours. Processes up to 50 jobs per run to avoid overloading
-    the Gemini API.
+    Runs every 3 hours. Processes up to settings.role_backfill_batch_size jobs
+    per run, in steps of settings.role_backfill_chunk_size: within a step titles
+    are de-duplicated, resolved from the normalized-title cache where possible
+    and the rest embedded in one call. Each chunk is its own step so a failure
+    only retries that chunk and no step runs long enough to hit a timeout.
     """
+    from config.settings import settings
+
     logger.info("[INNGEST] Running orphaned job role backfill")
 
     # Step 1: Find orphaned jobs
@@ -473,44 +576,41 @@ async def backfill_orphaned_job_roles_workflow(ctx) -> dict:
 
     logger.info(f"[INNGEST] Found {len(orphaned_jobs)} orphaned jobs to normalize")
 
-    # Step 2: Normalize each job (one step per job for retryability)
+    # Step 2: Normalize jobs chunk by chunk
+    chunk_size = max(1, settings.role_backfill_chunk_size)
     normalized = 0
     failed = 0
-
-    for job_info in orphaned_jobs:
-        try:
-            result = await ctx.step.run(
-                f"normalize-job-{job_info['id']}",
-                normalize_orphaned_job_step,
-                job_info
-            )
-            if result.get("success"):
-                normalized += 1
-            else:
-                failed += 1
-        except Exception as e:
-            logger.error(
-                f"[INNGEST] Failed to normalize job {job_info['id']}: {e}"
-            )
-            failed += 1
+    methods = {}
+    for chunk_index, start in enumerate(range(0, len(orphaned_jobs), chunk_size)):
+        result = await ctx.step.run(
+            f"normalize-orphaned-jobs-{chunk_index}",
+            normalize_orphaned_jobs_step,
+            orphaned_jobs[start:start + chunk_size]
+        )
+        normalized += result["normalized"]
+        failed += result["failed"]
+        for method, count in result["methods"].items():
+            methods[method] = methods.get(method, 0) + count
 
     logger.info(
         f"[INNGEST] Backfill complete: {normalized} normalized, {failed} failed "
-        f"out of {len(orphaned_jobs)} orphaned jobs"
+        f"out of {len(orphaned_jobs)} orphaned jobs (methods: {methods})"
     )
 
     return {
         "orphaned_found": len(orphaned_jobs),
         "normalized": normalized,
-        "failed": failed
+        "failed": failed,
+        "methods": methods
     }
 
 
 def find_orphaned_jobs_step() -> list:
-    """Find job postings without a normalized_role_id (max 50)."""
+    """Find job postings without a normalized_role_id (max settings.role_backfill_batch_size)."""
     from app import db
     from app.models.job_posting import JobPosting
     from sqlalchemy import select
+    from config.settings import settings
 
     stmt = (
         select(JobPosting.id, JobPosting.title)
@@ -520,7 +620,7 @@ def find_orphaned_jobs_step() -> list:
             JobPosting.title != ""
         )
         .order_by(JobPosting.created_at.desc())
-        .limit(50)
+        .limit(settings.role_backfill_batch_size)
     )
 
     rows = db.session.execute(stmt).all()
@@ -528,42 +628,36 @@ def find_orphaned_jobs_step() -> list:
     return [{"id": row[0], "title": row[1]} for row in rows]
 
 
-def normalize_orphaned_job_step(job_info: dict) -> dict:
-    """Normalize a single orphaned job's title and create its RoleJobMapping."""
+def normalize_orphaned_jobs_step(orphaned_jobs: list) -> dict:
+    """Normalize a chunk of orphaned jobs' titles in one batch and create their RoleJobMappings."""
     from app import db
     from app.services.ai_role_normalization_service import AIRoleNormalizationService
 
-    job_id = job_info["id"]
-    job_title = job_info["title"]
-
-    logger.info(f"[INNGEST] Backfill normalizing job {job_id}: '{job_title}'")
-
     try:
         service = AIRoleNormalizationService()
-        global_role, similarity, method = service.normalize_job_title(
-            job_title=job_title,
-            job_posting_id=job_id
+        results = service.normalize_job_titles_batch(
+            [(job_info["id"], job_info["title"]) for job_info in orphaned_jobs]
         )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"[INNGEST] Error normalizing {len(orphaned_jobs)} orphaned jobs: {e}", exc_info=True)
+        raise
 
+    methods = {}
+    failed_job_ids = []
+    for job_id, (global_role, _, method) in results.items():
         if global_role:
-            db.session.commit()
-            logger.info(
-                f"[INNGEST] Job {job_id} linked to role '{global_role.name}' "
-                f"(similarity: {similarity:.2%}, method: {method})"
-            )
-            return {
-                "success": True,
-                "job_id": job_id,
-                "role_name": global_role.name,
-                "similarity": similarity,
-                "method": method
-            }
+            methods[method] = methods.get(method, 0) + 1
         else:
-            logger.warning(f"[INNGEST] Normalization returned None for job {job_id}")
-            return {"success": False, "job_id": job_id, "reason": "normalization_returned_none"}
+            failed_job_ids.append(job_id)
 
-    except Exception as e:
-        db.session.rollback()
-        logger.error(f"[INNGEST] Error normalizing job {job_id}: {e}", exc_info=True)
-        return {"success": False, "job_id": job_id, "reason": str(e)}
+    if failed_job_ids:
+        logger.warning(f"[INNGEST] Backfill could not normalize jobs: {failed_job_ids}")
+
+    return {
+        "normalized": len(results) - len(failed_job_ids),
+        "failed": len(failed_job_ids),
+        "methods": methods
+    }
 
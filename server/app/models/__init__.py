@@ -61,6 +61,7 @@ from app.models.role import Role
 from app.models.permission import Permission
 from app.models.role_permission import RolePermission
 from app.models.user_role import UserRole
+from app.models.portal_user_hierarchy import PortalUserHierarchy
 from app.models.candidate import Candidate
 
 # Import candidate onboarding models
@@ -78,6 +79,7 @@ from app.models.job_posting import JobPosting
 from app.models.candidate_job_match import CandidateJobMatch
 from app.models.job_application import JobApplication
 from app.models.job_import_batch import JobImportBatch
+from app.models.job_posting_stats import JobPostingStatCounter, JobPostingStatSnapshot
 
 # Import scrape queue models (role-based job scraping)
 from app.models.global_role import GlobalRole
@@ -6,12 +6,14 @@ Stores candidate information with resume parsing support
 from datetime import datetime
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ARRAY, DateTime, Integer, String, Text
+from sqlalchemy import ARRAY, BigInteger, DateTime, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Load, deferred, validates
 
 from sqlalchemy import Index
 
 from app import db
+from app.utils.skill_vocabulary import SkillVocabulary
 
 
 class BaseModel(db.Model):
@@ -39,6 +41,12 @@ class Candidate(BaseModel):
         Index('idx_candidates_tenant', 'tenant_id'),
         Index('idx_candidates_tenant_status', 'tenant_id', 'status'),
         Index('idx_candidates_tenant_created', 'tenant_id', db.text('created_at DESC')),
+        # Broadcast-visible candidates per tenant (assigned-candidates listing)
+        Index(
+            'idx_candidates_tenant_broadcast_updated',
+            'tenant_id', db.text('updated_at DESC'),
+            postgresql_where=db.text('is_visible_to_all_team = true')
+        ),
         # IVFFlat ANN index on embedding is created via raw SQL in migration
         # (pgvector indexes require special CREATE INDEX syntax)
     )
@@ -105,7 +113,7 @@ class Candidate(BaseModel):
     total_experience_years = db.Column(Integer)
     notice_period = db.Column(String(100))
     expected_salary = db.Column(String(100))
-    professional_summary = db.Column(Text)
+    professional_summary = deferred(db.Column(Text), group="description")
     
     # Visa/Work Authorization
     visa_type = db.Column(String(50))  # US Citizen, Green Card, H1B, H4 EAD, L1, L2 EAD, OPT, CPT, TN, O1, E2, Other
@@ -113,6 +121,7 @@ class Candidate(BaseModel):
     # Structured Arrays (PostgreSQL ARRAY columns)
     preferred_locations = db.Column(ARRAY(String))  # ["San Francisco", "Remote"]
     skills = db.Column(ARRAY(String))  # ["Python", "React", "Node.js"]
+    skill_ids = db.Column(ARRAY(BigInteger))  # Canonical skill ids (SkillVocabulary), kept in sync with skills
     certifications = db.Column(ARRAY(String))  # ["AWS Certified", "Scrum Master"]
     languages = db.Column(ARRAY(String))  # ["English", "Spanish", "French"]
 
@@ -121,7 +130,7 @@ class Candidate(BaseModel):
     # Example: ["Software Engineer", "Tech Lead", "Solutions Architect"]
 
     # Structured Data (PostgreSQL JSONB columns)
-    education = db.Column(JSONB)  # Array of education objects
+    education = deferred(db.Column(JSONB), group="description")  # Array of education objects
     # Example: [
     #   {
     #     "degree": "B.S. Computer Science",
@@ -132,7 +141,7 @@ class Candidate(BaseModel):
     #   }
     # ]
 
-    work_experience = db.Column(JSONB)  # Array of work experience objects
+    work_experience = deferred(db.Column(JSONB), group="description")  # Array of work experience objects
     # Example: [
     #   {
     #     "title": "Senior Software Engineer",
@@ -150,7 +159,7 @@ class Candidate(BaseModel):
     # Each resume now has its own parsed and polished data
 
     # AI-Suggested Roles (NEW)
-    suggested_roles = db.Column(JSONB)  # AI-generated role suggestions
+    suggested_roles = deferred(db.Column(JSONB), group="description")  # AI-generated role suggestions
     # Example: {
     #   "roles": [
     #     {"role": "Senior Software Engineer", "score": 0.95, "reasoning": "Strong Python/React skills"},
@@ -161,7 +170,8 @@ class Candidate(BaseModel):
     # }
 
     # AI Matching Data
-    embedding = db.Column(Vector(768))  # Google Gemini embeddings for semantic matching
+    # Deferred: only matching/embedding code needs the vector (use Candidate.with_embedding())
+    embedding = deferred(db.Column(Vector(768)), group="embedding")  # Google Gemini embeddings for semantic matching
 
     # Relationships
     tenant = db.relationship("Tenant", back_populates="candidates")
@@ -209,6 +219,26 @@ class Candidate(BaseModel):
     def __repr__(self):
         return f"<Candidate {self.first_name} {self.last_name}>"
 
+    @validates("skills")
+    def _sync_skill_ids(self, key, skills):
+        """Keep skill_ids (canonical skill ids used by scorers) in sync with skills."""
+        self.skill_ids = SkillVocabulary.skill_ids(skills)
+        return skills
+
+    # Loader options for deferred column groups. List endpoints and counts skip
+    # these columns; callers that read them for many rows should opt in so the
+    # group is fetched in the main query instead of one lazy SELECT per row.
+    @classmethod
+    def with_embedding(cls):
+        """Loader option that fetches the deferred ``embedding`` vector."""
+        return Load(cls).undefer_group("embedding")
+
+    @classmethod
+    def with_description(cls):
+        """Loader option that fetches the deferred long-form profile columns
+        (professional_summary, education, work_experience, suggested_roles)."""
+        return Load(cls).undefer_group("description")
+
     def to_dict(self, include_assignments=False, include_onboarding_users=False, include_resumes=False):
         """
         Convert candidate to dictionary
@@ -89,6 +89,8 @@ class CandidateAssignment(db.Model):
         db.Index('idx_assignment_assigned_to', 'assigned_to_user_id'),
         db.Index('idx_assignment_status', 'status'),
         db.Index('idx_assignment_type', 'assignment_type'),
+        # "My candidates" listing: assignee + status, newest first
+        db.Index('idx_assignment_assignee_status_assigned', 'assigned_to_user_id', 'status', db.text('assigned_at DESC')),
     )
     
     def __repr__(self):
@@ -8,11 +8,18 @@ This model implements:
 - Queue management: Priority-based processing for external scrapers
 """
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, Index
+from sqlalchemy import String, Integer, DateTime, Index, Computed
 from sqlalchemy.dialects.postgresql import ARRAY
 from pgvector.sqlalchemy import Vector
 from app import db
 
+# Numeric queue priority (urgent=4 ... low=1, NULL for anything else), stored so the
+# dequeue ORDER BY can be served by an index instead of sorting on a CASE expression
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'urgent' THEN 4 WHEN 'high' THEN 3 "
+    "WHEN 'normal' THEN 2 WHEN 'low' THEN 1 END"
+)
+
 
 class GlobalRole(db.Model):
     """
@@ -55,6 +62,7 @@ class GlobalRole(db.Model):
     # high: Roles with many candidates waiting  
     # normal: Regular queue processing
     # low: Background refresh (stale roles)
+    priority_rank = db.Column(Integer, Computed(PRIORITY_RANK_SQL, persisted=True))  # Generated from priority
     
     # Statistics
     total_jobs_scraped = db.Column(Integer, default=0)  # Jobs found for this role (all time)
@@ -84,6 +92,12 @@ class GlobalRole(db.Model):
         ),
         # Queue processing: status + priority + candidate_count
         Index('idx_global_roles_queue', 'queue_status', 'priority', 'candidate_count'),
+        # Scraper dequeue: approved roles already in dequeue order (LIMIT 1 index scan)
+        Index(
+            'idx_global_roles_dequeue',
+            db.text('priority_rank DESC'), db.text('last_scraped_at ASC NULLS FIRST'), db.text('candidate_count DESC'),
+            postgresql_where=db.text("queue_status = 'approved'")
+        ),
         # Category filtering
         Index('idx_global_roles_category', 'category'),
     )
@@ -3,10 +3,12 @@ Job Posting Model
 Stores external job listings from various platforms (GLOBAL - not tenant-specific)
 """
 from datetime import datetime
-from sqlalchemy import String, Integer, Text, DateTime, Boolean, Date, ARRAY, Index, DECIMAL, ForeignKey
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import String, Integer, BigInteger, Text, DateTime, Boolean, Date, ARRAY, Index, DECIMAL, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB, UUID, TSVECTOR
+from sqlalchemy.orm import Load, deferred, validates
 from pgvector.sqlalchemy import Vector
 from app import db
+from app.utils.skill_vocabulary import SkillVocabulary
 
 
 class JobPosting(db.Model):
@@ -35,7 +37,7 @@ class JobPosting(db.Model):
     salary_currency = db.Column(String(10), default='USD')
     
     # Job Description
-    description = db.Column(Text, nullable=False)
+    description = deferred(db.Column(Text, nullable=False), group="description")
     snippet = db.Column(Text)
     requirements = db.Column(Text)  # Extracted from description
     
@@ -50,6 +52,7 @@ class JobPosting(db.Model):
     
     # Skills & Keywords
     skills = db.Column(ARRAY(String))  # Array of skill keywords
+    skill_ids = db.Column(ARRAY(BigInteger))  # Canonical skill ids (SkillVocabulary), kept in sync with skills
     # DEPRECATED: extracted_keywords is no longer used (keyword scoring removed to speed up job imports)
     # Will be dropped in migration ff6b8764e616
     extracted_keywords = db.Column(JSONB, nullable=True, default=dict)
@@ -62,8 +65,12 @@ class JobPosting(db.Model):
     status = db.Column(String(50), default='ACTIVE', index=True)  # ACTIVE, EXPIRED, FILLED, CLOSED
     
     # AI Matching Data
-    embedding = db.Column(Vector(768))  # Google Gemini embeddings (768 dimensions)
-    raw_metadata = db.Column(JSONB)  # Original platform-specific data
+    # Deferred: list endpoints and counts never need these (see with_embedding/with_description)
+    embedding = deferred(db.Column(Vector(768)), group="embedding")  # Google Gemini embeddings (768 dimensions)
+    raw_metadata = deferred(db.Column(JSONB))  # Original platform-specific data
+    # Weighted full-text vector (title A, skills B, company C, description D), maintained by a
+    # database trigger (job_postings_search_vector_update) - never written by the application
+    search_vector = deferred(db.Column(TSVECTOR), group="search")
     
     # Import Tracking
     imported_at = db.Column(DateTime, default=datetime.utcnow)
@@ -128,11 +135,32 @@ class JobPosting(db.Model):
         Index('idx_job_posting_skills', 'skills', postgresql_using='gin'),
         Index('idx_job_posting_posted_date_desc', 'posted_date', postgresql_ops={'posted_date': 'DESC'}),
         Index('idx_job_posting_embedding', 'embedding', postgresql_using='ivfflat', postgresql_with={'lists': 100}, postgresql_ops={'embedding': 'vector_cosine_ops'}),
+        # Full-text search (ranked) and pg_trgm substring/typeahead matching (ILIKE '%term%')
+        Index('idx_job_posting_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('idx_job_posting_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('idx_job_posting_company_trgm', 'company', postgresql_using='gin', postgresql_ops={'company': 'gin_trgm_ops'}),
+        Index('idx_job_posting_location_trgm', 'location', postgresql_using='gin', postgresql_ops={'location': 'gin_trgm_ops'}),
     )
     
     def __repr__(self):
         return f'<JobPosting {self.title} @ {self.company} ({self.platform})>'
     
+    @validates('skills')
+    def _sync_skill_ids(self, key, skills):
+        """Keep skill_ids (canonical skill ids used by scorers) in sync with skills."""
+        self.skill_ids = SkillVocabulary.skill_ids(skills)
+        return skills
+    
+    @classmethod
+    def with_embedding(cls):
+        """Loader option that fetches the deferred ``embedding`` vector."""
+        return Load(cls).undefer_group('embedding')
+    
+    @classmethod
+    def with_description(cls):
+        """Loader option that fetches the deferred ``description`` text."""
+        return Load(cls).undefer_group('description')
+    
     def to_dict(self, include_description=True, include_embedding=False):
         """Convert job posting to dictionary"""
         result = {
@@ -0,0 +1,68 @@
+"""
+Job Posting Statistics Models
+Incrementally maintained counters behind the jobs-page statistics.
+"""
+from datetime import datetime
+from sqlalchemy import String, Integer, BigInteger, DateTime, UniqueConstraint
+from app import db
+
+
+# Segment key used for the global scraped catalogue (and for "no user")
+GLOBAL_SEGMENT = 0
+
+
+class JobPostingStatCounter(db.Model):
+    """
+    Job counts per visibility segment, platform and sourcing user.
+    
+    Segments:
+    - tenant_id = 0: scraped jobs (global catalogue, visible to every tenant)
+    - tenant_id = N: email-sourced jobs of tenant N, per sourced_by_user_id
+    
+    Incremented by the job import paths (JobPostingStatsService.record_imported_jobs)
+    and rebuilt exactly on a schedule (JobPostingStatsService.recompute), which also
+    corrects drift from status changes and deletions between recomputes.
+    """
+    __tablename__ = 'job_posting_stat_counters'
+    
+    id = db.Column(Integer, primary_key=True)
+    
+    # 0 = global scraped catalogue, otherwise the source tenant of email jobs
+    tenant_id = db.Column(Integer, nullable=False, default=GLOBAL_SEGMENT)
+    platform = db.Column(String(50), nullable=False)
+    # 0 = not attributed to a user (always 0 for scraped jobs)
+    sourced_by_user_id = db.Column(Integer, nullable=False, default=GLOBAL_SEGMENT)
+    
+    total_jobs = db.Column(BigInteger, nullable=False, default=0)
+    active_jobs = db.Column(BigInteger, nullable=False, default=0)
+    remote_jobs = db.Column(BigInteger, nullable=False, default=0)
+    
+    updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'platform', 'sourced_by_user_id', name='uq_job_posting_stat_counter_segment'),
+    )
+    
+    def __repr__(self):
+        return f'<JobPostingStatCounter tenant={self.tenant_id} platform={self.platform} total={self.total_jobs}>'
+
+
+class JobPostingStatSnapshot(db.Model):
+    """
+    Exact distinct counts from the last scheduled recompute.
+    
+    - tenant_id = 0: distinct companies/locations of the scraped catalogue
+    - tenant_id = N: distinct over the scraped catalogue plus tenant N's email jobs
+      (only stored for tenants with email jobs; others use the global row)
+    
+    The global row's computed_at is the time of the last exact recompute.
+    """
+    __tablename__ = 'job_posting_stat_snapshots'
+    
+    tenant_id = db.Column(Integer, primary_key=True)
+    unique_companies = db.Column(BigInteger, nullable=False, default=0)
+    unique_locations = db.Column(BigInteger, nullable=False, default=0)
+    computed_at = db.Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<JobPostingStatSnapshot tenant={self.tenant_id} computed_at={self.computed_at}>'
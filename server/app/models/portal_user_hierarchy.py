@@ -0,0 +1,56 @@
+"""
+PortalUserHierarchy closure table for the team (manager) hierarchy.
+"""
+
+from sqlalchemy import Index
+from app import db
+
+
+class PortalUserHierarchy(db.Model):
+    """
+    Closure table of the PortalUser.manager_id tree.
+    
+    One row per (ancestor, descendant) pair with depth >= 1, so a direct
+    report has depth 1, a skip-level report depth 2, and so on. Subtree
+    lookups and cycle checks become a single indexed query.
+    
+    Always kept in sync by TeamManagementService.sync_hierarchy_closure()
+    whenever a manager_id changes; settings.team_hierarchy_use_closure_table
+    only controls whether lookups read it instead of walking manager_id with
+    recursive CTEs. Run TeamManagementService.rebuild_hierarchy_closure() once
+    to backfill rows for data that predates the table.
+    
+    Attributes:
+        ancestor_id: Manager (direct or indirect)
+        descendant_id: Report (direct or indirect)
+        depth: Number of manager_id hops from ancestor to descendant
+        tenant_id: Tenant of both users
+    """
+    
+    __tablename__ = 'portal_user_hierarchy'
+    
+    ancestor_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portal_users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    descendant_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portal_users.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    depth = db.Column(db.Integer, nullable=False)
+    tenant_id = db.Column(
+        db.Integer,
+        db.ForeignKey('tenants.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        # Ancestor lookups (cycle checks, "is X above Y")
+        Index('idx_portal_user_hierarchy_descendant', 'descendant_id', 'depth'),
+        Index('idx_portal_user_hierarchy_tenant', 'tenant_id'),
+    )
+    
+    def __repr__(self):
+        return f'<PortalUserHierarchy {self.ancestor_id} -> {self.descendant_id} depth={self.depth}>'
@@ -10,9 +10,10 @@ When a candidate is approved with preferred roles and locations,
 all combinations are added to this queue for the scraper to process.
 """
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, UniqueConstraint, Text
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, UniqueConstraint, Text, Computed
 from sqlalchemy.dialects.postgresql import JSONB
 from app import db
+from app.models.global_role import PRIORITY_RANK_SQL
 
 
 class RoleLocationQueue(db.Model):
@@ -61,6 +62,7 @@ class RoleLocationQueue(db.Model):
         default='normal', 
         nullable=False
     )  # urgent, high, normal, low
+    priority_rank = db.Column(Integer, Computed(PRIORITY_RANK_SQL, persisted=True))  # Generated from priority
     
     # Candidate tracking - how many candidates need this role+location
     candidate_count = db.Column(Integer, default=0, nullable=False)
@@ -86,6 +88,12 @@ class RoleLocationQueue(db.Model):
         UniqueConstraint('global_role_id', 'location', name='uq_role_location_queue'),
         # Queue lookup: find next role+location to scrape
         Index('idx_role_location_queue_status_priority', 'queue_status', 'priority'),
+        # Scraper dequeue: approved entries already in dequeue order (LIMIT 1 index scan)
+        Index(
+            'idx_role_location_queue_dequeue',
+            db.text('priority_rank DESC'), db.text('last_scraped_at ASC NULLS FIRST'), db.text('candidate_count DESC'),
+            postgresql_where=db.text("queue_status = 'approved'")
+        ),
         # Role lookup: find all locations for a role
         Index('idx_role_location_queue_role', 'global_role_id'),
     )
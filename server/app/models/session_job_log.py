@@ -3,12 +3,16 @@ Session Job Log Model
 
 Logs all jobs received during a scrape session with their import status.
 Used for detailed session analysis and debugging duplicate detection.
+
+How much of each job is stored depends on settings.scraper_job_log_level
+(see SessionJobLogService).
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from uuid import UUID as PyUUID
-from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index, func, select
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Load, deferred
 
 from app import db
 
@@ -18,7 +22,8 @@ class SessionJobLog(db.Model):
     Logs each job received during a scrape session.
     
     Stores:
-    - Raw job data as received from scraper
+    - Raw job data as received from scraper, inline (raw_job_data) or as a
+      content hash plus the key of the batch's payload blob in file storage
     - Import status (imported, skipped, error)
     - Skip reason with details
     - Reference to duplicate job if applicable
@@ -43,8 +48,12 @@ class SessionJobLog(db.Model):
     external_job_id = db.Column(db.String(255), nullable=True)
     job_index = db.Column(db.Integer, nullable=False)  # Order in the batch
     
-    # Raw job data from scraper
-    raw_job_data = db.Column(db.JSON, nullable=False, default=dict)
+    # Raw job data from scraper (empty when stored by reference)
+    raw_job_data = deferred(db.Column(db.JSON, nullable=False, default=dict), group="raw_job_data")
+    
+    # Reference logging: SHA-256 of the job JSON and the gzipped JSONL blob holding it
+    payload_hash = db.Column(db.String(64), nullable=True)
+    payload_key = db.Column(db.String(500), nullable=True)
     
     # Extracted key fields for quick filtering
     title = db.Column(db.String(500), nullable=True)
@@ -126,12 +135,15 @@ class SessionJobLog(db.Model):
             "skip_reason_detail": self.skip_reason_detail,
             "duplicate_job_id": self.duplicate_job_id,
             "error_message": self.error_message,
+            "payload_hash": self.payload_hash,
+            "payload_stored": "reference" if self.payload_key else "inline",
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
         
         if include_raw_data:
-            result["raw_job_data"] = self.raw_job_data
+            # Reference rows are resolved by SessionJobLogService.load_payloads
+            result["raw_job_data"] = None if self.payload_key else self.raw_job_data
         
         if include_duplicate and self.duplicate_job:
             result["duplicate_job"] = {
@@ -149,6 +161,36 @@ class SessionJobLog(db.Model):
         
         return result
     
+    @classmethod
+    def with_raw_job_data(cls):
+        """Loader option that fetches the deferred ``raw_job_data`` JSON."""
+        return Load(cls).undefer_group("raw_job_data")
+    
+    @classmethod
+    def build_row(
+        cls,
+        session_id: PyUUID,
+        platform_name: str,
+        job_index: int,
+        raw_job_data: Dict[str, Any],
+        platform_status_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Column values of a pending job log entry (key fields extracted from the raw job)."""
+        return {
+            "session_id": session_id,
+            "platform_name": platform_name,
+            "platform_status_id": platform_status_id,
+            "job_index": job_index,
+            "raw_job_data": raw_job_data,
+            "external_job_id": (
+                raw_job_data.get("jobId") or raw_job_data.get("job_id") or raw_job_data.get("external_job_id")
+            ),
+            "title": raw_job_data.get("title"),
+            "company": raw_job_data.get("company"),
+            "location": raw_job_data.get("location"),
+            "status": "pending"
+        }
+    
     @classmethod
     def log_job(
         cls,
@@ -159,18 +201,7 @@ class SessionJobLog(db.Model):
         platform_status_id: Optional[int] = None
     ) -> "SessionJobLog":
         """Create a pending job log entry."""
-        log = cls(
-            session_id=session_id,
-            platform_name=platform_name,
-            platform_status_id=platform_status_id,
-            job_index=job_index,
-            raw_job_data=raw_job_data,
-            external_job_id=raw_job_data.get("jobId") or raw_job_data.get("job_id") or raw_job_data.get("external_job_id"),
-            title=raw_job_data.get("title"),
-            company=raw_job_data.get("company"),
-            location=raw_job_data.get("location"),
-            status="pending"
-        )
+        log = cls(**cls.build_row(session_id, platform_name, job_index, raw_job_data, platform_status_id))
         db.session.add(log)
         return log
     
@@ -201,11 +232,23 @@ class SessionJobLog(db.Model):
     
     @classmethod
     def get_session_summary(cls, session_id: PyUUID) -> Dict[str, Any]:
-        """Get summary statistics for a session."""
-        logs = cls.query.filter_by(session_id=session_id).all()
+        """
+        Get summary statistics for a session.
+        
+        Counted with one GROUP BY (no log rows are loaded). Sessions imported
+        with the "summary" log level have no rows; their totals come from the
+        per-platform counters instead, without a skip reason breakdown.
+        """
+        from app.models.session_platform_status import SessionPlatformStatus
+        
+        counts = db.session.execute(
+            select(cls.platform_name, cls.status, cls.skip_reason, func.count())
+            .where(cls.session_id == session_id)
+            .group_by(cls.platform_name, cls.status, cls.skip_reason)
+        ).all()
         
         summary = {
-            "total": len(logs),
+            "total": 0,
             "imported": 0,
             "skipped": 0,
             "error": 0,
@@ -217,32 +260,48 @@ class SessionJobLog(db.Model):
                 "missing_required": 0,
                 "error": 0
             },
-            "by_platform": {}
+            "by_platform": {},
+            "source": "job_logs"
         }
         
-        for log in logs:
+        for platform_name, status, skip_reason, count in counts:
+            summary["total"] += count
+            
             # Count by status
-            if log.status == "imported":
-                summary["imported"] += 1
-            elif log.status == "skipped":
-                summary["skipped"] += 1
-                if log.skip_reason:
-                    if log.skip_reason in summary["skip_reasons"]:
-                        summary["skip_reasons"][log.skip_reason] += 1
-            elif log.status == "error":
-                summary["error"] += 1
+            if status in ("imported", "skipped", "error"):
+                summary[status] += count
+                if status == "skipped" and skip_reason in summary["skip_reasons"]:
+                    summary["skip_reasons"][skip_reason] += count
             else:
-                summary["pending"] += 1
+                summary["pending"] += count
             
             # Count by platform
-            if log.platform_name not in summary["by_platform"]:
-                summary["by_platform"][log.platform_name] = {
+            if platform_name not in summary["by_platform"]:
+                summary["by_platform"][platform_name] = {
                     "total": 0,
                     "imported": 0,
                     "skipped": 0,
                     "error": 0
                 }
-            summary["by_platform"][log.platform_name]["total"] += 1
-            summary["by_platform"][log.platform_name][log.status] += 1
+            platform_summary = summary["by_platform"][platform_name]
+            platform_summary["total"] += count
+            platform_summary[status] = platform_summary.get(status, 0) + count
+        
+        if not counts:
+            platform_statuses = SessionPlatformStatus.query.filter_by(session_id=session_id).all()
+            for ps in platform_statuses:
+                imported = ps.jobs_imported or 0
+                skipped = ps.jobs_skipped or 0
+                summary["total"] += imported + skipped
+                summary["imported"] += imported
+                summary["skipped"] += skipped
+                summary["by_platform"][ps.platform_name] = {
+                    "total": imported + skipped,
+                    "imported": imported,
+                    "skipped": skipped,
+                    "error": 0
+                }
+            if summary["total"]:
+                summary["source"] = "platform_status"
         
         return summary
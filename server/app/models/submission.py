@@ -194,6 +194,8 @@ class Submission(db.Model):
         Index('idx_submission_tenant_status', 'tenant_id', 'status'),
         Index('idx_submission_submitted_at', 'submitted_at', postgresql_ops={'submitted_at': 'DESC'}),
         Index('idx_submission_submitted_by', 'submitted_by_user_id', 'status'),
+        # Submission stats: tenant (+ recruiter) scoped single scan
+        Index('idx_submission_tenant_user_submitted', 'tenant_id', 'submitted_by_user_id', 'submitted_at'),
         # External job queries
         Index('idx_submission_external', 'tenant_id', 'is_external_job'),
     )
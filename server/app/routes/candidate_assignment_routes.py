@@ -314,6 +314,8 @@ def get_my_assigned_candidates():
     Query Parameters:
         status (optional): Filter by assignment status (PENDING, ACCEPTED, COMPLETED, CANCELLED)
         include_completed (optional): Include completed assignments (default: false)
+        page (optional): Page number; when given, results are paginated in SQL
+        per_page (optional): Results per page (default: 50, max: 200)
     
     Returns: List of assigned candidates
     Permissions: candidates.view OR candidates.view_assigned
@@ -340,8 +342,37 @@ def get_my_assigned_candidates():
         
         status = request.args.get('status')
         include_completed = request.args.get('include_completed', 'false').lower() == 'true'
-        
+        page = request.args.get('page', type=int)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 200)
+        
+        if page is None:
+            candidates = CandidateAssignmentService.get_user_assigned_candidates(
+                user_id=user_id,
+                tenant_id=tenant_id,
+                status_filter=status,
+                include_completed=include_completed
+            )
+            
+            return jsonify({
+                'candidates': candidates,
+                'total': len(candidates),
+                'user_id': user_id,
+                'filters': {
+                    'status': status,
+                    'include_completed': include_completed
+                }
+            }), 200
+        
+        page = max(page, 1)
         candidates = CandidateAssignmentService.get_user_assigned_candidates(
+            user_id=user_id,
+            tenant_id=tenant_id,
+            status_filter=status,
+            include_completed=include_completed,
+            limit=per_page,
+            offset=(page - 1) * per_page
+        )
+        total = CandidateAssignmentService.count_user_assigned_candidates(
             user_id=user_id,
             tenant_id=tenant_id,
             status_filter=status,
@@ -350,7 +381,10 @@ def get_my_assigned_candidates():
         
         return jsonify({
             'candidates': candidates,
-            'total': len(candidates),
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': (total + per_page - 1) // per_page if total > 0 else 0,
             'user_id': user_id,
             'filters': {
                 'status': status,
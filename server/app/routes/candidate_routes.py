@@ -326,7 +326,7 @@ def get_pending_review():
                 Candidate.status == 'pending_review',
                 Candidate.status == 'processing',
             ),
-        ).order_by(Candidate.created_at.desc())
+        ).options(Candidate.with_description()).order_by(Candidate.created_at.desc())
         
         candidates = list(db.session.scalars(stmt))
         
@@ -9,7 +9,7 @@ import logging
 from datetime import datetime
 
 from flask import Blueprint, g, jsonify, request
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, select
 
 from app import db
 from app.middleware.portal_auth import require_portal_auth, require_permission
@@ -19,6 +19,7 @@ from app.models.portal_user import PortalUser
 from app.models.processed_email import ProcessedEmail
 from app.models.user_email_integration import UserEmailIntegration
 from app.services.email_job_service import EmailJobService
+from app.services.job_posting_service import JobPostingService
 
 bp = Blueprint("email_jobs", __name__, url_prefix="/api/email-jobs")
 logger = logging.getLogger(__name__)
@@ -79,17 +80,10 @@ def list_email_jobs():
         stmt = stmt.where(JobPosting.status == status)
     
     if search:
-        search_pattern = f"%{search}%"
-        stmt = stmt.where(
-            or_(
-                JobPosting.title.ilike(search_pattern),
-                JobPosting.company.ilike(search_pattern),
-                func.array_to_string(JobPosting.skills, ",").ilike(search_pattern),
-            )
-        )
+        stmt = stmt.where(JobPostingService.search_filter(search))
     
-    # Order by most recent first
-    stmt = stmt.order_by(desc(JobPosting.created_at))
+    # Order by most recent first; to_dict() below serializes the deferred description
+    stmt = stmt.order_by(desc(JobPosting.created_at)).options(JobPosting.with_description())
     
     # Paginate
     paginated = db.paginate(stmt, page=page, per_page=per_page)
@@ -62,7 +62,7 @@ def generate_matches_for_candidate(candidate_id: int):
         tenant_id = g.tenant_id
         
         # Verify candidate exists and belongs to tenant
-        candidate = db.session.get(Candidate, candidate_id)
+        candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_embedding()])
         if not candidate:
             return error_response(f"Candidate {candidate_id} not found", 404)
         
@@ -112,7 +112,7 @@ def generate_matches_for_candidate(candidate_id: int):
                 JobPosting.id.in_(job_ids),
                 JobPosting.embedding.isnot(None),
                 JobPosting.status == 'ACTIVE'
-            )
+            ).options(JobPosting.with_embedding())
         ).all() if job_ids else []
         
         # Score using UnifiedScorerService
@@ -196,7 +196,7 @@ def generate_matches_for_all():
             select(Candidate).where(
                 Candidate.tenant_id == tenant_id,
                 Candidate.status.in_(['approved', 'ready_for_assignment', 'new', 'screening']),
-            )
+            ).options(Candidate.with_embedding())
         ).all()
         
         total_candidates = len(candidates)
@@ -250,7 +250,7 @@ def generate_matches_for_all():
                             JobPosting.id.in_(job_ids),
                             JobPosting.embedding.isnot(None),
                             JobPosting.status == 'ACTIVE'
-                        )
+                        ).options(JobPosting.with_embedding())
                     ).all() if job_ids else []
                     
                     candidate_matches = 0
@@ -614,6 +614,8 @@ def get_candidate_matches(candidate_id: int):
                     )
                 )
             )
+            # Response includes a description preview
+            .options(JobPosting.with_description())
         )
         
         # Apply min_score filter
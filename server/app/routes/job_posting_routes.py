@@ -189,10 +189,11 @@ def list_job_postings():
     - page: int (default 1)
     - per_page: int (default 20, max 100)
     - status: string (active, inactive, closed)
-    - search: string (search in title, company, location, description)
+    - search: string (full-text search in title, skills, company, description; partial match on title, company, location)
     - location: string (filter by location)
     - is_remote: boolean
-    - sort_by: string (posted_date, title, company, salary_min, created_at)
+    - sort_by: string (relevance, date, posted_date, title, company, salary_min, created_at)
+      - defaults to relevance when search is given, otherwise date
     - sort_order: string (asc, desc)
     - source: string (all, email, scraped) - NEW: filter by job source
     - platform: string (filter by specific platform: indeed, dice, email, etc.)
@@ -214,7 +215,7 @@ def list_job_postings():
         search = request.args.get('search')
         location = request.args.get('location')
         is_remote_str = request.args.get('is_remote')
-        sort_by = request.args.get('sort_by', 'date')
+        sort_by = request.args.get('sort_by', 'relevance' if search else 'date')
         sort_order = request.args.get('sort_order', 'desc')
         source = request.args.get('source', 'all')
         platform = request.args.get('platform')
@@ -256,6 +257,9 @@ def search_job_postings():
     
     GET /api/job-postings/search?q=python developer
     
+    Results are ranked by full-text relevance (title > skills > company > description),
+    then by posted date, and include highlighted snippets in 'search_highlights'.
+    
     Permissions: candidates.view
     """
     try:
@@ -265,13 +269,9 @@ def search_job_postings():
         if not query_string:
             return jsonify([]), 200
         
-        # Search in multiple fields
-        search_filter = or_(
-            JobPosting.title.ilike(f'%{query_string}%'),
-            JobPosting.company.ilike(f'%{query_string}%'),
-            JobPosting.location.ilike(f'%{query_string}%'),
-            JobPosting.description.ilike(f'%{query_string}%')
-        )
+        # Full-text + partial-match search (GIN indexed)
+        search_query = JobPostingService.search_tsquery(query_string)
+        search_filter = JobPostingService.search_filter(query_string, search_query)
         
         # Visibility rules: scraped (global) + email (tenant-specific)
         visibility_filter = or_(
@@ -285,16 +285,22 @@ def search_job_postings():
         query = (
             select(JobPosting)
             .where(and_(search_filter, visibility_filter, JobPosting.status == 'ACTIVE'))
-            .order_by(JobPosting.posted_date.desc().nullslast())
+            .options(JobPosting.with_description())
+            .order_by(
+                JobPostingService.search_rank(search_query).desc(),
+                JobPosting.posted_date.desc().nullslast()
+            )
             .limit(50)
         )
         
         jobs = db.session.scalars(query).all()
+        highlights = JobPostingService.get_search_highlights([job.id for job in jobs], query_string)
         
         jobs_list = []
         for job in jobs:
             job_dict = job.to_dict()
             job_dict = _add_sourced_by_info(job_dict, job)
+            job_dict['search_highlights'] = highlights.get(job.id)
             jobs_list.append(job_dict)
         
         return jsonify(jobs_list), 200
@@ -314,7 +320,10 @@ def get_job_statistics():
     
     GET /api/job-postings/statistics
     
-    Returns stats for both scraped and email-sourced jobs.
+    Returns stats for both scraped and email-sourced jobs, served from
+    incrementally maintained counters. unique_companies/unique_locations are
+    HyperLogLog estimates when unique_counts_approximate is true; stats_as_of
+    is the time of the last exact recompute.
     
     Permissions: candidates.view
     """
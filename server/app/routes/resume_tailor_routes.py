@@ -12,7 +12,7 @@ from app.models.job_posting import JobPosting
 from app.models.candidate_job_match import CandidateJobMatch
 from app.models.tailored_resume import TailoredResume, TailoredResumeStatus
 from app.services.resume_tailor import ResumeTailorOrchestrator
-from app.services.export import ResumeExportService
+from app.services.export import ResumeExportService, resume_render_cache
 from app.schemas.tailored_resume_schema import (
     TailorResumeRequest,
     TailorResumeFromMatchRequest,
@@ -594,8 +594,8 @@ def export_tailored_resume(tailor_id: str):
         
         elif format_enum == ExportFormat.PDF:
             try:
-                logger.info(f"Generating PDF with template '{template}' for tailor_id={tailor_id}")
-                pdf_bytes = export_service.export_pdf(content, template=template_enum.value)
+                logger.info(f"Exporting PDF with template '{template}' for tailor_id={tailor_id}")
+                pdf_bytes = resume_render_cache.get(tenant_id, content, template=template_enum.value, export_format='pdf')
                 
                 return Response(
                     pdf_bytes,
@@ -611,8 +611,8 @@ def export_tailored_resume(tailor_id: str):
         
         elif format_enum == ExportFormat.DOCX:
             try:
-                logger.info(f"Generating DOCX with template '{template}' for tailor_id={tailor_id}")
-                docx_bytes = export_service.export_docx(content, template=template_enum.value)
+                logger.info(f"Exporting DOCX with template '{template}' for tailor_id={tailor_id}")
+                docx_bytes = resume_render_cache.get(tenant_id, content, template=template_enum.value, export_format='docx')
                 
                 return Response(
                     docx_bytes,
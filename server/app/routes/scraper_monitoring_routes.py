@@ -18,6 +18,7 @@ from app.models.role_location_queue import RoleLocationQueue
 from app.middleware import require_pm_admin
 from app.services.scraper_api_key_service import ScraperApiKeyService
 from app.services.role_location_queue_service import RoleLocationQueueService
+from app.services.scraper_stats_service import ScraperStatsService
 
 logger = logging.getLogger(__name__)
 
@@ -50,176 +51,18 @@ def get_scraper_stats():
         },
         "avg_duration_seconds": 125,
         "total_api_keys": 5,
-        "active_api_keys": 4
+        "active_api_keys": 4,
+        "stats_as_of": "2026-01-01T12:00:00Z",
+        "stats_age_seconds": 12
     }
+    
+    The default 24h window is served from the stats snapshot (refreshed every
+    minute); other windows are computed on demand.
     """
     try:
         hours = request.args.get('hours', 24, type=int)
-        since = datetime.utcnow() - timedelta(hours=hours)
-        
-        # Active scrapers (with in_progress session in last 10 minutes)
-        active_cutoff = datetime.utcnow() - timedelta(minutes=10)
-        active_scrapers = db.session.scalar(
-            db.select(func.count(func.distinct(ScrapeSession.scraper_key_id)))
-            .where(
-                ScrapeSession.updated_at >= active_cutoff,
-                ScrapeSession.status == 'in_progress'
-            )
-        ) or 0
-        
-        # Pending queue count (roles ready to be scraped - approved status)
-        pending_queue = db.session.scalar(
-            db.select(func.count(GlobalRole.id))
-            .where(GlobalRole.queue_status == 'approved')
-        ) or 0
-        
-        # Jobs imported in time period
-        jobs_imported = db.session.scalar(
-            db.select(func.count(JobPosting.id))
-            .where(JobPosting.imported_at >= since)
-        ) or 0
-        
-        # Jobs stats from sessions (found, imported, skipped)
-        jobs_stats = db.session.execute(
-            db.select(
-                func.coalesce(func.sum(ScrapeSession.jobs_found), 0).label('total_found'),
-                func.coalesce(func.sum(ScrapeSession.jobs_imported), 0).label('total_imported'),
-                func.coalesce(func.sum(ScrapeSession.jobs_skipped), 0).label('total_skipped')
-            )
-            .where(ScrapeSession.created_at >= since)
-        ).first()
-        
-        # Session statistics
-        session_stats = db.session.execute(
-            db.select(
-                ScrapeSession.status,
-                func.count(ScrapeSession.id).label('count')
-            )
-            .where(ScrapeSession.created_at >= since)
-            .group_by(ScrapeSession.status)
-        ).all()
-        
-        sessions_by_status = {row[0]: row[1] for row in session_stats}
-        
-        # Average duration of completed sessions
-        avg_duration = db.session.scalar(
-            db.select(func.avg(ScrapeSession.duration_seconds))
-            .where(
-                ScrapeSession.status == 'completed',
-                ScrapeSession.created_at >= since
-            )
-        ) or 0
-        
-        # API key counts
-        total_keys = db.session.scalar(
-            db.select(func.count(ScraperApiKey.id))
-        ) or 0
-        
-        active_keys = db.session.scalar(
-            db.select(func.count(ScraperApiKey.id))
-            .where(ScraperApiKey.is_active == True)
-        ) or 0
-        
-        # Count of roles that need PM_ADMIN review (newly normalized, awaiting approval)
-        # These are roles with queue_status='pending' that were recently created
-        # For the dashboard, we show all pending roles as "Roles to Review"
-        pending_roles_count = pending_queue  # Same as pending queue for now
-        
-        # =========================================================================
-        # LOCATION ANALYTICS
-        # =========================================================================
         
-        # Sessions with location (role+location scraping) vs without
-        location_session_counts = db.session.execute(
-            db.select(
-                func.count(ScrapeSession.id).filter(ScrapeSession.location.isnot(None)).label('with_location'),
-                func.count(ScrapeSession.id).filter(ScrapeSession.location.is_(None)).label('without_location')
-            )
-            .where(ScrapeSession.created_at >= since)
-        ).first()
-        
-        # Jobs by location (top 10 locations by jobs imported in last 24h)
-        jobs_by_location = db.session.execute(
-            db.select(
-                ScrapeSession.location,
-                func.sum(ScrapeSession.jobs_found).label('jobs_found'),
-                func.sum(ScrapeSession.jobs_imported).label('jobs_imported'),
-                func.count(ScrapeSession.id).label('session_count')
-            )
-            .where(
-                ScrapeSession.created_at >= since,
-                ScrapeSession.location.isnot(None)
-            )
-            .group_by(ScrapeSession.location)
-            .order_by(func.sum(ScrapeSession.jobs_imported).desc())
-            .limit(10)
-        ).all()
-        
-        # Role+Location queue stats
-        location_queue_stats = db.session.execute(
-            db.select(
-                RoleLocationQueue.queue_status,
-                func.count(RoleLocationQueue.id).label('count')
-            )
-            .group_by(RoleLocationQueue.queue_status)
-        ).all()
-        
-        location_queue_by_status = {row[0]: row[1] for row in location_queue_stats}
-        
-        # Unique locations in queue
-        unique_locations_in_queue = db.session.scalar(
-            db.select(func.count(func.distinct(RoleLocationQueue.location)))
-        ) or 0
-        
-        # Total role+location entries
-        total_location_entries = db.session.scalar(
-            db.select(func.count(RoleLocationQueue.id))
-        ) or 0
-        
-        return jsonify({
-            "active_scrapers": active_scrapers,
-            "pending_queue": pending_queue,
-            "pending_roles_count": pending_roles_count,  # For dashboard "Roles to Review" card
-            "jobs_imported_24h": jobs_imported,
-            "jobs_imported_today": jobs_imported,  # Alias for frontend compatibility
-            "jobs_stats_24h": {
-                "total_found": int(jobs_stats.total_found) if jobs_stats else 0,
-                "total_imported": int(jobs_stats.total_imported) if jobs_stats else 0,
-                "total_skipped": int(jobs_stats.total_skipped) if jobs_stats else 0,
-                "success_rate": round((int(jobs_stats.total_imported) / int(jobs_stats.total_found) * 100) if jobs_stats and jobs_stats.total_found > 0 else 0, 1)
-            },
-            "sessions_24h": {
-                "total": sum(sessions_by_status.values()),
-                "completed": sessions_by_status.get('completed', 0),
-                "failed": sessions_by_status.get('failed', 0),
-                "in_progress": sessions_by_status.get('in_progress', 0),
-                "timeout": sessions_by_status.get('timeout', 0)
-            },
-            "avg_duration_seconds": int(avg_duration),
-            "total_api_keys": total_keys,
-            "active_api_keys": active_keys,
-            "location_analytics": {
-                "sessions_with_location": location_session_counts.with_location if location_session_counts else 0,
-                "sessions_without_location": location_session_counts.without_location if location_session_counts else 0,
-                "top_locations": [
-                    {
-                        "location": row.location,
-                        "jobs_found": int(row.jobs_found) if row.jobs_found else 0,
-                        "jobs_imported": int(row.jobs_imported) if row.jobs_imported else 0,
-                        "session_count": int(row.session_count) if row.session_count else 0
-                    }
-                    for row in jobs_by_location
-                ],
-                "queue": {
-                    "total": total_location_entries,
-                    "pending": location_queue_by_status.get('pending', 0),
-                    "approved": location_queue_by_status.get('approved', 0),
-                    "processing": location_queue_by_status.get('processing', 0),
-                    "completed": location_queue_by_status.get('completed', 0),
-                    "unique_locations": unique_locations_in_queue
-                }
-            }
-        }), 200
+        return jsonify(ScraperStatsService.get_scraper_stats(hours)), 200
         
     except Exception as e:
         logger.error(f"Error getting scraper stats: {e}")
@@ -1088,8 +931,6 @@ def get_role_location_queue():
     }
     """
     try:
-        from app.models.role_location_queue import RoleLocationQueue
-        
         status_filter = request.args.get('status')
         search = request.args.get('search', '').strip()
         page = request.args.get('page', 1, type=int)
@@ -1114,12 +955,7 @@ def get_role_location_queue():
         
         # Order by priority and candidate count
         query = query.order_by(
-            db.case(
-                (RoleLocationQueue.priority == 'urgent', 4),
-                (RoleLocationQueue.priority == 'high', 3),
-                (RoleLocationQueue.priority == 'normal', 2),
-                (RoleLocationQueue.priority == 'low', 1),
-            ).desc(),
+            RoleLocationQueue.priority_rank.desc(),
             RoleLocationQueue.candidate_count.desc()
         )
         
@@ -1203,8 +1039,6 @@ def get_locations_for_role(role_id: int):
     }
     """
     try:
-        from app.models.role_location_queue import RoleLocationQueue
-        
         # Get the role
         role = db.session.get(GlobalRole, role_id)
         if not role:
@@ -1394,7 +1228,8 @@ def get_session_job_logs(session_id: str):
     - skip_reason: Filter by specific skip reason
     - page: Page number (default: 1)
     - per_page: Items per page (default: 50)
-    - include_raw_data: Include raw job data (default: false)
+    - include_raw_data: Include raw job data (default: false); payloads logged
+      by reference are read from their batch blobs
     - include_duplicate: Include duplicate job details (default: true)
     
     Response:
@@ -1415,6 +1250,7 @@ def get_session_job_logs(session_id: str):
     try:
         from uuid import UUID
         from app.models.session_job_log import SessionJobLog
+        from app.services.session_job_log_service import SessionJobLogService
         
         # Validate session exists
         session = ScrapeSession.query.filter_by(session_id=UUID(session_id)).first()
@@ -1443,6 +1279,8 @@ def get_session_job_logs(session_id: str):
         
         # Order by job index
         query = query.order_by(SessionJobLog.job_index)
+        if include_raw_data:
+            query = query.options(SessionJobLog.with_raw_job_data())
         
         # Paginate
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
@@ -1455,6 +1293,10 @@ def get_session_job_logs(session_id: str):
             log.to_dict(include_raw_data=include_raw_data, include_duplicate=include_duplicate)
             for log in pagination.items
         ]
+        if include_raw_data:
+            payloads = SessionJobLogService.load_payloads(pagination.items)
+            for job, log in zip(jobs, pagination.items):
+                job["raw_job_data"] = payloads.get(log.id)
         
         # Get session info
         session_info = {
@@ -1509,7 +1351,8 @@ def get_session_job_log_detail(session_id: str, job_log_id: int):
     Get detailed information for a single job log entry.
     
     Includes:
-    - Raw job data as received from scraper
+    - Raw job data as received from scraper (fetched from the batch payload
+      blob when the log stores it by reference; null if no longer available)
     - Full duplicate job details if applicable
     - Comparison between incoming and existing job
     
@@ -1524,12 +1367,13 @@ def get_session_job_log_detail(session_id: str, job_log_id: int):
     try:
         from uuid import UUID
         from app.models.session_job_log import SessionJobLog
+        from app.services.session_job_log_service import SessionJobLogService
         
         # Get job log
         job_log = SessionJobLog.query.filter_by(
             id=job_log_id,
             session_id=UUID(session_id)
-        ).first()
+        ).options(SessionJobLog.with_raw_job_data()).first()
         
         if not job_log:
             return jsonify({
@@ -1537,16 +1381,21 @@ def get_session_job_log_detail(session_id: str, job_log_id: int):
                 "message": f"Job log {job_log_id} not found in session {session_id}"
             }), 404
         
+        # Lazily resolve the payload (inline JSON or the batch blob)
+        raw_job_data = SessionJobLogService.load_payloads([job_log]).get(job_log.id)
+        
         # Build response
+        job_log_dict = job_log.to_dict(include_raw_data=True, include_duplicate=True)
+        job_log_dict["raw_job_data"] = raw_job_data
         response = {
-            "job_log": job_log.to_dict(include_raw_data=True, include_duplicate=True),
-            "raw_job_data": job_log.raw_job_data
+            "job_log": job_log_dict,
+            "raw_job_data": raw_job_data
         }
         
         # Add comparison if this was a duplicate skip
         if job_log.duplicate_job_id and job_log.duplicate_job:
             dup = job_log.duplicate_job
-            incoming = job_log.raw_job_data
+            incoming = raw_job_data or {}
             
             response["duplicate_job"] = {
                 "id": dup.id,
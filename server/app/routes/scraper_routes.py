@@ -11,7 +11,6 @@ External API endpoints for job scrapers to:
 Authentication: X-Scraper-API-Key header
 """
 import logging
-import math
 from functools import wraps
 from uuid import UUID
 from flask import Blueprint, request, jsonify, g
@@ -22,7 +21,9 @@ from app.models.scrape_session import ScrapeSession
 from app.models.session_platform_status import SessionPlatformStatus
 from app.services.scrape_queue_service import ScrapeQueueService
 from app.services.scraper_service import ScraperService
+from app.services.scraper_import_publisher import ScraperImportPublisher
 from app.services.platform_service import PlatformService
+from app.services.scraper_stats_service import ScraperStatsService
 from app.middleware.pm_admin import require_pm_admin
 from app.inngest import inngest_client
 
@@ -374,11 +375,12 @@ def post_jobs():
                 "progress": _get_session_progress(session)
             }
         else:
-            # Batch jobs to avoid Inngest payload size limits (256KB max)
-            # Each job can be ~5-10KB, so we use batches of 20 jobs (~100-200KB safe margin)
-            BATCH_SIZE = 20
+            # Batch jobs by payload size (Inngest events are capped at 256KB) and
+            # offload each batch to Redis so the events only carry a reference
+            batches = ScraperImportPublisher.plan_batches(jobs)
             total_jobs = len(jobs)
-            total_batches = max(1, math.ceil(total_jobs / BATCH_SIZE))
+            total_batches = len(batches)
+            jobs_refs = ScraperImportPublisher.store_batch_payloads(session_id, platform_name, batches)
             
             # CRITICAL: Delegate to service to set batch tracking BEFORE sending events
             # This avoids race condition where Inngest processes events async and batches
@@ -395,32 +397,19 @@ def post_jobs():
                 f"with {total_jobs} jobs in {total_batches} batch(es) (session: {session_id})"
             )
             
-            # Now send batched events (safe because total_batches is already committed)
-            for batch_index in range(total_batches):
-                start_idx = batch_index * BATCH_SIZE
-                end_idx = min(start_idx + BATCH_SIZE, total_jobs)
-                batch_jobs = jobs[start_idx:end_idx]
-                
-                inngest_client.send_sync(
-                    inngest.Event(
-                        name="jobs/scraper.platform-import",
-                        data={
-                            "session_id": session_id,
-                            "scraper_key_id": g.scraper_key.id,
-                            "platform_name": platform_name,
-                            "platform_status_id": platform_status.id,
-                            "jobs": batch_jobs,
-                            "jobs_count": len(batch_jobs),
-                            # Batch metadata for tracking
-                            "batch_index": batch_index,
-                            "total_batches": total_batches,
-                            "total_jobs_in_platform": total_jobs
-                        }
-                    )
-                )
+            # Now send all batch events (safe because total_batches is already committed)
+            send_calls = ScraperImportPublisher.publish_platform_import(
+                session_id=session_id,
+                scraper_key_id=g.scraper_key.id,
+                platform_name=platform_name,
+                platform_status_id=platform_status.id,
+                batches=batches,
+                jobs_refs=jobs_refs
+            )
             
             logger.info(
-                f"All {total_batches} batch events sent for platform {platform_name} (session: {session_id})"
+                f"All {total_batches} batch events sent in {send_calls} call(s) "
+                f"for platform {platform_name} (session: {session_id})"
             )
             
             result = {
@@ -518,8 +507,8 @@ def complete_session_endpoint():
     
     try:
         # Delegate to service - marks session as pending_completion
-        # The last batch to complete will trigger actual session completion workflow via Inngest
-        # This avoids race condition where complete is called before batches finish processing
+        # The completion workflow waits for the last platform batch (jobs/scraper.platform-batches-done)
+        # if imports are still running, so it is safe to trigger it right away
         session = ScraperService.mark_session_pending_completion(
             session_id=session_id,
             scraper_key_id=g.scraper_key.id
@@ -528,29 +517,15 @@ def complete_session_endpoint():
         # Get current stats for response
         platform_statuses = session.platform_statuses
         
-        # FIX: Handle race condition where batches finish BEFORE /queue/complete is called
-        # Check if all platforms are already done
-        all_platforms_done = all(
-            ps.status in ('completed', 'failed', 'skipped') or
-            (ps.completed_batches or 0) >= (ps.total_batches or 1)
-            for ps in platform_statuses
-        )
-        
-        if all_platforms_done and len(platform_statuses) > 0:
-            # Batches already finished - trigger completion immediately
-            logger.info(
-                f"Session {session_id}: All {len(platform_statuses)} platforms already done. "
-                f"Triggering session completion immediately."
-            )
-            inngest_client.send_sync(
-                inngest.Event(
-                    name="jobs/scraper.complete",
-                    data={
-                        "session_id": session_id,
-                        "scraper_key_id": g.scraper_key.id
-                    }
-                )
+        inngest_client.send_sync(
+            inngest.Event(
+                name="jobs/scraper.complete",
+                data={
+                    "session_id": session_id,
+                    "scraper_key_id": g.scraper_key.id
+                }
             )
+        )
         
         failed_platforms = [
             {"platform": ps.platform_name, "error": ps.error_message}
@@ -663,11 +638,15 @@ def get_queue_stats():
         "by_status": {"pending": 50, "processing": 3, "completed": 200},
         "by_priority": {"urgent": 5, "high": 15, "normal": 30},
         "total_pending_candidates": 1234,
-        "queue_depth": 50
+        "queue_depth": 50,
+        "stats_as_of": "2026-01-01T12:00:00Z",
+        "stats_age_seconds": 12
     }
+    
+    Served from the stats snapshot (refreshed every minute).
     """
     try:
-        stats = ScrapeQueueService.get_queue_stats()
+        stats = ScraperStatsService.get_section("queue")
         return jsonify(stats), 200
     except Exception as e:
         logger.error(f"Error getting queue stats: {e}")
@@ -690,11 +669,15 @@ def get_role_location_queue_stats():
         "total_location_entries": 60,
         "unique_roles": 15,
         "unique_locations": 8,
-        "queue_depth": 20
+        "queue_depth": 20,
+        "stats_as_of": "2026-01-01T12:00:00Z",
+        "stats_age_seconds": 12
     }
+    
+    Served from the stats snapshot (refreshed every minute).
     """
     try:
-        stats = ScrapeQueueService.get_role_location_queue_stats()
+        stats = ScraperStatsService.get_section("location_queue")
         return jsonify(stats), 200
     except Exception as e:
         logger.error(f"Error getting role+location queue stats: {e}")
@@ -4,6 +4,7 @@ AI Role Normalization Service
 Implements Option B: Embedding Similarity First, Then AI normalization.
 
 The workflow:
+0. Job titles: exact match on the normalized title against role names/aliases (cached)
 1. Generate embedding for input role name
 2. Search for similar existing roles using vector similarity
 3. If similarity >= 85%: Use existing role (fast path)
@@ -14,6 +15,9 @@ This approach provides:
 - 10% of cases: Gemini AI for new roles (ensures quality)
 """
 import logging
+import string
+import threading
+import time
 from typing import Tuple, Optional, List, Dict, Any
 from datetime import datetime
 
@@ -24,10 +28,14 @@ from app import db
 from app.models.global_role import GlobalRole
 from app.models.candidate_global_role import CandidateGlobalRole
 from app.services.embedding_service import EmbeddingService
+from app.services.role_embedding_index import RoleEmbeddingIndex
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Punctuation stripped from both ends of a title when building its cache key
+TITLE_KEY_STRIP_CHARS = string.punctuation + ' '
+
 
 class AIRoleNormalizationService:
     """
@@ -40,6 +48,11 @@ class AIRoleNormalizationService:
     SIMILARITY_THRESHOLD = 0.85  # 85% similarity for candidate role auto-match
     JOB_SIMILARITY_THRESHOLD = 0.75  # 75% for job titles (more verbose than candidate roles)
     
+    # Process-local cache of normalized title (role names + aliases) -> GlobalRole ID
+    _title_role_map: Optional[Dict[str, int]] = None
+    _title_role_map_expires_at: float = 0.0
+    _title_role_map_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize service with embedding service and Gemini API."""
         self.embedding_service = EmbeddingService()
@@ -157,6 +170,8 @@ class AIRoleNormalizationService:
                         priority='normal'
                     )
                     db.session.add(global_role)
+                    db.session.flush()  # Get ID
+                    RoleEmbeddingIndex.add_role(global_role.id, role_embedding_for_new)
                     similarity = 1.0
             
             method = "ai_created"
@@ -172,6 +187,9 @@ class AIRoleNormalizationService:
         """
         Find similar existing role using vector similarity search.
         
+        Searches the in-memory RoleEmbeddingIndex; the pgvector query is only
+        used when the index is unavailable.
+        
         Args:
             embedding: 768-dimensional embedding vector
             threshold: Minimum similarity threshold (defaults to SIMILARITY_THRESHOLD)
@@ -182,7 +200,23 @@ class AIRoleNormalizationService:
         if threshold is None:
             threshold = self.SIMILARITY_THRESHOLD
         
+        # Fast path: in-memory role embedding index
+        index_matches = RoleEmbeddingIndex.search_many([embedding], threshold)
+        if index_matches is not None:
+            match = index_matches[0]
+            if not match:
+                return None
+            role = db.session.get(GlobalRole, match[0])
+            if role:
+                return {
+                    "role": role,
+                    "similarity": match[1]
+                }
+            # Matched role was deleted since the snapshot was built
+            RoleEmbeddingIndex.invalidate()
+        
         try:
+            # Fallback: pgvector query
             # Convert embedding to PostgreSQL array format
             embedding_str = '[' + ','.join(map(str, embedding)) + ']'
             
@@ -247,7 +281,7 @@ Examples:
 - "Staff Software Engineer" → "Software Engineer"
 
 Return ONLY the normalized job title, nothing else."""
-
+        
         try:
             response = self.ai_model.generate_content(prompt)
             normalized = response.text.strip().strip('"').strip("'")
@@ -316,7 +350,7 @@ Rules:
 7. Only create a NEW role name if no existing role covers this job function
 
 Return ONLY the normalized job title, nothing else."""
-
+        
         try:
             response = self.ai_model.generate_content(prompt)
             normalized = response.text.strip().strip('"').strip("'")
@@ -573,9 +607,29 @@ Return ONLY the normalized job title, nothing else."""
             task_type="SEMANTIC_SIMILARITY"
         )
         
+        top_matches = RoleEmbeddingIndex.search_top_k(query_embedding, limit)
+        if top_matches is not None:
+            similarity_by_id = dict(top_matches)
+            rows = db.session.execute(
+                select(
+                    GlobalRole.id, GlobalRole.name, GlobalRole.category, GlobalRole.candidate_count
+                ).where(GlobalRole.id.in_(similarity_by_id))
+            ).all()
+            rows.sort(key=lambda r: similarity_by_id[r.id], reverse=True)
+            return [
+                {
+                    "id": r.id,
+                    "name": r.name,
+                    "category": r.category,
+                    "candidate_count": r.candidate_count,
+                    "similarity": similarity_by_id[r.id]
+                }
+                for r in rows
+            ]
+        
         embedding_str = '[' + ','.join(map(str, query_embedding)) + ']'
         
-        # Find similar roles
+        # Fallback: pgvector query
         # Note: Use CAST() instead of :: to avoid SQLAlchemy parameter parsing issues
         sql = text("""
             SELECT id, name, category, candidate_count,
@@ -671,6 +725,8 @@ Return ONLY the normalized job title, nothing else."""
         
         db.session.commit()
         db.session.expire_all()
+        AIRoleNormalizationService.invalidate_title_role_cache()
+        RoleEmbeddingIndex.bump_version()
         
         return {
             "merged_roles": merged_roles,
@@ -680,6 +736,105 @@ Return ONLY the normalized job title, nothing else."""
             "new_aliases": all_new_aliases
         }
     
+    # ------------------------------------------------------------------
+    # Normalized-title → GlobalRole cache
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _title_key(title: str) -> str:
+        """
+        Normalize a job title into a cache key.
+        
+        Case-folds, collapses whitespace and strips surrounding punctuation so
+        "Senior Java Developer", "senior  java developer" and "Senior Java Developer."
+        share one key.
+        """
+        return ' '.join((title or '').casefold().split()).strip(TITLE_KEY_STRIP_CHARS)
+    
+    @classmethod
+    def _get_title_role_map(cls) -> Dict[str, int]:
+        """
+        Get the title-key → GlobalRole ID map, reloading it when expired.
+        
+        Built from every role's name and aliases; names win over aliases when
+        a key collides. Cached in-process for settings.role_title_cache_ttl seconds.
+        """
+        now = time.monotonic()
+        if cls._title_role_map is not None and cls._title_role_map_expires_at > now:
+            return cls._title_role_map
+        
+        title_map: Dict[str, int] = {}
+        rows = db.session.execute(select(GlobalRole.id, GlobalRole.name, GlobalRole.aliases)).all()
+        for role_id, _, aliases in rows:
+            for alias in aliases or []:
+                title_map.setdefault(cls._title_key(alias), role_id)
+        for role_id, name, _ in rows:
+            title_map[cls._title_key(name)] = role_id
+        title_map.pop('', None)
+        
+        with cls._title_role_map_lock:
+            cls._title_role_map = title_map
+            cls._title_role_map_expires_at = now + settings.role_title_cache_ttl
+        
+        return title_map
+    
+    @classmethod
+    def _remember_titles(cls, global_role: GlobalRole, *titles: str) -> None:
+        """Record that the given titles resolve to global_role."""
+        if cls._title_role_map is None:
+            return
+        with cls._title_role_map_lock:
+            for title in titles:
+                key = cls._title_key(title)
+                if key:
+                    cls._title_role_map[key] = global_role.id
+    
+    @classmethod
+    def invalidate_title_role_cache(cls) -> None:
+        """Drop the cached title-key → GlobalRole map (e.g. after roles are merged)."""
+        with cls._title_role_map_lock:
+            cls._title_role_map = None
+            cls._title_role_map_expires_at = 0.0
+    
+    def _lookup_cached_role(self, job_title: str) -> Optional[GlobalRole]:
+        """
+        Resolve a job title by exact match on its normalized form (names and aliases).
+        
+        Args:
+            job_title: Raw job title
+        
+        Returns:
+            Matching GlobalRole, or None on a miss
+        """
+        key = self._title_key(job_title)
+        if not key:
+            return None
+        
+        role_id = self._get_title_role_map().get(key)
+        if role_id is None:
+            return None
+        
+        global_role = db.session.get(GlobalRole, role_id)
+        if global_role is None:
+            # Role was deleted (e.g. merged away) since the map was built
+            self.invalidate_title_role_cache()
+        return global_role
+    
+    @staticmethod
+    def _add_role_aliases(global_role: GlobalRole, *titles: str) -> None:
+        """Append titles to global_role.aliases (case-insensitive de-dup, skips the name)."""
+        aliases = list(global_role.aliases or [])
+        known = {alias.lower() for alias in aliases}
+        known.add(global_role.name.lower())
+        changed = False
+        for title in titles:
+            if title and title.lower() not in known:
+                aliases.append(title)
+                known.add(title.lower())
+                changed = True
+        if changed:
+            global_role.aliases = aliases
+    
     def normalize_job_title(
         self,
         job_title: str,
@@ -691,9 +846,11 @@ Return ONLY the normalized job title, nothing else."""
         This enables job matching: candidates with matching preferred roles will
         automatically see jobs linked to the same GlobalRole.
         
-        Uses a lower similarity threshold (75%) than candidate roles since job titles
-        tend to be more verbose. Also performs a secondary embedding check after AI
-        normalization to prevent creating duplicate roles.
+        The title is first looked up in the normalized-title cache (role names and
+        aliases), which needs no API call. On a miss it uses a lower similarity
+        threshold (75%) than candidate roles since job titles tend to be more
+        verbose. Also performs a secondary embedding check after AI normalization
+        to prevent creating duplicate roles.
         
         Args:
             job_title: Raw job title (e.g., "Senior Python Developer")
@@ -701,115 +858,46 @@ Return ONLY the normalized job title, nothing else."""
         
         Returns:
             Tuple of (GlobalRole, similarity_score, method)
-            method: "embedding_match" or "ai_created"
+            method: "cache_match", "embedding_match" or "ai_created"
             Returns (None, 0.0, "error") if normalization fails
         """
-        from app.models.role_job_mapping import RoleJobMapping
-        from app.models.job_posting import JobPosting
-        
         logger.info(f"Normalizing job title '{job_title}' for job {job_posting_id}")
         
         try:
-            # Step 1: Generate embedding for job title
-            job_embedding = self.embedding_service.generate_embedding(
-                job_title,
-                task_type="SEMANTIC_SIMILARITY"
-            )
-            
-            # Step 2: Search for similar existing roles with lower threshold for jobs
-            similar_role = self._find_similar_role(job_embedding, threshold=self.JOB_SIMILARITY_THRESHOLD)
-            
-            if similar_role:
-                global_role = similar_role["role"]
-                similarity = similar_role["similarity"]
-                method = "embedding_match"
-                
-                logger.info(
-                    f"Found existing role '{global_role.name}' with {similarity:.2%} similarity for job title"
-                )
-                
-                # Add job title to aliases if not already there
-                if job_title.lower() not in [alias.lower() for alias in (global_role.aliases or [])]:
-                    aliases = list(global_role.aliases or [])
-                    aliases.append(job_title)
-                    global_role.aliases = aliases
+            # Step 0: Exact match on the normalized title (no API call)
+            global_role = self._lookup_cached_role(job_title)
+            if global_role:
+                similarity = 1.0
+                method = "cache_match"
             else:
-                # Step 3: No embedding match - call Gemini AI to normalize (SLOW PATH)
-                # Feed existing role names into the prompt to encourage reuse
-                existing_roles = self._get_existing_role_names()
-                canonical_name = self._ai_normalize_role_with_existing(job_title, existing_roles)
-                
-                logger.info(f"AI normalized job title '{job_title}' to '{canonical_name}'")
+                # Step 1: Generate embedding for job title
+                job_embedding = self.embedding_service.generate_embedding(
+                    job_title,
+                    task_type="SEMANTIC_SIMILARITY"
+                )
                 
-                # Check if AI-normalized name already exists (exact match)
-                stmt = select(GlobalRole).where(GlobalRole.name == canonical_name)
-                existing = db.session.scalar(stmt)
+                # Step 2: Search for similar existing roles with lower threshold for jobs
+                similar_role = self._find_similar_role(job_embedding, threshold=self.JOB_SIMILARITY_THRESHOLD)
                 
-                if existing:
-                    # AI normalized to an existing role
-                    global_role = existing
-                    similarity = 1.0  # Exact match after AI
+                if similar_role:
+                    global_role = similar_role["role"]
+                    similarity = similar_role["similarity"]
+                    method = "embedding_match"
                     
-                    # Add job title to aliases
-                    if job_title.lower() not in [alias.lower() for alias in (existing.aliases or [])]:
-                        aliases = list(existing.aliases or [])
-                        aliases.append(job_title)
-                        existing.aliases = aliases
-                else:
-                    # Step 3b: Secondary embedding check — generate embedding for the
-                    # AI-normalized canonical name and search again. This catches cases
-                    # like "Python Engineer" vs "Python Developer" that are semantically
-                    # identical but have different string names.
-                    canonical_embedding = self.embedding_service.generate_embedding(
-                        canonical_name,
-                        task_type="SEMANTIC_SIMILARITY"
-                    )
-                    secondary_match = self._find_similar_role(
-                        canonical_embedding, threshold=self.SIMILARITY_THRESHOLD
+                    logger.info(
+                        f"Found existing role '{global_role.name}' with {similarity:.2%} similarity for job title"
                     )
                     
-                    if secondary_match:
-                        # Found a match via secondary embedding check
-                        global_role = secondary_match["role"]
-                        similarity = secondary_match["similarity"]
-                        
-                        logger.info(
-                            f"Secondary embedding match: AI canonical '{canonical_name}' "
-                            f"matched existing role '{global_role.name}' ({similarity:.2%})"
-                        )
-                        
-                        # Add both the original job title and canonical name as aliases
-                        aliases = list(global_role.aliases or [])
-                        for alias in [job_title, canonical_name]:
-                            if alias.lower() not in [a.lower() for a in aliases]:
-                                aliases.append(alias)
-                        global_role.aliases = aliases
-                    else:
-                        # Truly new role — create it
-                        global_role = GlobalRole(
-                            name=canonical_name,
-                            embedding=canonical_embedding,
-                            aliases=[job_title] if job_title.lower() != canonical_name.lower() else [],
-                            queue_status='approved',  # Job-sourced roles are auto-approved (real jobs exist)
-                            priority='normal'
-                        )
-                        db.session.add(global_role)
-                        db.session.flush()  # Get ID
-                        similarity = 1.0
-                        
-                        logger.info(
-                            f"Created new role '{canonical_name}' for job title '{job_title}'"
-                        )
-                
-                method = "ai_created"
-            
-            # Step 4: Link job to role via RoleJobMapping
-            self._link_job_to_role(job_posting_id, global_role)
+                    # Add job title to aliases if not already there
+                    self._add_role_aliases(global_role, job_title)
+                    self._remember_titles(global_role, job_title)
+                else:
+                    # Step 3: No embedding match - call Gemini AI to normalize (SLOW PATH)
+                    global_role, similarity = self._resolve_new_job_title(job_title)
+                    method = "ai_created"
             
-            # Step 5: Update job's normalized_role_id directly
-            job = db.session.get(JobPosting, job_posting_id)
-            if job:
-                job.normalized_role_id = global_role.id
+            # Step 4: Link job to role via RoleJobMapping and set normalized_role_id
+            self._attach_job_to_role(job_posting_id, global_role)
             
             # Use flush() instead of commit() - let the caller manage the transaction
             # This is called from email_job_parser_service which batches multiple operations
@@ -822,13 +910,284 @@ Return ONLY the normalized job title, nothing else."""
             )
             
             return global_role, similarity, method
-            
+        
         except Exception as e:
             logger.error(f"Failed to normalize job title '{job_title}': {e}", exc_info=True)
             # Don't rollback here - let the caller handle the transaction
             # Rollback here would undo ALL pending work including the job posting
             return None, 0.0, "error"
     
+    def normalize_job_titles_batch(
+        self,
+        jobs: List[Tuple[int, str]]
+    ) -> Dict[int, Tuple[Optional[GlobalRole], float, str]]:
+        """
+        Normalize many job titles at once and link each job to its GlobalRole.
+        
+        Titles are de-duplicated by normalized form, so "Senior Java Developer"
+        appearing 500 times costs one resolution. Per distinct title:
+        1. Exact match against the normalized-title cache (no API call)
+        2. Remaining titles are embedded in ONE generate_batch_embeddings call and
+           matched against an in-memory matrix of all role embeddings (one
+           generate_embedding call per title if the batch call fails)
+        3. Titles still unmatched go through the AI slow path one by one
+        
+        Each distinct title is resolved inside a savepoint so one failure does not
+        undo the others. Does not commit - the caller manages the transaction.
+        
+        Args:
+            jobs: List of (job_posting_id, job_title) tuples
+        
+        Returns:
+            Dict mapping job_posting_id to (GlobalRole, similarity_score, method);
+            (None, 0.0, "error") for jobs that could not be normalized
+        """
+        results: Dict[int, Tuple[Optional[GlobalRole], float, str]] = {}
+        
+        # De-duplicate titles by normalized key (first raw spelling wins)
+        titles_by_key: Dict[str, str] = {}
+        job_ids_by_key: Dict[str, List[int]] = {}
+        for job_id, job_title in jobs:
+            key = self._title_key(job_title)
+            if not key:
+                results[job_id] = (None, 0.0, "error")
+                continue
+            titles_by_key.setdefault(key, job_title.strip())
+            job_ids_by_key.setdefault(key, []).append(job_id)
+        
+        if not titles_by_key:
+            return results
+        
+        # Pass 1: exact cache hits
+        resolved: Dict[str, Tuple[GlobalRole, float, str]] = {}
+        for key, job_title in titles_by_key.items():
+            global_role = self._lookup_cached_role(job_title)
+            if global_role:
+                resolved[key] = (global_role, 1.0, "cache_match")
+        
+        misses = [key for key in titles_by_key if key not in resolved]
+        logger.info(
+            f"Batch job title normalization: {len(jobs)} jobs, {len(titles_by_key)} distinct titles, "
+            f"{len(resolved)} cache hits, {len(misses)} misses"
+        )
+        
+        # Pass 2: one embedding call for all misses, matched in memory
+        unmatched: List[str] = []
+        if misses:
+            embedded_keys = misses
+            try:
+                embeddings = self.embedding_service.generate_batch_embeddings(
+                    [titles_by_key[key] for key in misses],
+                    task_type="SEMANTIC_SIMILARITY"
+                )
+            except Exception as e:
+                # Fall back to one embedding call per title; titles that still
+                # fail are reported as errors
+                logger.warning(
+                    f"Batch embedding of {len(misses)} job titles failed, embedding one by one: {e}"
+                )
+                embedded_keys, embeddings = [], []
+                for key in misses:
+                    try:
+                        embeddings.append(self.embedding_service.generate_embedding(
+                            titles_by_key[key],
+                            task_type="SEMANTIC_SIMILARITY"
+                        ))
+                        embedded_keys.append(key)
+                    except Exception as title_error:
+                        logger.error(f"Failed to embed job title '{titles_by_key[key]}': {title_error}")
+            
+            try:
+                matches = self._match_embeddings_to_roles(embeddings, self.JOB_SIMILARITY_THRESHOLD)
+            except Exception as e:
+                logger.error(f"Matching {len(embeddings)} job title embeddings failed: {e}", exc_info=True)
+                embedded_keys, matches = [], []
+            
+            for key, match in zip(embedded_keys, matches):
+                if match:
+                    global_role, similarity = match
+                    self._add_role_aliases(global_role, titles_by_key[key])
+                    self._remember_titles(global_role, titles_by_key[key])
+                    resolved[key] = (global_role, similarity, "embedding_match")
+                else:
+                    unmatched.append(key)
+        
+        # Pass 3: AI slow path for titles nothing existing matched
+        existing_roles = self._get_existing_role_names() if unmatched else []
+        for key in unmatched:
+            job_title = titles_by_key[key]
+            # An earlier title in this batch may have created or aliased the role
+            global_role = self._lookup_cached_role(job_title)
+            if global_role:
+                resolved[key] = (global_role, 1.0, "cache_match")
+                continue
+            savepoint = db.session.begin_nested()
+            try:
+                global_role, similarity = self._resolve_new_job_title(job_title, existing_roles)
+                savepoint.commit()
+                resolved[key] = (global_role, similarity, "ai_created")
+                if global_role.name not in existing_roles:
+                    existing_roles.append(global_role.name)
+            except Exception as e:
+                savepoint.rollback()
+                logger.error(f"Failed to normalize job title '{job_title}': {e}", exc_info=True)
+        
+        # Link every job to its title's role
+        for key, job_ids in job_ids_by_key.items():
+            if key not in resolved:
+                for job_id in job_ids:
+                    results[job_id] = (None, 0.0, "error")
+                continue
+            
+            global_role, similarity, method = resolved[key]
+            savepoint = db.session.begin_nested()
+            try:
+                for job_id in job_ids:
+                    self._attach_job_to_role(job_id, global_role)
+                savepoint.commit()
+                for job_id in job_ids:
+                    results[job_id] = (global_role, similarity, method)
+            except Exception as e:
+                savepoint.rollback()
+                logger.error(
+                    f"Failed to link {len(job_ids)} jobs to role '{global_role.name}': {e}",
+                    exc_info=True
+                )
+                for job_id in job_ids:
+                    results[job_id] = (None, 0.0, "error")
+        
+        return results
+    
+    def _match_embeddings_to_roles(
+        self,
+        embeddings: List[List[float]],
+        threshold: float
+    ) -> List[Optional[Tuple[GlobalRole, float]]]:
+        """
+        Find the most similar role for each embedding.
+        
+        Scores all query embeddings against the in-memory role embedding index
+        with a single matrix product, instead of one pgvector query per title.
+        Falls back to _find_similar_role per embedding if the index is unavailable.
+        
+        Args:
+            embeddings: Query embedding vectors
+            threshold: Minimum cosine similarity for a match
+        
+        Returns:
+            One (GlobalRole, similarity) or None per input embedding, in order
+        """
+        index_matches = RoleEmbeddingIndex.search_many(embeddings, threshold)
+        
+        matches: List[Optional[Tuple[GlobalRole, float]]] = []
+        for idx, embedding in enumerate(embeddings):
+            match = index_matches[idx] if index_matches is not None else None
+            global_role = db.session.get(GlobalRole, match[0]) if match else None
+            if global_role:
+                matches.append((global_role, match[1]))
+                continue
+            if index_matches is not None and not match:
+                matches.append(None)
+                continue
+            # Index unavailable or stale (matched role was deleted)
+            if match:
+                RoleEmbeddingIndex.invalidate()
+            similar = self._find_similar_role(embedding, threshold=threshold)
+            matches.append((similar["role"], similar["similarity"]) if similar else None)
+        return matches
+    
+    def _resolve_new_job_title(
+        self,
+        job_title: str,
+        existing_roles: Optional[List[str]] = None
+    ) -> Tuple[GlobalRole, float]:
+        """
+        AI slow path: normalize a title no existing role matched, reusing a role when possible.
+        
+        Feeds existing role names into the prompt to encourage reuse, then checks
+        the canonical name by exact match and by a secondary embedding search
+        before creating a new role.
+        
+        Args:
+            job_title: Raw job title
+            existing_roles: Existing role names for the prompt (loaded if None)
+        
+        Returns:
+            Tuple of (GlobalRole, similarity_score)
+        """
+        if existing_roles is None:
+            existing_roles = self._get_existing_role_names()
+        canonical_name = self._ai_normalize_role_with_existing(job_title, existing_roles)
+        
+        logger.info(f"AI normalized job title '{job_title}' to '{canonical_name}'")
+        
+        # Check if AI-normalized name already exists (exact match)
+        stmt = select(GlobalRole).where(GlobalRole.name == canonical_name)
+        existing = db.session.scalar(stmt)
+        
+        if existing:
+            # AI normalized to an existing role
+            global_role = existing
+            similarity = 1.0  # Exact match after AI
+            
+            # Add job title to aliases
+            self._add_role_aliases(existing, job_title)
+        else:
+            # Secondary embedding check — generate embedding for the
+            # AI-normalized canonical name and search again. This catches cases
+            # like "Python Engineer" vs "Python Developer" that are semantically
+            # identical but have different string names.
+            canonical_embedding = self.embedding_service.generate_embedding(
+                canonical_name,
+                task_type="SEMANTIC_SIMILARITY"
+            )
+            secondary_match = self._find_similar_role(
+                canonical_embedding, threshold=self.SIMILARITY_THRESHOLD
+            )
+            
+            if secondary_match:
+                # Found a match via secondary embedding check
+                global_role = secondary_match["role"]
+                similarity = secondary_match["similarity"]
+                
+                logger.info(
+                    f"Secondary embedding match: AI canonical '{canonical_name}' "
+                    f"matched existing role '{global_role.name}' ({similarity:.2%})"
+                )
+                
+                # Add both the original job title and canonical name as aliases
+                self._add_role_aliases(global_role, job_title, canonical_name)
+            else:
+                # Truly new role — create it
+                global_role = GlobalRole(
+                    name=canonical_name,
+                    embedding=canonical_embedding,
+                    aliases=[job_title] if job_title.lower() != canonical_name.lower() else [],
+                    queue_status='approved',  # Job-sourced roles are auto-approved (real jobs exist)
+                    priority='normal'
+                )
+                db.session.add(global_role)
+                db.session.flush()  # Get ID
+                RoleEmbeddingIndex.add_role(global_role.id, canonical_embedding)
+                similarity = 1.0
+                
+                logger.info(
+                    f"Created new role '{canonical_name}' for job title '{job_title}'"
+                )
+        
+        self._remember_titles(global_role, job_title, canonical_name)
+        return global_role, similarity
+    
+    def _attach_job_to_role(self, job_posting_id: int, global_role: GlobalRole):
+        """Link a job to global_role (RoleJobMapping) and set its normalized_role_id."""
+        from app.models.job_posting import JobPosting
+        
+        self._link_job_to_role(job_posting_id, global_role)
+        
+        job = db.session.get(JobPosting, job_posting_id)
+        if job:
+            job.normalized_role_id = global_role.id
+    
     def _link_job_to_role(self, job_posting_id: int, global_role: GlobalRole):
         """
         Link a job posting to a global role via RoleJobMapping.
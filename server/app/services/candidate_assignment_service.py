@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, exists, func, literal, null, cast, union_all, Integer, DateTime
 
 from app import db
 from app.models import (
@@ -437,12 +437,151 @@ class CandidateAssignmentService:
 
         return result
 
+    # Assignment statuses shown as ACTIVE in the "my candidates" view
+    ACTIVE_ASSIGNMENT_STATUSES = ['PENDING', 'ACCEPTED', 'ACTIVE']
+
     @staticmethod
-    def get_user_assigned_candidates(
+    def _assigned_candidates_query(
         user_id: int,
         tenant_id: int,
         status_filter: Optional[str] = None,
         include_completed: bool = False
+    ):
+        """
+        Build the projection-only query behind get_user_assigned_candidates.
+
+        One UNION ALL statement returns explicit assignments (joined to their
+        candidate) followed by broadcast-visible candidates. Only the columns the
+        listing needs are selected, so heavy candidate columns (embedding, parsed
+        resume data, ...) are never loaded.
+
+        Args:
+            user_id: ID of user
+            tenant_id: Tenant ID for security
+            status_filter: Optional filter by assignment status
+            include_completed: If True, include completed/cancelled assignments
+
+        Returns:
+            Selectable with one row per listed candidate, ordered for display
+        """
+        # Frontend uses ACTIVE to mean PENDING, ACCEPTED, or ACTIVE (broadcast)
+        status_condition = None
+        if status_filter:
+            if status_filter == 'ACTIVE':
+                status_condition = CandidateAssignment.status.in_(CandidateAssignmentService.ACTIVE_ASSIGNMENT_STATUSES)
+            else:
+                status_condition = CandidateAssignment.status == status_filter
+        elif not include_completed:
+            status_condition = CandidateAssignment.status.in_(CandidateAssignmentService.ACTIVE_ASSIGNMENT_STATUSES)
+
+        assignment_conditions = [
+            CandidateAssignment.assigned_to_user_id == user_id,
+            Candidate.tenant_id == tenant_id,
+        ]
+        if status_condition is not None:
+            assignment_conditions.append(status_condition)
+
+        # Part 1: candidates with explicit assignments to this user
+        assigned = select(
+            Candidate.id.label('candidate_id'),
+            Candidate.first_name,
+            Candidate.last_name,
+            Candidate.email,
+            Candidate.phone,
+            Candidate.onboarding_status,
+            Candidate.is_visible_to_all_team,
+            CandidateAssignment.id.label('assignment_id'),
+            CandidateAssignment.assigned_to_user_id,
+            CandidateAssignment.assigned_by_user_id,
+            CandidateAssignment.assignment_type,
+            CandidateAssignment.status,
+            CandidateAssignment.assignment_reason,
+            CandidateAssignment.assigned_at,
+            CandidateAssignment.completed_at,
+            literal(0).label('source_rank'),
+        ).join(
+            Candidate, CandidateAssignment.candidate_id == Candidate.id
+        ).where(*assignment_conditions)
+
+        # Part 2: broadcast-visible candidates (only when showing active)
+        if status_filter == 'ACTIVE' or (not status_filter and not include_completed):
+            # Exclude candidates already listed through an explicit assignment
+            already_assigned_conditions = [
+                CandidateAssignment.candidate_id == Candidate.id,
+                CandidateAssignment.assigned_to_user_id == user_id,
+            ]
+            if status_condition is not None:
+                already_assigned_conditions.append(status_condition)
+            already_assigned = select(CandidateAssignment.id).where(*already_assigned_conditions)
+            broadcast = select(
+                Candidate.id.label('candidate_id'),
+                Candidate.first_name,
+                Candidate.last_name,
+                Candidate.email,
+                Candidate.phone,
+                Candidate.onboarding_status,
+                Candidate.is_visible_to_all_team,
+                cast(null(), Integer).label('assignment_id'),
+                cast(null(), Integer).label('assigned_to_user_id'),
+                cast(null(), Integer).label('assigned_by_user_id'),
+                literal('BROADCAST').label('assignment_type'),
+                literal('ACTIVE').label('status'),
+                literal('Visible to all team members').label('assignment_reason'),
+                Candidate.updated_at.label('assigned_at'),
+                cast(null(), DateTime).label('completed_at'),
+                literal(1).label('source_rank'),
+            ).where(
+                Candidate.tenant_id == tenant_id,
+                Candidate.is_visible_to_all_team == True,
+                ~exists(already_assigned)
+            )
+            listing = union_all(assigned, broadcast).subquery('assigned_candidates')
+        else:
+            listing = assigned.subquery('assigned_candidates')
+
+        # Explicit assignments first (newest first), then broadcast candidates (recently updated first)
+        return select(listing).order_by(
+            listing.c.source_rank,
+            listing.c.assigned_at.desc(),
+            listing.c.candidate_id.desc()
+        )
+
+    @staticmethod
+    def _assigned_candidate_row_to_dict(row) -> Dict:
+        """Convert a row of _assigned_candidates_query into the API dictionary."""
+        # Map PENDING/ACCEPTED/ACTIVE to ACTIVE for frontend compatibility
+        display_status = row.status
+        if row.status in CandidateAssignmentService.ACTIVE_ASSIGNMENT_STATUSES:
+            display_status = 'ACTIVE'
+
+        return {
+            'id': row.candidate_id,
+            'first_name': row.first_name,
+            'last_name': row.last_name,
+            'email': row.email,
+            'phone': row.phone,
+            'onboarding_status': row.onboarding_status,
+            'is_visible_to_all_team': row.is_visible_to_all_team,
+            'current_assignment': {
+                'id': row.assignment_id,
+                'assigned_to_user_id': row.assigned_to_user_id,
+                'assigned_by_user_id': row.assigned_by_user_id,
+                'assignment_type': row.assignment_type,
+                'status': display_status,
+                'assignment_reason': row.assignment_reason,
+                'assigned_at': row.assigned_at.isoformat() if row.assigned_at else None,
+                'completed_at': row.completed_at.isoformat() if row.completed_at else None,
+            }
+        }
+
+    @staticmethod
+    def get_user_assigned_candidates(
+        user_id: int,
+        tenant_id: int,
+        status_filter: Optional[str] = None,
+        include_completed: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict]:
         """
         Get all candidates assigned to a user.
@@ -453,6 +592,8 @@ class CandidateAssignmentService:
             tenant_id: Tenant ID for security
             status_filter: Optional filter by assignment status
             include_completed: If True, include completed/cancelled assignments
+            limit: Optional page size (applied in SQL)
+            offset: Rows to skip (applied in SQL)
 
         Returns:
             List of candidate dictionaries with assignment info
@@ -468,107 +609,46 @@ class CandidateAssignmentService:
         if user.tenant_id != tenant_id:
             raise ValueError("User does not belong to the specified tenant")
 
-        result = []
-        seen_candidate_ids = set()
-
-        # Part 1: Get candidates with explicit assignments to this user
-        query = select(CandidateAssignment).where(
-            CandidateAssignment.assigned_to_user_id == user_id
+        query = CandidateAssignmentService._assigned_candidates_query(
+            user_id, tenant_id, status_filter, include_completed
         )
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
 
-        # Filter by status
-        # Frontend uses ACTIVE to mean PENDING, ACCEPTED, or ACTIVE (broadcast)
-        if status_filter:
-            if status_filter == 'ACTIVE':
-                query = query.where(
-                    CandidateAssignment.status.in_(['PENDING', 'ACCEPTED', 'ACTIVE'])
-                )
-            else:
-                query = query.where(CandidateAssignment.status == status_filter)
-        elif not include_completed:
-            # By default, show only active assignments (including broadcast)
-            query = query.where(
-                CandidateAssignment.status.in_(['PENDING', 'ACCEPTED', 'ACTIVE'])
-            )
+        result = [
+            CandidateAssignmentService._assigned_candidate_row_to_dict(row)
+            for row in db.session.execute(query)
+        ]
 
-        query = query.order_by(CandidateAssignment.assigned_at.desc())
+        logger.debug(f"Retrieved {len(result)} assigned candidates for user {user_id}")
 
-        assignments = list(db.session.scalars(query))
+        return result
 
-        # Get candidate details with assignment info
-        for assignment in assignments:
-            if assignment.candidate:
-                seen_candidate_ids.add(assignment.candidate.id)
-                
-                # Map PENDING/ACCEPTED/ACTIVE to ACTIVE for frontend compatibility
-                display_status = assignment.status
-                if assignment.status in ['PENDING', 'ACCEPTED', 'ACTIVE']:
-                    display_status = 'ACTIVE'
-                    
-                candidate_dict = {
-                    'id': assignment.candidate.id,
-                    'first_name': assignment.candidate.first_name,
-                    'last_name': assignment.candidate.last_name,
-                    'email': assignment.candidate.email,
-                    'phone': assignment.candidate.phone,
-                    'onboarding_status': assignment.candidate.onboarding_status,
-                    'is_visible_to_all_team': assignment.candidate.is_visible_to_all_team,
-                    'current_assignment': {
-                        'id': assignment.id,
-                        'assigned_to_user_id': assignment.assigned_to_user_id,
-                        'assigned_by_user_id': assignment.assigned_by_user_id,
-                        'assignment_type': assignment.assignment_type,
-                        'status': display_status,
-                        'assignment_reason': assignment.assignment_reason,
-                        'assigned_at': assignment.assigned_at.isoformat() if assignment.assigned_at else None,
-                        'completed_at': assignment.completed_at.isoformat() if assignment.completed_at else None,
-                    }
-                }
-                result.append(candidate_dict)
-
-        # Part 2: Get candidates with is_visible_to_all_team=True (only if showing active)
-        # These are automatically visible to all team members without explicit assignment
-        if status_filter == 'ACTIVE' or (not status_filter and not include_completed):
-            # Build the query for broadcast candidates
-            broadcast_conditions = [
-                Candidate.tenant_id == tenant_id,
-                Candidate.is_visible_to_all_team == True,
-            ]
-            # Exclude candidates already added from explicit assignments
-            if seen_candidate_ids:
-                broadcast_conditions.append(~Candidate.id.in_(seen_candidate_ids))
-            
-            broadcast_candidates_query = select(Candidate).where(
-                *broadcast_conditions
-            ).order_by(Candidate.updated_at.desc())
-
-            broadcast_candidates = list(db.session.scalars(broadcast_candidates_query))
-
-            for candidate in broadcast_candidates:
-                candidate_dict = {
-                    'id': candidate.id,
-                    'first_name': candidate.first_name,
-                    'last_name': candidate.last_name,
-                    'email': candidate.email,
-                    'phone': candidate.phone,
-                    'onboarding_status': candidate.onboarding_status,
-                    'is_visible_to_all_team': candidate.is_visible_to_all_team,
-                    'current_assignment': {
-                        'id': None,  # No explicit assignment record
-                        'assigned_to_user_id': None,
-                        'assigned_by_user_id': None,
-                        'assignment_type': 'BROADCAST',
-                        'status': 'ACTIVE',
-                        'assignment_reason': 'Visible to all team members',
-                        'assigned_at': candidate.updated_at.isoformat() if candidate.updated_at else None,
-                        'completed_at': None,
-                    }
-                }
-                result.append(candidate_dict)
+    @staticmethod
+    def count_user_assigned_candidates(
+        user_id: int,
+        tenant_id: int,
+        status_filter: Optional[str] = None,
+        include_completed: bool = False
+    ) -> int:
+        """
+        Count the rows get_user_assigned_candidates would return (without pagination).
 
-        logger.debug(f"Retrieved {len(result)} assigned candidates for user {user_id}")
+        Args:
+            user_id: ID of user
+            tenant_id: Tenant ID for security
+            status_filter: Optional filter by assignment status
+            include_completed: If True, include completed/cancelled assignments
 
-        return result
+        Returns:
+            Total number of listed candidates
+        """
+        listing = CandidateAssignmentService._assigned_candidates_query(
+            user_id, tenant_id, status_filter, include_completed
+        ).order_by(None).subquery()
+        return db.session.scalar(select(func.count()).select_from(listing)) or 0
 
     @staticmethod
     def get_assignment_history(
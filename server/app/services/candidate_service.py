@@ -444,7 +444,7 @@ class CandidateService:
             candidate_id: Candidate ID
             tenant_id: Optional tenant ID for access control
         """
-        candidate = db.session.get(Candidate, candidate_id)
+        candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_description()])
         
         if candidate and tenant_id and candidate.tenant_id != tenant_id:
             return None  # Access denied
@@ -491,8 +491,8 @@ class CandidateService:
             from sqlalchemy.dialects.postgresql import array
             query = query.where(Candidate.skills.overlap(skills))
         
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
+        # Count total (id only, so the count never touches heavy columns)
+        count_query = select(func.count()).select_from(query.with_only_columns(Candidate.id).subquery())
         total = db.session.scalar(count_query)
         
         # Paginate
@@ -1097,7 +1097,7 @@ class CandidateService:
         # Paginate
         offset = (page - 1) * per_page
         total = query.count()
-        candidates = query.limit(per_page).offset(offset).all()
+        candidates = query.options(Candidate.with_description()).limit(per_page).offset(offset).all()
         
         return {
             'candidates': [c.to_dict(include_assignments=False, include_onboarding_users=True) for c in candidates],
@@ -1215,7 +1215,7 @@ class CandidateService:
         
         query = query.filter(or_(*match_conditions))
         
-        candidates = query.all()
+        candidates = query.options(Candidate.with_description()).all()
         
         for candidate in candidates:
             match_reasons = []
@@ -16,6 +16,7 @@ from app.models.processed_email import ProcessedEmail
 from app.models.user_email_integration import UserEmailIntegration
 from app.services.oauth.gmail_oauth import gmail_oauth_service
 from app.services.oauth.outlook_oauth import outlook_oauth_service
+from app.services.processed_email_service import ProcessedEmailService
 from app.utils.encryption import token_encryption
 
 logger = logging.getLogger(__name__)
@@ -326,6 +327,7 @@ class EmailIntegrationService:
         db.session.delete(integration)
         db.session.commit()
         db.session.expire_all()
+        ProcessedEmailService.forget_integration(integration_id)
         
         logger.info(f"Disconnected {integration.provider} integration for user {user_id}")
         return True
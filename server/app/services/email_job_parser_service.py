@@ -23,6 +23,8 @@ from app import db
 from app.models.job_posting import JobPosting
 from app.models.processed_email import ProcessedEmail
 from app.models.user_email_integration import UserEmailIntegration
+from app.services.job_posting_stats_service import JobPostingStatsService, JobStatsDelta
+from app.services.processed_email_service import ProcessedEmailService
 from app.utils.circuit_breaker import gemini_circuit_breaker, CircuitBreakerError
 from config.settings import settings
 
@@ -143,7 +145,11 @@ Important:
                 
                 integration.emails_processed_count = (integration.emails_processed_count or 0) + 1
                 integration.jobs_created_count = (integration.jobs_created_count or 0) + 1
+                stats_delta = JobStatsDelta()
+                stats_delta.add(job)
+                JobPostingStatsService.record_imported_jobs(stats_delta)
                 db.session.commit()
+                ProcessedEmailService.remember(integration.id, [email_id])
                 
                 logger.info(f"Created job posting {job.id} from email {email_id}")
             else:
@@ -160,6 +166,7 @@ Important:
                 skip_reason=str(e)[:500],
             )
             db.session.commit()
+            ProcessedEmailService.remember(integration.id, [email_id])
             return None
     
     def parse_emails_to_jobs_batch(
@@ -194,19 +201,21 @@ Important:
             
             results = []
             jobs_created = 0
+            stats_delta = JobStatsDelta()
+            processed_rows = []
             
             for email_data, job_data in zip(emails_data, extracted_jobs):
                 email_id = email_data.get("email_id")
                 
                 if not job_data or not job_data.get("title"):
                     logger.warning(f"Could not extract job from email {email_id} in batch")
-                    self._record_processed_email(
+                    processed_rows.append(self._processed_email_row(
                         integration=integration,
                         email_data=email_data,
                         result="failed",
                         skip_reason="no_job_extracted",
                         confidence=job_data.get("confidence_score") if job_data else None,
-                    )
+                    ))
                     results.append((None, email_data))
                     continue
                 
@@ -224,14 +233,15 @@ Important:
                     continue
                 
                 if is_new:
-                    self._record_processed_email(
+                    processed_rows.append(self._processed_email_row(
                         integration=integration,
                         email_data=email_data,
                         result="job_created",
                         job_id=job.id,
                         confidence=job_data.get("confidence_score"),
-                    )
+                    ))
                     jobs_created += 1
+                    stats_delta.add(job)
                     logger.info(f"Batch created job {job.id} from email {email_id}")
                 else:
                     logger.info(f"Batch found existing job {job.id} for email {email_id}")
@@ -240,7 +250,11 @@ Important:
             
             integration.emails_processed_count = (integration.emails_processed_count or 0) + len(emails_data)
             integration.jobs_created_count = (integration.jobs_created_count or 0) + jobs_created
+            JobPostingStatsService.record_imported_jobs(stats_delta)
+            # One multi-row insert for the whole batch
+            ProcessedEmailService.record(processed_rows)
             db.session.commit()
+            ProcessedEmailService.remember(integration.id, [row["email_message_id"] for row in processed_rows])
             
             logger.info(f"Batch processing complete: {jobs_created} new jobs created from {len(emails_data)} emails")
             return results
@@ -251,14 +265,18 @@ Important:
             # Without this, the session is in a PendingRollback state and any operations will fail
             db.session.rollback()
             
-            for email_data in emails_data:
-                self._record_processed_email(
+            error_rows = [
+                self._processed_email_row(
                     integration=integration,
                     email_data=email_data,
                     result="error",
                     skip_reason=f"Batch error: {str(e)[:450]}",
                 )
+                for email_data in emails_data
+            ]
+            ProcessedEmailService.record(error_rows)
             db.session.commit()
+            ProcessedEmailService.remember(integration.id, [row["email_message_id"] for row in error_rows])
             return [(None, email_data) for email_data in emails_data]
     
     def _extract_job_details(
@@ -961,6 +979,29 @@ Important:
             f"'{global_role.name}' (id={global_role_id}) — skipped AI normalization"
         )
     
+    def _processed_email_row(
+        self,
+        integration: UserEmailIntegration,
+        email_data: dict,
+        result: str,
+        job_id: Optional[int] = None,
+        skip_reason: Optional[str] = None,
+        confidence: Optional[float] = None,
+    ) -> dict:
+        """Build a processed_emails row for ProcessedEmailService.record()."""
+        return {
+            "integration_id": integration.id,
+            "tenant_id": integration.tenant_id,
+            "email_message_id": email_data.get("email_id", ""),
+            "email_thread_id": email_data.get("thread_id"),
+            "email_subject": email_data.get("subject", "")[:500],
+            "email_sender": email_data.get("sender", "")[:255],
+            "processing_result": result,
+            "job_id": job_id,
+            "skip_reason": skip_reason,
+            "parsing_confidence": confidence,
+        }
+    
     def _record_processed_email(
         self,
         integration: UserEmailIntegration,
@@ -969,25 +1010,11 @@ Important:
         job_id: Optional[int] = None,
         skip_reason: Optional[str] = None,
         confidence: Optional[float] = None,
-    ) -> ProcessedEmail:
-        """Record a processed email."""
-        processed = ProcessedEmail(
-            integration_id=integration.id,
-            tenant_id=integration.tenant_id,
-            email_message_id=email_data.get("email_id", ""),
-            email_thread_id=email_data.get("thread_id"),
-            email_subject=email_data.get("subject", "")[:500],
-            email_sender=email_data.get("sender", "")[:255],
-            processing_result=result,
-            job_id=job_id,
-            skip_reason=skip_reason,
-            parsing_confidence=confidence,
-        )
-        
-        db.session.add(processed)
-        db.session.flush()
-        
-        return processed
+    ) -> None:
+        """Record a processed email (no-op if the message is already recorded)."""
+        ProcessedEmailService.record([
+            self._processed_email_row(integration, email_data, result, job_id, skip_reason, confidence)
+        ])
     
     def reparse_email(
         self,
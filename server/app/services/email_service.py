@@ -5,14 +5,16 @@ Handles email sending with SMTP configuration per tenant
 import logging
 import smtplib
 import time
-import os
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from sqlalchemy import select
 
 from app import db
 from app.models.tenant import Tenant
+from app.utils.email_templates import render_email_template
+from app.utils.encryption import token_encryption
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -25,11 +27,60 @@ class EmailService:
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 2
     
+    # Process-local cache of resolved (decrypted) SMTP configs: tenant_id -> (expires_at, config)
+    _smtp_config_cache: Dict[int, Tuple[float, Optional[Dict]]] = {}
+    _smtp_config_cache_lock = threading.Lock()
+    
     @staticmethod
     def _get_tenant_smtp_config(tenant_id: int) -> Optional[Dict]:
         """
         Get SMTP configuration for a tenant.
+        
+        Resolved configs (including the decrypted password) are cached in-process
+        for settings.email_smtp_config_cache_ttl seconds, so bulk sends do no
+        per-message DB lookup or decryption. The cache is invalidated through
+        invalidate_smtp_config_cache() when tenant settings change.
+        
+        Args:
+            tenant_id: Tenant ID
+            
+        Returns:
+            SMTP config dict or None if not configured
+        """
+        now = time.monotonic()
+        cached = EmailService._smtp_config_cache.get(tenant_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        smtp_config = EmailService._load_tenant_smtp_config(tenant_id)
+        
+        ttl = settings.email_smtp_config_cache_ttl
+        if ttl > 0:
+            with EmailService._smtp_config_cache_lock:
+                EmailService._smtp_config_cache[tenant_id] = (now + ttl, smtp_config)
+        
+        return smtp_config
+    
+    @staticmethod
+    def invalidate_smtp_config_cache(tenant_id: Optional[int] = None) -> None:
+        """
+        Drop cached SMTP config for a tenant (or all tenants).
+        
+        Args:
+            tenant_id: Tenant ID, or None to clear the whole cache
+        """
+        with EmailService._smtp_config_cache_lock:
+            if tenant_id is None:
+                EmailService._smtp_config_cache.clear()
+            else:
+                EmailService._smtp_config_cache.pop(tenant_id, None)
+    
+    @staticmethod
+    def _load_tenant_smtp_config(tenant_id: int) -> Optional[Dict]:
+        """
+        Load SMTP configuration for a tenant from the database.
         First checks tenant.settings.smtp_config, falls back to global .env config.
+        A tenant password stored as 'password_encrypted' is decrypted here.
         
         Args:
             tenant_id: Tenant ID
@@ -44,7 +95,13 @@ class EmailService:
         
         # Try tenant-specific SMTP config first
         if tenant.settings and 'smtp_config' in tenant.settings:
-            smtp_config = tenant.settings['smtp_config']
+            smtp_config = dict(tenant.settings['smtp_config'])
+            
+            if 'password' not in smtp_config and smtp_config.get('password_encrypted'):
+                try:
+                    smtp_config['password'] = token_encryption.decrypt(smtp_config.pop('password_encrypted'))
+                except ValueError as e:
+                    logger.error(f"Failed to decrypt SMTP password for tenant {tenant_id}: {e}")
             
             # Validate required fields
             required_fields = ['host', 'port', 'username', 'password', 'from_email']
@@ -57,19 +114,32 @@ class EmailService:
         # Fall back to global SMTP config from .env
         if settings.smtp_enabled:
             logger.info(f"Using global SMTP config for tenant {tenant_id}")
-            return {
-                'host': settings.smtp_host,
-                'port': settings.smtp_port,
-                'username': settings.smtp_username,
-                'password': settings.smtp_password,
-                'from_email': settings.smtp_from_email,
-                'from_name': settings.smtp_from_name,
-                'use_tls': settings.smtp_use_tls
-            }
+            return EmailService._get_global_smtp_config()
         
         logger.warning(f"No SMTP config found for tenant {tenant_id}")
         return None
     
+    @staticmethod
+    def _get_global_smtp_config(default_from_name: Optional[str] = None) -> Dict:
+        """
+        Build SMTP configuration from global .env settings.
+        
+        Args:
+            default_from_name: Sender name used when settings.smtp_from_name is empty
+            
+        Returns:
+            SMTP config dict
+        """
+        return {
+            'host': settings.smtp_host,
+            'port': settings.smtp_port,
+            'username': settings.smtp_username,
+            'password': settings.smtp_password,
+            'from_email': settings.smtp_from_email,
+            'from_name': settings.smtp_from_name or default_from_name,
+            'use_tls': settings.smtp_use_tls
+        }
+    
     @staticmethod
     def _send_email(
         to: str,
@@ -171,75 +241,14 @@ class EmailService:
         
         subject = f"You're invited to join {company_name}"
         
-        # HTML email body
-        body_html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-            <h2 style="color: #2563eb;">{greeting},</h2>
-            
-            <p>We're excited to invite you to join <strong>{company_name}</strong>!</p>
-            
-            <p>To get started, please complete your candidate profile using the link below:</p>
-            
-            <p style="margin: 30px 0;">
-                <a href="{onboarding_url}" 
-                   style="background-color: #2563eb; color: white; padding: 12px 24px; 
-                          text-decoration: none; border-radius: 5px; display: inline-block;">
-                    Complete Your Profile
-                </a>
-            </p>
-            
-            <p><strong>Important:</strong> This link will expire on <strong>{expiry_date}</strong>. 
-               Please complete your profile before then.</p>
-            
-            <p><strong>What you'll need to do:</strong></p>
-            <ul>
-                <li>Fill in your personal and professional details</li>
-                <li>Upload your resume</li>
-                <li>Upload required documents (ID proof, work authorization, etc.)</li>
-            </ul>
-            
-            <p>If you have any questions, feel free to reach out to us.</p>
-            
-            <p>Looking forward to learning more about you!</p>
-            
-            <p>Best regards,<br>
-            <strong>{company_name} HR Team</strong></p>
-            
-            <hr style="margin-top: 30px; border: none; border-top: 1px solid #ddd;">
-            <p style="font-size: 12px; color: #666;">
-                This is an automated email. Please do not reply directly to this message.
-            </p>
-        </body>
-        </html>
-        """
-        
-        # Plain text fallback
-        body_text = f"""
-        {greeting},
-        
-        We're excited to invite you to join {company_name}!
-        
-        To get started, please complete your candidate profile using this link:
-        {onboarding_url}
-        
-        This link will expire on {expiry_date}. Please complete your profile before then.
-        
-        What you'll need to do:
-        - Fill in your personal and professional details
-        - Upload your resume
-        - Upload required documents (ID proof, work authorization, etc.)
-        
-        If you have any questions, feel free to reach out to us.
-        
-        Looking forward to learning more about you!
-        
-        Best regards,
-        {company_name} HR Team
-        
-        ---
-        This is an automated email. Please do not reply directly to this message.
-        """
+        template_context = {
+            'greeting': greeting,
+            'company_name': company_name,
+            'onboarding_url': onboarding_url,
+            'expiry_date': expiry_date,
+        }
+        body_html = render_email_template('invitation.html', **template_context)
+        body_text = render_email_template('invitation.txt', **template_context)
         
         return EmailService._send_email(
             to=to_email,
@@ -423,226 +432,16 @@ class EmailService:
             return False
         
         company_name = smtp_config.get('from_name', 'Our Company')
-        candidate_data = candidate_data or {}
-        hr_edited_fields = hr_edited_fields or []
-        
-        # Helper to format field with HR edit indicator
-        def format_field(label: str, value, field_name: str) -> str:
-            if not value:
-                return ""
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px; margin-left: 8px;">Updated by HR</span>' if field_name in hr_edited_fields else ""
-            return f'<tr><td style="padding: 8px 12px; color: #6b7280; width: 160px; vertical-align: top;">{label}</td><td style="padding: 8px 12px;"><strong>{value}</strong>{edit_badge}</td></tr>'
-        
-        # Build profile sections
-        # Personal Information
-        personal_info = ""
-        personal_info += format_field("Full Name", candidate_data.get('full_name'), 'full_name')
-        personal_info += format_field("Email", candidate_data.get('email'), 'email')
-        personal_info += format_field("Phone", candidate_data.get('phone'), 'phone')
-        personal_info += format_field("Location", candidate_data.get('location'), 'location')
-        if candidate_data.get('linkedin_url'):
-            linkedin = f'<a href="{candidate_data.get("linkedin_url")}" style="color: #2563eb;">LinkedIn Profile</a>'
-            personal_info += format_field("LinkedIn", linkedin, 'linkedin_url')
-        if candidate_data.get('portfolio_url'):
-            portfolio = f'<a href="{candidate_data.get("portfolio_url")}" style="color: #2563eb;">Portfolio</a>'
-            personal_info += format_field("Portfolio", portfolio, 'portfolio_url')
-        
-        # Professional Information
-        professional_info = ""
-        professional_info += format_field("Current Title", candidate_data.get('current_title'), 'current_title')
-        if candidate_data.get('total_experience_years'):
-            exp_years = candidate_data.get('total_experience_years')
-            exp_text = f"{exp_years} year{'s' if exp_years != 1 else ''}"
-            professional_info += format_field("Experience", exp_text, 'total_experience_years')
-        professional_info += format_field("Expected Salary", candidate_data.get('expected_salary'), 'expected_salary')
-        professional_info += format_field("Visa / Work Authorization", candidate_data.get('visa_type'), 'visa_type')
-        
-        # Summary
-        summary_section = ""
-        if candidate_data.get('professional_summary'):
-            summary = candidate_data.get('professional_summary')
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'professional_summary' in hr_edited_fields else ""
-            summary_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Professional Summary{edit_badge}</h3>
-                <p style="background-color: #f9fafb; padding: 15px; border-radius: 8px; color: #374151; line-height: 1.6;">{summary}</p>
-            </div>
-            '''
-        
-        # Skills
-        skills_section = ""
-        skills = candidate_data.get('skills', [])
-        if skills:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'skills' in hr_edited_fields else ""
-            skills_html = ' '.join([f'<span style="background-color: #dbeafe; color: #1e40af; padding: 4px 10px; border-radius: 12px; font-size: 13px; display: inline-block; margin: 3px;">{skill}</span>' for skill in skills[:15]])
-            skills_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Skills{edit_badge}</h3>
-                <div>{skills_html}</div>
-            </div>
-            '''
-        
-        # Preferred Roles
-        roles_section = ""
-        preferred_roles = candidate_data.get('preferred_roles', [])
-        if preferred_roles:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'preferred_roles' in hr_edited_fields else ""
-            roles_html = ' '.join([f'<span style="background-color: #dcfce7; color: #166534; padding: 4px 10px; border-radius: 12px; font-size: 13px; display: inline-block; margin: 3px;">{role}</span>' for role in preferred_roles])
-            roles_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Preferred Roles{edit_badge}</h3>
-                <div>{roles_html}</div>
-            </div>
-            '''
-        
-        # Education
-        education_section = ""
-        education = candidate_data.get('education', [])
-        if education:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'education' in hr_edited_fields else ""
-            edu_items = []
-            for edu in education[:3]:  # Limit to 3
-                degree = edu.get('degree', '')
-                institution = edu.get('institution', '')
-                year = edu.get('graduation_year', '')
-                edu_items.append(f'<li style="margin-bottom: 8px;"><strong>{degree}</strong> - {institution} {f"({year})" if year else ""}</li>')
-            education_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Education{edit_badge}</h3>
-                <ul style="margin: 0; padding-left: 20px; color: #374151;">{"".join(edu_items)}</ul>
-            </div>
-            '''
-        
-        # Work Experience
-        experience_section = ""
-        work_experience = candidate_data.get('work_experience', [])
-        if work_experience:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'work_experience' in hr_edited_fields else ""
-            exp_items = []
-            for exp in work_experience[:3]:  # Limit to 3
-                title = exp.get('title', '')
-                company = exp.get('company', '')
-                start = exp.get('start_date', '')
-                end = exp.get('end_date', 'Present')
-                is_current = exp.get('is_current', False)
-                period = f"{start} - {'Present' if is_current else end}" if start else ""
-                exp_items.append(f'<li style="margin-bottom: 10px;"><strong>{title}</strong> at {company}<br/><span style="color: #6b7280; font-size: 13px;">{period}</span></li>')
-            experience_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Work Experience{edit_badge}</h3>
-                <ul style="margin: 0; padding-left: 20px; color: #374151; list-style-type: none;">{"".join(exp_items)}</ul>
-            </div>
-            '''
-        
-        # Certifications
-        certifications_section = ""
-        certifications = candidate_data.get('certifications', [])
-        if certifications:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'certifications' in hr_edited_fields else ""
-            certs_html = ' '.join([f'<span style="background-color: #fef3c7; color: #92400e; padding: 4px 10px; border-radius: 12px; font-size: 13px; display: inline-block; margin: 3px;">{cert}</span>' for cert in certifications])
-            certifications_section = f'''
-            <div style="margin-top: 20px;">
-                <h3 style="color: #374151; margin-bottom: 10px; font-size: 16px;">Certifications{edit_badge}</h3>
-                <div>{certs_html}</div>
-            </div>
-            '''
-        
-        # Languages
-        languages_section = ""
-        languages = candidate_data.get('languages', [])
-        if languages:
-            edit_badge = ' <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span>' if 'languages' in hr_edited_fields else ""
-            langs_html = ', '.join(languages)
-            languages_section = f'''
-            <div style="margin-top: 15px;">
-                <span style="color: #6b7280;">Languages:</span> <strong>{langs_html}</strong>{edit_badge}
-            </div>
-            '''
-        
-        # HR edits notice
-        hr_notice = ""
-        if hr_edited_fields:
-            hr_notice = f'''
-            <div style="background-color: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin-top: 25px; border-radius: 0 8px 8px 0;">
-                <p style="margin: 0; color: #92400e;">
-                    <strong>📝 Note:</strong> Some fields in your profile were updated by our HR team during the review process. 
-                    Fields marked with <span style="background-color: #fef3c7; color: #92400e; font-size: 11px; padding: 2px 6px; border-radius: 4px;">Updated by HR</span> 
-                    have been modified. If you have any questions about these changes, please contact us.
-                </p>
-            </div>
-            '''
         
         subject = f"Welcome to {company_name}! Your Profile Has Been Approved 🎉"
         
-        body_html = f"""
-        <html>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif; line-height: 1.6; color: #333; max-width: 650px; margin: 0 auto; background-color: #f3f4f6; padding: 20px;">
-            <div style="background-color: white; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 6px rgba(0,0,0,0.05);">
-                <!-- Header -->
-                <div style="background: linear-gradient(135deg, #16a34a 0%, #15803d 100%); padding: 30px; text-align: center;">
-                    <h1 style="color: white; margin: 0; font-size: 28px;">🎉 Congratulations!</h1>
-                    <p style="color: #bbf7d0; margin: 10px 0 0 0; font-size: 16px;">Your profile has been approved</p>
-                </div>
-                
-                <!-- Content -->
-                <div style="padding: 30px;">
-                    <p style="font-size: 18px; color: #374151;">Hi <strong>{candidate_name}</strong>,</p>
-                    
-                    <p style="color: #4b5563;">Great news! Your candidate profile with <strong>{company_name}</strong> has been reviewed and approved. 
-                    You are now part of our talent pipeline!</p>
-                    
-                    {hr_notice}
-                    
-                    <!-- Profile Summary Card -->
-                    <div style="background-color: #f9fafb; border-radius: 8px; padding: 20px; margin-top: 25px;">
-                        <h2 style="color: #1f2937; margin: 0 0 15px 0; font-size: 18px; border-bottom: 2px solid #e5e7eb; padding-bottom: 10px;">📋 Your Approved Profile</h2>
-                        
-                        <!-- Personal Information -->
-                        <h3 style="color: #374151; margin: 15px 0 10px 0; font-size: 16px;">Contact Information</h3>
-                        <table style="width: 100%; border-collapse: collapse;">
-                            {personal_info}
-                        </table>
-                        
-                        <!-- Professional Information -->
-                        {f'<h3 style="color: #374151; margin: 20px 0 10px 0; font-size: 16px;">Professional Details</h3><table style="width: 100%; border-collapse: collapse;">{professional_info}</table>' if professional_info else ''}
-                    </div>
-                    
-                    {summary_section}
-                    {skills_section}
-                    {roles_section}
-                    {experience_section}
-                    {education_section}
-                    {certifications_section}
-                    {languages_section}
-                    
-                    <!-- Next Steps -->
-                    <div style="margin-top: 30px; background-color: #eff6ff; border-radius: 8px; padding: 20px;">
-                        <h3 style="color: #1e40af; margin: 0 0 15px 0; font-size: 16px;">📌 What's Next?</h3>
-                        <ul style="margin: 0; padding-left: 20px; color: #374151;">
-                            <li style="margin-bottom: 8px;">Your profile is now active in our system</li>
-                            <li style="margin-bottom: 8px;">Our recruiters will reach out when relevant opportunities arise</li>
-                            <li style="margin-bottom: 8px;">You can contact us anytime to update your profile</li>
-                        </ul>
-                    </div>
-                    
-                    <p style="margin-top: 30px; color: #4b5563;">If you have any questions, feel free to reach out to us.</p>
-                    
-                    <p style="margin-top: 20px;">
-                        Best regards,<br>
-                        <strong>{company_name} HR Team</strong>
-                    </p>
-                </div>
-                
-                <!-- Footer -->
-                <div style="background-color: #f9fafb; padding: 20px; text-align: center; border-top: 1px solid #e5e7eb;">
-                    <p style="margin: 0; color: #9ca3af; font-size: 12px;">
-                        This email was sent by {company_name} via Blacklight Recruiting Platform
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+        body_html = render_email_template(
+            'approval.html',
+            company_name=company_name,
+            candidate_name=candidate_name,
+            candidate=candidate_data or {},
+            hr_edited_fields=hr_edited_fields or [],
+        )
         
         return EmailService._send_email(
             to=to_email,
@@ -678,113 +477,19 @@ class EmailService:
             logger.error("Cannot send tenant welcome email - SMTP not configured")
             return False
         
-        smtp_config = {
-            'host': settings.smtp_host,
-            'port': settings.smtp_port,
-            'username': settings.smtp_username,
-            'password': settings.smtp_password,
-            'from_email': settings.smtp_from_email,
-            'from_name': settings.smtp_from_name or 'Blacklight Platform',
-            'use_tls': settings.smtp_use_tls
-        }
+        smtp_config = EmailService._get_global_smtp_config(default_from_name='Blacklight Platform')
         
         subject = f"Welcome to Blacklight - Your {tenant_name} Account is Ready! 🎉"
         
-        body_html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto;">
-            <div style="background: linear-gradient(135deg, #1e40af 0%, #7c3aed 100%); padding: 30px; text-align: center;">
-                <h1 style="color: white; margin: 0;">Welcome to Blacklight</h1>
-                <p style="color: #e0e7ff; margin: 10px 0 0 0;">Your HR Recruiting Platform</p>
-            </div>
-            
-            <div style="padding: 30px; background-color: #f9fafb;">
-                <h2 style="color: #1e40af;">Hi {admin_name},</h2>
-                
-                <p>Congratulations! Your organization <strong>{tenant_name}</strong> has been successfully set up on the Blacklight platform.</p>
-                
-                <p>You have been assigned as the <strong>Tenant Administrator</strong> for your organization. Here are your login credentials:</p>
-                
-                <div style="background-color: #fff; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px; margin: 20px 0;">
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px 0; color: #6b7280;"><strong>Email:</strong></td>
-                            <td style="padding: 8px 0;">{to_email}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; color: #6b7280;"><strong>Temporary Password:</strong></td>
-                            <td style="padding: 8px 0; font-family: monospace; background-color: #fef3c7; padding: 4px 8px; border-radius: 4px;">{temporary_password}</td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <div style="background-color: #fef2f2; border-left: 4px solid #dc2626; padding: 15px; margin: 20px 0;">
-                    <p style="margin: 0; color: #dc2626;"><strong>⚠️ Important Security Notice:</strong></p>
-                    <p style="margin: 10px 0 0 0;">Please change your password immediately after your first login for security purposes.</p>
-                </div>
-                
-                <p style="text-align: center; margin: 30px 0;">
-                    <a href="{login_url}" 
-                       style="background-color: #1e40af; color: white; padding: 14px 32px; 
-                              text-decoration: none; border-radius: 8px; display: inline-block;
-                              font-weight: bold;">
-                        Login to Your Dashboard
-                    </a>
-                </p>
-                
-                <h3 style="color: #1e40af;">Getting Started:</h3>
-                <ul style="padding-left: 20px;">
-                    <li>Login and change your password</li>
-                    <li>Set up your team by inviting Managers and Recruiters</li>
-                    <li>Start adding candidates or send onboarding invitations</li>
-                    <li>Configure your organization's settings</li>
-                </ul>
-                
-                <p>If you have any questions or need assistance, our support team is here to help.</p>
-                
-                <p>Welcome aboard!</p>
-                
-                <p>Best regards,<br>
-                <strong>The Blacklight Team</strong></p>
-            </div>
-            
-            <div style="background-color: #1f2937; padding: 20px; text-align: center;">
-                <p style="color: #9ca3af; font-size: 12px; margin: 0;">
-                    This is an automated email from Blacklight Platform.<br>
-                    Please do not reply directly to this message.
-                </p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        body_text = f"""
-        Welcome to Blacklight!
-        
-        Hi {admin_name},
-        
-        Congratulations! Your organization {tenant_name} has been successfully set up on the Blacklight platform.
-        
-        You have been assigned as the Tenant Administrator. Here are your login credentials:
-        
-        Email: {to_email}
-        Temporary Password: {temporary_password}
-        
-        IMPORTANT: Please change your password immediately after your first login.
-        
-        Login URL: {login_url}
-        
-        Getting Started:
-        - Login and change your password
-        - Set up your team by inviting Managers and Recruiters
-        - Start adding candidates or send onboarding invitations
-        - Configure your organization's settings
-        
-        Welcome aboard!
-        
-        Best regards,
-        The Blacklight Team
-        """
+        template_context = {
+            'admin_name': admin_name,
+            'tenant_name': tenant_name,
+            'to_email': to_email,
+            'temporary_password': temporary_password,
+            'login_url': login_url,
+        }
+        body_html = render_email_template('tenant_welcome.html', **template_context)
+        body_text = render_email_template('tenant_welcome.txt', **template_context)
         
         return EmailService._send_email(
             to=to_email,
@@ -822,15 +527,7 @@ class EmailService:
             logger.error("Cannot send portal user welcome email - SMTP not configured")
             return False
         
-        smtp_config = {
-            'host': settings.smtp_host,
-            'port': settings.smtp_port,
-            'username': settings.smtp_username,
-            'password': settings.smtp_password,
-            'from_email': settings.smtp_from_email,
-            'from_name': settings.smtp_from_name or 'Blacklight Platform',
-            'use_tls': settings.smtp_use_tls
-        }
+        smtp_config = EmailService._get_global_smtp_config(default_from_name='Blacklight Platform')
         
         role_text = f" as {role_name}" if role_name else ""
         subject = f"Welcome to {tenant_name} - Your Account is Ready! 🎉"
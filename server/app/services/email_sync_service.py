@@ -22,10 +22,13 @@ import base64
 import json
 import logging
 import re
+import threading
+import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from sqlalchemy import select, func
 
@@ -38,7 +41,9 @@ from app.models.user_email_integration import UserEmailIntegration
 from app.services.email_integration_service import email_integration_service
 from app.services.oauth.gmail_oauth import gmail_oauth_service
 from app.services.oauth.outlook_oauth import outlook_oauth_service
+from app.services.processed_email_service import ProcessedEmailService
 from app.utils.circuit_breaker import gmail_circuit_breaker, outlook_circuit_breaker, CircuitBreakerError
+from app.utils.html_to_text import html_to_text
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -50,6 +55,12 @@ TENANT_ROLES_CACHE_TTL = 3600
 # Using 100 for safety margin, better error isolation, and lower memory pressure
 GMAIL_BATCH_SIZE = 100
 
+# Headers requested in the format=metadata prefilter pass
+GMAIL_METADATA_HEADERS = ["Subject", "From", "Date"]
+
+# Fields listed for every Outlook message; bodies are fetched only for matches
+OUTLOOK_HEADER_FIELDS = ["id", "subject", "from", "receivedDateTime", "conversationId"]
+
 # Redis key prefix for email data storage
 REDIS_EMAIL_DATA_PREFIX = "email_sync:emails:"
 
@@ -64,9 +75,11 @@ class EmailSyncService:
     Scalability features:
     - Redis caching for tenant roles (Phase 3)
     - Gmail Batch API for reduced API calls (Phase 2)
+    - Gmail header-only prefilter and pipelined, concurrent batch fetch
+    - Outlook $select header prefilter, streamed page by page
     - Incremental sync using Gmail History API (Phase 5)
     - Distributed circuit breakers (Redis-backed) (Phase 7)
-    - Batch dedup via IN() query (Large Scale)
+    - Batch dedup via Redis set of recent IDs + one = ANY() query (Large Scale)
     - Redis email data storage (Large Scale)
     - No ProcessedEmail rows for skipped emails (Large Scale)
     """
@@ -251,49 +264,32 @@ class EmailSyncService:
             access_token = email_integration_service.get_valid_access_token(integration)
 
             # Fetch emails based on provider
+            # Both providers apply the role filter and dedup to headers before
+            # downloading bodies; fetch_stats counts what they dropped
             if integration.provider == "gmail":
-                emails, new_history_id = self._fetch_gmail_emails_with_history(
-                    access_token, integration
+                emails, new_history_id, fetch_stats = self._fetch_gmail_emails_with_history(
+                    access_token, integration, preferred_roles
                 )
             else:
-                emails = self._fetch_outlook_emails(access_token, integration)
+                emails, fetch_stats = self._fetch_outlook_emails(
+                    access_token, integration, preferred_roles
+                )
                 new_history_id = None
 
-            # Batch dedup: get all already-processed email IDs in one query
-            email_ids = [
-                e.get("id") or e.get("message_id") for e in emails
-            ]
-            email_ids = [eid for eid in email_ids if eid]
-            already_processed_ids = self._batch_check_processed(
-                integration.id, email_ids
-            )
-
             # Filter and collect matched emails
             matched_emails = []
-            skipped_count = 0
-            already_processed_count = len(already_processed_ids)
+            skipped_count = fetch_stats["prefiltered"]
+            already_processed_count = fetch_stats["already_processed"]
 
             for email in emails:
-                email_id = email.get("id") or email.get("message_id")
+                email_id = email.get("id")
                 if not email_id:
                     continue
 
-                # Skip if already processed (batch-checked)
-                if email_id in already_processed_ids:
-                    continue
-
-                # Check if matches job criteria (ROLE-BASED only)
+                # Role match and dedup were applied to headers by the fetcher
                 subject = email.get("subject", "")
-                sender = email.get("sender", "")
-                matches, match_reason, global_role_id = self._matches_job_criteria(
-                    subject, sender, preferred_roles
-                )
-
-                if not matches:
-                    skipped_count += 1
-                    # Large Scale: Do NOT record skipped emails to ProcessedEmail.
-                    # We rely on time-based sync cursors for dedup, not row-per-email.
-                    continue
+                match_reason = email["match_reason"]
+                global_role_id = email["global_role_id"]
 
                 logger.info(
                     f"Matched email: subject='{subject[:60]}...', reason={match_reason}"
@@ -345,7 +341,7 @@ class EmailSyncService:
             ]
 
             result = {
-                "fetched": len(emails),
+                "fetched": fetch_stats["listed"],
                 "matched": len(matched_emails),
                 "skipped_count": skipped_count,
                 "already_processed": already_processed_count,
@@ -402,8 +398,8 @@ class EmailSyncService:
         email_ids: list[str],
     ) -> set[str]:
         """
-        Check which email IDs have already been processed using a single
-        batch IN() query instead of N individual queries.
+        Check which email IDs have already been processed: the integration's
+        Redis set of recent IDs first, then one `= ANY(:ids)` query for the rest.
 
         Args:
             integration_id: Integration ID
@@ -412,27 +408,7 @@ class EmailSyncService:
         Returns:
             Set of already-processed email IDs
         """
-        if not email_ids:
-            return set()
-
-        # Process in chunks of 500 to avoid hitting query parameter limits
-        processed_ids: set[str] = set()
-        chunk_size = 500
-
-        for i in range(0, len(email_ids), chunk_size):
-            chunk = email_ids[i:i + chunk_size]
-            stmt = select(ProcessedEmail.email_message_id).where(
-                ProcessedEmail.integration_id == integration_id,
-                ProcessedEmail.email_message_id.in_(chunk),
-            )
-            chunk_results = set(db.session.scalars(stmt).all())
-            processed_ids.update(chunk_results)
-
-        logger.debug(
-            f"Batch dedup: {len(processed_ids)}/{len(email_ids)} already processed "
-            f"for integration {integration_id}"
-        )
-        return processed_ids
+        return ProcessedEmailService.filter_processed(integration_id, email_ids)
 
     # ========================================================================
     # Redis Email Storage (Large Scale)
@@ -628,19 +604,25 @@ class EmailSyncService:
         self,
         access_token: str,
         integration: UserEmailIntegration,
-    ) -> tuple[list[dict], Optional[str]]:
+        preferred_roles: dict[str, int],
+    ) -> tuple[list[dict], Optional[str], dict]:
         """
         Fetch Gmail emails using incremental History API when possible.
 
         Phase 5: Uses Gmail History API for incremental sync, falling back
         to full sync when history ID is not available or expired.
 
+        Only emails whose subject/sender pass _matches_job_criteria and that
+        are not yet processed are downloaded in full (see
+        _fetch_gmail_messages_pipelined).
+
         Args:
             access_token: Valid Gmail access token
             integration: UserEmailIntegration object
+            preferred_roles: Dict mapping normalized role keywords to GlobalRole IDs
 
         Returns:
-            Tuple of (emails list, new history_id for next sync)
+            Tuple of (matched emails list, new history_id for next sync, fetch stats)
         """
         logger.info(f"Fetching Gmail emails for integration_id={integration.id}")
 
@@ -663,13 +645,13 @@ class EmailSyncService:
                     f"Attempting incremental sync from "
                     f"historyId={integration.gmail_history_id}"
                 )
-                emails = self._fetch_gmail_emails_incremental(
-                    service, integration.gmail_history_id
+                emails, stats = self._fetch_gmail_emails_incremental(
+                    service, access_token, integration, preferred_roles
                 )
                 logger.info(
                     f"Incremental sync successful: fetched {len(emails)} new emails"
                 )
-                return emails, latest_history_id
+                return emails, latest_history_id, stats
             except Exception as e:
                 logger.info(
                     f"Incremental sync failed (will fallback to full): {e}"
@@ -677,52 +659,76 @@ class EmailSyncService:
         else:
             logger.info("No history ID available, performing full sync")
 
-        emails = self._fetch_gmail_emails_batch(access_token, integration)
+        emails, stats = self._fetch_gmail_emails_batch(
+            service, access_token, integration, preferred_roles
+        )
         logger.info(f"Full sync complete: fetched {len(emails)} emails")
-        return emails, latest_history_id
+        return emails, latest_history_id, stats
 
     @gmail_circuit_breaker
     def _fetch_gmail_emails_incremental(
         self,
         service,
-        start_history_id: str,
-    ) -> list[dict]:
+        access_token: str,
+        integration: UserEmailIntegration,
+        preferred_roles: dict[str, int],
+    ) -> tuple[list[dict], dict]:
         """
         Fetch only new emails since last sync using History API.
 
         Phase 5: Incremental sync reduces API calls and data transfer.
 
         Args:
-            service: Gmail API service
-            start_history_id: History ID from last sync
+            service: Gmail API service (used for history listing)
+            access_token: Valid Gmail access token
+            integration: UserEmailIntegration object
+            preferred_roles: Dict mapping normalized role keywords to GlobalRole IDs
 
         Returns:
-            List of new email dictionaries
+            Tuple of (matched emails list, fetch stats)
         """
-        response = service.users().history().list(
-            userId="me",
-            startHistoryId=start_history_id,
-            historyTypes=["messageAdded"],
-            maxResults=100,
-        ).execute()
-
-        # Extract message IDs from history
-        message_ids = set()
-        for history in response.get("history", []):
-            for msg_added in history.get("messagesAdded", []):
-                message_ids.add(msg_added["message"]["id"])
-
-        if not message_ids:
-            return []
+        def history_pages():
+            seen: set[str] = set()
+            page_token = None
+            while True:
+                request_params = {
+                    "userId": "me",
+                    "startHistoryId": integration.gmail_history_id,
+                    "historyTypes": ["messageAdded"],
+                    "maxResults": self.max_emails_per_page,
+                }
+                if page_token:
+                    request_params["pageToken"] = page_token
+
+                response = service.users().history().list(**request_params).execute()
+
+                # Extract message IDs from history (a message can appear in several records)
+                page_ids = []
+                for history in response.get("history", []):
+                    for msg_added in history.get("messagesAdded", []):
+                        msg_id = msg_added["message"]["id"]
+                        if msg_id not in seen:
+                            seen.add(msg_id)
+                            page_ids.append(msg_id)
+                if page_ids:
+                    yield page_ids
+
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
 
-        return self._fetch_gmail_messages_batch(service, list(message_ids))
+        return self._fetch_gmail_messages_pipelined(
+            access_token, history_pages(), integration.id, preferred_roles
+        )
 
     @gmail_circuit_breaker
     def _fetch_gmail_emails_batch(
         self,
+        service,
         access_token: str,
         integration: UserEmailIntegration,
-    ) -> list[dict]:
+        preferred_roles: dict[str, int],
+    ) -> tuple[list[dict], dict]:
         """
         Fetch emails from Gmail using Batch API for efficiency.
 
@@ -731,15 +737,18 @@ class EmailSyncService:
         - Subsequent syncs: Fetch ALL emails since last_synced_at
         - No count limit — fetches all matching emails using pagination
 
+        Pages of message IDs are handed to the fetch pipeline as they are
+        listed, so downloads overlap with pagination.
+
         Args:
+            service: Gmail API service (used for message listing)
             access_token: Valid Gmail access token
             integration: UserEmailIntegration object
+            preferred_roles: Dict mapping normalized role keywords to GlobalRole IDs
 
         Returns:
-            List of email dictionaries
+            Tuple of (matched emails list, fetch stats)
         """
-        service = gmail_oauth_service.build_gmail_service(access_token)
-
         # Determine time boundary based on sync state
         is_initial_sync = integration.last_synced_at is None
 
@@ -768,136 +777,205 @@ class EmailSyncService:
             f"(after_date={after_date.strftime('%Y-%m-%d %H:%M:%S UTC')})"
         )
 
-        # Fetch ALL messages using pagination
-        all_message_ids = []
-        page_token = None
-
-        while True:
-            request_params = {
-                "userId": "me",
-                "q": query,
-                "maxResults": self.max_emails_per_page,
-                "includeSpamTrash": False,
-            }
-            if page_token:
-                request_params["pageToken"] = page_token
+        def message_pages():
+            # Fetch ALL messages using pagination
+            page_token = None
+            total = 0
+            while True:
+                request_params = {
+                    "userId": "me",
+                    "q": query,
+                    "maxResults": self.max_emails_per_page,
+                    "includeSpamTrash": False,
+                }
+                if page_token:
+                    request_params["pageToken"] = page_token
 
-            results = service.users().messages().list(**request_params).execute()
+                results = service.users().messages().list(**request_params).execute()
 
-            messages = results.get("messages", [])
-            all_message_ids.extend([msg["id"] for msg in messages])
+                messages = results.get("messages", [])
+                total += len(messages)
 
-            logger.info(
-                f"Gmail returned {len(messages)} messages in this page, "
-                f"total so far: {len(all_message_ids)}"
-            )
+                logger.info(
+                    f"Gmail returned {len(messages)} messages in this page, "
+                    f"total so far: {total}"
+                )
+                if messages:
+                    yield [msg["id"] for msg in messages]
 
-            page_token = results.get("nextPageToken")
-            if not page_token:
-                break
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
 
-        logger.info(
-            f"Found {len(all_message_ids)} total emails since "
-            f"{after_date.strftime('%Y-%m-%d %H:%M')}"
+        return self._fetch_gmail_messages_pipelined(
+            access_token, message_pages(), integration.id, preferred_roles
         )
 
-        if not all_message_ids:
-            return []
-
-        return self._fetch_gmail_messages_batch(service, all_message_ids)
-
-    @gmail_circuit_breaker
-    def _fetch_gmail_messages_batch(
+    def _fetch_gmail_messages_pipelined(
         self,
-        service,
-        message_ids: list[str],
-    ) -> list[dict]:
+        access_token: str,
+        id_pages: Iterable[list[str]],
+        integration_id: int,
+        preferred_roles: dict[str, int],
+    ) -> tuple[list[dict], dict]:
         """
-        Fetch multiple Gmail messages using batch API with chunking.
+        Fetch Gmail messages in two passes while IDs are still being listed.
 
-        Phase 2: Batch requests reduce N API calls to ceil(N/GMAIL_BATCH_SIZE).
-        Phase 7: Protected by distributed circuit breaker.
+        1. format=metadata (Subject/From/Date headers only) for every ID;
+           _matches_job_criteria and the processed-email check run on the
+           headers as each batch returns
+        2. format=full only for the remaining matches
+
+        Up to settings.email_sync_gmail_fetch_concurrency batch requests run at
+        once, each worker thread with its own Gmail client (the underlying
+        httplib2 connection is not thread-safe). Listing pauses while that many
+        batches are in flight.
 
         Args:
-            service: Gmail API service
-            message_ids: List of message IDs to fetch
+            access_token: Valid Gmail access token
+            id_pages: Iterable of message ID pages, consumed lazily
+            integration_id: Integration ID (for the processed-email check)
+            preferred_roles: Dict mapping normalized role keywords to GlobalRole IDs
 
         Returns:
-            List of parsed email dictionaries
+            Tuple of (matched emails list, fetch stats)
         """
-        from googleapiclient.http import BatchHttpRequest
+        started = time.perf_counter()
+        stats = {"listed": 0, "prefiltered": 0, "already_processed": 0, "full_fetched": 0}
+        emails: list[dict] = []
+        errors: list[dict] = []
+        matches: dict[str, tuple[str, int]] = {}
+        concurrency = max(1, settings.email_sync_gmail_fetch_concurrency)
+        thread_state = threading.local()
+
+        def fetch(message_ids: list[str], message_format: str) -> tuple[list[dict], list[dict]]:
+            if getattr(thread_state, "service", None) is None:
+                thread_state.service = gmail_oauth_service.build_gmail_service(access_token)
+            return self._execute_gmail_batch(thread_state.service, message_ids, message_format)
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gmail-fetch") as executor:
+            pending: dict = {}
+
+            def collect(max_pending: int) -> None:
+                """Handle finished batches until fewer than max_pending are in flight."""
+                while len(pending) > max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        message_format = pending.pop(future)
+                        messages, batch_errors = future.result()
+                        errors.extend(batch_errors)
+
+                        if message_format == "full":
+                            for message in messages:
+                                email = self._parse_gmail_message(message)
+                                if email:
+                                    email["match_reason"], email["global_role_id"] = matches[email["id"]]
+                                    emails.append(email)
+                            continue
+
+                        candidates = {}
+                        for message in messages:
+                            headers = self._gmail_headers(message)
+                            matched, match_reason, global_role_id = self._matches_job_criteria(
+                                headers.get("subject", ""), headers.get("from", ""), preferred_roles
+                            )
+                            if matched:
+                                candidates[message["id"]] = (match_reason, global_role_id)
+                            else:
+                                stats["prefiltered"] += 1
 
-        all_emails = []
-        all_errors = []
-        total_messages = len(message_ids)
-        total_chunks = (total_messages + GMAIL_BATCH_SIZE - 1) // GMAIL_BATCH_SIZE
+                        already_processed = self._batch_check_processed(
+                            integration_id, list(candidates)
+                        )
+                        stats["already_processed"] += len(already_processed)
+                        full_ids = [mid for mid in candidates if mid not in already_processed]
+                        if full_ids:
+                            matches.update((mid, candidates[mid]) for mid in full_ids)
+                            stats["full_fetched"] += len(full_ids)
+                            pending[executor.submit(fetch, full_ids, "full")] = "full"
+
+            for page_ids in id_pages:
+                stats["listed"] += len(page_ids)
+                for chunk_index in range(0, len(page_ids), GMAIL_BATCH_SIZE):
+                    collect(concurrency - 1)
+                    chunk = page_ids[chunk_index:chunk_index + GMAIL_BATCH_SIZE]
+                    pending[executor.submit(fetch, chunk, "metadata")] = "metadata"
+
+            collect(0)
+
+        if errors:
+            logger.warning(
+                f"Batch fetch had {len(errors)} total errors: {errors[:5]}"
+            )
 
         logger.info(
-            f"Fetching {total_messages} messages in {total_chunks} batch(es) "
-            f"of up to {GMAIL_BATCH_SIZE}"
+            f"Pipelined Gmail fetch: listed={stats['listed']}, "
+            f"prefiltered={stats['prefiltered']}, "
+            f"already_processed={stats['already_processed']}, "
+            f"full_fetched={stats['full_fetched']}, parsed={len(emails)} "
+            f"in {time.perf_counter() - started:.1f}s"
         )
+        return emails, stats
 
-        for chunk_index in range(0, total_messages, GMAIL_BATCH_SIZE):
-            chunk = message_ids[chunk_index:chunk_index + GMAIL_BATCH_SIZE]
-            chunk_num = (chunk_index // GMAIL_BATCH_SIZE) + 1
-            chunk_emails = []
-            chunk_errors = []
-
-            def make_callback(emails_list, errors_list):
-                """Create a callback closure for this chunk."""
-                def handle_message(request_id, response, exception):
-                    if exception:
-                        errors_list.append({"id": request_id, "error": str(exception)})
-                        return
-                    try:
-                        email = self._parse_gmail_message(response)
-                        if email:
-                            emails_list.append(email)
-                    except Exception as e:
-                        errors_list.append({"id": request_id, "error": str(e)})
-                return handle_message
-
-            batch = service.new_batch_http_request(
-                callback=make_callback(chunk_emails, chunk_errors)
-            )
+    def _execute_gmail_batch(
+        self,
+        service,
+        message_ids: list[str],
+        message_format: str,
+    ) -> tuple[list[dict], list[dict]]:
+        """
+        Get up to GMAIL_BATCH_SIZE messages in one BatchHttpRequest.
 
-            for msg_id in chunk:
-                batch.add(
-                    service.users().messages().get(
-                        userId="me",
-                        id=msg_id,
-                        format="full",
-                    ),
-                    request_id=msg_id,
-                )
+        Phase 2: Batch requests reduce N API calls to ceil(N/GMAIL_BATCH_SIZE).
 
-            batch.execute()
+        Args:
+            service: Gmail API service (not shared across threads)
+            message_ids: Message IDs to get
+            message_format: "metadata" (Subject/From/Date headers) or "full"
 
-            all_emails.extend(chunk_emails)
-            all_errors.extend(chunk_errors)
+        Returns:
+            Tuple of (raw message resources, per-message errors)
+        """
+        messages: list[dict] = []
+        errors: list[dict] = []
 
-            logger.info(
-                f"Batch {chunk_num}/{total_chunks}: fetched {len(chunk_emails)} emails "
-                f"from {len(chunk)} IDs ({len(chunk_errors)} errors)"
-            )
+        def handle_message(request_id, response, exception):
+            if exception:
+                errors.append({"id": request_id, "error": str(exception)})
+            else:
+                messages.append(response)
+
+        batch = service.new_batch_http_request(callback=handle_message)
+        for msg_id in message_ids:
+            if message_format == "metadata":
+                request = service.users().messages().get(
+                    userId="me",
+                    id=msg_id,
+                    format="metadata",
+                    metadataHeaders=GMAIL_METADATA_HEADERS,
+                )
+            else:
+                request = service.users().messages().get(
+                    userId="me",
+                    id=msg_id,
+                    format="full",
+                )
+            batch.add(request, request_id=msg_id)
 
-        if all_errors:
-            logger.warning(
-                f"Batch fetch had {len(all_errors)} total errors: {all_errors[:5]}"
-            )
+        batch.execute()
+        return messages, errors
 
-        logger.info(
-            f"Batch fetched {len(all_emails)} emails from {total_messages} IDs total"
-        )
-        return all_emails
+    def _gmail_headers(self, message: dict) -> dict[str, str]:
+        """Lower-cased header name -> value for a Gmail message resource."""
+        return {
+            h["name"].lower(): h["value"]
+            for h in message.get("payload", {}).get("headers", [])
+        }
 
     def _parse_gmail_message(self, message: dict) -> Optional[dict]:
         """Parse Gmail message into email dictionary."""
         try:
-            headers = {
-                h["name"].lower(): h["value"]
-                for h in message.get("payload", {}).get("headers", [])
-            }
+            headers = self._gmail_headers(message)
             body = self._extract_gmail_body(message.get("payload", {}))
 
             return {
@@ -931,11 +1009,12 @@ class EmailSyncService:
                         break
                 elif mime_type == "text/html":
                     if part.get("body", {}).get("data"):
-                        body = base64.urlsafe_b64decode(
-                            part["body"]["data"]
-                        ).decode("utf-8", errors="ignore")
-                        body = re.sub(r"<[^>]+>", " ", body)
-                        body = re.sub(r"\s+", " ", body)
+                        body = html_to_text(
+                            base64.urlsafe_b64decode(part["body"]["data"]).decode(
+                                "utf-8", errors="ignore"
+                            ),
+                            max_chars=10000,
+                        )
                 elif mime_type.startswith("multipart/"):
                     body = self._extract_gmail_body(part)
                     if body:
@@ -959,86 +1038,154 @@ class EmailSyncService:
         self,
         access_token: str,
         integration: UserEmailIntegration,
-    ) -> list[dict]:
+        preferred_roles: dict[str, int],
+    ) -> tuple[list[dict], dict]:
         """
-        Fetch Outlook emails using delta query for incremental sync.
+        Fetch job-related Outlook emails, downloading bodies only for matches.
+
+        Pages list only OUTLOOK_HEADER_FIELDS ($select) and are consumed as a
+        stream: each page is filtered with _matches_job_criteria and the
+        processed-email check, then dropped, so memory does not grow with the
+        mailbox. Bodies of the remaining matches are fetched with up to
+        settings.email_sync_outlook_fetch_concurrency requests in flight.
 
         Args:
             access_token: Valid Outlook access token
             integration: UserEmailIntegration object
+            preferred_roles: Dict mapping normalized role keywords to GlobalRole IDs
 
         Returns:
-            List of email dictionaries
+            Tuple of (matched emails list, fetch stats)
         """
         logger.info(f"Fetching Outlook emails for integration_id={integration.id}")
 
-        all_emails = []
+        started = time.perf_counter()
+        stats = {"listed": 0, "prefiltered": 0, "already_processed": 0, "full_fetched": 0}
+        emails: list[dict] = []
+        seen_ids: set[str] = set()
+        cursor: dict = {}
+        concurrency = max(1, settings.email_sync_outlook_fetch_concurrency)
+
+        def fetch_body(msg: dict) -> dict:
+            full = outlook_oauth_service.get_message_by_id(access_token, msg["id"])
+            return {**msg, **full}
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="outlook-fetch") as executor:
+            pending: dict = {}
+
+            def collect(max_pending: int) -> None:
+                """Parse fetched bodies until fewer than max_pending are in flight."""
+                while len(pending) > max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        match_reason, global_role_id = pending.pop(future)
+                        try:
+                            email = self._parse_outlook_message(future.result())
+                        except Exception as e:
+                            logger.warning(f"Failed to fetch Outlook message body: {e}")
+                            continue
+                        email["match_reason"] = match_reason
+                        email["global_role_id"] = global_role_id
+                        emails.append(email)
+
+            for messages in self._iter_outlook_header_pages(access_token, integration, cursor):
+                stats["listed"] += len(messages)
+
+                candidates = {}
+                for msg in messages:
+                    msg_id = msg.get("id")
+                    if not msg_id or msg_id in seen_ids or msg.get("@removed"):
+                        continue
+                    seen_ids.add(msg_id)
+                    matched, match_reason, global_role_id = self._matches_job_criteria(
+                        msg.get("subject") or "", self._outlook_sender(msg), preferred_roles
+                    )
+                    if matched:
+                        candidates[msg_id] = (msg, match_reason, global_role_id)
+                    else:
+                        stats["prefiltered"] += 1
 
-        if integration.outlook_delta_link:
-            logger.info("Attempting delta sync with saved delta link")
-            try:
-                messages, new_delta_link = outlook_oauth_service.get_messages_delta(
-                    access_token=access_token,
-                    delta_link=integration.outlook_delta_link,
-                )
+                already_processed = self._batch_check_processed(integration.id, list(candidates))
+                stats["already_processed"] += len(already_processed)
 
-                logger.info(f"Delta sync successful: fetched {len(messages)} messages")
+                for msg_id, (msg, match_reason, global_role_id) in candidates.items():
+                    if msg_id in already_processed:
+                        continue
+                    if msg.get("body"):
+                        # Delta links saved before the header-only $select still return bodies
+                        email = self._parse_outlook_message(msg)
+                        email["match_reason"] = match_reason
+                        email["global_role_id"] = global_role_id
+                        emails.append(email)
+                        continue
+                    collect(concurrency - 1)
+                    stats["full_fetched"] += 1
+                    pending[executor.submit(fetch_body, msg)] = (match_reason, global_role_id)
 
-                for msg in messages:
-                    try:
-                        body = ""
-                        if msg.get("body"):
-                            body = msg["body"].get("content", "")
-                            if msg["body"].get("contentType") == "html":
-                                body = re.sub(r"<[^>]+>", " ", body)
-                                body = re.sub(r"\s+", " ", body)
-
-                        sender = ""
-                        if msg.get("from", {}).get("emailAddress"):
-                            sender_info = msg["from"]["emailAddress"]
-                            sender = (
-                                f"{sender_info.get('name', '')} "
-                                f"<{sender_info.get('address', '')}>"
-                            )
+            collect(0)
 
-                        all_emails.append({
-                            "id": msg["id"],
-                            "thread_id": msg.get("conversationId"),
-                            "subject": msg.get("subject", ""),
-                            "sender": sender,
-                            "body": body.strip()[:10000],
-                            "received_at": (
-                                datetime.fromisoformat(
-                                    msg["receivedDateTime"].replace("Z", "+00:00")
-                                )
-                                if msg.get("receivedDateTime")
-                                else None
-                            ),
-                        })
+        if "delta_link" in cursor:
+            integration.outlook_delta_link = cursor["delta_link"]
+            db.session.commit()
 
-                    except Exception as e:
-                        logger.warning(f"Failed to process Outlook message: {e}")
-                        continue
+        logger.info(
+            f"Outlook fetch ({cursor.get('mode', 'time-based')}): listed={stats['listed']}, "
+            f"prefiltered={stats['prefiltered']}, "
+            f"already_processed={stats['already_processed']}, "
+            f"full_fetched={stats['full_fetched']}, parsed={len(emails)} "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return emails, stats
 
-                integration.outlook_delta_link = new_delta_link
-                db.session.commit()
+    def _iter_outlook_header_pages(
+        self,
+        access_token: str,
+        integration: UserEmailIntegration,
+        cursor: dict,
+    ) -> Iterator[list[dict]]:
+        """
+        Yield pages of Outlook message headers, via delta query when possible.
 
-                logger.info(
-                    f"Outlook delta sync complete: {len(all_emails)} emails processed"
-                )
-                return all_emails
+        Follows @odata.nextLink lazily. After a complete delta pass the new
+        deltaLink is put in cursor["delta_link"] for the caller to save.
+
+        Args:
+            access_token: Valid Outlook access token
+            integration: UserEmailIntegration object
+            cursor: Output dict ("mode", "delta_link")
 
+        Yields:
+            Lists of message objects with OUTLOOK_HEADER_FIELDS
+        """
+        if integration.outlook_delta_link:
+            logger.info("Attempting delta sync with saved delta link")
+            cursor["mode"] = "delta"
+            link = integration.outlook_delta_link
+            try:
+                while link:
+                    messages, next_link, delta_link = outlook_oauth_service.get_messages_delta(
+                        access_token=access_token,
+                        delta_link=link,
+                    )
+                    if messages:
+                        yield messages
+                    link = next_link
+                    if delta_link:
+                        cursor["delta_link"] = delta_link
+                return
             except Exception as e:
                 logger.warning(
                     f"Delta query failed (will fallback to time-based): {e}"
                 )
                 integration.outlook_delta_link = None
                 db.session.commit()
+                cursor.pop("delta_link", None)
 
         # Fallback to time-based sync
         logger.info(
             f"Performing time-based sync (lookback: {self.initial_lookback_days} days)"
         )
+        cursor["mode"] = "time-based"
         after_date = datetime.now(timezone.utc) - timedelta(
             days=self.initial_lookback_days
         )
@@ -1046,77 +1193,54 @@ class EmailSyncService:
             f"receivedDateTime ge {after_date.strftime('%Y-%m-%dT%H:%M:%SZ')}"
         )
 
-        all_emails = []
-        next_link = None
-        is_first_request = True
-        page_count = 0
-
-        while True:
+        messages, next_link = outlook_oauth_service.get_messages(
+            access_token=access_token,
+            top=self.max_emails_per_page,
+            filter_query=filter_query,
+            select_fields=OUTLOOK_HEADER_FIELDS,
+        )
+        page_count = 1
+        while messages:
+            yield messages
+            if not next_link:
+                break
             page_count += 1
             logger.debug(f"Fetching Outlook page {page_count}")
+            # nextLink carries the original $select/$filter
+            messages, next_link = outlook_oauth_service.get_messages_from_url(
+                access_token=access_token,
+                url=next_link,
+            )
 
-            if is_first_request:
-                messages, next_link = outlook_oauth_service.get_messages(
-                    access_token=access_token,
-                    top=self.max_emails_per_page,
-                    filter_query=filter_query,
-                )
-                is_first_request = False
-            else:
-                if not next_link:
-                    break
-                messages, next_link = outlook_oauth_service.get_messages_from_url(
-                    access_token=access_token,
-                    url=next_link,
-                )
-
-            if not messages:
-                break
-
-            for msg in messages:
-                try:
-                    body = ""
-                    if msg.get("body"):
-                        body = msg["body"].get("content", "")
-                        if msg["body"].get("contentType") == "html":
-                            body = re.sub(r"<[^>]+>", " ", body)
-                            body = re.sub(r"\s+", " ", body)
-
-                    sender = ""
-                    if msg.get("from", {}).get("emailAddress"):
-                        sender_info = msg["from"]["emailAddress"]
-                        sender = (
-                            f"{sender_info.get('name', '')} "
-                            f"<{sender_info.get('address', '')}>"
-                        )
-
-                    all_emails.append({
-                        "id": msg["id"],
-                        "thread_id": msg.get("conversationId"),
-                        "subject": msg.get("subject", ""),
-                        "sender": sender,
-                        "body": body.strip()[:10000],
-                        "received_at": (
-                            datetime.fromisoformat(
-                                msg["receivedDateTime"].replace("Z", "+00:00")
-                            )
-                            if msg.get("receivedDateTime")
-                            else None
-                        ),
-                    })
-
-                except Exception as e:
-                    logger.warning(f"Failed to process Outlook message: {e}")
-                    continue
-
-            if not next_link:
-                break
+    def _outlook_sender(self, msg: dict) -> str:
+        """Format the from address of an Outlook message as 'Name <address>'."""
+        sender_info = (msg.get("from") or {}).get("emailAddress")
+        if not sender_info:
+            return ""
+        return f"{sender_info.get('name', '')} <{sender_info.get('address', '')}>"
 
-        logger.info(
-            f"Outlook time-based sync complete: {len(all_emails)} total emails, "
-            f"{page_count} pages"
-        )
-        return all_emails
+    def _parse_outlook_message(self, msg: dict) -> dict:
+        """Parse an Outlook message (with body) into email dictionary."""
+        body = ""
+        if msg.get("body"):
+            body = msg["body"].get("content", "") or ""
+            if msg["body"].get("contentType") == "html":
+                body = html_to_text(body, max_chars=10000)
+
+        return {
+            "id": msg["id"],
+            "thread_id": msg.get("conversationId"),
+            "subject": msg.get("subject", ""),
+            "sender": self._outlook_sender(msg),
+            "body": body.strip()[:10000],
+            "received_at": (
+                datetime.fromisoformat(
+                    msg["receivedDateTime"].replace("Z", "+00:00")
+                )
+                if msg.get("receivedDateTime")
+                else None
+            ),
+        }
 
     # ========================================================================
     # Role Normalization & Matching
@@ -6,9 +6,12 @@ Provides template-based PDF and DOCX export functionality for tailored resumes.
 
 from .resume_export_service import ResumeExportService
 from .base_template import BaseResumeTemplate, ResumeTemplateType
+from .render_cache import ResumeRenderCache, resume_render_cache
 
 __all__ = [
     "ResumeExportService",
     "BaseResumeTemplate",
     "ResumeTemplateType",
+    "ResumeRenderCache",
+    "resume_render_cache",
 ]
@@ -34,8 +34,13 @@ class BaseResumeTemplate(ABC):
     - Rendering HTML (for PDF generation and preview)
     - Rendering DOCX
     - Providing metadata for UI display
+    
+    Rendered exports are cached by (content hash, template id, template_version),
+    so bump template_version whenever a change alters the rendered output.
     """
     
+    template_version: int = 1
+    
     @property
     @abstractmethod
     def metadata(self) -> TemplateMetadata:
@@ -0,0 +1,245 @@
+"""
+Rendered Resume Cache
+
+Serves resume exports (PDF/DOCX) from rendered artifacts in file storage
+instead of re-running markdown -> HTML -> WeasyPrint on every download.
+
+Artifacts are keyed by (content hash, template id, template version):
+    tenants/{tenant_id}/rendered_resumes/{template}/v{version}/{sha256}.{format}
+
+- Edited content hashes to a new key and a template change bumps
+  template_version, so a stale render is never served
+- Completed tailored resumes are pre-rendered by the resume export Inngest
+  function, so most downloads are a storage read
+- Concurrent misses for the same artifact coalesce into one render: threads
+  of one process wait on the leader's future, and across processes the first
+  caller takes a Redis lock while the others poll storage for its result
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from config.settings import settings
+
+from .resume_export_service import ResumeExportService
+
+
+logger = logging.getLogger(__name__)
+
+MIME_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# Redis lock held while one process renders an artifact
+REDIS_RENDER_LOCK_PREFIX = "resume_render:lock:"
+
+# Seconds between storage checks while another process renders
+POLL_INTERVAL = 0.5
+
+
+class ResumeRenderCache:
+    """
+    Content-addressed cache of rendered resume exports in file storage.
+    """
+    
+    def __init__(self, export_service: Optional[ResumeExportService] = None):
+        """
+        Args:
+            export_service: Renderer used on a cache miss (default: a new ResumeExportService)
+        """
+        self.export_service = export_service or ResumeExportService()
+        self._storage = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    @property
+    def storage(self):
+        """File storage backend, created on first use."""
+        if self._storage is None:
+            from app.services.file_storage import FileStorageService
+            self._storage = FileStorageService()
+        return self._storage
+    
+    def cache_key(self, tenant_id: int, markdown_content: str, template: str, export_format: str) -> str:
+        """
+        Build the storage key of a rendered artifact.
+        
+        Args:
+            tenant_id: Tenant owning the resume
+            markdown_content: Resume content in markdown format
+            template: Template ID (unknown IDs resolve to the default template)
+            export_format: "pdf" or "docx"
+        
+        Returns:
+            Storage key
+        """
+        template_obj = self.export_service.resolve_template(template)
+        digest = hashlib.sha256(markdown_content.encode("utf-8")).hexdigest()
+        return (
+            f"tenants/{tenant_id}/rendered_resumes/{template_obj.metadata.id}/"
+            f"v{template_obj.template_version}/{digest}.{export_format}"
+        )
+    
+    def get(self, tenant_id: int, markdown_content: str, template: str = "modern", export_format: str = "pdf") -> bytes:
+        """
+        Get a rendered export, rendering and storing it on a miss.
+        
+        Args:
+            tenant_id: Tenant owning the resume
+            markdown_content: Resume content in markdown format
+            template: Template ID to use (default: "modern")
+            export_format: "pdf" or "docx"
+        
+        Returns:
+            File content as bytes
+        
+        Raises:
+            ValueError: If the format is not supported or content is empty
+        """
+        if export_format not in MIME_TYPES:
+            raise ValueError(f"Unsupported export format: {export_format}")
+        if not markdown_content:
+            raise ValueError(f"No content provided for {export_format.upper()} export")
+        
+        if not settings.resume_export_cache_enabled:
+            return self.export_service.export(markdown_content, template=template, export_format=export_format)
+        
+        key = self.cache_key(tenant_id, markdown_content, template, export_format)
+        cached = self._read(key)
+        if cached is not None:
+            logger.info(f"Serving cached resume export: {key}")
+            return cached
+        
+        # Coalesce concurrent misses in this process onto one render
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            return future.result(timeout=settings.resume_export_render_lock_timeout)
+        
+        try:
+            content = self._render_coordinated(key, markdown_content, template, export_format)
+            future.set_result(content)
+            return content
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def prerender(self, tenant_id: int, markdown_content: str, templates: List[str], export_format: str = "pdf") -> Dict[str, str]:
+        """
+        Ensure artifacts exist for several templates (used after tailoring completes).
+        
+        Args:
+            tenant_id: Tenant owning the resume
+            markdown_content: Resume content in markdown format
+            templates: Template IDs to render
+            export_format: "pdf" or "docx"
+        
+        Returns:
+            Dict of template ID -> storage key
+        """
+        keys = {}
+        for template in templates:
+            self.get(tenant_id, markdown_content, template=template, export_format=export_format)
+            keys[template] = self.cache_key(tenant_id, markdown_content, template, export_format)
+        return keys
+    
+    def _render_coordinated(self, key: str, markdown_content: str, template: str, export_format: str) -> bytes:
+        """Render under the cross-process lock, or wait for the process holding it."""
+        lock_key = f"{REDIS_RENDER_LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        acquired = self._acquire_lock(lock_key, token)
+        
+        if not acquired:
+            deadline = time.monotonic() + settings.resume_export_render_lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(POLL_INTERVAL)
+                # Check the lock before storage: a holder that stored and released in between is still seen
+                holder_active = self._lock_held(lock_key)
+                cached = self._read(key)
+                if cached is not None:
+                    return cached
+                if not holder_active:
+                    # Holder finished without storing (render or upload failed)
+                    break
+            logger.warning(f"Rendering {key} locally after waiting for another worker")
+        
+        try:
+            started = time.perf_counter()
+            content = self.export_service.export(markdown_content, template=template, export_format=export_format)
+            logger.info(f"Rendered resume export {key} in {(time.perf_counter() - started) * 1000:.0f} ms")
+            
+            result = self.storage.upload_bytes(key, content, MIME_TYPES[export_format])
+            if not result.get("success"):
+                logger.warning(f"Failed to store rendered resume export {key}: {result.get('error')}")
+            return content
+        finally:
+            if acquired:
+                self._release_lock(lock_key, token)
+    
+    def _read(self, key: str) -> Optional[bytes]:
+        """Read a stored artifact, None on a miss."""
+        content, _, error = self.storage.download_file(key)
+        if error:
+            return None
+        return content
+    
+    @staticmethod
+    def _acquire_lock(lock_key: str, token: str) -> bool:
+        """
+        Claim the right to render an artifact.
+        
+        Returns:
+            True if this caller should render (lock taken, or no Redis to coordinate)
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return True
+        try:
+            return bool(redis_client.set(lock_key, token, nx=True, ex=settings.resume_export_render_lock_timeout))
+        except Exception as e:
+            logger.warning(f"Failed to take resume render lock: {e}")
+            return True
+    
+    @staticmethod
+    def _lock_held(lock_key: str) -> bool:
+        """Whether another process still holds the render lock."""
+        from app import redis_client
+        
+        if not redis_client:
+            return False
+        try:
+            return bool(redis_client.exists(lock_key))
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _release_lock(lock_key: str, token: str) -> None:
+        """Release the render lock if this caller still owns it."""
+        from app import redis_client
+        
+        if not redis_client:
+            return
+        try:
+            if redis_client.get(lock_key) == token:
+                redis_client.delete(lock_key)
+        except Exception as e:
+            logger.warning(f"Failed to release resume render lock: {e}")
+
+
+# Shared instance so threads of one process coalesce on the same renders
+resume_render_cache = ResumeRenderCache()
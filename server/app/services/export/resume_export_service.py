@@ -54,6 +54,18 @@ class ResumeExportService:
         """
         return self._templates.get(template_id)
     
+    def resolve_template(self, template_id: str) -> BaseResumeTemplate:
+        """
+        Get the template used to render an export, falling back to the default.
+        
+        Args:
+            template_id: Template identifier (e.g., "modern", "classic")
+            
+        Returns:
+            Template instance
+        """
+        return self._templates.get(template_id, self._templates[self._default_template])
+    
     def export_pdf(
         self,
         markdown_content: str,
@@ -75,7 +87,7 @@ class ResumeExportService:
         if not markdown_content:
             raise ValueError("No content provided for PDF export")
         
-        template_obj = self._templates.get(template, self._templates[self._default_template])
+        template_obj = self.resolve_template(template)
         if not template_obj:
             raise ValueError(f"Template '{template}' not found")
         
@@ -122,7 +134,7 @@ class ResumeExportService:
         if not markdown_content:
             raise ValueError("No content provided for DOCX export")
         
-        template_obj = self._templates.get(template, self._templates[self._default_template])
+        template_obj = self.resolve_template(template)
         if not template_obj:
             raise ValueError(f"Template '{template}' not found")
         
@@ -133,6 +145,32 @@ class ResumeExportService:
         logger.info(f"DOCX generated successfully, size: {len(docx_bytes)} bytes")
         return docx_bytes
     
+    def export(
+        self,
+        markdown_content: str,
+        template: str = "modern",
+        export_format: str = "pdf",
+    ) -> bytes:
+        """
+        Export resume to a binary format.
+        
+        Args:
+            markdown_content: Resume content in markdown format
+            template: Template ID to use (default: "modern")
+            export_format: "pdf" or "docx"
+            
+        Returns:
+            File content as bytes
+            
+        Raises:
+            ValueError: If the format is not supported, template not found or content is empty
+        """
+        if export_format == "pdf":
+            return self.export_pdf(markdown_content, template=template)
+        if export_format == "docx":
+            return self.export_docx(markdown_content, template=template)
+        raise ValueError(f"Unsupported export format: {export_format}")
+    
     def get_preview_html(
         self,
         markdown_content: str,
@@ -156,7 +194,7 @@ class ResumeExportService:
         if not markdown_content:
             return "<html><body><p>No content available for preview</p></body></html>"
         
-        template_obj = self._templates.get(template, self._templates[self._default_template])
+        template_obj = self.resolve_template(template)
         if not template_obj:
             raise ValueError(f"Template '{template}' not found")
         
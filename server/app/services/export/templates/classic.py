@@ -34,6 +34,9 @@ class ClassicTemplate(BaseResumeTemplate):
     - More traditional formatting with indented bullets
     """
     
+    # Bump when the rendered HTML/DOCX changes (invalidates cached exports)
+    template_version = 1
+    
     @property
     def metadata(self) -> TemplateMetadata:
         return TemplateMetadata(
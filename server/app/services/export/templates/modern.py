@@ -33,6 +33,9 @@ class ModernTemplate(BaseResumeTemplate):
     - Black and white only
     """
     
+    # Bump when the rendered HTML/DOCX changes (invalidates cached exports)
+    template_version = 1
+    
     @property
     def metadata(self) -> TemplateMetadata:
         return TemplateMetadata(
@@ -412,6 +412,30 @@ class FileStorageService:
             logger.error(f"File upload failed: {e}")
             return {"success": False, "error": f"Upload failed: {str(e)}"}
     
+    def upload_bytes(self, file_key: str, file_content: bytes, mime_type: str) -> Dict[str, Any]:
+        """
+        Upload generated content under an explicit storage key.
+        
+        Unlike upload_file, no validation or key generation is applied; the
+        caller owns the key (e.g. a content-addressed cache key).
+        
+        Args:
+            file_key: Storage key/path
+            file_content: Content to store
+            mime_type: Content type
+        
+        Returns:
+            Dictionary with "success" and, on failure, "error"
+        """
+        try:
+            if self.storage_backend == 'gcs':
+                return self._upload_to_gcs(file_key, file_content, mime_type)
+            return self._upload_to_local(file_key, file_content)
+        
+        except Exception as e:
+            logger.error(f"File upload failed: {e}")
+            return {"success": False, "error": f"Upload failed: {str(e)}"}
+    
     def _upload_to_gcs(self, file_key: str, file_content: bytes, mime_type: str) -> Dict[str, Any]:
         """Upload file to Google Cloud Storage"""
         try:
@@ -441,8 +465,11 @@ class FileStorageService:
             file_path = self.local_path / file_key
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'wb') as f:
+            # Write-then-rename so concurrent readers never see a partial file
+            tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+            with open(tmp_path, 'wb') as f:
                 f.write(file_content)
+            os.replace(tmp_path, file_path)
             
             logger.info(f"Uploaded file to local storage: {file_path}")
             return {"success": True}
@@ -8,6 +8,7 @@ from app import db
 from app.models.global_role import GlobalRole
 from app.models.candidate_global_role import CandidateGlobalRole
 from app.models.role_job_mapping import RoleJobMapping
+from app.services.role_embedding_index import RoleEmbeddingIndex
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +102,7 @@ class GlobalRoleService:
         db.session.delete(role)
         db.session.commit()
         db.session.expire_all()
+        RoleEmbeddingIndex.bump_version()
         
         logger.info(f"Role {role_id} ({role_name}) rejected and deleted by PM_ADMIN. Reason: {reason}")
         return role_name
@@ -145,6 +147,7 @@ class GlobalRoleService:
         db.session.delete(role)
         db.session.commit()
         db.session.expire_all()
+        RoleEmbeddingIndex.bump_version()
         
         logger.info(f"Role {role_id} ({role_name}) deleted by PM_ADMIN")
         return role_name
@@ -10,12 +10,15 @@ from pathlib import Path
 from decimal import Decimal
 import logging
 
-from sqlalchemy import select, func
+from sqlalchemy import select, literal_column
 from sqlalchemy.dialects.postgresql import insert
 
 from app import db
 from app.models.job_posting import JobPosting
 from app.models.job_import_batch import JobImportBatch
+from app.services.job_posting_stats_service import JobPostingStatsService, JobStatsDelta
+from app.utils.phrase_matcher import PhraseMatcher
+from app.utils.skill_vocabulary import SKILL_DISPLAY_NAMES, SkillVocabulary
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -46,88 +49,11 @@ class JobImportService:
         'up_to': re.compile(r'up\s+to\s+(\d+)\s*(?:years?|yrs?)', re.IGNORECASE),
     }
     
-    # Common skill synonyms for normalization
-    SKILL_SYNONYMS = {
-        'aws': 'AWS',
-        'amazon web services': 'AWS',
-        'ec2': 'AWS EC2',
-        's3': 'AWS S3',
-        'kubernetes': 'Kubernetes',
-        'k8s': 'Kubernetes',
-        'docker': 'Docker',
-        'python': 'Python',
-        'java': 'Java',
-        'javascript': 'JavaScript',
-        'js': 'JavaScript',
-        'typescript': 'TypeScript',
-        'ts': 'TypeScript',
-        'react': 'React',
-        'reactjs': 'React',
-        'nodejs': 'Node.js',
-        'node': 'Node.js',
-        'angular': 'Angular',
-        'vue': 'Vue.js',
-        'vuejs': 'Vue.js',
-        'sql': 'SQL',
-        'mysql': 'MySQL',
-        'postgresql': 'PostgreSQL',
-        'postgres': 'PostgreSQL',
-        'mongodb': 'MongoDB',
-        'mongo': 'MongoDB',
-        'redis': 'Redis',
-        'jenkins': 'Jenkins',
-        'ci/cd': 'CI/CD',
-        'cicd': 'CI/CD',
-        'terraform': 'Terraform',
-        'ansible': 'Ansible',
-        'git': 'Git',
-        'github': 'GitHub',
-        'gitlab': 'GitLab',
-        'azure': 'Azure',
-        'gcp': 'Google Cloud',
-        'google cloud': 'Google Cloud',
-        'devops': 'DevOps',
-        'machine learning': 'Machine Learning',
-        'ml': 'Machine Learning',
-        'ai': 'Artificial Intelligence',
-        'rest': 'REST API',
-        'restful': 'REST API',
-        'api': 'API',
-        'graphql': 'GraphQL',
-        'kafka': 'Kafka',
-        'spark': 'Apache Spark',
-        'hadoop': 'Hadoop',
-        'linux': 'Linux',
-        'unix': 'Unix',
-        'bash': 'Bash',
-        'shell': 'Shell Script',
-        'powershell': 'PowerShell',
-        'c++': 'C++',
-        'c#': 'C#',
-        'csharp': 'C#',
-        '.net': '.NET',
-        'dotnet': '.NET',
-        'ruby': 'Ruby',
-        'rails': 'Ruby on Rails',
-        'php': 'PHP',
-        'go': 'Go',
-        'golang': 'Go',
-        'rust': 'Rust',
-        'swift': 'Swift',
-        'kotlin': 'Kotlin',
-        'scala': 'Scala',
-        'r': 'R',
-        'matlab': 'MATLAB',
-        'tableau': 'Tableau',
-        'power bi': 'Power BI',
-        'powerbi': 'Power BI',
-        'salesforce': 'Salesforce',
-        'sap': 'SAP',
-        'oracle': 'Oracle',
-        'agile': 'Agile',
-        'scrum': 'Scrum',
-        'jira': 'Jira',
-    }
+    # Common skill synonyms for normalization (raw skill -> display name)
+    SKILL_SYNONYMS = SKILL_DISPLAY_NAMES
+    
+    # Single-pass word-boundary matcher over the SKILL_SYNONYMS keywords
+    SKILL_KEYWORD_MATCHER = PhraseMatcher(SKILL_DISPLAY_NAMES, re.IGNORECASE)
     
     # Remote work indicators
     REMOTE_KEYWORDS = [
@@ -293,11 +219,9 @@ class JobImportService:
         
         # Extract skills mentioned in description
         found_skills = set(existing_skills)
-        for keyword, normalized_skill in self.SKILL_SYNONYMS.items():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, description_lower, re.IGNORECASE):
-                found_skills.add(normalized_skill)
+        # Use word boundaries to avoid partial matches
+        for keyword in self.SKILL_KEYWORD_MATCHER.find_all(description_lower):
+            found_skills.add(self.SKILL_SYNONYMS[keyword])
         
         return sorted(list(found_skills))
     
@@ -499,6 +423,8 @@ class JobImportService:
         normalized_skills = self.normalize_skills(raw_skills)
         enhanced_skills = self.extract_skills_from_description(description, normalized_skills)
         job_data['skills'] = enhanced_skills
+        # Bulk inserts bypass the model's skills validator, so set ids here
+        job_data['skill_ids'] = SkillVocabulary.skill_ids(enhanced_skills)
         
         # NOTE: extracted_keywords is now populated by Inngest workflow after import
         # The old 'keywords' column has been removed from JobPosting model
@@ -591,6 +517,7 @@ class JobImportService:
                     'experience_min': stmt.excluded.experience_min,
                     'experience_max': stmt.excluded.experience_max,
                     'skills': stmt.excluded.skills,
+                    'skill_ids': stmt.excluded.skill_ids,
                     'job_url': stmt.excluded.job_url,
                     'apply_url': stmt.excluded.apply_url,
                     'status': stmt.excluded.status,
@@ -599,32 +526,36 @@ class JobImportService:
                     'updated_at': datetime.utcnow(),
                 }
                 
+                # xmax = 0 only for rows inserted by this statement (not conflict updates)
                 stmt = stmt.on_conflict_do_update(
                     index_elements=['platform', 'external_job_id'],
                     set_=update_dict
-                ).returning(JobPosting.id)
+                ).returning(JobPosting.platform, JobPosting.external_job_id, literal_column('xmax = 0'))
+                
+                # Execute and split new vs updated rows
+                inserted_keys = {
+                    (platform, external_job_id)
+                    for platform, external_job_id, inserted in db.session.execute(stmt)
+                    if inserted
+                }
+                new_count = len(inserted_keys)
+                updated_count = len(jobs_data) - new_count
                 
-                # Execute and count results
-                result = db.session.execute(stmt)
+                stats_delta = JobStatsDelta()
+                for job_data in jobs_data:
+                    if (job_data['platform'], job_data['external_job_id']) in inserted_keys:
+                        stats_delta.add(job_data)
+                JobPostingStatsService.record_imported_jobs(stats_delta)
                 db.session.commit()
                 
-                # For upsert, we need to check which were new vs updated
-                # This is approximate - assumes all were processed successfully
-                existing_count = db.session.scalar(
-                    select(func.count(JobPosting.id)).where(
-                        JobPosting.import_batch_id == batch_id
-                    )
+                logger.info(
+                    f"Bulk upserted {len(jobs_data)} jobs (batch: {batch_id}): "
+                    f"{new_count} new, {updated_count} updated"
                 )
                 
-                # Estimate: if we have fewer records than input, some were updates
-                total_processed = len(jobs_data)
-                new_count = total_processed
-                updated_count = 0  # This is approximate with bulk upsert
-                
-                logger.info(f"Bulk upserted {total_processed} jobs (batch: {batch_id})")
-                
             else:
                 # Insert only new jobs, skip existing
+                stats_delta = JobStatsDelta()
                 for job_data in jobs_data:
                     try:
                         existing = self.check_duplicate(
@@ -639,17 +570,22 @@ class JobImportService:
                         job = JobPosting(**job_data)
                         db.session.add(job)
                         new_count += 1
+                        stats_delta.add(job_data)
                         
                         # Commit in batches of 100
                         if (new_count + updated_count + failed_count) % 100 == 0:
+                            JobPostingStatsService.record_imported_jobs(stats_delta)
                             db.session.commit()
+                            stats_delta = JobStatsDelta()
                             
                     except Exception as e:
                         logger.error(f"Failed to insert job {job_data.get('external_job_id')}: {e}")
                         batch.add_error(job_data.get('external_job_id', 'unknown'), str(e))
                         failed_count += 1
                         db.session.rollback()
+                        stats_delta = JobStatsDelta()
                 
+                JobPostingStatsService.record_imported_jobs(stats_delta)
                 db.session.commit()
                 logger.info(f"Inserted {new_count} new jobs, skipped {updated_count} existing")
                 
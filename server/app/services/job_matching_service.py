@@ -14,12 +14,12 @@ import re
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from sqlalchemy import select, and_, func
-from difflib import SequenceMatcher
 
 from app import db
 from app.models.candidate import Candidate
 from app.models.job_posting import JobPosting
 from app.models.candidate_job_match import CandidateJobMatch
+from app.utils.skill_vocabulary import SKILL_SYNONYMS, SkillVocabulary
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -47,192 +47,8 @@ class JobMatchingService:
     GRADE_C = 60       # Fair match
     GRADE_D = 50       # Poor match
     
-    # Skill synonyms dictionary for flexible matching
-    # Complete dictionary as documented in 06-SKILL-MATCHING.md
-    SKILL_SYNONYMS = {
-        # ===================
-        # CLOUD PLATFORMS
-        # ===================
-        'aws': [
-            'amazon web services', 
-            'amazon aws', 
-            'ec2', 
-            's3', 
-            'lambda', 
-            'cloudwatch',
-            'aws lambda'
-        ],
-        'gcp': [
-            'google cloud', 
-            'google cloud platform', 
-            'gce', 
-            'bigquery', 
-            'google compute engine'
-        ],
-        'azure': [
-            'microsoft azure', 
-            'azure cloud', 
-            'azure devops',
-            'azure functions'
-        ],
-        
-        # ===================
-        # PROGRAMMING LANGUAGES
-        # ===================
-        'javascript': ['js', 'es6', 'es2015', 'ecmascript', 'es5', 'es7'],
-        'typescript': ['ts'],
-        'python': ['py', 'python3', 'python2', 'cpython'],
-        'golang': ['go', 'go lang', 'go-lang'],
-        'c++': ['cpp', 'cplusplus', 'c plus plus'],
-        'c#': ['csharp', 'c sharp', 'dotnet'],
-        '.net': ['dotnet', 'dot net', '.net core', 'dotnet core'],
-        'ruby': ['rb'],
-        'rust': ['rustlang'],
-        'scala': ['scala lang'],
-        'kotlin': ['kt'],
-        'swift': ['swift lang', 'swiftui'],
-        'objective-c': ['objc', 'objective c'],
-        'php': ['php7', 'php8'],
-        'perl': ['perl5', 'perl6'],
-        
-        # ===================
-        # FRONTEND FRAMEWORKS
-        # ===================
-        'react': ['reactjs', 'react.js', 'react native', 'react-native'],
-        'vue': ['vuejs', 'vue.js', 'vue3', 'nuxt', 'nuxtjs'],
-        'angular': ['angularjs', 'angular.js', 'angular2', 'angular 2'],
-        'svelte': ['sveltejs', 'sveltekit'],
-        'next.js': ['nextjs', 'next'],
-        'gatsby': ['gatsbyjs'],
-        'ember': ['emberjs', 'ember.js'],
-        'backbone': ['backbonejs', 'backbone.js'],
-        'jquery': ['jq'],
-        
-        # ===================
-        # BACKEND FRAMEWORKS
-        # ===================
-        'node': ['nodejs', 'node.js', 'express', 'expressjs'],
-        'express': ['expressjs', 'express.js'],
-        'django': ['django rest framework', 'drf', 'django-rest'],
-        'flask': ['flask api'],
-        'fastapi': ['fast api', 'fast-api'],
-        'rails': ['ruby on rails', 'ror', 'ruby rails'],
-        'spring': ['spring boot', 'springboot', 'spring framework'],
-        'laravel': ['laravel php'],
-        'asp.net': ['asp net', 'aspnet'],
-        'nestjs': ['nest.js', 'nest'],
-        'koa': ['koajs', 'koa.js'],
-        'hapi': ['hapijs'],
-        'gin': ['gin-gonic', 'gin golang'],
-        'fiber': ['gofiber', 'fiber golang'],
-        
-        # ===================
-        # DATABASES
-        # ===================
-        'postgresql': ['postgres', 'pg', 'psql', 'pgsql'],
-        'mysql': ['mariadb', 'maria db', 'mysql server'],
-        'mongodb': ['mongo', 'mongo db', 'mongoose'],
-        'redis': ['redis cache', 'redis db'],
-        'elasticsearch': ['elastic search', 'elastic', 'es'],
-        'cassandra': ['apache cassandra'],
-        'dynamodb': ['dynamo db', 'amazon dynamodb'],
-        'oracle': ['oracle db', 'oracle database', 'plsql', 'pl/sql'],
-        'sql server': ['mssql', 'ms sql', 'microsoft sql'],
-        'sqlite': ['sqlite3'],
-        'couchdb': ['couch db', 'apache couchdb'],
-        'neo4j': ['neo 4j'],
-        'firestore': ['firebase firestore', 'cloud firestore'],
-        
-        # ===================
-        # DEVOPS & INFRASTRUCTURE
-        # ===================
-        'kubernetes': ['k8s', 'kube', 'kubectl'],
-        'docker': ['docker compose', 'docker-compose', 'containerization', 'containers'],
-        'terraform': ['tf', 'infrastructure as code', 'iac', 'hcl'],
-        'ansible': ['ansible playbook'],
-        'puppet': ['puppet enterprise'],
-        'chef': ['chef infra'],
-        'jenkins': ['jenkins ci', 'jenkinsfile'],
-        'gitlab ci': ['gitlab-ci', 'gitlab ci/cd'],
-        'github actions': ['gh actions'],
-        'circle ci': ['circleci'],
-        'travis ci': ['travis-ci', 'travisci'],
-        'ci/cd': ['cicd', 'continuous integration', 'continuous delivery', 'continuous deployment'],
-        'nginx': ['nginx server'],
-        'apache': ['apache server', 'httpd'],
-        'linux': ['unix', 'ubuntu', 'centos', 'debian', 'rhel'],
-        'bash': ['shell', 'shell script', 'sh', 'zsh'],
-        'prometheus': ['prometheus monitoring'],
-        'grafana': ['grafana dashboard'],
-        'datadog': ['data dog'],
-        
-        # ===================
-        # MESSAGE QUEUES
-        # ===================
-        'kafka': ['apache kafka'],
-        'rabbitmq': ['rabbit mq', 'amqp'],
-        'sqs': ['amazon sqs', 'aws sqs'],
-        'pubsub': ['google pubsub', 'gcp pubsub', 'pub/sub'],
-        
-        # ===================
-        # DATA & ML
-        # ===================
-        'machine learning': ['ml'],
-        'artificial intelligence': ['ai'],
-        'deep learning': ['dl'],
-        'natural language processing': ['nlp'],
-        'computer vision': ['cv'],
-        'tensorflow': ['tf', 'tf2'],
-        'pytorch': ['torch'],
-        'scikit-learn': ['sklearn', 'scikit learn'],
-        'pandas': ['pd'],
-        'numpy': ['np'],
-        'spark': ['apache spark', 'pyspark'],
-        'hadoop': ['apache hadoop', 'hdfs'],
-        
-        # ===================
-        # API & PROTOCOLS
-        # ===================
-        'rest api': ['restful', 'rest', 'restful api'],
-        'graphql': ['graph ql'],
-        'grpc': ['g rpc', 'google rpc'],
-        'websocket': ['websockets', 'ws'],
-        'oauth': ['oauth2', 'oauth 2.0'],
-        'jwt': ['json web token'],
-        
-        # ===================
-        # TESTING
-        # ===================
-        'unit testing': ['unit tests'],
-        'jest': ['jestjs'],
-        'pytest': ['py.test'],
-        'mocha': ['mochajs'],
-        'cypress': ['cypress.io'],
-        'selenium': ['selenium webdriver'],
-        'playwright': ['playwright testing'],
-        
-        # ===================
-        # VERSION CONTROL
-        # ===================
-        'git': ['github', 'gitlab', 'bitbucket', 'version control'],
-        
-        # ===================
-        # AGILE & PROJECT
-        # ===================
-        'agile': ['scrum', 'kanban', 'agile methodology'],
-        'jira': ['atlassian jira'],
-        
-        # ===================
-        # OTHER
-        # ===================
-        'html': ['html5'],
-        'css': ['css3', 'scss', 'sass', 'less'],
-        'tailwind': ['tailwindcss', 'tailwind css'],
-        'bootstrap': ['bootstrap css', 'bootstrap 5'],
-        'webpack': ['webpackjs'],
-        'vite': ['vitejs'],
-        'babel': ['babeljs'],
-    }
+    # Skill synonyms dictionary for flexible matching (shared vocabulary)
+    SKILL_SYNONYMS = SKILL_SYNONYMS
     
     # Fuzzy match threshold (0-1, higher = stricter)
     FUZZY_MATCH_THRESHOLD = 0.85
@@ -293,7 +109,8 @@ class JobMatchingService:
         
         skill_score, matched_skills, missing_skills = self.calculate_skill_match(
             candidate_skills,
-            job_skills
+            job_skills,
+            candidate_skill_ids=list(candidate.skill_ids) if candidate.skill_ids is not None else None
         )
         
         # 2. Calculate experience match (25%)
@@ -419,18 +236,25 @@ class JobMatchingService:
             'explanation': explanation
         }
     
-    def calculate_skill_match(self, candidate_skills: List[str], job_skills: List[str]) -> Tuple[float, List[str], List[str]]:
+    def calculate_skill_match(
+        self,
+        candidate_skills: List[str],
+        job_skills: List[str],
+        candidate_skill_ids: Optional[List[int]] = None
+    ) -> Tuple[float, List[str], List[str]]:
         """
         Calculate skill match score between candidate and job.
         
         Uses three matching strategies:
         1. Exact match (case-insensitive)
-        2. Fuzzy match using string similarity (for typos/variations)
-        3. Synonym match (AWS = Amazon Web Services, etc.)
+        2. Synonym match (AWS = Amazon Web Services, etc.) via shared skill ids,
+           plus related skills (C# / .NET, Node / Express)
+        3. Fuzzy match using string similarity (for typos/variations)
         
         Args:
             candidate_skills: List of candidate's skills
             job_skills: List of required job skills
+            candidate_skill_ids: Candidate's stored skill ids (computed if not provided)
             
         Returns:
             Tuple of (match_score_0_to_100, matched_skills_list, missing_skills_list)
@@ -447,52 +271,13 @@ class JobMatchingService:
         candidate_skills_normalized = [str(s).lower().strip() for s in candidate_skills if s is not None and str(s).strip()]
         job_skills_normalized = [str(s).lower().strip() for s in job_skills if s is not None and str(s).strip()]
         
-        matched_skills = []
-        missing_skills = []
-        
-        for job_skill in job_skills_normalized:
-            is_matched = False
-            
-            # Strategy 1: Exact match
-            if job_skill in candidate_skills_normalized:
-                matched_skills.append(job_skill)
-                is_matched = True
-                continue
-            
-            # Strategy 2: Synonym match
-            if not is_matched:
-                # Check if job_skill is in our synonym dictionary
-                for base_skill, synonyms in self.SKILL_SYNONYMS.items():
-                    # Check if job skill matches base or any synonym
-                    if job_skill == base_skill or job_skill in synonyms:
-                        # Check if candidate has base or any synonym
-                        if base_skill in candidate_skills_normalized or any(syn in candidate_skills_normalized for syn in synonyms):
-                            matched_skills.append(job_skill)
-                            is_matched = True
-                            break
-                
-                # Also check reverse: if candidate skill is base, job might be synonym
-                if not is_matched:
-                    for candidate_skill in candidate_skills_normalized:
-                        if candidate_skill in self.SKILL_SYNONYMS:
-                            synonyms = self.SKILL_SYNONYMS[candidate_skill]
-                            if job_skill in synonyms:
-                                matched_skills.append(job_skill)
-                                is_matched = True
-                                break
-            
-            # Strategy 3: Fuzzy match (for typos/minor variations)
-            if not is_matched:
-                for candidate_skill in candidate_skills_normalized:
-                    similarity = SequenceMatcher(None, job_skill, candidate_skill).ratio()
-                    if similarity >= self.FUZZY_MATCH_THRESHOLD:
-                        matched_skills.append(job_skill)
-                        is_matched = True
-                        break
-            
-            # If still not matched, add to missing skills
-            if not is_matched:
-                missing_skills.append(job_skill)
+        matched_skills, missing_skills, _ = SkillVocabulary.match_skills(
+            candidate_skills_normalized,
+            job_skills_normalized,
+            candidate_skill_ids=candidate_skill_ids,
+            fuzzy_threshold=self.FUZZY_MATCH_THRESHOLD,
+            include_related=True
+        )
         
         # Calculate percentage score
         match_percentage = (len(matched_skills) / len(job_skills_normalized)) * 100.0
@@ -886,7 +671,7 @@ class JobMatchingService:
         logger.info(f"Generating matches for candidate {candidate_id} (min_score={min_score}, limit={limit})")
         
         # 1. Fetch candidate
-        candidate = db.session.get(Candidate, candidate_id)
+        candidate = db.session.get(Candidate, candidate_id, options=[Candidate.with_embedding()])
         if not candidate:
             raise ValueError(f"Candidate {candidate_id} not found")
         
@@ -897,7 +682,7 @@ class JobMatchingService:
         # 2. Fetch all ACTIVE jobs (jobs are global, not tenant-specific)
         jobs_query = select(JobPosting).where(
             JobPosting.status == 'ACTIVE'
-        )
+        ).options(JobPosting.with_embedding())
         jobs = db.session.execute(jobs_query).scalars().all()
         
         if not jobs:
@@ -2,8 +2,9 @@
 Job Posting Service
 Business logic for job posting queries with optimized N+1 elimination
 """
+import html
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from sqlalchemy import select, func, or_, and_, case
 from sqlalchemy.sql.functions import coalesce
 from sqlalchemy.orm import joinedload
@@ -21,6 +22,114 @@ logger = logging.getLogger(__name__)
 class JobPostingService:
     """Service for optimized job posting queries"""
     
+    # Text search configuration used by the job_postings.search_vector trigger
+    SEARCH_CONFIG = 'english'
+    
+    # ts_headline markers; replaced with <mark> tags after the snippet is HTML-escaped
+    _HIGHLIGHT_START = '\x02'
+    _HIGHLIGHT_STOP = '\x03'
+    
+    @staticmethod
+    def search_tsquery(search: str):
+        """
+        Build the tsquery for user search text.
+        
+        Uses websearch_to_tsquery, so quoted phrases, OR and -term work and
+        punctuation is never a syntax error.
+        
+        Args:
+            search: Raw search text
+            
+        Returns:
+            SQL tsquery expression
+        """
+        return func.websearch_to_tsquery(JobPostingService.SEARCH_CONFIG, search)
+    
+    @staticmethod
+    def search_filter(search: str, tsquery=None):
+        """
+        Build the job search condition.
+        
+        Matches the weighted full-text vector (title, skills, company,
+        description), plus substring matches on title/company/location so
+        partial words keep working. Every branch is served by a GIN index
+        (search_vector, pg_trgm), so the condition composes with other filters
+        without a table scan.
+        
+        Args:
+            search: Raw search text
+            tsquery: Precomputed search_tsquery(search), if the caller also ranks
+            
+        Returns:
+            SQLAlchemy filter condition
+        """
+        if tsquery is None:
+            tsquery = JobPostingService.search_tsquery(search)
+        pattern = f'%{search}%'
+        return or_(
+            JobPosting.search_vector.op('@@')(tsquery),
+            JobPosting.title.ilike(pattern),
+            JobPosting.company.ilike(pattern),
+            JobPosting.location.ilike(pattern),
+        )
+    
+    @staticmethod
+    def search_rank(tsquery):
+        """
+        Relevance of a job for a tsquery (ts_rank; title > skills > company > description).
+        
+        Args:
+            tsquery: Expression from search_tsquery()
+            
+        Returns:
+            SQL float expression (0 for substring-only matches)
+        """
+        return func.ts_rank(JobPosting.search_vector, tsquery)
+    
+    @staticmethod
+    def get_search_highlights(job_ids: List[int], search: str) -> Dict[int, Dict[str, str]]:
+        """
+        Build highlighted title/description snippets for a page of search results.
+        
+        Runs ts_headline only for the given jobs (one query), after pagination.
+        Snippet text is HTML-escaped; matches are wrapped in <mark> tags.
+        
+        Args:
+            job_ids: Job IDs on the current page
+            search: Raw search text
+            
+        Returns:
+            Dict of job_id -> {'title': ..., 'description': ...}
+        """
+        if not job_ids or not search:
+            return {}
+        
+        config = JobPostingService.SEARCH_CONFIG
+        tsquery = JobPostingService.search_tsquery(search)
+        markers = f'StartSel={JobPostingService._HIGHLIGHT_START}, StopSel={JobPostingService._HIGHLIGHT_STOP}'
+        rows = db.session.execute(
+            select(
+                JobPosting.id,
+                func.ts_headline(config, JobPosting.title, tsquery, f'{markers}, HighlightAll=true'),
+                func.ts_headline(
+                    config, JobPosting.description, tsquery,
+                    f'{markers}, MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter=" ... "'
+                ),
+            ).where(JobPosting.id.in_(job_ids))
+        ).all()
+        
+        def to_html(snippet: Optional[str]) -> str:
+            return (
+                html.escape(snippet or '')
+                .replace(JobPostingService._HIGHLIGHT_START, '<mark>')
+                .replace(JobPostingService._HIGHLIGHT_STOP, '</mark>')
+            )
+        
+        return {
+            job_id: {'title': to_html(title), 'description': to_html(description)}
+            for job_id, title, description in rows
+        }
+    
     @staticmethod
     def _get_visibility_filter(tenant_id: int, source: str = 'all'):
         """
@@ -101,10 +210,12 @@ class JobPostingService:
             page: Page number (1-indexed)
             per_page: Results per page (max 100)
             status: Filter by status ('active', 'inactive', 'closed')
-            search: Search in title, company, location, description, skills
+            search: Full-text search over title, skills, company, description
+                (plus partial matches on title, company, location)
             location: Filter by location (partial match)
             is_remote: Filter by remote flag
-            sort_by: Sort field ('date', 'posted_date', 'title', 'company', 'salary_min', 'created_at')
+            sort_by: Sort field ('relevance', 'date', 'posted_date', 'title', 'company', 'salary_min',
+                'created_at'); 'relevance' ranks search results and falls back to 'date' without search
             sort_order: Sort direction ('asc', 'desc')
             source: Filter by source ('all', 'email', 'scraped')
             platform: Filter by platform ('indeed', 'dice', 'email', etc.)
@@ -134,18 +245,20 @@ class JobPostingService:
             query = query.where(JobPosting.is_remote == is_remote)
         
         search_filter = None
+        search_query = None
         if search:
-            search_filter = or_(
-                JobPosting.title.ilike(f'%{search}%'),
-                JobPosting.company.ilike(f'%{search}%'),
-                JobPosting.location.ilike(f'%{search}%'),
-                JobPosting.description.ilike(f'%{search}%'),
-                func.array_to_string(JobPosting.skills, ',').ilike(f'%{search}%')
-            )
+            search_query = JobPostingService.search_tsquery(search)
+            search_filter = JobPostingService.search_filter(search, search_query)
             query = query.where(search_filter)
         
         # Apply sorting
-        if sort_by == 'date':
+        if sort_by == 'relevance' and search_query is not None:
+            # Best full-text match first; substring-only matches (rank 0) by recency
+            query = query.order_by(
+                JobPostingService.search_rank(search_query).desc(),
+                JobPosting.created_at.desc()
+            )
+        elif sort_by == 'date' or sort_by == 'relevance':
             # COALESCE: prefer posted_date, fall back to created_at
             sort_field = coalesce(
                 func.cast(JobPosting.posted_date, db.DateTime),
@@ -161,14 +274,18 @@ class JobPostingService:
             }
             sort_field = valid_sort_fields.get(sort_by, JobPosting.created_at)
         
-        if sort_order.lower() == 'desc':
-            query = query.order_by(sort_field.desc().nullslast())
-        else:
-            query = query.order_by(sort_field.asc().nullslast())
+        if search_query is None or sort_by != 'relevance':
+            if sort_order.lower() == 'desc':
+                query = query.order_by(sort_field.desc().nullslast())
+            else:
+                query = query.order_by(sort_field.asc().nullslast())
         
-        # Eager load sourced_by_user to prevent N+1
+        # Eager load sourced_by_user to prevent N+1; to_dict() serializes the deferred description
         # Type ignore for SQLAlchemy relationship property
-        query = query.options(joinedload(JobPosting.sourced_by_user))  # type: ignore[arg-type]
+        query = query.options(
+            joinedload(JobPosting.sourced_by_user),  # type: ignore[arg-type]
+            JobPosting.with_description(),
+        )
         
         # Get total count with same filters (for pagination)
         count_query = select(func.count(JobPosting.id)).where(visibility_filter)
@@ -305,6 +422,12 @@ class JobPostingService:
             job_dict['matched_candidates'] = matched
             job_dict['matched_candidates_count'] = len(matched)
         
+        # Highlighted snippets for the current page of search results
+        if search and job_ids:
+            highlights = JobPostingService.get_search_highlights(job_ids, search)
+            for job_dict in jobs_list:
+                job_dict['search_highlights'] = highlights.get(job_dict.get('id'))
+        
         return {
             'jobs': jobs_list,
             'total': total,
@@ -316,9 +439,26 @@ class JobPostingService:
     @staticmethod
     def get_statistics_optimized(tenant_id: int) -> Dict[str, Any]:
         """
-        Get job posting statistics with optimized single-query aggregation.
+        Get job posting statistics from the incrementally maintained counters.
+        
+        See JobPostingStatsService.get_statistics.
+        
+        Args:
+            tenant_id: Current tenant ID
+            
+        Returns:
+            Dict with statistics about job postings and their freshness
+        """
+        from app.services.job_posting_stats_service import JobPostingStatsService
+        return JobPostingStatsService.get_statistics(tenant_id)
+    
+    @staticmethod
+    def compute_statistics_exact(tenant_id: int) -> Dict[str, Any]:
+        """
+        Compute job posting statistics by aggregating all visible job postings.
         
         Uses conditional aggregation to combine multiple COUNT queries into one.
+        Cost grows with the catalogue size; used until the first stats recompute.
         
         Args:
             tenant_id: Current tenant ID
@@ -403,16 +543,6 @@ class JobPostingService:
                         "jobs_count": count,
                     })
         
-        # Email processing stats (tenant-specific)
-        email_stats_query = select(
-            func.count(ProcessedEmail.id).label('emails_processed'),
-            func.count(case((ProcessedEmail.job_id.isnot(None), 1))).label('emails_converted'),
-        ).where(ProcessedEmail.tenant_id == tenant_id)
-        
-        email_stats = db.session.execute(email_stats_query).first()
-        emails_processed = email_stats.emails_processed if email_stats and email_stats.emails_processed else 0
-        emails_converted = email_stats.emails_converted if email_stats and email_stats.emails_converted else 0
-        
         return {
             'total_jobs': result.total_jobs or 0,
             'active_jobs': result.active_jobs or 0,
@@ -425,6 +555,30 @@ class JobPostingService:
             'by_platform': by_platform,
             # Email stats
             'email_by_user': email_by_user,
+            **JobPostingService.get_email_processing_stats(tenant_id),
+        }
+    
+    @staticmethod
+    def get_email_processing_stats(tenant_id: int) -> Dict[str, Any]:
+        """
+        Get email processing stats for a tenant.
+        
+        Args:
+            tenant_id: Current tenant ID
+            
+        Returns:
+            Dict with emails_processed, emails_converted and email_conversion_rate
+        """
+        email_stats_query = select(
+            func.count(ProcessedEmail.id).label('emails_processed'),
+            func.count(case((ProcessedEmail.job_id.isnot(None), 1))).label('emails_converted'),
+        ).where(ProcessedEmail.tenant_id == tenant_id)
+        
+        email_stats = db.session.execute(email_stats_query).first()
+        emails_processed = email_stats.emails_processed if email_stats and email_stats.emails_processed else 0
+        emails_converted = email_stats.emails_converted if email_stats and email_stats.emails_converted else 0
+        
+        return {
             'emails_processed': emails_processed,
             'emails_converted': emails_converted,
             'email_conversion_rate': round(emails_converted / emails_processed * 100, 1) if emails_processed > 0 else 0,
@@ -0,0 +1,510 @@
+"""
+Job Posting Stats Service
+
+Jobs-page statistics served from incrementally maintained counters instead of
+aggregating every visible job posting on each page load.
+
+Key Features:
+- Per-segment counter table (scraped catalogue, per-tenant email jobs by user)
+  incremented by the job import paths in the importing transaction
+- HyperLogLog sketches in Redis (PFADD/PFCOUNT) for approximate distinct
+  companies and locations; a tenant's count is the union of the global and
+  tenant sketches
+- Exact recompute on a schedule corrects counter drift from status changes and
+  deletions (applied as deltas, without locking imports out) and rebuilds the
+  sketches and a distinct-count snapshot
+- Every response reports when the last exact recompute ran
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from sqlalchemy import and_, case, delete, exists, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from app import db
+from app.models.job_posting import JobPosting
+from app.models.job_posting_stats import GLOBAL_SEGMENT, JobPostingStatCounter, JobPostingStatSnapshot
+from app.models.portal_user import PortalUser
+from app.services.job_posting_service import JobPostingService
+
+logger = logging.getLogger(__name__)
+
+REDIS_HLL_PREFIX = "job_stats:hll"
+
+# Values PFADDed per Redis round trip while rebuilding sketches
+HLL_REBUILD_CHUNK = 5000
+
+# Sketched columns: sketch name -> JobPosting column
+HLL_COLUMNS = {
+    "companies": JobPosting.company,
+    "locations": JobPosting.location,
+}
+
+
+def _hll_key(name: str, tenant_id: int) -> str:
+    """Redis key of a distinct-value sketch (tenant_id 0 = scraped catalogue)."""
+    return f"{REDIS_HLL_PREFIX}:{name}:{tenant_id}"
+
+
+class JobStatsDelta:
+    """
+    Jobs imported in one transaction, accumulated for
+    JobPostingStatsService.record_imported_jobs().
+    
+    Add each new job (JobPosting or column dict) before the transaction commits.
+    """
+    
+    def __init__(self):
+        # (tenant_id, platform, sourced_by_user_id) -> [total, active, remote]
+        self.counters: Dict[Tuple[int, str, int], List[int]] = {}
+        # sketch name -> tenant_id -> values
+        self.values: Dict[str, Dict[int, Set[str]]] = {name: {} for name in HLL_COLUMNS}
+    
+    def add(self, job: Union[JobPosting, Dict[str, Any]]) -> None:
+        """Count one newly inserted job."""
+        get = job.get if isinstance(job, dict) else (lambda attr: getattr(job, attr, None))
+        
+        if get("is_email_sourced"):
+            if get("source_tenant_id") is None:
+                return  # Not visible to any tenant
+            tenant_id = get("source_tenant_id")
+            user_id = get("sourced_by_user_id") or GLOBAL_SEGMENT
+        else:
+            tenant_id = GLOBAL_SEGMENT
+            user_id = GLOBAL_SEGMENT
+        
+        counts = self.counters.setdefault((tenant_id, get("platform") or "", user_id), [0, 0, 0])
+        counts[0] += 1
+        if (get("status") or "ACTIVE") == "ACTIVE":
+            counts[1] += 1
+        if get("is_remote"):
+            counts[2] += 1
+        
+        for name, column in HLL_COLUMNS.items():
+            value = get(column.key)
+            if value:
+                self.values[name].setdefault(tenant_id, set()).add(value)
+    
+    def __bool__(self) -> bool:
+        return bool(self.counters)
+
+
+class JobPostingStatsService:
+    """Service for incrementally maintained job posting statistics."""
+    
+    @staticmethod
+    def record_imported_jobs(delta: JobStatsDelta) -> None:
+        """
+        Apply imported jobs to the counters and sketches.
+        
+        Call inside the importing transaction, right before its commit, so the
+        counter increments commit (or roll back) with the jobs. Failures are
+        logged and never fail the import; the next recompute corrects them.
+        
+        Args:
+            delta: Jobs inserted by the current transaction
+        """
+        if not delta:
+            return
+        
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "platform": platform,
+                "sourced_by_user_id": user_id,
+                "total_jobs": total,
+                "active_jobs": active,
+                "remote_jobs": remote,
+            }
+            for (tenant_id, platform, user_id), (total, active, remote) in sorted(delta.counters.items())
+        ]
+        stmt = JobPostingStatsService._increment_counters_stmt(rows, datetime.utcnow())
+        try:
+            with db.session.begin_nested():
+                db.session.execute(stmt)
+        except Exception as e:
+            logger.warning(f"Failed to update job posting stat counters: {e}")
+        
+        JobPostingStatsService._add_to_sketches(delta.values)
+    
+    @staticmethod
+    def _increment_counters_stmt(rows: List[Dict[str, Any]], updated_at: datetime):
+        """
+        Upsert adding each row's counts to its segment's counters.
+        
+        Rows are applied in the given order; callers sort them by segment so
+        concurrent writers lock counter rows in the same order.
+        """
+        stmt = pg_insert(JobPostingStatCounter).values([{**row, "updated_at": updated_at} for row in rows])
+        return stmt.on_conflict_do_update(
+            constraint="uq_job_posting_stat_counter_segment",
+            set_={
+                "total_jobs": JobPostingStatCounter.total_jobs + stmt.excluded.total_jobs,
+                "active_jobs": JobPostingStatCounter.active_jobs + stmt.excluded.active_jobs,
+                "remote_jobs": JobPostingStatCounter.remote_jobs + stmt.excluded.remote_jobs,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+    
+    @staticmethod
+    def _add_to_sketches(values: Dict[str, Dict[int, Set[str]]]) -> None:
+        """PFADD new values to the distinct-count sketches (no-op without Redis)."""
+        from app import redis_client
+        
+        if not redis_client:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for name, by_tenant in values.items():
+                for tenant_id, tenant_values in by_tenant.items():
+                    pipe.pfadd(_hll_key(name, tenant_id), *tenant_values)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to update job posting stat sketches: {e}")
+    
+    @staticmethod
+    def recompute() -> Dict[str, Any]:
+        """
+        Rebuild counters, distinct-count snapshot and sketches from job_postings.
+        
+        Called by the recompute-job-posting-stats scheduled function. The
+        aggregates and the current counters are read in one REPEATABLE READ
+        snapshot without locking; the difference is then added to the counters
+        in a short write transaction. Imports committing meanwhile keep their
+        own increments, so no lock on the counter table is needed.
+        
+        Returns:
+            Dict with counter segment count, tenants snapshotted and computed_at
+        """
+        computed_at = datetime.utcnow()
+        is_scraped = JobPosting.is_email_sourced.is_(False)
+        is_tenant_email = and_(JobPosting.is_email_sourced.is_(True), JobPosting.source_tenant_id.isnot(None))
+        
+        # Read phase: every aggregate sees the same committed state as the counters
+        db.session.commit()
+        db.session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        
+        # Counters: one pass over the visible postings
+        tenant_segment = case((is_scraped, GLOBAL_SEGMENT), else_=JobPosting.source_tenant_id)
+        user_segment = case(
+            (is_scraped, GLOBAL_SEGMENT),
+            else_=func.coalesce(JobPosting.sourced_by_user_id, GLOBAL_SEGMENT)
+        )
+        counter_rows = db.session.execute(
+            select(
+                tenant_segment.label("tenant_id"),
+                func.coalesce(JobPosting.platform, "").label("platform"),
+                user_segment.label("sourced_by_user_id"),
+                func.count().label("total_jobs"),
+                func.count().filter(JobPosting.status == "ACTIVE").label("active_jobs"),
+                func.count().filter(JobPosting.is_remote.is_(True)).label("remote_jobs"),
+            )
+            .where(or_(is_scraped, is_tenant_email))
+            .group_by(tenant_segment, func.coalesce(JobPosting.platform, ""), user_segment)
+        ).mappings().all()
+        
+        current_rows = db.session.execute(
+            select(
+                JobPostingStatCounter.tenant_id,
+                JobPostingStatCounter.platform,
+                JobPostingStatCounter.sourced_by_user_id,
+                JobPostingStatCounter.total_jobs,
+                JobPostingStatCounter.active_jobs,
+                JobPostingStatCounter.remote_jobs,
+            )
+        ).mappings().all()
+        corrections = JobPostingStatsService._counter_corrections(counter_rows, current_rows)
+        
+        # Distinct counts: scraped catalogue, then per tenant the email values
+        # the catalogue does not already contain
+        global_distinct = db.session.execute(
+            select(
+                func.count(func.distinct(JobPosting.company)),
+                func.count(func.distinct(JobPosting.location)),
+            ).where(is_scraped)
+        ).one()
+        
+        scraped = aliased(JobPosting)
+        
+        def not_in_catalogue(column: str):
+            return ~exists().where(
+                scraped.is_email_sourced.is_(False),
+                getattr(scraped, column) == getattr(JobPosting, column)
+            )
+        
+        tenant_distinct = db.session.execute(
+            select(
+                JobPosting.source_tenant_id,
+                func.count(func.distinct(JobPosting.company)).filter(not_in_catalogue("company")),
+                func.count(func.distinct(JobPosting.location)).filter(not_in_catalogue("location")),
+            )
+            .where(is_tenant_email)
+            .group_by(JobPosting.source_tenant_id)
+        ).all()
+        
+        snapshot_rows = [{
+            "tenant_id": GLOBAL_SEGMENT,
+            "unique_companies": global_distinct[0],
+            "unique_locations": global_distinct[1],
+            "computed_at": computed_at,
+        }]
+        snapshot_rows.extend(
+            {
+                "tenant_id": tenant_id,
+                "unique_companies": global_distinct[0] + extra_companies,
+                "unique_locations": global_distinct[1] + extra_locations,
+                "computed_at": computed_at,
+            }
+            for tenant_id, extra_companies, extra_locations in tenant_distinct
+        )
+        db.session.commit()
+        
+        # Write phase: apply the drift as deltas and swap the snapshot in
+        if corrections:
+            db.session.execute(JobPostingStatsService._increment_counters_stmt(corrections, computed_at))
+        db.session.execute(
+            delete(JobPostingStatCounter).where(
+                JobPostingStatCounter.total_jobs == 0,
+                JobPostingStatCounter.active_jobs == 0,
+                JobPostingStatCounter.remote_jobs == 0,
+            )
+        )
+        db.session.execute(delete(JobPostingStatSnapshot))
+        db.session.execute(insert(JobPostingStatSnapshot), snapshot_rows)
+        db.session.commit()
+        
+        JobPostingStatsService._rebuild_sketches()
+        
+        logger.info(
+            f"Recomputed job posting stats: {len(counter_rows)} counter segments "
+            f"({len(corrections)} corrected), {len(tenant_distinct)} tenant snapshots"
+        )
+        return {
+            "counter_segments": len(counter_rows),
+            "tenant_snapshots": len(tenant_distinct),
+            "computed_at": computed_at.isoformat(),
+        }
+    
+    @staticmethod
+    def _counter_corrections(
+        exact_rows: List[Dict[str, Any]],
+        current_rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-segment deltas that turn the current counters into the exact counts.
+        
+        Both inputs must come from the same snapshot. Segments missing from
+        exact_rows have no jobs left and are corrected down to zero.
+        
+        Returns:
+            Counter rows of non-zero deltas, sorted by segment
+        """
+        fields = ("total_jobs", "active_jobs", "remote_jobs")
+        deltas: Dict[Tuple[int, str, int], List[int]] = {}
+        for rows, sign in ((exact_rows, 1), (current_rows, -1)):
+            for row in rows:
+                segment = (row["tenant_id"], row["platform"], row["sourced_by_user_id"])
+                counts = deltas.setdefault(segment, [0, 0, 0])
+                for i, field in enumerate(fields):
+                    counts[i] += sign * row[field]
+        
+        return [
+            {
+                "tenant_id": tenant_id,
+                "platform": platform,
+                "sourced_by_user_id": user_id,
+                **dict(zip(fields, counts)),
+            }
+            for (tenant_id, platform, user_id), counts in sorted(deltas.items())
+            if any(counts)
+        ]
+    
+    @staticmethod
+    def _rebuild_sketches() -> None:
+        """Rebuild every distinct-count sketch from job_postings and swap it in."""
+        from app import redis_client
+        
+        if not redis_client:
+            return
+        
+        try:
+            rebuilt = set()
+            for name, column in HLL_COLUMNS.items():
+                segment = case(
+                    (JobPosting.is_email_sourced.is_(False), GLOBAL_SEGMENT),
+                    else_=JobPosting.source_tenant_id
+                )
+                rows = db.session.execute(
+                    select(segment, column)
+                    .where(
+                        column.isnot(None),
+                        or_(
+                            JobPosting.is_email_sourced.is_(False),
+                            and_(JobPosting.is_email_sourced.is_(True), JobPosting.source_tenant_id.isnot(None))
+                        )
+                    )
+                    .group_by(segment, column)
+                    .order_by(segment)
+                    .execution_options(yield_per=HLL_REBUILD_CHUNK)
+                )
+                
+                current_tenant = None
+                chunk: List[str] = []
+                for tenant_id, value in rows:
+                    if tenant_id != current_tenant:
+                        JobPostingStatsService._flush_sketch_chunk(redis_client, name, current_tenant, chunk)
+                        current_tenant, chunk = tenant_id, []
+                        redis_client.delete(_hll_key(name, tenant_id) + ":rebuild")
+                        rebuilt.add(_hll_key(name, tenant_id))
+                    chunk.append(value)
+                    if len(chunk) >= HLL_REBUILD_CHUNK:
+                        JobPostingStatsService._flush_sketch_chunk(redis_client, name, current_tenant, chunk)
+                        chunk = []
+                JobPostingStatsService._flush_sketch_chunk(redis_client, name, current_tenant, chunk)
+            
+            # Swap rebuilt sketches in; drop sketches of segments that no longer have jobs
+            pipe = redis_client.pipeline(transaction=False)
+            for key in rebuilt:
+                pipe.rename(key + ":rebuild", key)
+            for key in redis_client.scan_iter(match=f"{REDIS_HLL_PREFIX}:*"):
+                if key not in rebuilt and not key.endswith(":rebuild"):
+                    pipe.delete(key)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to rebuild job posting stat sketches: {e}")
+    
+    @staticmethod
+    def _flush_sketch_chunk(redis_client, name: str, tenant_id: Optional[int], chunk: List[str]) -> None:
+        """PFADD one chunk of rebuilt values to the segment's staging sketch."""
+        if tenant_id is not None and chunk:
+            redis_client.pfadd(_hll_key(name, tenant_id) + ":rebuild", *chunk)
+    
+    @staticmethod
+    def _approximate_distinct(tenant_id: int) -> Optional[Dict[str, int]]:
+        """
+        Distinct companies/locations visible to a tenant from the sketches.
+        
+        Returns:
+            Dict of sketch name -> estimate, or None when sketches are unavailable
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return None
+        try:
+            if not redis_client.exists(_hll_key("companies", GLOBAL_SEGMENT)):
+                return None
+            return {
+                name: int(redis_client.pfcount(_hll_key(name, GLOBAL_SEGMENT), _hll_key(name, tenant_id)))
+                for name in HLL_COLUMNS
+            }
+        except Exception as e:
+            logger.warning(f"Failed to read job posting stat sketches: {e}")
+            return None
+    
+    @staticmethod
+    def get_statistics(tenant_id: int) -> Dict[str, Any]:
+        """
+        Get jobs-page statistics for a tenant.
+        
+        Counts come from the counter table (scraped segment plus the tenant's
+        email segments); distinct companies/locations from the sketches, or the
+        last exact snapshot without Redis. Before the first recompute the stats
+        are aggregated exactly from job_postings.
+        
+        Args:
+            tenant_id: Current tenant ID
+        
+        Returns:
+            Dict in the /api/job-postings/statistics format plus stats_as_of,
+            stats_age_seconds and unique_counts_approximate
+        """
+        snapshots = {
+            row.tenant_id: row for row in db.session.scalars(
+                select(JobPostingStatSnapshot)
+                .where(JobPostingStatSnapshot.tenant_id.in_([GLOBAL_SEGMENT, tenant_id]))
+            ).all()
+        }
+        global_snapshot = snapshots.get(GLOBAL_SEGMENT)
+        if global_snapshot is None:
+            stats = JobPostingService.compute_statistics_exact(tenant_id)
+            stats.update(JobPostingStatsService.freshness(datetime.utcnow()))
+            stats["unique_counts_approximate"] = False
+            return stats
+        
+        counters = db.session.scalars(
+            select(JobPostingStatCounter)
+            .where(JobPostingStatCounter.tenant_id.in_([GLOBAL_SEGMENT, tenant_id]))
+        ).all()
+        
+        totals = {"total_jobs": 0, "active_jobs": 0, "remote_jobs": 0, "scraped_jobs": 0, "email_jobs": 0}
+        by_platform: Dict[str, int] = {}
+        email_user_counts: Dict[int, int] = {}
+        for counter in counters:
+            totals["total_jobs"] += counter.total_jobs
+            totals["active_jobs"] += counter.active_jobs
+            totals["remote_jobs"] += counter.remote_jobs
+            if counter.tenant_id == GLOBAL_SEGMENT:
+                totals["scraped_jobs"] += counter.total_jobs
+            else:
+                totals["email_jobs"] += counter.total_jobs
+                if counter.sourced_by_user_id != GLOBAL_SEGMENT:
+                    email_user_counts[counter.sourced_by_user_id] = (
+                        email_user_counts.get(counter.sourced_by_user_id, 0) + counter.total_jobs
+                    )
+            if counter.platform and counter.total_jobs:
+                by_platform[counter.platform] = by_platform.get(counter.platform, 0) + counter.total_jobs
+        
+        # Email jobs by team member
+        email_by_user = []
+        if email_user_counts:
+            users = {
+                user.id: user for user in db.session.scalars(
+                    select(PortalUser).where(PortalUser.id.in_(list(email_user_counts)))
+                ).all()
+            }
+            for user_id, count in email_user_counts.items():
+                user = users.get(user_id)
+                if user and count:
+                    email_by_user.append({
+                        "user_id": user_id,
+                        "name": f"{user.first_name} {user.last_name}",
+                        "email": user.email,
+                        "jobs_count": count,
+                    })
+        
+        distinct = JobPostingStatsService._approximate_distinct(tenant_id)
+        approximate = distinct is not None
+        if distinct is None:
+            snapshot = snapshots.get(tenant_id, global_snapshot)
+            distinct = {"companies": snapshot.unique_companies, "locations": snapshot.unique_locations}
+        
+        stats = {
+            **totals,
+            "unique_companies": distinct["companies"],
+            "unique_locations": distinct["locations"],
+            "by_platform": by_platform,
+            "email_by_user": email_by_user,
+            **JobPostingService.get_email_processing_stats(tenant_id),
+        }
+        stats.update(JobPostingStatsService.freshness(global_snapshot.computed_at))
+        stats["unique_counts_approximate"] = approximate
+        return stats
+    
+    @staticmethod
+    def freshness(computed_at: datetime) -> Dict[str, Any]:
+        """
+        Freshness fields added to every statistics response.
+        
+        Args:
+            computed_at: Time of the last exact recompute (UTC)
+        
+        Returns:
+            Dict with stats_as_of (ISO timestamp) and stats_age_seconds
+        """
+        return {
+            "stats_as_of": computed_at.isoformat() + "Z",
+            "stats_age_seconds": max(0, int((datetime.utcnow() - computed_at).total_seconds())),
+        }
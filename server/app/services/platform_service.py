@@ -5,7 +5,9 @@ Manages scraper platforms (CRUD operations and statistics).
 Used by CentralD Dashboard to manage dynamic platform list.
 """
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 from sqlalchemy import select, func, and_
@@ -14,9 +16,12 @@ from app import db
 from app.models.scraper_platform import ScraperPlatform
 from app.models.session_platform_status import SessionPlatformStatus
 from app.models.scrape_session import ScrapeSession
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+REDIS_VERSION_KEY = "scraper_platforms:version"
+
 
 class PlatformService:
     """
@@ -25,6 +30,72 @@ class PlatformService:
     Provides CRUD operations and statistics for job scraping platforms.
     """
     
+    # Process-local active platform registry: (expires_at, shared version, platforms)
+    _active_platforms_cache: Optional[Tuple[float, Optional[int], List[Dict[str, Any]]]] = None
+    _active_platforms_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _registry_version() -> Optional[int]:
+        """
+        Read the shared platform registry version.
+        
+        Returns:
+            Version number (0 if never bumped), or None if Redis is unavailable
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return None
+        try:
+            return int(redis_client.get(REDIS_VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read platform registry version: {e}")
+            return None
+    
+    @staticmethod
+    def get_active_platforms_cached() -> List[Dict[str, Any]]:
+        """
+        Get active platforms (id, name, display_name) ordered by priority.
+        
+        Cached in-process for settings.scraper_platform_cache_ttl seconds, so the
+        scrape queue dequeue does no platform query. Writes through this service
+        call invalidate_platform_cache(), which also bumps a shared Redis version
+        so other workers reload on their next call.
+        
+        Returns:
+            List of platform dicts (copies; safe to modify)
+        """
+        now = time.monotonic()
+        version = PlatformService._registry_version()
+        cached = PlatformService._active_platforms_cache
+        if cached is not None and cached[0] > now and cached[1] == version:
+            return [dict(platform) for platform in cached[2]]
+        
+        platforms = [
+            {"id": platform.id, "name": platform.name, "display_name": platform.display_name}
+            for platform in ScraperPlatform.get_active_platforms()
+        ]
+        
+        ttl = settings.scraper_platform_cache_ttl
+        if ttl > 0:
+            with PlatformService._active_platforms_cache_lock:
+                PlatformService._active_platforms_cache = (now + ttl, version, platforms)
+        
+        return [dict(platform) for platform in platforms]
+    
+    @staticmethod
+    def invalidate_platform_cache() -> None:
+        """Drop the cached platform registry here and in every other worker."""
+        from app import redis_client
+        
+        with PlatformService._active_platforms_cache_lock:
+            PlatformService._active_platforms_cache = None
+        if redis_client:
+            try:
+                redis_client.incr(REDIS_VERSION_KEY)
+            except Exception as e:
+                logger.warning(f"Failed to bump platform registry version: {e}")
+    
     @staticmethod
     def get_all_platforms(include_inactive: bool = False, include_stats: bool = False) -> List[Dict]:
         """
@@ -113,6 +184,7 @@ class PlatformService:
         
         db.session.add(platform)
         db.session.commit()
+        PlatformService.invalidate_platform_cache()
         
         logger.info(f"Created platform: {name}")
         return platform
@@ -144,6 +216,7 @@ class PlatformService:
                 setattr(platform, field, value)
         
         db.session.commit()
+        PlatformService.invalidate_platform_cache()
         
         logger.info(f"Updated platform: {platform.name}")
         return platform
@@ -167,6 +240,7 @@ class PlatformService:
         db.session.delete(platform)
         db.session.commit()
         db.session.expire_all()
+        PlatformService.invalidate_platform_cache()
         
         logger.info(f"Deleted platform: {name}")
         return True
@@ -188,6 +262,7 @@ class PlatformService:
         
         platform.is_active = not platform.is_active
         db.session.commit()
+        PlatformService.invalidate_platform_cache()
         
         logger.info(f"Toggled platform {platform.name} to {'active' if platform.is_active else 'inactive'}")
         return platform
@@ -209,6 +284,7 @@ class PlatformService:
                 platform.priority = idx + 1
         
         db.session.commit()
+        PlatformService.invalidate_platform_cache()
         logger.info("Reordered platforms")
         return True
     
@@ -295,4 +371,7 @@ class PlatformService:
         Returns:
             True if seeded, False if platforms already exist
         """
-        return ScraperPlatform.seed_default_platforms()
+        seeded = ScraperPlatform.seed_default_platforms()
+        if seeded:
+            PlatformService.invalidate_platform_cache()
+        return seeded
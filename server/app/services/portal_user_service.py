@@ -17,6 +17,7 @@ from app.schemas.portal_user_schema import (
 )
 from app.services import AuditLogService
 from app.services.tenant_service import TenantService
+from app.services.team_management_service import TeamManagementService
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +164,9 @@ class PortalUserService:
         db.session.add(user)
         db.session.flush()  # Flush to get user.id
         
+        if manager_id:
+            TeamManagementService.sync_hierarchy_closure(user.id, manager_id, tenant_id)
+        
         # Assign role to user
         user_role = UserRole(
             user_id=user.id,
@@ -450,6 +454,9 @@ class PortalUserService:
             },
         )
 
+        # Detach the user's subtree from their managers; reports become top-level (SET NULL)
+        TeamManagementService.sync_hierarchy_closure(user_id, None, tenant_id)
+
         # Delete user
         db.session.delete(user)
         db.session.commit()
@@ -0,0 +1,166 @@
+"""
+Processed Email Service
+
+Deduplication of synced emails against the processed_emails table.
+
+Key Features:
+- Per-integration Redis sorted set of recently processed message IDs
+  (member = message ID, score = time recorded), checked before the database;
+  entries older than settings.email_sync_processed_cache_days are trimmed
+- IDs not in Redis are checked with one `email_message_id = ANY(:ids)` query,
+  served by the unique (integration_id, email_message_id) index, and hits are
+  written back to Redis so the next sync finds them there
+- Recording is a single multi-row INSERT ... ON CONFLICT DO NOTHING, so a
+  retried batch cannot fail on the unique constraint
+- Redis only ever answers "processed"; a cold or lost set falls back to the
+  database, never to reprocessing
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+
+from app import db
+from app.models.processed_email import ProcessedEmail
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_PROCESSED_PREFIX = "email_sync:processed"
+
+
+def _processed_key(integration_id: int) -> str:
+    """Redis key of an integration's recently processed message IDs."""
+    return f"{REDIS_PROCESSED_PREFIX}:{integration_id}"
+
+
+class ProcessedEmailService:
+    """Check and record processed emails (Redis front, PostgreSQL source of truth)."""
+    
+    @staticmethod
+    def filter_processed(integration_id: int, message_ids: List[str]) -> Set[str]:
+        """
+        Find which message IDs have already been processed.
+        
+        Args:
+            integration_id: Integration ID
+            message_ids: Message IDs to check
+        
+        Returns:
+            Set of already-processed message IDs
+        """
+        message_ids = list(dict.fromkeys(mid for mid in message_ids if mid))
+        if not message_ids:
+            return set()
+        
+        processed = ProcessedEmailService._cached_processed(integration_id, message_ids)
+        remaining = [mid for mid in message_ids if mid not in processed]
+        
+        if remaining:
+            stmt = select(ProcessedEmail.email_message_id).where(
+                ProcessedEmail.integration_id == integration_id,
+                ProcessedEmail.email_message_id == any_(
+                    bindparam("message_ids", remaining, type_=ARRAY(String))
+                ),
+            )
+            from_db = set(db.session.scalars(stmt).all())
+            if from_db:
+                processed.update(from_db)
+                ProcessedEmailService.remember(integration_id, from_db)
+        
+        logger.debug(
+            f"Processed check for integration {integration_id}: "
+            f"{len(processed)}/{len(message_ids)} processed "
+            f"({len(message_ids) - len(remaining)} answered by Redis)"
+        )
+        return processed
+    
+    @staticmethod
+    def record(rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert processed-email rows in one statement, skipping IDs already recorded.
+        
+        Runs in the caller's transaction; call remember() after it commits.
+        
+        Args:
+            rows: ProcessedEmail column dicts (integration_id, tenant_id,
+                  email_message_id, processing_result, ...)
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        # A message repeated within rows also hits DO NOTHING: the first row is kept
+        stmt = pg_insert(ProcessedEmail).values(rows).on_conflict_do_nothing(
+            constraint="uq_processed_email_integration_message"
+        )
+        result = db.session.execute(stmt)
+        return result.rowcount or 0
+    
+    @staticmethod
+    def remember(integration_id: int, message_ids: Iterable[str]) -> None:
+        """
+        Add committed message IDs to the integration's Redis set.
+        
+        Args:
+            integration_id: Integration ID
+            message_ids: Message IDs recorded in processed_emails
+        """
+        from app import redis_client
+        
+        message_ids = [mid for mid in message_ids if mid]
+        if not redis_client or not message_ids:
+            return
+        
+        now = time.time()
+        window = settings.email_sync_processed_cache_days * 86400
+        key = _processed_key(integration_id)
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zadd(key, {mid: now for mid in message_ids})
+            pipe.zremrangebyscore(key, "-inf", now - window)
+            pipe.expire(key, int(window))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to cache processed emails for integration {integration_id}: {e}")
+    
+    @staticmethod
+    def forget_integration(integration_id: int) -> None:
+        """
+        Drop an integration's Redis set (after its processed_emails rows are deleted).
+        
+        Args:
+            integration_id: Integration ID
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return
+        try:
+            redis_client.delete(_processed_key(integration_id))
+        except Exception as e:
+            logger.warning(f"Failed to clear processed email cache for integration {integration_id}: {e}")
+    
+    @staticmethod
+    def _cached_processed(integration_id: int, message_ids: List[str]) -> Set[str]:
+        """Message IDs found in the integration's Redis set within the window."""
+        from app import redis_client
+        
+        if not redis_client:
+            return set()
+        
+        cutoff = time.time() - settings.email_sync_processed_cache_days * 86400
+        try:
+            scores: List[Optional[float]] = redis_client.zmscore(_processed_key(integration_id), message_ids)
+        except Exception as e:
+            logger.warning(f"Failed to read processed email cache for integration {integration_id}: {e}")
+            return set()
+        
+        return {
+            mid for mid, score in zip(message_ids, scores)
+            if score is not None and score >= cutoff
+        }
@@ -4,6 +4,7 @@ Keyword Extractor Service
 Extracts structured keywords and requirements from job descriptions.
 Uses LangChain with Google Gemini for intelligent extraction.
 """
+import hashlib
 import logging
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field
@@ -63,6 +64,19 @@ class JobKeywords(BaseModel):
     )
 
 
+class JobKeywordsItem(JobKeywords):
+    """Keywords for one job description in a batch extraction"""
+    id: str = Field(..., description="The JOB id of the description these keywords belong to")
+
+
+class BatchJobKeywords(BaseModel):
+    """Keywords for every job description in a batch extraction"""
+    items: List[JobKeywordsItem] = Field(
+        default_factory=list,
+        description="One entry per job description"
+    )
+
+
 class JobContext(BaseModel):
     """Context about the job role for better tailoring"""
     job_title: str = Field(..., description="The job title")
@@ -95,6 +109,10 @@ class KeywordExtractorService:
     Uses LangChain with Gemini for intelligent extraction with structured output.
     """
     
+    MAX_DESCRIPTION_CHARS = 4000  # Description text sent to the LLM per job
+    CHARS_PER_TOKEN = 4  # Rough estimate used for batch token budgeting
+    BATCH_PROMPT_OVERHEAD_TOKENS = 300  # Instructions + per-batch framing
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the keyword extractor with Gemini API.
@@ -177,10 +195,159 @@ class KeywordExtractorService:
         try:
             structured_llm = self.model.with_structured_output(JobKeywords)
             
-            prompt = f"""Extract keywords from this job description for ATS matching.
+            prompt = self._build_keywords_prompt(job_description)
+            
+            result: JobKeywords = structured_llm.invoke([HumanMessage(content=prompt)])
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to extract keywords: {e}")
+            return JobKeywords()
+    
+    def extract_keywords_batch(self, job_descriptions: Dict[Any, str]) -> Dict[Any, JobKeywords]:
+        """
+        Extract keywords for many job descriptions with as few LLM calls as possible.
+        
+        Identical descriptions (by content hash) are extracted once. The rest are
+        packed into multi-description prompts bounded by a token budget, and up
+        to settings.keyword_extraction_max_concurrency prompts run concurrently.
+        Descriptions missing from a batch response (or whose batch failed) fall
+        back to one extract_keywords_only-style call each.
+        
+        Args:
+            job_descriptions: Dict mapping caller IDs (e.g. job IDs) to description text
+            
+        Returns:
+            Dict mapping the same IDs to JobKeywords (empty JobKeywords on failure)
+        """
+        results: Dict[Any, JobKeywords] = {}
+        
+        # De-duplicate by description hash
+        texts_by_hash: Dict[str, str] = {}
+        keys_by_hash: Dict[str, List[Any]] = {}
+        for key, description in job_descriptions.items():
+            text = (description or "").strip()[:self.MAX_DESCRIPTION_CHARS]
+            if not text:
+                results[key] = JobKeywords()
+                continue
+            content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            texts_by_hash.setdefault(content_hash, text)
+            keys_by_hash.setdefault(content_hash, []).append(key)
+        
+        if not texts_by_hash:
+            return results
+        
+        batches = self._plan_keyword_batches(texts_by_hash)
+        logger.info(
+            f"Extracting keywords for {len(job_descriptions)} descriptions "
+            f"({len(texts_by_hash)} unique) in {len(batches)} batch calls"
+        )
+        
+        extracted = self._run_keyword_batches(batches, texts_by_hash)
+        
+        # Per-item fallback for anything the batch calls did not return
+        missing = [content_hash for content_hash in texts_by_hash if content_hash not in extracted]
+        if missing:
+            logger.warning(f"Batch keyword extraction missed {len(missing)} descriptions, retrying individually")
+            structured_llm = self.model.with_structured_output(JobKeywords)
+            responses = structured_llm.batch(
+                [[HumanMessage(content=self._build_keywords_prompt(texts_by_hash[h]))] for h in missing],
+                config={"max_concurrency": settings.keyword_extraction_max_concurrency},
+                return_exceptions=True,
+            )
+            for content_hash, response in zip(missing, responses):
+                if isinstance(response, JobKeywords):
+                    extracted[content_hash] = response
+                else:
+                    logger.error(f"Failed to extract keywords: {response}")
+        
+        for content_hash, keys in keys_by_hash.items():
+            keywords = extracted.get(content_hash) or JobKeywords()
+            for key in keys:
+                results[key] = keywords
+        
+        return results
+    
+    def _plan_keyword_batches(self, texts_by_hash: Dict[str, str]) -> List[List[str]]:
+        """
+        Group description hashes into batches bounded by an estimated token budget.
+        
+        Args:
+            texts_by_hash: Dict mapping content hash to description text
+            
+        Returns:
+            List of batches (lists of content hashes)
+        """
+        token_budget = settings.keyword_extraction_batch_token_budget
+        max_items = settings.keyword_extraction_batch_max_jobs
+        
+        batches: List[List[str]] = []
+        current: List[str] = []
+        current_tokens = self.BATCH_PROMPT_OVERHEAD_TOKENS
+        
+        for content_hash, text in texts_by_hash.items():
+            tokens = len(text) // self.CHARS_PER_TOKEN + 1
+            if current and (current_tokens + tokens > token_budget or len(current) >= max_items):
+                batches.append(current)
+                current, current_tokens = [], self.BATCH_PROMPT_OVERHEAD_TOKENS
+            current.append(content_hash)
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _run_keyword_batches(
+        self,
+        batches: List[List[str]],
+        texts_by_hash: Dict[str, str]
+    ) -> Dict[str, JobKeywords]:
+        """
+        Run batch extraction prompts with bounded concurrency and map results back by id.
+        
+        Args:
+            batches: Batches of content hashes from _plan_keyword_batches
+            texts_by_hash: Dict mapping content hash to description text
+            
+        Returns:
+            Dict mapping content hash to JobKeywords for every item returned
+        """
+        structured_llm = self.model.with_structured_output(BatchJobKeywords)
+        
+        prompts = [
+            [HumanMessage(content=self._build_keywords_batch_prompt([texts_by_hash[h] for h in batch]))]
+            for batch in batches
+        ]
+        responses = structured_llm.batch(
+            prompts,
+            config={"max_concurrency": settings.keyword_extraction_max_concurrency},
+            return_exceptions=True,
+        )
+        
+        extracted: Dict[str, JobKeywords] = {}
+        for batch, response in zip(batches, responses):
+            if not isinstance(response, BatchJobKeywords):
+                logger.error(f"Batch keyword extraction failed for {len(batch)} descriptions: {response}")
+                continue
+            
+            # Prompt ids are 1-based positions within the batch
+            for item in response.items:
+                try:
+                    position = int(str(item.id).strip().lstrip("#")) - 1
+                except ValueError:
+                    continue
+                if 0 <= position < len(batch) and batch[position] not in extracted:
+                    extracted[batch[position]] = JobKeywords(**item.model_dump(exclude={"id"}))
+        
+        return extracted
+    
+    def _build_keywords_prompt(self, job_description: str) -> str:
+        """Build the keyword extraction prompt for a single job description."""
+        return f"""Extract keywords from this job description for ATS matching.
 
 JOB DESCRIPTION:
-{job_description[:4000]}
+{job_description[:self.MAX_DESCRIPTION_CHARS]}
 
 EXTRACTION RULES:
 1. technical_keywords: ALL tools, frameworks, languages, platforms mentioned
@@ -189,13 +356,25 @@ EXTRACTION RULES:
 4. soft_skills: Communication, leadership, teamwork, problem-solving skills mentioned
 
 Return only keywords that actually appear in the job description."""
-            
-            result: JobKeywords = structured_llm.invoke([HumanMessage(content=prompt)])
-            return result
-            
-        except Exception as e:
-            logger.error(f"Failed to extract keywords: {e}")
-            return JobKeywords()
+    
+    def _build_keywords_batch_prompt(self, job_descriptions: List[str]) -> str:
+        """Build the keyword extraction prompt for several job descriptions."""
+        sections = "\n".join(
+            f"=== JOB {idx} ===\n{description}\n"
+            for idx, description in enumerate(job_descriptions, start=1)
+        )
+        
+        return f"""Extract keywords from each of the following {len(job_descriptions)} job descriptions for ATS matching.
+
+{sections}
+EXTRACTION RULES (apply to each job separately):
+1. technical_keywords: ALL tools, frameworks, languages, platforms mentioned
+2. action_verbs: Strong action verbs used (design, implement, lead, develop, etc.)
+3. industry_terms: Domain-specific terminology (agile, CI/CD, microservices, etc.)
+4. soft_skills: Communication, leadership, teamwork, problem-solving skills mentioned
+
+Return exactly one item per job, with "id" set to the JOB number (e.g. "1").
+Only include keywords that actually appear in that job's description."""
     
     def extract_requirements_only(self, job_description: str) -> JobRequirements:
         """
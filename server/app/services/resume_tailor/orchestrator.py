@@ -265,6 +265,7 @@ class ResumeTailorOrchestrator:
                     iterations=0
                 )
                 db.session.commit()
+                self._queue_export_prerender(tailored_resume)
                 return tailored_resume
             
             # Iterative improvement - track best version
@@ -362,6 +363,7 @@ class ResumeTailorOrchestrator:
                 iterations=iterations_used
             )
             db.session.commit()
+            self._queue_export_prerender(tailored_resume)
             
             logger.info(
                 f"Resume tailoring completed. Score: {initial_score_decimal:.2%} -> {final_score:.2%} "
@@ -557,6 +559,7 @@ class ResumeTailorOrchestrator:
                     iterations=0
                 )
                 db.session.commit()
+                self._queue_export_prerender(tailored_resume)
                 
                 yield TailorProgressEvent(
                     tailor_id=tailor_id,
@@ -658,6 +661,7 @@ class ResumeTailorOrchestrator:
                 iterations=iterations_used
             )
             db.session.commit()
+            self._queue_export_prerender(tailored_resume)
             
             score_improvement = (current_score - initial_score_decimal) * 100
             
@@ -835,6 +839,7 @@ class ResumeTailorOrchestrator:
                     iterations=0
                 )
                 db.session.commit()
+                self._queue_export_prerender(tailored_resume)
                 return tailored_resume
             
             # Iterative improvement - track best version
@@ -931,6 +936,7 @@ class ResumeTailorOrchestrator:
                 iterations=iterations_used
             )
             db.session.commit()
+            self._queue_export_prerender(tailored_resume)
             
             logger.info(
                 f"Manual resume tailoring completed. Score: {initial_score_decimal:.2%} -> {final_score:.2%} "
@@ -952,6 +958,25 @@ class ResumeTailorOrchestrator:
             
             raise
     
+    def _queue_export_prerender(self, tailored_resume: TailoredResume) -> None:
+        """Trigger background rendering of the completed resume's exports."""
+        try:
+            import inngest
+            from app.inngest import inngest_client
+            
+            inngest_client.send_sync(
+                inngest.Event(
+                    name="resume-tailor/completed",
+                    data={
+                        "tailor_id": tailored_resume.tailor_id,
+                        "tenant_id": tailored_resume.tenant_id,
+                    }
+                )
+            )
+        except Exception as e:
+            # Downloads render on demand if the event is lost
+            logger.warning(f"Failed to queue export pre-render for {tailored_resume.tailor_id}: {e}")
+    
     def get_tailored_resume(self, tailor_id: str) -> Optional[TailoredResume]:
         """Get a tailored resume by its UUID."""
         stmt = select(TailoredResume).where(TailoredResume.tailor_id == tailor_id)
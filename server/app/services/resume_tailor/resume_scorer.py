@@ -12,6 +12,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
 
 from config.settings import settings
+from app.utils.skill_vocabulary import SKILL_SYNONYMS, SkillVocabulary
 from app.services.embedding_service import EmbeddingService
 from app.services.resume_tailor.keyword_extractor import (
     KeywordExtractorService,
@@ -100,30 +101,8 @@ class ResumeScorerService:
     WEIGHT_EXPERIENCE = 0.20
     WEIGHT_SEMANTIC = 0.20
     
-    # Skill matching synonyms (commonly interchangeable skills)
-    SKILL_SYNONYMS = {
-        'javascript': ['js', 'es6', 'ecmascript', 'node.js', 'nodejs'],
-        'typescript': ['ts'],
-        'python': ['py', 'python3'],
-        'react': ['react.js', 'reactjs'],
-        'vue': ['vue.js', 'vuejs'],
-        'angular': ['angular.js', 'angularjs'],
-        'aws': ['amazon web services', 'ec2', 's3', 'lambda'],
-        'gcp': ['google cloud', 'google cloud platform'],
-        'azure': ['microsoft azure'],
-        'docker': ['containerization'],
-        'kubernetes': ['k8s'],
-        'postgres': ['postgresql', 'pg'],
-        'mysql': ['mariadb'],
-        'mongodb': ['mongo'],
-        'redis': ['in-memory cache'],
-        'ci/cd': ['continuous integration', 'continuous deployment', 'jenkins', 'github actions'],
-        'agile': ['scrum', 'kanban'],
-        'rest': ['restful', 'rest api'],
-        'graphql': ['gql'],
-        'machine learning': ['ml', 'deep learning', 'ai'],
-        'data science': ['data analysis', 'analytics'],
-    }
+    # Skill matching synonyms (shared vocabulary)
+    SKILL_SYNONYMS = SKILL_SYNONYMS
     
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -322,24 +301,19 @@ class ResumeScorerService:
             
             # Check for synonym match
             synonym_found = False
-            for base_skill, synonyms in self.SKILL_SYNONYMS.items():
-                if skill_lower == base_skill or skill_lower in synonyms:
-                    # Check if any synonym is in resume
-                    all_variants = [base_skill] + synonyms
-                    for variant in all_variants:
-                        if variant in resume_lower:
-                            matched.append(skill)
-                            detailed_matches.append(SkillMatch(
-                                skill=skill,
-                                matched=True,
-                                match_type='synonym',
-                                confidence=0.9,
-                                resume_context=f"Found as: {variant}"
-                            ))
-                            synonym_found = True
-                            break
-                    if synonym_found:
-                        break
+            if SkillVocabulary.canonical(skill_lower):
+                # Check if any synonym is in resume (as a whole word)
+                variant = SkillVocabulary.find_variant(skill_lower, resume_lower)
+                if variant:
+                    matched.append(skill)
+                    detailed_matches.append(SkillMatch(
+                        skill=skill,
+                        matched=True,
+                        match_type='synonym',
+                        confidence=0.9,
+                        resume_context=f"Found as: {variant}"
+                    ))
+                    synonym_found = True
             
             if synonym_found:
                 continue
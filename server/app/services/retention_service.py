@@ -0,0 +1,206 @@
+"""
+Retention Service
+
+Deletes expired rows from high-volume log tables in small, index-driven
+chunks so retention never runs one large DELETE against tables the import
+and sync paths are writing to.
+
+Key Features:
+- Per-table policy in settings (retention days, 0 = keep forever; archive on/off)
+- Walks the primary key upward from the oldest row; each chunk is an id range
+  filtered by created_at and committed on its own, with a short pause between
+  chunks, and a run stops after settings.retention_max_seconds (the next run
+  resumes from the oldest remaining row)
+- Optional archive of each chunk to gzipped JSONL in file storage before it is
+  deleted; a failed upload stops the run without deleting the chunk
+"""
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import and_, delete, select
+
+from app import db
+from app.models.processed_email import ProcessedEmail
+from app.models.session_job_log import SessionJobLog
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Storage prefix of archived chunks: archives/{policy}/{YYYY/MM/DD}/...
+ARCHIVE_PREFIX = "archives"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Retention rule for one table (an id primary key and created_at are required)."""
+    name: str
+    model: Any
+    days_setting: str
+    archive_setting: str
+
+
+RETENTION_POLICIES: Dict[str, RetentionPolicy] = {
+    policy.name: policy
+    for policy in (
+        RetentionPolicy(
+            name="processed_emails",
+            model=ProcessedEmail,
+            days_setting="retention_processed_emails_days",
+            archive_setting="retention_processed_emails_archive",
+        ),
+        RetentionPolicy(
+            name="session_job_logs",
+            model=SessionJobLog,
+            days_setting="retention_session_job_logs_days",
+            archive_setting="retention_session_job_logs_archive",
+        ),
+    )
+}
+
+
+class RetentionService:
+    """Chunked retention for log tables."""
+    
+    @staticmethod
+    def purge(name: str) -> Dict[str, Any]:
+        """
+        Delete rows older than a table's retention period.
+        
+        Rows are visited in id order and the walk stops at the first row inside
+        the retention period, so it relies on ids growing with created_at (true
+        for these insert-only log tables).
+        
+        Args:
+            name: Policy name (key of RETENTION_POLICIES)
+        
+        Returns:
+            Summary dict (deleted, archived, chunks, complete, archive_keys)
+        
+        Raises:
+            ValueError: If the policy does not exist
+        """
+        policy = RETENTION_POLICIES.get(name)
+        if not policy:
+            raise ValueError(f"Unknown retention policy: {name}")
+        
+        days = getattr(settings, policy.days_setting)
+        if days <= 0:
+            return {"table": name, "skipped": True, "reason": "retention disabled"}
+        
+        table = policy.model.__table__
+        archive = getattr(settings, policy.archive_setting)
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        chunk_size = max(1, settings.retention_chunk_size)
+        deadline = time.monotonic() + settings.retention_max_seconds
+        
+        summary: Dict[str, Any] = {
+            "table": name,
+            "retention_days": days,
+            "cutoff": cutoff.isoformat(),
+            "deleted": 0,
+            "archived": 0,
+            "chunks": 0,
+            "complete": False,
+            "archive_keys": [],
+        }
+        
+        lower_id = None
+        while True:
+            # Oldest remaining row at or after the current position (primary key scan)
+            next_row_stmt = select(table.c.id, table.c.created_at).order_by(table.c.id).limit(1)
+            if lower_id is not None:
+                next_row_stmt = next_row_stmt.where(table.c.id >= lower_id)
+            next_row = db.session.execute(next_row_stmt).first()
+            db.session.commit()
+            
+            if next_row is None or next_row.created_at >= cutoff:
+                summary["complete"] = True
+                break
+            if time.monotonic() > deadline:
+                logger.info(f"[RETENTION] {name}: time budget reached, resuming next run")
+                break
+            
+            lower_id = next_row.id
+            upper_id = lower_id + chunk_size
+            in_chunk = and_(
+                table.c.id >= lower_id,
+                table.c.id < upper_id,
+                table.c.created_at < cutoff,
+            )
+            
+            if archive:
+                rows = db.session.execute(
+                    select(table).where(in_chunk).order_by(table.c.id)
+                ).mappings().all()
+                if rows:
+                    summary["archive_keys"].append(RetentionService._archive_chunk(name, cutoff, rows))
+                    summary["archived"] += len(rows)
+            
+            result = db.session.execute(delete(table).where(in_chunk))
+            db.session.commit()
+            
+            summary["deleted"] += result.rowcount or 0
+            summary["chunks"] += 1
+            lower_id = upper_id
+            
+            if settings.retention_chunk_pause_ms > 0:
+                time.sleep(settings.retention_chunk_pause_ms / 1000)
+        
+        logger.info(
+            f"[RETENTION] {name}: deleted {summary['deleted']} rows older than {days} days "
+            f"in {summary['chunks']} chunks (archived {summary['archived']}, complete={summary['complete']})"
+        )
+        return summary
+    
+    @staticmethod
+    def purge_all() -> List[Dict[str, Any]]:
+        """
+        Apply every retention policy.
+        
+        Returns:
+            List of purge summaries
+        """
+        return [RetentionService.purge(name) for name in RETENTION_POLICIES]
+    
+    @staticmethod
+    def _archive_chunk(name: str, cutoff: datetime, rows: List[Any]) -> str:
+        """
+        Write rows to gzipped JSONL in file storage.
+        
+        Args:
+            name: Policy name
+            cutoff: Retention cutoff of this run (dates the archive path)
+            rows: Row mappings, ordered by id
+        
+        Returns:
+            Storage key of the archive
+        
+        Raises:
+            RuntimeError: If the upload fails (the chunk must not be deleted)
+        """
+        from app.services.file_storage import FileStorageService
+        
+        payload = "".join(
+            json.dumps(dict(row), default=str, separators=(",", ":")) + "\n"
+            for row in rows
+        ).encode("utf-8")
+        content = gzip.compress(payload)
+        
+        file_key = (
+            f"{ARCHIVE_PREFIX}/{name}/{cutoff.strftime('%Y/%m/%d')}/"
+            f"{name}_{rows[0]['id']}-{rows[-1]['id']}.jsonl.gz"
+        )
+        result = FileStorageService().upload_bytes(file_key, content, "application/gzip")
+        if not result.get("success"):
+            raise RuntimeError(f"Failed to archive {name} rows to {file_key}: {result.get('error')}")
+        
+        logger.info(
+            f"[RETENTION] Archived {len(rows)} {name} rows to {file_key} "
+            f"({len(payload)} -> {len(content)} bytes)"
+        )
+        return file_key
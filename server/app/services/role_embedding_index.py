@@ -0,0 +1,269 @@
+"""
+Role Embedding Index
+Process-local, in-memory similarity index over GlobalRole embeddings.
+
+Features:
+- float32 matrix of L2-normalized role embeddings; cosine similarity is a NumPy dot product
+- Shared version counter in Redis, bumped after roles are created, merged or deleted
+- Version checked at most every few seconds; snapshot also rebuilt after a max age
+- Callers fall back to the pgvector query when the index is unavailable
+"""
+import logging
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import event, select
+
+from app import db
+from app.models.global_role import GlobalRole
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_VERSION_KEY = "role_embedding_index:version"
+
+# Session.info flags: commit/rollback listeners registered, roles added since last commit
+SESSION_LISTENERS_KEY = "role_embedding_index_listeners"
+SESSION_PENDING_KEY = "role_embedding_index_pending"
+
+
+class RoleEmbeddingIndex:
+    """In-memory GlobalRole embedding matrix shared by all lookups in this process."""
+
+    _lock = threading.Lock()
+    # (role_ids, matrix): int64 role IDs row-aligned with a float32 (n_roles, dim)
+    # matrix of L2-normalized rows. Replaced as a whole, never mutated, so
+    # readers can take it without the lock.
+    _index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    _version: Optional[int] = None  # Shared version the snapshot corresponds to
+    _built_at: float = 0.0
+    _checked_at: float = 0.0
+
+    @staticmethod
+    def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize each row in place (zero rows are left as zeros)."""
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+    @staticmethod
+    def _current_version() -> Optional[int]:
+        """
+        Read the shared index version.
+
+        Returns:
+            Version number (0 if never bumped), or None if Redis is unavailable
+        """
+        from app import redis_client
+
+        if not redis_client:
+            return None
+        try:
+            return int(redis_client.get(REDIS_VERSION_KEY) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read role embedding index version: {e}")
+            return None
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop this process's snapshot; the next search rebuilds it."""
+        with cls._lock:
+            cls._index = None
+            cls._version = None
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """
+        Signal that roles changed (created, merged, deleted, re-embedded).
+
+        Invalidates the local snapshot immediately and increments the shared
+        version so other processes rebuild on their next version check. Call
+        after the change is committed where possible, so other processes do
+        not rebuild from pre-commit data.
+        """
+        from app import redis_client
+
+        cls.invalidate()
+        if redis_client:
+            try:
+                redis_client.incr(REDIS_VERSION_KEY)
+            except Exception as e:
+                logger.warning(f"Failed to bump role embedding index version: {e}")
+
+    @classmethod
+    def add_role(cls, role_id: int, embedding: Sequence[float]) -> None:
+        """
+        Add a newly created role to the index without a full rebuild.
+
+        Only the local snapshot is touched here; the shared version is bumped
+        once the caller's transaction commits, so other processes never
+        rebuild before the role is visible to them. If the transaction rolls
+        back the local snapshot is dropped instead.
+
+        Args:
+            role_id: New GlobalRole ID (must be flushed)
+            embedding: The role's embedding vector
+        """
+        with cls._lock:
+            if cls._index is not None:
+                role_ids, matrix = cls._index
+                row = cls._normalize_rows(np.asarray([embedding], dtype=np.float32))
+                cls._index = (np.append(role_ids, np.int64(role_id)), np.vstack([matrix, row]))
+
+        session = db.session()
+        if not session.info.get(SESSION_LISTENERS_KEY):
+            event.listen(session, "after_commit", cls._on_session_commit)
+            event.listen(session, "after_rollback", cls._on_session_rollback)
+            session.info[SESSION_LISTENERS_KEY] = True
+        session.info[SESSION_PENDING_KEY] = True
+
+    @classmethod
+    def _on_session_commit(cls, session) -> None:
+        """Publish roles added in the committed transaction to other processes."""
+        if not session.info.pop(SESSION_PENDING_KEY, False):
+            return
+
+        from app import redis_client
+
+        if not redis_client:
+            return
+        try:
+            new_version = int(redis_client.incr(REDIS_VERSION_KEY))
+        except Exception as e:
+            logger.warning(f"Failed to bump role embedding index version: {e}")
+            return
+
+        with cls._lock:
+            if cls._index is None:
+                return
+            if cls._version is None or new_version != cls._version + 1:
+                # Someone else changed roles too - rebuild from the database
+                cls._index = None
+                cls._version = None
+                return
+            # The local snapshot already has the new rows
+            cls._version = new_version
+
+    @classmethod
+    def _on_session_rollback(cls, session) -> None:
+        """Drop local rows of roles whose transaction was rolled back."""
+        if session.info.pop(SESSION_PENDING_KEY, False):
+            cls.invalidate()
+
+    @classmethod
+    def _snapshot(cls) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the current (role_ids, matrix) snapshot, rebuilding it if stale.
+
+        Returns:
+            Tuple of (role_ids, matrix), or None if the index is disabled or
+            could not be loaded
+        """
+        if not settings.role_embedding_index_enabled:
+            return None
+
+        now = time.monotonic()
+        index = cls._index
+        if index is not None and now - cls._built_at < settings.role_embedding_index_max_age:
+            if now - cls._checked_at < settings.role_embedding_index_version_check_interval:
+                return index
+            version = cls._current_version()
+            cls._checked_at = now
+            if version is None or version == cls._version:
+                return index
+
+        # Read the version before loading so a bump during the load triggers another rebuild
+        version = cls._current_version()
+        try:
+            rows = db.session.execute(
+                select(GlobalRole.id, GlobalRole.embedding).where(GlobalRole.embedding.isnot(None))
+            ).all()
+        except Exception as e:
+            logger.warning(f"Failed to load role embeddings into memory: {e}")
+            db.session.rollback()
+            return None
+
+        dimension = settings.gemini_embedding_dimension
+        role_ids = np.asarray([row[0] for row in rows], dtype=np.int64)
+        if rows:
+            matrix = cls._normalize_rows(np.asarray([row[1] for row in rows], dtype=np.float32))
+        else:
+            matrix = np.zeros((0, dimension), dtype=np.float32)
+
+        with cls._lock:
+            cls._index = (role_ids, matrix)
+            cls._version = version
+            cls._built_at = cls._checked_at = now
+
+        logger.info(f"Loaded {len(role_ids)} role embeddings into memory (version {version})")
+        return role_ids, matrix
+
+    @classmethod
+    def search_many(
+        cls,
+        embeddings: Sequence[Sequence[float]],
+        threshold: float
+    ) -> Optional[List[Optional[Tuple[int, float]]]]:
+        """
+        Find the most similar role for each embedding.
+
+        Args:
+            embeddings: Query embedding vectors
+            threshold: Minimum cosine similarity for a match
+
+        Returns:
+            One (role_id, similarity) or None per input embedding, in order;
+            None if the index is unavailable (use the pgvector fallback)
+        """
+        snapshot = cls._snapshot()
+        if snapshot is None:
+            return None
+        role_ids, matrix = snapshot
+
+        if not len(embeddings):
+            return []
+        if not len(role_ids):
+            return [None] * len(embeddings)
+
+        queries = cls._normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        similarities = queries @ matrix.T
+        best_idx = similarities.argmax(axis=1)
+
+        matches: List[Optional[Tuple[int, float]]] = []
+        for query_idx, role_idx in enumerate(best_idx):
+            similarity = float(similarities[query_idx, role_idx])
+            matches.append((int(role_ids[role_idx]), similarity) if similarity >= threshold else None)
+        return matches
+
+    @classmethod
+    def search_top_k(
+        cls,
+        embedding: Sequence[float],
+        limit: int
+    ) -> Optional[List[Tuple[int, float]]]:
+        """
+        Find the `limit` most similar roles to an embedding.
+
+        Args:
+            embedding: Query embedding vector
+            limit: Max results
+
+        Returns:
+            List of (role_id, similarity), most similar first; None if the
+            index is unavailable (use the pgvector fallback)
+        """
+        snapshot = cls._snapshot()
+        if snapshot is None:
+            return None
+        role_ids, matrix = snapshot
+
+        if not len(role_ids) or limit <= 0:
+            return []
+
+        query = cls._normalize_rows(np.asarray([embedding], dtype=np.float32))[0]
+        similarities = matrix @ query
+        limit = min(limit, len(role_ids))
+        top_idx = np.argpartition(-similarities, limit - 1)[:limit]
+        top_idx = top_idx[np.argsort(-similarities[top_idx])]
+        return [(int(role_ids[i]), float(similarities[i])) for i in top_idx]
@@ -14,7 +14,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
-from sqlalchemy import select, case, func, and_, or_, update
+from sqlalchemy import select, func, and_, or_, update, insert
 import inngest
 
 from app import db
@@ -23,9 +23,10 @@ from app.models.scrape_session import ScrapeSession
 from app.models.scraper_api_key import ScraperApiKey
 from app.models.job_posting import JobPosting
 from app.models.role_job_mapping import RoleJobMapping
-from app.models.scraper_platform import ScraperPlatform
 from app.models.session_platform_status import SessionPlatformStatus
 from app.services.job_import_service import JobImportService
+from app.services.job_posting_stats_service import JobPostingStatsService, JobStatsDelta
+from app.services.platform_service import PlatformService
 from app.inngest import inngest_client
 from config.settings import settings
 
@@ -168,14 +169,9 @@ class ScrapeQueueService:
         stmt = select(GlobalRole).where(
             GlobalRole.queue_status == "approved"
         ).order_by(
-            case(
-                (GlobalRole.priority == "urgent", 4),
-                (GlobalRole.priority == "high", 3),
-                (GlobalRole.priority == "normal", 2),
-                (GlobalRole.priority == "low", 1),
-            ).desc(),
+            GlobalRole.priority_rank.desc(),
             GlobalRole.candidate_count.desc()  # Higher demand = higher priority
-        )
+        ).limit(1)
         role = db.session.scalar(stmt)
         
         if not role:
@@ -219,6 +215,54 @@ class ScrapeQueueService:
             }
         }
     
+    @staticmethod
+    def _create_session_with_platforms(
+        session_values: Dict[str, Any],
+        platforms: List[Dict[str, Any]]
+    ) -> uuid.UUID:
+        """
+        Insert a scrape session and its platform checklist (not committed).
+        
+        The session is one INSERT and the checklist one multi-row INSERT, so the
+        caller's dequeue transaction holds its row lock for two round trips
+        instead of one per platform.
+        
+        Args:
+            session_values: ScrapeSession column values (scraper, role, location)
+            platforms: Active platforms from PlatformService.get_active_platforms_cached()
+        
+        Returns:
+            The new session_id
+        """
+        session_id = uuid.uuid4()
+        now = datetime.utcnow()
+        
+        db.session.execute(
+            insert(ScrapeSession).values(
+                session_id=session_id,
+                started_at=now,
+                status="in_progress",
+                platforms_total=len(platforms),
+                platforms_completed=0,
+                platforms_failed=0,
+                **session_values
+            )
+        )
+        db.session.execute(
+            insert(SessionPlatformStatus).values([
+                {
+                    "session_id": session_id,
+                    "platform_id": platform["id"],
+                    "platform_name": platform["name"],
+                    "status": "pending",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for platform in platforms
+            ])
+        )
+        return session_id
+    
     @staticmethod
     def get_next_role_with_platforms(scraper_key: ScraperApiKey) -> Optional[Dict[str, Any]]:
         """
@@ -254,74 +298,48 @@ class ScrapeQueueService:
                 f"Complete or terminate the current session before requesting a new role."
             )
         
+        # Active platforms (cached registry) - resolved before the row lock is taken
+        active_platforms = PlatformService.get_active_platforms_cached()
+        
+        if not active_platforms:
+            logger.warning("No active platforms configured")
+            return None
+        
         # Find approved roles with round-robin rotation:
         # 1. Priority (urgent > high > normal > low)
         # 2. Last scraped (oldest/never scraped first) - enables rotation through all roles
         # 3. Candidate count (higher = more demand)
         # Use FOR UPDATE SKIP LOCKED to prevent race conditions when multiple scrapers
         # call this endpoint simultaneously - each will get a different role
+        # LIMIT 1 locks only the claimed row; idx_global_roles_dequeue serves this order
         stmt = select(GlobalRole).where(
             GlobalRole.queue_status == "approved"
         ).order_by(
-            case(
-                (GlobalRole.priority == "urgent", 4),
-                (GlobalRole.priority == "high", 3),
-                (GlobalRole.priority == "normal", 2),
-                (GlobalRole.priority == "low", 1),
-            ).desc(),
+            GlobalRole.priority_rank.desc(),
             # NULLS FIRST: roles never scraped get priority, then oldest scraped
             GlobalRole.last_scraped_at.asc().nulls_first(),
             GlobalRole.candidate_count.desc()
-        ).with_for_update(skip_locked=True)
+        ).limit(1).with_for_update(skip_locked=True)
         role = db.session.scalar(stmt)
         
         if not role:
             logger.info("Scrape queue is empty - no approved roles")
             return None
         
-        # Get active platforms
-        active_platforms = ScraperPlatform.get_active_platforms()
-        
-        if not active_platforms:
-            logger.warning("No active platforms configured")
-            return None
-        
         # Mark role as processing
         role.queue_status = "processing"
         role.updated_at = datetime.utcnow()
         
-        # Create session for tracking
-        session = ScrapeSession(
-            session_id=uuid.uuid4(),
-            scraper_key_id=scraper_key.id,
-            scraper_name=scraper_key.name,
-            global_role_id=role.id,
-            role_name=role.name,
-            started_at=datetime.utcnow(),
-            status="in_progress",
-            platforms_total=len(active_platforms),
-            platforms_completed=0,
-            platforms_failed=0
+        # Create session + platform checklist
+        session_id = ScrapeQueueService._create_session_with_platforms(
+            {
+                "scraper_key_id": scraper_key.id,
+                "scraper_name": scraper_key.name,
+                "global_role_id": role.id,
+                "role_name": role.name,
+            },
+            active_platforms
         )
-        db.session.add(session)
-        db.session.flush()  # Get session_id
-        
-        # Create platform status entries for each active platform
-        platform_list = []
-        for platform in active_platforms:
-            platform_status = SessionPlatformStatus(
-                session_id=session.session_id,
-                platform_id=platform.id,
-                platform_name=platform.name,
-                status="pending"
-            )
-            db.session.add(platform_status)
-            
-            platform_list.append({
-                "id": platform.id,
-                "name": platform.name,
-                "display_name": platform.display_name
-            })
         
         # Record API key usage
         scraper_key.record_usage()
@@ -330,11 +348,11 @@ class ScrapeQueueService:
         
         logger.info(
             f"Assigned role '{role.name}' (id={role.id}) to scraper '{scraper_key.name}' "
-            f"(session={session.session_id}) with {len(platform_list)} platforms"
+            f"(session={session_id}) with {len(active_platforms)} platforms"
         )
         
         return {
-            "session_id": str(session.session_id),
+            "session_id": str(session_id),
             "role": {
                 "id": role.id,
                 "name": role.name,
@@ -342,7 +360,7 @@ class ScrapeQueueService:
                 "category": role.category,
                 "candidate_count": role.candidate_count
             },
-            "platforms": platform_list
+            "platforms": active_platforms
         }
     
     @staticmethod
@@ -385,25 +403,28 @@ class ScrapeQueueService:
                 f"Complete or terminate the current session before requesting a new role."
             )
         
+        # Active platforms (cached registry) - resolved before the row lock is taken
+        active_platforms = PlatformService.get_active_platforms_cached()
+        
+        if not active_platforms:
+            logger.warning("No active platforms configured")
+            return None
+        
         # Find approved role+location entries with round-robin rotation:
         # 1. Priority (urgent > high > normal > low)
         # 2. Last scraped (oldest/never scraped first) - enables rotation through all entries
         # 3. Candidate count (higher = more demand)
         # Use FOR UPDATE SKIP LOCKED to prevent race conditions when multiple scrapers
         # call this endpoint simultaneously - each will get a different entry
+        # LIMIT 1 locks only the claimed row; idx_role_location_queue_dequeue serves this order
         stmt = select(RoleLocationQueue).where(
             RoleLocationQueue.queue_status == "approved"
         ).order_by(
-            case(
-                (RoleLocationQueue.priority == "urgent", 4),
-                (RoleLocationQueue.priority == "high", 3),
-                (RoleLocationQueue.priority == "normal", 2),
-                (RoleLocationQueue.priority == "low", 1),
-            ).desc(),
+            RoleLocationQueue.priority_rank.desc(),
             # NULLS FIRST: entries never scraped get priority, then oldest scraped
             RoleLocationQueue.last_scraped_at.asc().nulls_first(),
             RoleLocationQueue.candidate_count.desc()
-        ).with_for_update(skip_locked=True)
+        ).limit(1).with_for_update(skip_locked=True)
         queue_entry = db.session.scalar(stmt)
         
         if not queue_entry:
@@ -416,51 +437,22 @@ class ScrapeQueueService:
             logger.error(f"GlobalRole not found for queue entry {queue_entry.id}")
             return None
         
-        # Get active platforms
-        active_platforms = ScraperPlatform.get_active_platforms()
-        
-        if not active_platforms:
-            logger.warning("No active platforms configured")
-            return None
-        
         # Mark queue entry as processing
         queue_entry.queue_status = "processing"
         queue_entry.updated_at = datetime.utcnow()
         
-        # Create session for tracking (include location in role_name for identification)
-        session = ScrapeSession(
-            session_id=uuid.uuid4(),
-            scraper_key_id=scraper_key.id,
-            scraper_name=scraper_key.name,
-            global_role_id=role.id,
-            role_name=role.name,
-            location=queue_entry.location,  # Store location in dedicated column
-            role_location_queue_id=queue_entry.id,  # Track which queue entry this is for
-            started_at=datetime.utcnow(),
-            status="in_progress",
-            platforms_total=len(active_platforms),
-            platforms_completed=0,
-            platforms_failed=0
+        # Create session + platform checklist
+        session_id = ScrapeQueueService._create_session_with_platforms(
+            {
+                "scraper_key_id": scraper_key.id,
+                "scraper_name": scraper_key.name,
+                "global_role_id": role.id,
+                "role_name": role.name,
+                "location": queue_entry.location,  # Store location in dedicated column
+                "role_location_queue_id": queue_entry.id,  # Track which queue entry this is for
+            },
+            active_platforms
         )
-        db.session.add(session)
-        db.session.flush()  # Get session_id
-        
-        # Create platform status entries for each active platform
-        platform_list = []
-        for platform in active_platforms:
-            platform_status = SessionPlatformStatus(
-                session_id=session.session_id,
-                platform_id=platform.id,
-                platform_name=platform.name,
-                status="pending"
-            )
-            db.session.add(platform_status)
-            
-            platform_list.append({
-                "id": platform.id,
-                "name": platform.name,
-                "display_name": platform.display_name
-            })
         
         # Record API key usage
         scraper_key.record_usage()
@@ -469,12 +461,12 @@ class ScrapeQueueService:
         
         logger.info(
             f"Assigned role '{role.name}' + location '{queue_entry.location}' "
-            f"to scraper '{scraper_key.name}' (session={session.session_id}) "
-            f"with {len(platform_list)} platforms"
+            f"to scraper '{scraper_key.name}' (session={session_id}) "
+            f"with {len(active_platforms)} platforms"
         )
         
         return {
-            "session_id": str(session.session_id),
+            "session_id": str(session_id),
             "role": {
                 "id": role.id,
                 "name": role.name,
@@ -484,7 +476,7 @@ class ScrapeQueueService:
             },
             "location": queue_entry.location,
             "role_location_queue_id": queue_entry.id,
-            "platforms": platform_list
+            "platforms": active_platforms
         }
 
     @staticmethod
@@ -639,6 +631,7 @@ class ScrapeQueueService:
         imported_count = 0
         skipped_count = 0
         job_ids = []
+        stats_delta = JobStatsDelta()
         
         for job_data in jobs_data:
             try:
@@ -696,11 +689,15 @@ class ScrapeQueueService:
                 
                 job_ids.append(job.id)
                 imported_count += 1
+                stats_delta.add(job)
                 
             except Exception as e:
                 logger.error(f"Failed to import job: {e}")
                 skipped_count += 1
         
+        # Jobs-page stat counters commit with the caller's transaction
+        JobPostingStatsService.record_imported_jobs(stats_delta)
+        
         return {
             "imported": imported_count,
             "skipped": skipped_count,
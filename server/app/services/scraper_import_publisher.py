@@ -0,0 +1,220 @@
+"""
+Scraper Import Publisher
+Fans a platform's scraped jobs out to `jobs/scraper.platform-import` events.
+
+Features:
+- Batches sized by serialized payload bytes (not a fixed job count)
+- Batch payloads offloaded to Redis; events carry only a reference
+- All batch events published in as few `send` calls as possible
+- Falls back to inline payloads when Redis is unavailable
+"""
+import json
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+import inngest
+
+from app.inngest import inngest_client
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_IMPORT_EVENT = "jobs/scraper.platform-import"
+REDIS_JOBS_PAYLOAD_PREFIX = "scraper_import:jobs:"
+
+
+class ScraperImportPublisher:
+    """Publishes scraper platform imports as batched Inngest events."""
+
+    @staticmethod
+    def plan_batches(
+        jobs: List[Dict[str, Any]],
+        max_bytes: Optional[int] = None,
+        max_jobs: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Split jobs into batches bounded by serialized size and job count.
+
+        A single job larger than max_bytes gets a batch of its own.
+
+        Args:
+            jobs: Job dicts as posted by the scraper
+            max_bytes: Max JSON bytes per batch (default: settings)
+            max_jobs: Max jobs per batch (default: settings)
+
+        Returns:
+            List of batches (always at least one, possibly empty)
+        """
+        max_bytes = max_bytes or settings.scraper_import_batch_max_bytes
+        max_jobs = max_jobs or settings.scraper_import_batch_max_jobs
+
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_bytes = 0
+
+        for job in jobs:
+            job_bytes = len(json.dumps(job, default=str).encode("utf-8"))
+            if current and (current_bytes + job_bytes > max_bytes or len(current) >= max_jobs):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(job)
+            current_bytes += job_bytes
+
+        if current or not batches:
+            batches.append(current)
+
+        return batches
+
+    @staticmethod
+    def store_batch_payloads(
+        session_id: str,
+        platform_name: str,
+        batches: List[List[Dict[str, Any]]]
+    ) -> Optional[List[str]]:
+        """
+        Store each batch's jobs in Redis in a single pipeline round trip.
+
+        Args:
+            session_id: Scrape session UUID (for key namespacing)
+            platform_name: Platform name (for key namespacing)
+            batches: Batches from plan_batches
+
+        Returns:
+            Redis keys (one per batch), or None if Redis is unavailable
+        """
+        from app import redis_client
+
+        if not redis_client:
+            logger.warning("Redis unavailable — scraper jobs will be sent inline in events")
+            return None
+
+        # Unique per post so a re-posted platform never overwrites in-flight payloads
+        publish_id = uuid.uuid4().hex[:12]
+        keys = [
+            f"{REDIS_JOBS_PAYLOAD_PREFIX}{session_id}:{platform_name}:{publish_id}:{batch_index}"
+            for batch_index in range(len(batches))
+        ]
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key, batch_jobs in zip(keys, batches):
+                pipe.set(key, json.dumps(batch_jobs, default=str), ex=settings.scraper_import_payload_ttl)
+            pipe.execute()
+            return keys
+        except Exception as e:
+            logger.error(f"Failed to store scraper job payloads in Redis: {e}")
+            return None
+
+    @staticmethod
+    def load_batch_payload(jobs_ref: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load a batch's jobs stored by store_batch_payloads.
+
+        Args:
+            jobs_ref: Redis key carried in the event
+
+        Returns:
+            List of job dicts, or None if the key expired/is missing
+        """
+        from app import redis_client
+
+        if not redis_client:
+            return None
+
+        data = redis_client.get(jobs_ref)
+        if not data:
+            logger.warning(f"Scraper job payload expired or missing: {jobs_ref}")
+            return None
+        return json.loads(data)
+
+    @staticmethod
+    def release_batch_payload(jobs_ref: str) -> bool:
+        """
+        Delete a batch payload once it has been imported.
+
+        Args:
+            jobs_ref: Redis key carried in the event
+
+        Returns:
+            True if deleted successfully
+        """
+        from app import redis_client
+
+        if not redis_client or not jobs_ref:
+            return False
+
+        try:
+            redis_client.delete(jobs_ref)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to delete scraper job payload {jobs_ref}: {e}")
+            return False
+
+    @staticmethod
+    def publish_platform_import(
+        session_id: str,
+        scraper_key_id: int,
+        platform_name: str,
+        platform_status_id: int,
+        batches: List[List[Dict[str, Any]]],
+        jobs_refs: Optional[List[str]] = None
+    ) -> int:
+        """
+        Send one `jobs/scraper.platform-import` event per batch.
+
+        Events are grouped into as few `send` calls as the request size budget
+        allows (one call when payloads are offloaded to Redis).
+
+        Args:
+            session_id: Scrape session UUID
+            scraper_key_id: Scraper API key ID
+            platform_name: Platform name
+            platform_status_id: SessionPlatformStatus ID
+            batches: Batches from plan_batches
+            jobs_refs: Redis keys from store_batch_payloads (None = inline jobs)
+
+        Returns:
+            Number of send calls made
+        """
+        total_batches = len(batches)
+        total_jobs = sum(len(batch_jobs) for batch_jobs in batches)
+
+        events: List[inngest.Event] = []
+        event_sizes: List[int] = []
+        for batch_index, batch_jobs in enumerate(batches):
+            data = {
+                "session_id": session_id,
+                "scraper_key_id": scraper_key_id,
+                "platform_name": platform_name,
+                "platform_status_id": platform_status_id,
+                "jobs_count": len(batch_jobs),
+                # Batch metadata for tracking
+                "batch_index": batch_index,
+                "total_batches": total_batches,
+                "total_jobs_in_platform": total_jobs
+            }
+            if jobs_refs:
+                data["jobs_ref"] = jobs_refs[batch_index]
+            else:
+                data["jobs"] = batch_jobs
+
+            events.append(inngest.Event(name=PLATFORM_IMPORT_EVENT, data=data))
+            event_sizes.append(len(json.dumps(data, default=str).encode("utf-8")))
+
+        # Group events into send calls under the request size budget
+        send_calls = 0
+        chunk: List[inngest.Event] = []
+        chunk_bytes = 0
+        for event, size in zip(events, event_sizes):
+            if chunk and chunk_bytes + size > settings.scraper_import_send_max_bytes:
+                inngest_client.send_sync(chunk)
+                send_calls += 1
+                chunk, chunk_bytes = [], 0
+            chunk.append(event)
+            chunk_bytes += size
+        if chunk:
+            inngest_client.send_sync(chunk)
+            send_calls += 1
+
+        return send_calls
@@ -6,12 +6,14 @@ Features:
 - Platform failure marking
 - Platform batch initialization (CRITICAL: commits before Inngest to avoid race)
 - Session completion marking
+- Atomic platform-finished counters and `platform-batches-done` notification
 """
 import logging
 from typing import Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+import inngest
+from sqlalchemy import select, update
 
 from app import db
 from app.models.scrape_session import ScrapeSession
@@ -19,6 +21,8 @@ from app.models.session_platform_status import SessionPlatformStatus
 
 logger = logging.getLogger(__name__)
 
+PLATFORM_BATCHES_DONE_EVENT = "jobs/scraper.platform-batches-done"
+
 
 class ScraperService:
     """Service for managing scraper sessions."""
@@ -68,9 +72,8 @@ class ScraperService:
         # Mark platform as failed
         platform_status.mark_failed(error_message)
         
-        # Update session counters
-        session.platforms_completed += 1
-        session.platforms_failed += 1
+        # Update session counters atomically (batches of other platforms may finish concurrently)
+        all_platforms_done = ScraperService.record_platform_finished(session_id, failed=True)
         
         # Commit transaction
         db.session.commit()
@@ -79,6 +82,9 @@ class ScraperService:
             f"Platform {platform_name} marked failed for session {session_id}: {error_message}"
         )
         
+        if all_platforms_done:
+            ScraperService.publish_platform_batches_done(session_id)
+        
         return session, platform_status
     
     @staticmethod
@@ -187,3 +193,71 @@ class ScraperService:
         )
         
         return session
+    
+    @staticmethod
+    def record_platform_finished(
+        session_id: UUID,
+        jobs_found: int = 0,
+        jobs_imported: int = 0,
+        jobs_skipped: int = 0,
+        failed: bool = False
+    ) -> bool:
+        """
+        Atomically count a finished platform against its session.
+        
+        Must be called exactly once per platform (callers guard this with a
+        conditional status update). Does not commit - the caller commits and
+        then calls publish_platform_batches_done if this returns True.
+        
+        Args:
+            session_id: UUID of scraper session
+            jobs_found: Jobs found on the platform
+            jobs_imported: Jobs imported from the platform
+            jobs_skipped: Jobs skipped on the platform
+            failed: Whether the platform failed
+            
+        Returns:
+            True if this was the last platform of the session to finish
+        """
+        stmt = (
+            update(ScrapeSession)
+            .where(ScrapeSession.session_id == session_id)
+            .values(
+                platforms_completed=db.func.coalesce(ScrapeSession.platforms_completed, 0) + 1,
+                platforms_failed=db.func.coalesce(ScrapeSession.platforms_failed, 0) + (1 if failed else 0),
+                jobs_found=db.func.coalesce(ScrapeSession.jobs_found, 0) + jobs_found,
+                jobs_imported=db.func.coalesce(ScrapeSession.jobs_imported, 0) + jobs_imported,
+                jobs_skipped=db.func.coalesce(ScrapeSession.jobs_skipped, 0) + jobs_skipped,
+            )
+            .returning(ScrapeSession.platforms_completed, ScrapeSession.platforms_total)
+            .execution_options(synchronize_session=False)
+        )
+        row = db.session.execute(stmt).first()
+        if not row:
+            return False
+        
+        platforms_completed, platforms_total = row
+        return platforms_completed >= (platforms_total or 0)
+    
+    @staticmethod
+    def publish_platform_batches_done(session_id: UUID) -> None:
+        """
+        Notify a waiting session-completion workflow that every platform finished.
+        
+        Send failures are logged only; the workflow falls back to its timeout.
+        
+        Args:
+            session_id: UUID of scraper session
+        """
+        from app.inngest import inngest_client
+        
+        try:
+            inngest_client.send_sync(
+                inngest.Event(
+                    name=PLATFORM_BATCHES_DONE_EVENT,
+                    data={"session_id": str(session_id)}
+                )
+            )
+            logger.info(f"All platforms done for session {session_id}, sent {PLATFORM_BATCHES_DONE_EVENT}")
+        except Exception as e:
+            logger.error(f"Failed to send {PLATFORM_BATCHES_DONE_EVENT} for session {session_id}: {e}")
@@ -0,0 +1,377 @@
+"""
+Scraper Stats Service
+
+Dashboard statistics for the scrape queue and scraper activity.
+
+Key Features:
+- Stats snapshot refreshed every minute by a scheduled function and stored in Redis
+- Dashboard polls read the snapshot instead of running the aggregates per request
+- Stale or missing snapshots are refreshed on read by one worker (Redis lock)
+- Every response carries the snapshot's freshness timestamp
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from sqlalchemy import func
+
+from app import db
+from app.models.scraper_api_key import ScraperApiKey
+from app.models.scrape_session import ScrapeSession
+from app.models.global_role import GlobalRole
+from app.models.job_posting import JobPosting
+from app.models.role_location_queue import RoleLocationQueue
+from app.services.scrape_queue_service import ScrapeQueueService
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_SNAPSHOT_KEY = "scraper_stats:snapshot"
+REDIS_REFRESH_LOCK_KEY = "scraper_stats:refresh_lock"
+
+
+class ScraperStatsService:
+    """
+    Service for scraper monitoring statistics.
+    
+    Snapshot sections:
+    - queue: ScrapeQueueService.get_queue_stats()
+    - location_queue: ScrapeQueueService.get_role_location_queue_stats()
+    - scraper: compute_scraper_stats() for the default dashboard window
+    """
+    
+    # Time window (hours) of the scraper section kept in the snapshot
+    SNAPSHOT_HOURS = 24
+    
+    # Process-local snapshot, used when Redis is unavailable
+    _local_snapshot: Optional[Dict[str, Any]] = None
+    _local_snapshot_lock = threading.Lock()
+    
+    @staticmethod
+    def compute_scraper_stats(hours: int = 24) -> Dict[str, Any]:
+        """
+        Compute aggregated scraper statistics from the database.
+        
+        Args:
+            hours: Time range in hours for session/job statistics
+        
+        Returns:
+            Dict in the /api/scraper-monitoring/stats response format
+        """
+        since = datetime.utcnow() - timedelta(hours=hours)
+        
+        # Active scrapers (with in_progress session in last 10 minutes)
+        active_cutoff = datetime.utcnow() - timedelta(minutes=10)
+        active_scrapers = db.session.scalar(
+            db.select(func.count(func.distinct(ScrapeSession.scraper_key_id)))
+            .where(
+                ScrapeSession.updated_at >= active_cutoff,
+                ScrapeSession.status == 'in_progress'
+            )
+        ) or 0
+        
+        # Pending queue count (roles ready to be scraped - approved status)
+        pending_queue = db.session.scalar(
+            db.select(func.count(GlobalRole.id))
+            .where(GlobalRole.queue_status == 'approved')
+        ) or 0
+        
+        # Jobs imported in time period
+        jobs_imported = db.session.scalar(
+            db.select(func.count(JobPosting.id))
+            .where(JobPosting.imported_at >= since)
+        ) or 0
+        
+        # Jobs stats from sessions (found, imported, skipped)
+        jobs_stats = db.session.execute(
+            db.select(
+                func.coalesce(func.sum(ScrapeSession.jobs_found), 0).label('total_found'),
+                func.coalesce(func.sum(ScrapeSession.jobs_imported), 0).label('total_imported'),
+                func.coalesce(func.sum(ScrapeSession.jobs_skipped), 0).label('total_skipped')
+            )
+            .where(ScrapeSession.created_at >= since)
+        ).first()
+        
+        # Session statistics
+        session_stats = db.session.execute(
+            db.select(
+                ScrapeSession.status,
+                func.count(ScrapeSession.id).label('count')
+            )
+            .where(ScrapeSession.created_at >= since)
+            .group_by(ScrapeSession.status)
+        ).all()
+        
+        sessions_by_status = {row[0]: row[1] for row in session_stats}
+        
+        # Average duration of completed sessions
+        avg_duration = db.session.scalar(
+            db.select(func.avg(ScrapeSession.duration_seconds))
+            .where(
+                ScrapeSession.status == 'completed',
+                ScrapeSession.created_at >= since
+            )
+        ) or 0
+        
+        # API key counts
+        total_keys = db.session.scalar(
+            db.select(func.count(ScraperApiKey.id))
+        ) or 0
+        
+        active_keys = db.session.scalar(
+            db.select(func.count(ScraperApiKey.id))
+            .where(ScraperApiKey.is_active == True)
+        ) or 0
+        
+        # Count of roles that need PM_ADMIN review (newly normalized, awaiting approval)
+        # These are roles with queue_status='pending' that were recently created
+        # For the dashboard, we show all pending roles as "Roles to Review"
+        pending_roles_count = pending_queue  # Same as pending queue for now
+        
+        # =========================================================================
+        # LOCATION ANALYTICS
+        # =========================================================================
+        
+        # Sessions with location (role+location scraping) vs without
+        location_session_counts = db.session.execute(
+            db.select(
+                func.count(ScrapeSession.id).filter(ScrapeSession.location.isnot(None)).label('with_location'),
+                func.count(ScrapeSession.id).filter(ScrapeSession.location.is_(None)).label('without_location')
+            )
+            .where(ScrapeSession.created_at >= since)
+        ).first()
+        
+        # Jobs by location (top 10 locations by jobs imported in last 24h)
+        jobs_by_location = db.session.execute(
+            db.select(
+                ScrapeSession.location,
+                func.sum(ScrapeSession.jobs_found).label('jobs_found'),
+                func.sum(ScrapeSession.jobs_imported).label('jobs_imported'),
+                func.count(ScrapeSession.id).label('session_count')
+            )
+            .where(
+                ScrapeSession.created_at >= since,
+                ScrapeSession.location.isnot(None)
+            )
+            .group_by(ScrapeSession.location)
+            .order_by(func.sum(ScrapeSession.jobs_imported).desc())
+            .limit(10)
+        ).all()
+        
+        # Role+Location queue stats
+        location_queue_stats = db.session.execute(
+            db.select(
+                RoleLocationQueue.queue_status,
+                func.count(RoleLocationQueue.id).label('count')
+            )
+            .group_by(RoleLocationQueue.queue_status)
+        ).all()
+        
+        location_queue_by_status = {row[0]: row[1] for row in location_queue_stats}
+        
+        # Unique locations in queue
+        unique_locations_in_queue = db.session.scalar(
+            db.select(func.count(func.distinct(RoleLocationQueue.location)))
+        ) or 0
+        
+        # Total role+location entries
+        total_location_entries = db.session.scalar(
+            db.select(func.count(RoleLocationQueue.id))
+        ) or 0
+        
+        return {
+            "active_scrapers": active_scrapers,
+            "pending_queue": pending_queue,
+            "pending_roles_count": pending_roles_count,  # For dashboard "Roles to Review" card
+            "jobs_imported_24h": jobs_imported,
+            "jobs_imported_today": jobs_imported,  # Alias for frontend compatibility
+            "jobs_stats_24h": {
+                "total_found": int(jobs_stats.total_found) if jobs_stats else 0,
+                "total_imported": int(jobs_stats.total_imported) if jobs_stats else 0,
+                "total_skipped": int(jobs_stats.total_skipped) if jobs_stats else 0,
+                "success_rate": round((int(jobs_stats.total_imported) / int(jobs_stats.total_found) * 100) if jobs_stats and jobs_stats.total_found > 0 else 0, 1)
+            },
+            "sessions_24h": {
+                "total": sum(sessions_by_status.values()),
+                "completed": sessions_by_status.get('completed', 0),
+                "failed": sessions_by_status.get('failed', 0),
+                "in_progress": sessions_by_status.get('in_progress', 0),
+                "timeout": sessions_by_status.get('timeout', 0)
+            },
+            "avg_duration_seconds": int(avg_duration),
+            "total_api_keys": total_keys,
+            "active_api_keys": active_keys,
+            "location_analytics": {
+                "sessions_with_location": location_session_counts.with_location if location_session_counts else 0,
+                "sessions_without_location": location_session_counts.without_location if location_session_counts else 0,
+                "top_locations": [
+                    {
+                        "location": row.location,
+                        "jobs_found": int(row.jobs_found) if row.jobs_found else 0,
+                        "jobs_imported": int(row.jobs_imported) if row.jobs_imported else 0,
+                        "session_count": int(row.session_count) if row.session_count else 0
+                    }
+                    for row in jobs_by_location
+                ],
+                "queue": {
+                    "total": total_location_entries,
+                    "pending": location_queue_by_status.get('pending', 0),
+                    "approved": location_queue_by_status.get('approved', 0),
+                    "processing": location_queue_by_status.get('processing', 0),
+                    "completed": location_queue_by_status.get('completed', 0),
+                    "unique_locations": unique_locations_in_queue
+                }
+            }
+        }
+    
+    @staticmethod
+    def compute_snapshot() -> Dict[str, Any]:
+        """
+        Compute every snapshot section from the database.
+        
+        Returns:
+            Snapshot dict with section stats plus computed_at (epoch seconds)
+        """
+        return {
+            "queue": ScrapeQueueService.get_queue_stats(),
+            "location_queue": ScrapeQueueService.get_role_location_queue_stats(),
+            "scraper": ScraperStatsService.compute_scraper_stats(ScraperStatsService.SNAPSHOT_HOURS),
+            "computed_at": time.time(),
+        }
+    
+    @staticmethod
+    def refresh_snapshot() -> Dict[str, Any]:
+        """
+        Recompute the snapshot and publish it (Redis, or in-process without Redis).
+        
+        Called by the refresh-scraper-stats-snapshot scheduled function.
+        
+        Returns:
+            The new snapshot
+        """
+        from app import redis_client
+        
+        snapshot = ScraperStatsService.compute_snapshot()
+        
+        if redis_client:
+            try:
+                redis_client.setex(
+                    REDIS_SNAPSHOT_KEY,
+                    max(settings.scraper_stats_snapshot_max_age * 10, 600),
+                    json.dumps(snapshot)
+                )
+                return snapshot
+            except Exception as e:
+                logger.warning(f"Failed to store scraper stats snapshot: {e}")
+        
+        with ScraperStatsService._local_snapshot_lock:
+            ScraperStatsService._local_snapshot = snapshot
+        return snapshot
+    
+    @staticmethod
+    def _read_snapshot() -> Optional[Dict[str, Any]]:
+        """Read the published snapshot (Redis first, then in-process)."""
+        from app import redis_client
+        
+        if redis_client:
+            try:
+                raw = redis_client.get(REDIS_SNAPSHOT_KEY)
+                if raw:
+                    return json.loads(raw)
+            except Exception as e:
+                logger.warning(f"Failed to read scraper stats snapshot: {e}")
+        return ScraperStatsService._local_snapshot
+    
+    @staticmethod
+    def _acquire_refresh_lock() -> bool:
+        """
+        Claim the right to refresh a stale snapshot.
+        
+        Returns:
+            True if this caller should refresh (lock taken, or no Redis to coordinate)
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return True
+        try:
+            return bool(redis_client.set(REDIS_REFRESH_LOCK_KEY, "1", nx=True, ex=30))
+        except Exception as e:
+            logger.warning(f"Failed to take scraper stats refresh lock: {e}")
+            return True
+    
+    @staticmethod
+    def get_snapshot() -> Dict[str, Any]:
+        """
+        Get the stats snapshot for dashboard reads.
+        
+        A snapshot older than settings.scraper_stats_snapshot_max_age seconds is
+        refreshed by the first caller that takes the refresh lock; concurrent
+        callers keep serving the stale snapshot meanwhile.
+        
+        Returns:
+            Snapshot dict (see compute_snapshot)
+        """
+        snapshot = ScraperStatsService._read_snapshot()
+        age = time.time() - snapshot["computed_at"] if snapshot else None
+        if age is not None and age <= settings.scraper_stats_snapshot_max_age:
+            return snapshot
+        
+        if snapshot is None or ScraperStatsService._acquire_refresh_lock():
+            return ScraperStatsService.refresh_snapshot()
+        return snapshot
+    
+    @staticmethod
+    def freshness(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Freshness fields added to every dashboard stats response.
+        
+        Args:
+            snapshot: Snapshot dict with computed_at
+        
+        Returns:
+            Dict with stats_as_of (ISO timestamp) and stats_age_seconds
+        """
+        computed_at = snapshot["computed_at"]
+        return {
+            "stats_as_of": datetime.utcfromtimestamp(computed_at).isoformat() + "Z",
+            "stats_age_seconds": max(0, int(time.time() - computed_at)),
+        }
+    
+    @staticmethod
+    def get_section(section: str) -> Dict[str, Any]:
+        """
+        Get one snapshot section with freshness fields.
+        
+        Args:
+            section: "queue", "location_queue" or "scraper"
+        
+        Returns:
+            Section stats plus stats_as_of / stats_age_seconds
+        """
+        snapshot = ScraperStatsService.get_snapshot()
+        return {**snapshot[section], **ScraperStatsService.freshness(snapshot)}
+    
+    @staticmethod
+    def get_scraper_stats(hours: int = 24) -> Dict[str, Any]:
+        """
+        Get scraper statistics for the monitoring dashboard.
+        
+        The default window is served from the snapshot; other windows are
+        computed on demand.
+        
+        Args:
+            hours: Time range in hours
+        
+        Returns:
+            Scraper stats plus stats_as_of / stats_age_seconds
+        """
+        if hours == ScraperStatsService.SNAPSHOT_HOURS:
+            return ScraperStatsService.get_section("scraper")
+        
+        stats = ScraperStatsService.compute_scraper_stats(hours)
+        stats.update(ScraperStatsService.freshness({"computed_at": time.time()}))
+        return stats
@@ -0,0 +1,251 @@
+"""
+Session Job Log Service
+
+Writes the per-job import log of a scrape batch and reads logged payloads back.
+
+Key Features:
+- Logging level from settings.scraper_job_log_level:
+  - full: each row stores the job's raw JSON (raw_job_data)
+  - reference: each row stores a SHA-256 of the job JSON (payload_hash) and
+    the key of one gzipped JSONL blob per batch in file storage
+    (payload_key); the raw JSON is only fetched when a log is opened
+  - summary: no rows; session totals come from SessionPlatformStatus
+- Rows of a batch are collected while it is imported and written with one
+  multi-row INSERT instead of one ORM object per job
+- If the payload blob cannot be uploaded the batch is logged inline (full)
+"""
+import gzip
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from app import db
+from app.models.session_job_log import SessionJobLog
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LOG_LEVELS = ("full", "reference", "summary")
+
+# Storage prefix of batch payload blobs: session_job_payloads/{session}/{platform}/...
+PAYLOAD_PREFIX = "session_job_payloads"
+
+
+def _canonical_json(raw_job_data: Dict[str, Any]) -> str:
+    """Stable JSON encoding of a job (the input of payload_hash)."""
+    return json.dumps(raw_job_data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class PendingJobLog:
+    """
+    Import outcome of one job, written later by SessionJobLogBatch.write().
+    
+    Has the same mark_* methods as SessionJobLog.
+    """
+    
+    def __init__(self, job_index: int, raw_job_data: Dict[str, Any]):
+        self.job_index = job_index
+        self.raw_job_data = raw_job_data
+        self.fields: Dict[str, Any] = {}
+    
+    def mark_imported(self, job_id: int) -> None:
+        """Mark this job as successfully imported."""
+        self.fields = {"status": "imported", "imported_job_id": job_id, "processed_at": datetime.utcnow()}
+    
+    def mark_skipped(self, reason: str, detail: str, duplicate_job_id: Optional[int] = None) -> None:
+        """Mark this job as skipped with reason."""
+        self.fields = {
+            "status": "skipped",
+            "skip_reason": reason,
+            "skip_reason_detail": detail,
+            "duplicate_job_id": duplicate_job_id,
+            "processed_at": datetime.utcnow(),
+        }
+    
+    def mark_error(self, error_message: str) -> None:
+        """Mark this job as having an error."""
+        self.fields = {"status": "error", "error_message": error_message, "processed_at": datetime.utcnow()}
+
+
+class SessionJobLogBatch:
+    """Collects the job logs of one import batch and writes them in bulk."""
+    
+    def __init__(
+        self,
+        session_id: UUID,
+        platform_name: str,
+        batch_index: int = 0,
+        platform_status_id: Optional[int] = None,
+        level: Optional[str] = None
+    ):
+        self.session_id = session_id
+        self.platform_name = platform_name
+        self.batch_index = batch_index
+        self.platform_status_id = platform_status_id
+        self.level = level or settings.scraper_job_log_level
+        if self.level not in LOG_LEVELS:
+            logger.warning(f"[JOB-LOG] Unknown log level '{self.level}', using 'full'")
+            self.level = "full"
+        self._entries: Dict[int, PendingJobLog] = {}
+    
+    def entry(self, job_index: int, raw_job_data: Dict[str, Any]) -> PendingJobLog:
+        """
+        Start the log entry of a job, replacing any earlier entry for it.
+        
+        Args:
+            job_index: Order of the job in the batch
+            raw_job_data: Job as received from the scraper
+        
+        Returns:
+            Pending entry to mark imported/skipped/error
+        """
+        entry = PendingJobLog(job_index, raw_job_data)
+        self._entries[job_index] = entry
+        return entry
+    
+    def write(self) -> int:
+        """
+        Insert the collected entries (in the caller's transaction).
+        
+        Returns:
+            Number of rows written
+        """
+        if self.level == "summary" or not self._entries:
+            return 0
+        
+        entries = sorted(self._entries.values(), key=lambda e: e.job_index)
+        hashes = {
+            e.job_index: hashlib.sha256(_canonical_json(e.raw_job_data).encode("utf-8")).hexdigest()
+            for e in entries
+        }
+        payload_key = self._upload_payloads(entries, hashes) if self.level == "reference" else None
+        
+        rows = []
+        for e in entries:
+            row = {
+                "imported_job_id": None,
+                "skip_reason": None,
+                "skip_reason_detail": None,
+                "duplicate_job_id": None,
+                "error_message": None,
+                "processed_at": None,
+                **SessionJobLog.build_row(
+                    self.session_id,
+                    self.platform_name,
+                    e.job_index,
+                    e.raw_job_data,
+                    self.platform_status_id
+                ),
+                "payload_hash": hashes[e.job_index],
+                "payload_key": payload_key,
+                **e.fields,
+            }
+            if payload_key:
+                row["raw_job_data"] = {}
+            rows.append(row)
+        
+        db.session.execute(insert(SessionJobLog), rows)
+        return len(rows)
+    
+    def _upload_payloads(self, entries: List[PendingJobLog], hashes: Dict[int, str]) -> Optional[str]:
+        """
+        Store the batch's jobs as gzipped JSONL (one line per job, in job_index order).
+        
+        The key is derived from session, platform and batch, so a retried
+        batch overwrites its own blob.
+        
+        Returns:
+            Storage key, or None if the upload failed (log inline instead)
+        """
+        from app.services.file_storage import FileStorageService
+        
+        payload = "".join(
+            json.dumps(
+                {"job_index": e.job_index, "hash": hashes[e.job_index], "job": e.raw_job_data},
+                default=str,
+                separators=(",", ":")
+            ) + "\n"
+            for e in entries
+        ).encode("utf-8")
+        content = gzip.compress(payload)
+        
+        file_key = (
+            f"{PAYLOAD_PREFIX}/{self.session_id}/{self.platform_name}/"
+            f"batch_{self.batch_index:04d}.jsonl.gz"
+        )
+        result = FileStorageService().upload_bytes(file_key, content, "application/gzip")
+        if not result.get("success"):
+            logger.warning(
+                f"[JOB-LOG] Failed to store payloads at {file_key}, logging inline: {result.get('error')}"
+            )
+            return None
+        
+        logger.debug(
+            f"[JOB-LOG] Stored {len(entries)} job payloads at {file_key} "
+            f"({len(payload)} -> {len(content)} bytes)"
+        )
+        return file_key
+
+
+class SessionJobLogService:
+    """Read raw job payloads of session job logs."""
+    
+    @staticmethod
+    def load_payloads(logs: Iterable[SessionJobLog]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get the raw job JSON of log rows.
+        
+        Inline rows return raw_job_data; reference rows are read from their
+        batch blob, downloaded once per blob. A missing blob or a payload whose
+        hash no longer matches yields None.
+        
+        Args:
+            logs: SessionJobLog rows
+        
+        Returns:
+            Dict of log ID -> raw job data (or None)
+        """
+        payloads: Dict[int, Optional[Dict[str, Any]]] = {}
+        by_key: Dict[str, List[SessionJobLog]] = {}
+        for log in logs:
+            if log.payload_key:
+                by_key.setdefault(log.payload_key, []).append(log)
+            else:
+                payloads[log.id] = log.raw_job_data
+        
+        for payload_key, key_logs in by_key.items():
+            blob = SessionJobLogService._read_blob(payload_key)
+            for log in key_logs:
+                line = blob.get(log.job_index)
+                if line is None:
+                    payloads[log.id] = None
+                elif line[0] != log.payload_hash:
+                    logger.warning(f"[JOB-LOG] Payload hash mismatch for job log {log.id} in {payload_key}")
+                    payloads[log.id] = None
+                else:
+                    payloads[log.id] = line[1]
+        
+        return payloads
+    
+    @staticmethod
+    def _read_blob(payload_key: str) -> Dict[int, Tuple[str, Dict[str, Any]]]:
+        """Job index -> (hash, job) of a payload blob; empty if it cannot be read."""
+        from app.services.file_storage import FileStorageService
+        
+        content, _, error = FileStorageService().download_file(payload_key)
+        if error or content is None:
+            logger.warning(f"[JOB-LOG] Failed to read payload blob {payload_key}: {error}")
+            return {}
+        
+        try:
+            lines = gzip.decompress(content).decode("utf-8").splitlines()
+            records = (json.loads(line) for line in lines if line)
+            return {record["job_index"]: (record["hash"], record["job"]) for record in records}
+        except Exception as e:
+            logger.warning(f"[JOB-LOG] Corrupt payload blob {payload_key}: {e}")
+            return {}
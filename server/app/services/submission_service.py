@@ -4,6 +4,8 @@ Business logic for tracking candidate submissions to job postings.
 Core service for the ATS (Applicant Tracking System) functionality.
 """
 import logging
+import threading
+import time
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -14,10 +16,13 @@ from app.models.submission import Submission, SubmissionStatus
 from app.models.submission_activity import SubmissionActivity, ActivityType
 from app.models.candidate import Candidate
 from app.models.job_posting import JobPosting
+from config.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
+REDIS_STATS_VERSION_PREFIX = "submission_stats:version"
+
 
 class SubmissionService:
     """
@@ -31,6 +36,11 @@ class SubmissionService:
     - Duplicate detection
     """
     
+    # Process-local get_stats() results: (tenant_id, user_id, days_back) -> (expires_at, shared version, stats)
+    _stats_cache: Dict[Tuple[int, Optional[int], int], Tuple[float, Optional[int], Dict[str, Any]]] = {}
+    _stats_cache_lock = threading.Lock()
+    _STATS_CACHE_MAX_ENTRIES = 1024
+    
     def __init__(self, tenant_id: int):
         """
         Initialize SubmissionService for a specific tenant.
@@ -158,6 +168,7 @@ class SubmissionService:
         db.session.add(activity)
         
         db.session.commit()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Created submission {submission.id} for candidate {candidate_id} to job {job_posting_id}")
         
@@ -285,6 +296,7 @@ class SubmissionService:
         db.session.add(activity)
         
         db.session.commit()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Created external submission {submission.id} for candidate {candidate_id} to {external_job_title} at {external_job_company}")
         
@@ -559,6 +571,7 @@ class SubmissionService:
                 db.session.add(activity)
         
         db.session.commit()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Updated submission {submission_id}: {', '.join(changes) if changes else 'no field changes'}")
         
@@ -641,6 +654,7 @@ class SubmissionService:
         db.session.add(activity)
         
         db.session.commit()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Submission {submission_id} status changed: {old_status} -> {new_status}")
         
@@ -663,6 +677,7 @@ class SubmissionService:
         db.session.delete(submission)
         db.session.commit()
         db.session.expire_all()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Deleted submission {submission_id}")
         
@@ -914,6 +929,7 @@ class SubmissionService:
         db.session.add(activity)
         
         db.session.commit()
+        SubmissionService.invalidate_stats_cache(self.tenant_id)
         
         logger.info(f"Interview scheduled for submission {submission_id} at {interview_scheduled_at}")
         
@@ -929,6 +945,10 @@ class SubmissionService:
         """
         Get submission statistics.
         
+        Results are cached in-process per (tenant, user, days_back) for
+        settings.submission_stats_cache_ttl seconds; submission writes call
+        invalidate_stats_cache().
+        
         Args:
             user_id: Optional filter by user (for personal stats)
             days_back: Number of days to look back for time-based stats
@@ -945,80 +965,80 @@ class SubmissionService:
             - interview_rate: % of submissions that got interviews
             - placement_rate: % of submissions that got placed
         """
-        base_query = select(Submission).where(Submission.tenant_id == self.tenant_id)
-        
-        if user_id:
-            base_query = base_query.where(Submission.submitted_by_user_id == user_id)
-        
-        # Total count
-        total_query = select(func.count()).select_from(base_query.subquery())
-        total = db.session.scalar(total_query) or 0
-        
-        # Count by status
-        status_query = select(
-            Submission.status,
-            func.count(Submission.id)
-        ).where(Submission.tenant_id == self.tenant_id)
+        cache_key = (self.tenant_id, user_id, days_back)
+        now_monotonic = time.monotonic()
+        version = SubmissionService._stats_version(self.tenant_id)
+        cached = SubmissionService._stats_cache.get(cache_key)
+        if cached is not None and cached[0] > now_monotonic and cached[1] == version:
+            return SubmissionService._copy_stats(cached[2])
+        
+        stats = self._compute_stats(user_id)
+        
+        ttl = settings.submission_stats_cache_ttl
+        if ttl > 0:
+            with SubmissionService._stats_cache_lock:
+                if len(SubmissionService._stats_cache) >= SubmissionService._STATS_CACHE_MAX_ENTRIES:
+                    SubmissionService._stats_cache = {
+                        key: entry for key, entry in SubmissionService._stats_cache.items()
+                        if entry[0] > now_monotonic
+                    }
+                SubmissionService._stats_cache[cache_key] = (now_monotonic + ttl, version, stats)
         
-        if user_id:
-            status_query = status_query.where(Submission.submitted_by_user_id == user_id)
+        return SubmissionService._copy_stats(stats)
+    
+    def _compute_stats(self, user_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Compute submission statistics in a single scan of the tenant's submissions.
         
-        status_query = status_query.group_by(Submission.status)
-        status_results = db.session.execute(status_query).all()
-        by_status = {status: count for status, count in status_results}
+        One GROUP BY status query with FILTER aggregates yields the per-status
+        counts and every time-window metric; totals are summed from the groups.
+        Served by idx_submission_tenant_user_submitted.
         
-        # Time-based calculations
+        Args:
+            user_id: Optional filter by user (for personal stats)
+            
+        Returns:
+            Statistics dictionary (see get_stats)
+        """
         now = datetime.utcnow()
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
         
-        # Submitted this week
-        week_query = select(func.count()).where(
-            and_(
-                Submission.tenant_id == self.tenant_id,
-                Submission.submitted_at >= week_ago
-            )
-        )
-        if user_id:
-            week_query = week_query.where(Submission.submitted_by_user_id == user_id)
-        submitted_this_week = db.session.scalar(week_query) or 0
+        is_placed = Submission.status == SubmissionStatus.PLACED
+        days_to_status = (
+            func.extract('epoch', Submission.status_changed_at) -
+            func.extract('epoch', Submission.submitted_at)
+        ) / 86400  # Convert seconds to days
         
-        # Submitted this month
-        month_query = select(func.count()).where(
-            and_(
-                Submission.tenant_id == self.tenant_id,
-                Submission.submitted_at >= month_ago
-            )
-        )
-        if user_id:
-            month_query = month_query.where(Submission.submitted_by_user_id == user_id)
-        submitted_this_month = db.session.scalar(month_query) or 0
+        stats_query = select(
+            Submission.status,
+            func.count().label('total'),
+            func.count().filter(Submission.submitted_at >= week_ago).label('this_week'),
+            func.count().filter(Submission.submitted_at >= month_ago).label('this_month'),
+            # Submissions in INTERVIEW_SCHEDULED status or with upcoming interviews
+            func.count().filter(or_(
+                Submission.status == SubmissionStatus.INTERVIEW_SCHEDULED,
+                Submission.interview_scheduled_at >= now
+            )).label('interviews'),
+            func.count().filter(and_(is_placed, Submission.status_changed_at >= month_ago)).label('placements_month'),
+            # Sum and count (not avg) so the average can be combined across status groups
+            func.sum(days_to_status).filter(is_placed).label('placement_days_sum'),
+            func.count(days_to_status).filter(is_placed).label('placement_days_count'),
+        ).where(Submission.tenant_id == self.tenant_id)
         
-        # Interviews scheduled (submissions in INTERVIEW_SCHEDULED status or with upcoming interviews)
-        interview_query = select(func.count()).where(
-            and_(
-                Submission.tenant_id == self.tenant_id,
-                or_(
-                    Submission.status == SubmissionStatus.INTERVIEW_SCHEDULED,
-                    Submission.interview_scheduled_at >= now
-                )
-            )
-        )
         if user_id:
-            interview_query = interview_query.where(Submission.submitted_by_user_id == user_id)
-        interviews_scheduled = db.session.scalar(interview_query) or 0
+            stats_query = stats_query.where(Submission.submitted_by_user_id == user_id)
         
-        # Placements this month
-        placement_query = select(func.count()).where(
-            and_(
-                Submission.tenant_id == self.tenant_id,
-                Submission.status == SubmissionStatus.PLACED,
-                Submission.status_changed_at >= month_ago
-            )
-        )
-        if user_id:
-            placement_query = placement_query.where(Submission.submitted_by_user_id == user_id)
-        placements_this_month = db.session.scalar(placement_query) or 0
+        rows = db.session.execute(stats_query.group_by(Submission.status)).all()
+        
+        by_status = {row.status: row.total for row in rows}
+        total = sum(row.total for row in rows)
+        submitted_this_week = sum(row.this_week for row in rows)
+        submitted_this_month = sum(row.this_month for row in rows)
+        interviews_scheduled = sum(row.interviews for row in rows)
+        placements_this_month = sum(row.placements_month for row in rows)
+        placement_days_sum = sum(row.placement_days_sum or 0 for row in rows)
+        placement_days_count = sum(row.placement_days_count for row in rows)
         
         # Calculate rates
         interview_statuses = [
@@ -1033,29 +1053,12 @@ class SubmissionService:
         placement_count = by_status.get(SubmissionStatus.PLACED, 0)
         placement_rate = round((placement_count / total) * 100, 2) if total > 0 else 0.0
         
-        # Average days to placement (for placed submissions)
-        # This would require more complex calculation using status_changed_at vs submitted_at
-        # For now, return None if no data
+        # Average days to placement (status_changed_at vs submitted_at of placed submissions)
         avg_days_to_placement = None
-        if placement_count > 0:
-            # Calculate average for placed submissions
-            placed_query = select(
-                func.avg(
-                    func.extract('epoch', Submission.status_changed_at) - 
-                    func.extract('epoch', Submission.submitted_at)
-                ) / 86400  # Convert seconds to days
-            ).where(
-                and_(
-                    Submission.tenant_id == self.tenant_id,
-                    Submission.status == SubmissionStatus.PLACED
-                )
-            )
-            if user_id:
-                placed_query = placed_query.where(Submission.submitted_by_user_id == user_id)
-            
-            avg_seconds = db.session.scalar(placed_query)
-            if avg_seconds:
-                avg_days_to_placement = round(float(avg_seconds), 1)
+        if placement_days_count:
+            avg_days = float(placement_days_sum) / placement_days_count
+            if avg_days:
+                avg_days_to_placement = round(avg_days, 1)
         
         return {
             'total': total,
@@ -1069,6 +1072,45 @@ class SubmissionService:
             'placement_rate': placement_rate,
         }
     
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached stats dict so callers can modify it."""
+        return {**stats, 'by_status': dict(stats['by_status'])}
+    
+    @staticmethod
+    def _stats_version(tenant_id: int) -> Optional[int]:
+        """
+        Read the shared submission stats version of a tenant.
+        
+        Returns:
+            Version number (0 if never bumped), or None if Redis is unavailable
+        """
+        from app import redis_client
+        
+        if not redis_client:
+            return None
+        try:
+            return int(redis_client.get(f"{REDIS_STATS_VERSION_PREFIX}:{tenant_id}") or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read submission stats version: {e}")
+            return None
+    
+    @staticmethod
+    def invalidate_stats_cache(tenant_id: int) -> None:
+        """Drop a tenant's cached stats here and in every other worker."""
+        from app import redis_client
+        
+        with SubmissionService._stats_cache_lock:
+            SubmissionService._stats_cache = {
+                key: entry for key, entry in SubmissionService._stats_cache.items()
+                if key[0] != tenant_id
+            }
+        if redis_client:
+            try:
+                redis_client.incr(f"{REDIS_STATS_VERSION_PREFIX}:{tenant_id}")
+            except Exception as e:
+                logger.warning(f"Failed to bump submission stats version: {e}")
+    
     # ==================== Utilities ====================
     
     def check_duplicate(
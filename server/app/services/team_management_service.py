@@ -2,10 +2,12 @@
 
 import logging
 from typing import List, Dict, Optional
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, delete, exists, literal, true, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, selectinload
 
 from app import db
-from app.models import PortalUser, Role
+from app.models import PortalUser, PortalUserHierarchy, Role
 from app.services import AuditLogService
 from config.settings import settings
 
@@ -20,6 +22,9 @@ ROLE_HIERARCHY = {
     'RECRUITER': 4,        # Cannot manage anyone
 }
 
+# Hard stop for closure-table rebuilds (guards against pre-existing cycles in manager_id data)
+CLOSURE_REBUILD_MAX_DEPTH = 100
+
 
 class TeamManagementService:
     """Service for team hierarchy and manager assignment operations."""
@@ -174,6 +179,7 @@ class TeamManagementService:
 
         # Assign manager
         user.manager_id = manager_id
+        TeamManagementService.sync_hierarchy_closure(user_id, manager_id, user.tenant_id)
         db.session.commit()
 
         # Log audit
@@ -205,6 +211,9 @@ class TeamManagementService:
     def _would_create_cycle(user_id: int, proposed_manager_id: int) -> bool:
         """
         Check if assigning proposed_manager_id as manager would create a circular hierarchy.
+        
+        A cycle appears exactly when user_id is already above proposed_manager_id,
+        which is answered with a single ancestor query.
 
         Args:
             user_id: ID of user receiving manager assignment
@@ -213,29 +222,238 @@ class TeamManagementService:
         Returns:
             True if assignment would create a cycle, False otherwise
         """
-        # Walk up the proposed manager's chain to see if we encounter user_id
-        current_id = proposed_manager_id
-        visited = set()
+        if user_id == proposed_manager_id:
+            return True
+
+        return TeamManagementService._is_ancestor(user_id, proposed_manager_id)
+
+    @staticmethod
+    def _ancestors_cte(user_id: int, tenant_id: Optional[int] = None, max_depth: Optional[int] = None):
+        """
+        Build a recursive CTE of every manager above user_id (direct and indirect).
+
+        Without max_depth, uses UNION rather than UNION ALL so a pre-existing
+        cycle in manager_id data terminates instead of recursing forever. With
+        max_depth, the walk carries a depth column and stops after that many
+        levels.
+
+        Args:
+            user_id: ID of the user whose management chain to walk
+            tenant_id: Optional tenant ID; the walk stops at users outside it
+            max_depth: Optional number of manager levels to walk
+
+        Returns:
+            CTE with a ``user_id`` column (and ``depth`` when max_depth is set)
+        """
+        columns = [PortalUser.manager_id.label('user_id')]
+        if max_depth is not None:
+            columns.append(literal(1).label('depth'))
+        start = select(*columns).where(
+            PortalUser.id == user_id,
+            PortalUser.manager_id.isnot(None)
+        )
+        if tenant_id is not None:
+            start = start.where(PortalUser.tenant_id == tenant_id)
+        ancestors = start.cte('manager_chain', recursive=True)
+
+        parent = aliased(PortalUser)
+        if max_depth is None:
+            step = select(parent.manager_id)
+        else:
+            step = select(parent.manager_id, ancestors.c.depth + 1).where(ancestors.c.depth < max_depth)
+        step = step.where(
+            parent.id == ancestors.c.user_id,
+            parent.manager_id.isnot(None)
+        )
+        if tenant_id is not None:
+            step = step.where(parent.tenant_id == tenant_id)
+
+        if max_depth is None:
+            return ancestors.union(step)
+        return ancestors.union_all(step)
+
+    @staticmethod
+    def _is_ancestor(
+        ancestor_id: int,
+        descendant_id: int,
+        tenant_id: Optional[int] = None,
+        max_depth: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether ancestor_id is a direct or indirect manager of descendant_id.
+
+        Args:
+            ancestor_id: Potential manager user ID
+            descendant_id: Potential report user ID
+            tenant_id: Optional tenant ID to scope the lookup
+            max_depth: Optional max number of levels between them (1 = direct manager)
+
+        Returns:
+            True if ancestor_id is above descendant_id in the hierarchy
+        """
+        if settings.team_hierarchy_use_closure_table:
+            conditions = [
+                PortalUserHierarchy.ancestor_id == ancestor_id,
+                PortalUserHierarchy.descendant_id == descendant_id,
+            ]
+            if tenant_id is not None:
+                conditions.append(PortalUserHierarchy.tenant_id == tenant_id)
+            if max_depth is not None:
+                conditions.append(PortalUserHierarchy.depth <= max_depth)
+            return bool(db.session.scalar(select(exists().where(*conditions))))
+
+        ancestors = TeamManagementService._ancestors_cte(descendant_id, tenant_id, max_depth)
+        return bool(db.session.scalar(
+            select(exists().where(ancestors.c.user_id == ancestor_id))
+        ))
+
+    @staticmethod
+    def _get_descendant_depths(manager_id: int, tenant_id: int) -> Dict[int, int]:
+        """
+        Get every direct and indirect report of a manager with its depth, in one query.
+
+        Depth is limited to settings.team_hierarchy_max_depth.
+
+        Args:
+            manager_id: ID of manager
+            tenant_id: Tenant ID for filtering
+
+        Returns:
+            Dictionary of user_id -> depth (1 = direct report)
+        """
+        max_depth = settings.team_hierarchy_max_depth
+
+        if settings.team_hierarchy_use_closure_table:
+            rows = db.session.execute(
+                select(PortalUserHierarchy.descendant_id, PortalUserHierarchy.depth).where(
+                    PortalUserHierarchy.ancestor_id == manager_id,
+                    PortalUserHierarchy.tenant_id == tenant_id,
+                    PortalUserHierarchy.depth <= max_depth
+                )
+            )
+            return {user_id: depth for user_id, depth in rows}
+
+        tree = select(
+            PortalUser.id.label('user_id'),
+            literal(1).label('depth')
+        ).where(
+            PortalUser.manager_id == manager_id,
+            PortalUser.tenant_id == tenant_id
+        ).cte('reports', recursive=True)
+
+        child = aliased(PortalUser)
+        tree = tree.union_all(
+            select(child.id, tree.c.depth + 1).where(
+                child.manager_id == tree.c.user_id,
+                child.tenant_id == tenant_id,
+                tree.c.depth < max_depth
+            )
+        )
+
+        rows = db.session.execute(select(tree.c.user_id, tree.c.depth))
+        depths = {}
+        for user_id, depth in rows:
+            depths.setdefault(user_id, depth)
+        return depths
+
+    @staticmethod
+    def sync_hierarchy_closure(user_id: int, new_manager_id: Optional[int], tenant_id: int) -> None:
+        """
+        Update the portal_user_hierarchy closure table after user_id's manager changes.
 
-        while current_id:
-            if current_id == user_id:
-                return True  # Found a cycle
+        Moves user_id's whole subtree: links from its old ancestors are removed and
+        links from new_manager_id and its ancestors are inserted. Does not commit;
+        call inside the transaction that changes manager_id.
+
+        Args:
+            user_id: ID of user whose manager changed (or who was just created)
+            new_manager_id: New manager ID, or None when the manager was removed
+            tenant_id: Tenant ID of the user
+        """
+        hierarchy = PortalUserHierarchy
+        subtree_ids = select(hierarchy.descendant_id).where(hierarchy.ancestor_id == user_id)
+
+        # Detach the subtree from its previous ancestors
+        db.session.execute(
+            delete(hierarchy).where(
+                or_(hierarchy.descendant_id == user_id, hierarchy.descendant_id.in_(subtree_ids)),
+                hierarchy.ancestor_id != user_id,
+                hierarchy.ancestor_id.notin_(subtree_ids)
+            ).execution_options(synchronize_session=False)
+        )
 
-            if current_id in visited:
-                # Infinite loop detected (existing cycle in data)
-                logger.warning(f"Existing cycle detected in manager hierarchy at user {current_id}")
-                return True
+        if new_manager_id is None:
+            return
+
+        # Attach it under the new manager: every (ancestor of manager) x (member of subtree)
+        manager_chain = union_all(
+            select(literal(new_manager_id).label('user_id'), literal(0).label('depth')),
+            select(hierarchy.ancestor_id, hierarchy.depth).where(hierarchy.descendant_id == new_manager_id)
+        ).subquery('manager_chain')
+        subtree = union_all(
+            select(literal(user_id).label('user_id'), literal(0).label('depth')),
+            select(hierarchy.descendant_id, hierarchy.depth).where(hierarchy.ancestor_id == user_id)
+        ).subquery('subtree')
+
+        db.session.execute(
+            insert(hierarchy).from_select(
+                ['ancestor_id', 'descendant_id', 'depth', 'tenant_id'],
+                select(
+                    manager_chain.c.user_id,
+                    subtree.c.user_id,
+                    manager_chain.c.depth + subtree.c.depth + 1,
+                    literal(tenant_id)
+                ).select_from(manager_chain.join(subtree, true()))
+            ).on_conflict_do_nothing()
+        )
 
-            visited.add(current_id)
+    @staticmethod
+    def rebuild_hierarchy_closure(tenant_id: Optional[int] = None) -> int:
+        """
+        Rebuild the portal_user_hierarchy closure table from manager_id.
 
-            # Get the manager's manager
-            manager = db.session.get(PortalUser, current_id)
-            if not manager:
-                break
+        Run once before enabling settings.team_hierarchy_use_closure_table, or to
+        repair drift after manual data changes.
 
-            current_id = manager.manager_id
+        Args:
+            tenant_id: Optional tenant ID to rebuild; all tenants if None
 
-        return False
+        Returns:
+            Number of closure rows inserted
+        """
+        clear = delete(PortalUserHierarchy)
+        if tenant_id is not None:
+            clear = clear.where(PortalUserHierarchy.tenant_id == tenant_id)
+        db.session.execute(clear)
+
+        base = select(
+            PortalUser.manager_id.label('ancestor_id'),
+            PortalUser.id.label('descendant_id'),
+            literal(1).label('depth'),
+            PortalUser.tenant_id.label('tenant_id')
+        ).where(PortalUser.manager_id.isnot(None))
+        if tenant_id is not None:
+            base = base.where(PortalUser.tenant_id == tenant_id)
+        tree = base.cte('closure', recursive=True)
+
+        child = aliased(PortalUser)
+        tree = tree.union_all(
+            select(tree.c.ancestor_id, child.id, tree.c.depth + 1, tree.c.tenant_id).where(
+                child.manager_id == tree.c.descendant_id,
+                tree.c.depth < CLOSURE_REBUILD_MAX_DEPTH
+            )
+        )
+
+        result = db.session.execute(
+            insert(PortalUserHierarchy).from_select(
+                ['ancestor_id', 'descendant_id', 'depth', 'tenant_id'],
+                select(tree.c.ancestor_id, tree.c.descendant_id, tree.c.depth, tree.c.tenant_id)
+            ).on_conflict_do_nothing()
+        )
+        db.session.commit()
+
+        logger.info(f"Rebuilt team hierarchy closure (tenant={tenant_id}): {result.rowcount} rows")
+        return result.rowcount
 
     @staticmethod
     def remove_manager_assignment(
@@ -286,6 +504,7 @@ class TeamManagementService:
 
         # Remove manager
         user.manager_id = None
+        TeamManagementService.sync_hierarchy_closure(user_id, None, user.tenant_id)
         db.session.commit()
 
         # Log audit
@@ -356,40 +575,57 @@ class TeamManagementService:
         return team_members
 
     @staticmethod
-    def _get_all_descendants(manager_id: int, tenant_id: int, level: int = 0) -> List[Dict]:
+    def _get_all_descendants(manager_id: int, tenant_id: int) -> List[Dict]:
         """
-        Recursively get all descendants (direct and indirect reports) of a manager.
+        Get all descendants (direct and indirect reports) of a manager.
+
+        The subtree is resolved with one recursive query (or one closure-table
+        lookup) and the users are loaded with a second query, then emitted in
+        depth-first order.
 
         Args:
             manager_id: ID of manager
             tenant_id: Tenant ID for filtering
-            level: Current recursion level (for hierarchy tracking)
 
         Returns:
             List of user dictionaries with hierarchy level
         """
-        max_depth = settings.team_hierarchy_max_depth
-        if level > max_depth:  # Prevent infinite recursion
-            logger.warning(f"Maximum recursion depth ({max_depth}) reached for manager {manager_id}")
+        depths = TeamManagementService._get_descendant_depths(manager_id, tenant_id)
+        if not depths:
             return []
 
-        # Get direct reports
-        query = select(PortalUser).where(
-            PortalUser.manager_id == manager_id,
-            PortalUser.tenant_id == tenant_id
+        users = db.session.scalars(
+            select(PortalUser)
+            .options(selectinload(PortalUser.roles))
+            .where(PortalUser.id.in_(list(depths.keys())))
+            .order_by(PortalUser.id)
         )
-        direct_reports = list(db.session.scalars(query))
+
+        # A cycle through manager_id (M -> A -> B -> M) returns M as its own
+        # descendant; leave it out and only follow edges one level deeper
+        children: Dict[int, List[PortalUser]] = {}
+        for user in users:
+            if user.id != manager_id:
+                children.setdefault(user.manager_id, []).append(user)
+
+        def reports_of(parent_id: int, parent_depth: int) -> List[PortalUser]:
+            return [
+                user for user in children.get(parent_id, [])
+                if depths[user.id] == parent_depth + 1
+            ]
 
         result = []
-        for user in direct_reports:
+        seen = set()
+        stack = list(reversed(reports_of(manager_id, 0)))
+        while stack:
+            user = stack.pop()
+            if user.id in seen:
+                continue
+            seen.add(user.id)
             user_dict = user.to_dict(include_roles=True, include_team=False)
-            user_dict['hierarchy_level'] = level + 1
-
+            user_dict['hierarchy_level'] = depths[user.id]
             result.append(user_dict)
-
-            # Recursively get this user's team members
-            descendants = TeamManagementService._get_all_descendants(user.id, tenant_id, level + 1)
-            result.extend(descendants)
+            stack.extend(reversed(reports_of(user.id, depths[user.id])))
 
         return result
 
@@ -409,7 +645,7 @@ class TeamManagementService:
             ValueError: If tenant not found
         """
         # Get all users in the tenant
-        query = select(PortalUser).where(
+        query = select(PortalUser).options(selectinload(PortalUser.roles)).where(
             PortalUser.tenant_id == tenant_id,
             PortalUser.is_active == True
         ).order_by(PortalUser.first_name, PortalUser.last_name)
@@ -569,7 +805,7 @@ class TeamManagementService:
                 'has_team_members': bool  # True if user has direct reports
             }
         """
-        from app.models import Candidate, CandidateAssignment, Role
+        from app.models import Candidate
         from sqlalchemy import func, distinct
         
         # Get current user to check their role
@@ -681,7 +917,7 @@ class TeamManagementService:
                 Candidate.recruiter_id == member_id,
                 Candidate.is_visible_to_all_team == True  # Include broadcast candidates
             )
-        ).order_by(Candidate.created_at.desc())
+        ).options(Candidate.with_description()).order_by(Candidate.created_at.desc())
         
         candidates = list(db.session.scalars(candidates_query))
         
@@ -710,23 +946,7 @@ class TeamManagementService:
         if manager and any(role.name == 'TENANT_ADMIN' for role in manager.roles):
             return True
         
-        # Walk up the subordinate's management chain
-        current_user = db.session.get(PortalUser, subordinate_id)
-        if not current_user or current_user.tenant_id != tenant_id:
-            return False
-        
-        # Check up to max_depth levels (prevent infinite loops)
-        max_depth = settings.team_hierarchy_max_depth
-        for _ in range(max_depth):
-            if not current_user.manager_id:
-                break
-            
-            if current_user.manager_id == manager_id:
-                return True
-            
-            # Move up one level
-            current_user = db.session.get(PortalUser, current_user.manager_id)
-            if not current_user or current_user.tenant_id != tenant_id:
-                break
-        
-        return False
+        # Managers see reports up to team_hierarchy_max_depth levels down
+        return TeamManagementService._is_ancestor(
+            manager_id, subordinate_id, tenant_id, max_depth=settings.team_hierarchy_max_depth
+        )
@@ -34,6 +34,7 @@ from app.schemas.tenant_schema import (
     TenantDeleteResponseSchema,
 )
 from app.services import AuditLogService
+from app.services.email_service import EmailService
 
 logger = logging.getLogger(__name__)
 
@@ -423,6 +424,9 @@ class TenantService:
         if changes:
             db.session.commit()
 
+            if "settings" in changes:
+                EmailService.invalidate_smtp_config_cache(tenant_id)
+
             # Log audit
             AuditLogService.log_action(
                 action="UPDATE",
@@ -687,6 +691,7 @@ class TenantService:
         db.session.delete(tenant)
         db.session.commit()
         db.session.expire_all()
+        EmailService.invalidate_smtp_config_cache(tenant_id)
 
         logger.warning(
             f"Tenant deleted: {tenant_id} ({slug}) with {users_count} users by {changed_by}. "
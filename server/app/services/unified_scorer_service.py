@@ -21,7 +21,6 @@ import logging
 from typing import Dict, List, Optional, Tuple, Any
 from decimal import Decimal
 from datetime import datetime
-from difflib import SequenceMatcher
 from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage, SystemMessage
 import numpy as np
@@ -30,6 +29,7 @@ from app import db
 from app.models.candidate import Candidate
 from app.models.job_posting import JobPosting
 from app.models.candidate_job_match import CandidateJobMatch
+from app.utils.skill_vocabulary import SKILL_SYNONYMS, SkillVocabulary
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -113,216 +113,8 @@ class UnifiedScorerService:
     # Fuzzy match threshold (0-1, higher = stricter)
     FUZZY_MATCH_THRESHOLD = 0.85
     
-    # ===========================================
-    # Merged Skill Synonyms Dictionary
-    # Combined from JobMatchingService (200+) and ResumeScorerService (~20)
-    # ===========================================
-    SKILL_SYNONYMS = {
-        # ===================
-        # CLOUD PLATFORMS
-        # ===================
-        'aws': [
-            'amazon web services', 'amazon aws', 'ec2', 's3', 'lambda', 
-            'cloudwatch', 'aws lambda', 'rds', 'cloudfront', 'route53'
-        ],
-        'gcp': [
-            'google cloud', 'google cloud platform', 'gce', 'bigquery', 
-            'google compute engine', 'cloud run', 'cloud functions'
-        ],
-        'azure': [
-            'microsoft azure', 'azure cloud', 'azure devops', 'azure functions',
-            'azure blob', 'azure sql'
-        ],
-        
-        # ===================
-        # PROGRAMMING LANGUAGES
-        # ===================
-        'javascript': ['js', 'es6', 'es2015', 'ecmascript', 'es5', 'es7', 'es2020'],
-        'typescript': ['ts', 'typescript language'],
-        'python': ['py', 'python3', 'python2', 'cpython', 'python language'],
-        'golang': ['go', 'go lang', 'go-lang', 'google go'],
-        'c++': ['cpp', 'cplusplus', 'c plus plus', 'c++11', 'c++17', 'c++20'],
-        'c#': ['csharp', 'c sharp', 'c-sharp'],
-        '.net': ['dotnet', 'dot net', '.net core', 'dotnet core', '.net framework'],
-        'java': ['java8', 'java11', 'java17', 'jdk', 'jvm'],
-        'ruby': ['rb', 'ruby language'],
-        'rust': ['rustlang', 'rust language'],
-        'scala': ['scala lang', 'scala language'],
-        'kotlin': ['kt', 'kotlin language'],
-        'swift': ['swift lang', 'swiftui', 'swift ui'],
-        'objective-c': ['objc', 'objective c', 'obj-c'],
-        'php': ['php7', 'php8', 'php language'],
-        'perl': ['perl5', 'perl6', 'raku'],
-        'r': ['r language', 'r programming', 'rstats'],
-        'matlab': ['mat lab'],
-        'julia': ['julia lang'],
-        
-        # ===================
-        # FRONTEND FRAMEWORKS
-        # ===================
-        'react': ['reactjs', 'react.js', 'react native', 'react-native', 'react hooks'],
-        'vue': ['vuejs', 'vue.js', 'vue3', 'nuxt', 'nuxtjs', 'vue 3'],
-        'angular': ['angularjs', 'angular.js', 'angular2', 'angular 2', 'angular 14'],
-        'svelte': ['sveltejs', 'sveltekit', 'svelte kit'],
-        'next.js': ['nextjs', 'next', 'next js'],
-        'gatsby': ['gatsbyjs', 'gatsby js'],
-        'ember': ['emberjs', 'ember.js'],
-        'backbone': ['backbonejs', 'backbone.js'],
-        'jquery': ['jq', 'j query'],
-        'redux': ['redux toolkit', 'rtk'],
-        'mobx': ['mob x'],
-        
-        # ===================
-        # BACKEND FRAMEWORKS
-        # ===================
-        'node': ['nodejs', 'node.js', 'node js'],
-        'express': ['expressjs', 'express.js', 'express js'],
-        'django': ['django rest framework', 'drf', 'django-rest', 'django rest'],
-        'flask': ['flask api', 'flask python'],
-        'fastapi': ['fast api', 'fast-api', 'fast api python'],
-        'rails': ['ruby on rails', 'ror', 'ruby rails', 'ruby on rails'],
-        'spring': ['spring boot', 'springboot', 'spring framework', 'spring mvc'],
-        'laravel': ['laravel php'],
-        'asp.net': ['asp net', 'aspnet', 'asp.net core', 'asp.net mvc'],
-        'nestjs': ['nest.js', 'nest', 'nest js'],
-        'koa': ['koajs', 'koa.js'],
-        'hapi': ['hapijs', 'hapi.js'],
-        'gin': ['gin-gonic', 'gin golang'],
-        'fiber': ['gofiber', 'fiber golang'],
-        'echo': ['echo golang'],
-        
-        # ===================
-        # DATABASES
-        # ===================
-        'postgresql': ['postgres', 'pg', 'psql', 'pgsql', 'postgre'],
-        'mysql': ['mariadb', 'maria db', 'mysql server'],
-        'mongodb': ['mongo', 'mongo db', 'mongoose'],
-        'redis': ['redis cache', 'redis db', 'in-memory cache'],
-        'elasticsearch': ['elastic search', 'elastic', 'es', 'opensearch'],
-        'cassandra': ['apache cassandra'],
-        'dynamodb': ['dynamo db', 'amazon dynamodb', 'aws dynamodb'],
-        'oracle': ['oracle db', 'oracle database', 'plsql', 'pl/sql'],
-        'sql server': ['mssql', 'ms sql', 'microsoft sql', 'tsql', 't-sql'],
-        'sqlite': ['sqlite3'],
-        'couchdb': ['couch db', 'apache couchdb'],
-        'neo4j': ['neo 4j', 'graph database'],
-        'firestore': ['firebase firestore', 'cloud firestore'],
-        
-        # ===================
-        # DEVOPS & INFRASTRUCTURE
-        # ===================
-        'kubernetes': ['k8s', 'kube', 'kubectl', 'k8', 'kubernetes cluster'],
-        'docker': ['docker compose', 'docker-compose', 'containerization', 'containers', 'dockerfile'],
-        'terraform': ['tf', 'infrastructure as code', 'iac', 'hcl', 'terraform cloud'],
-        'ansible': ['ansible playbook', 'ansible automation'],
-        'puppet': ['puppet enterprise'],
-        'chef': ['chef infra'],
-        'jenkins': ['jenkins ci', 'jenkinsfile', 'jenkins pipeline'],
-        'gitlab ci': ['gitlab-ci', 'gitlab ci/cd', 'gitlab cicd'],
-        'github actions': ['gh actions', 'github action'],
-        'circle ci': ['circleci', 'circle-ci'],
-        'travis ci': ['travis-ci', 'travisci'],
-        'ci/cd': ['cicd', 'continuous integration', 'continuous delivery', 'continuous deployment'],
-        'nginx': ['nginx server', 'nginx proxy'],
-        'apache': ['apache server', 'httpd', 'apache httpd'],
-        'linux': ['unix', 'ubuntu', 'centos', 'debian', 'rhel', 'fedora'],
-        'bash': ['shell', 'shell script', 'sh', 'zsh', 'shell scripting'],
-        'prometheus': ['prometheus monitoring'],
-        'grafana': ['grafana dashboard'],
-        'datadog': ['data dog', 'datadog monitoring'],
-        'new relic': ['newrelic'],
-        'splunk': ['splunk logging'],
-        'elk': ['elk stack', 'elasticsearch logstash kibana'],
-        
-        # ===================
-        # MESSAGE QUEUES
-        # ===================
-        'kafka': ['apache kafka', 'kafka streaming'],
-        'rabbitmq': ['rabbit mq', 'amqp', 'rabbit'],
-        'sqs': ['amazon sqs', 'aws sqs', 'simple queue service'],
-        'pubsub': ['google pubsub', 'gcp pubsub', 'pub/sub', 'pub sub'],
-        'celery': ['celery task queue'],
-        
-        # ===================
-        # DATA & ML
-        # ===================
-        'machine learning': ['ml', 'ml engineer', 'ml engineering'],
-        'artificial intelligence': ['ai', 'ai engineer'],
-        'deep learning': ['dl', 'neural networks', 'nn'],
-        'natural language processing': ['nlp', 'text processing'],
-        'computer vision': ['cv', 'image processing'],
-        'tensorflow': ['tf', 'tf2', 'tensorflow 2'],
-        'pytorch': ['torch', 'py torch'],
-        'scikit-learn': ['sklearn', 'scikit learn', 'sk-learn'],
-        'pandas': ['pd', 'pandas python'],
-        'numpy': ['np', 'numpy python'],
-        'spark': ['apache spark', 'pyspark', 'spark sql'],
-        'hadoop': ['apache hadoop', 'hdfs', 'mapreduce'],
-        'data science': ['data analysis', 'analytics', 'data analytics'],
-        'llm': ['large language model', 'large language models', 'gpt', 'chatgpt'],
-        'langchain': ['lang chain'],
-        
-        # ===================
-        # API & PROTOCOLS
-        # ===================
-        'rest api': ['restful', 'rest', 'restful api', 'rest apis'],
-        'graphql': ['graph ql', 'gql'],
-        'grpc': ['g rpc', 'google rpc'],
-        'websocket': ['websockets', 'ws', 'socket.io'],
-        'oauth': ['oauth2', 'oauth 2.0', 'oauth2.0'],
-        'jwt': ['json web token', 'json web tokens'],
-        'openapi': ['swagger', 'openapi spec'],
-        
-        # ===================
-        # TESTING
-        # ===================
-        'unit testing': ['unit tests', 'unit test'],
-        'jest': ['jestjs', 'jest testing'],
-        'pytest': ['py.test', 'pytest testing'],
-        'mocha': ['mochajs', 'mocha testing'],
-        'cypress': ['cypress.io', 'cypress testing'],
-        'selenium': ['selenium webdriver', 'selenium testing'],
-        'playwright': ['playwright testing'],
-        'testing library': ['react testing library', 'rtl'],
-        'tdd': ['test driven development'],
-        'bdd': ['behavior driven development'],
-        
-        # ===================
-        # VERSION CONTROL
-        # ===================
-        'git': ['github', 'gitlab', 'bitbucket', 'version control'],
-        
-        # ===================
-        # AGILE & PROJECT
-        # ===================
-        'agile': ['scrum', 'kanban', 'agile methodology', 'agile development'],
-        'jira': ['atlassian jira'],
-        'confluence': ['atlassian confluence'],
-        
-        # ===================
-        # FRONTEND TOOLS
-        # ===================
-        'html': ['html5', 'html 5'],
-        'css': ['css3', 'scss', 'sass', 'less', 'css 3'],
-        'tailwind': ['tailwindcss', 'tailwind css'],
-        'bootstrap': ['bootstrap css', 'bootstrap 5', 'bootstrap 4'],
-        'webpack': ['webpackjs', 'webpack bundler'],
-        'vite': ['vitejs', 'vite bundler'],
-        'babel': ['babeljs', 'babel transpiler'],
-        'eslint': ['es lint'],
-        'prettier': ['code formatter'],
-        'storybook': ['storybook js'],
-        
-        # ===================
-        # MOBILE
-        # ===================
-        'react native': ['react-native', 'rn', 'react native mobile'],
-        'flutter': ['flutter dart', 'flutter mobile'],
-        'ionic': ['ionic framework'],
-        'xamarin': ['xamarin forms'],
-        'android': ['android sdk', 'android development'],
-        'ios': ['ios sdk', 'ios development', 'swift ios'],
-    }
+    # Merged skill synonyms (shared vocabulary, see app/utils/skill_vocabulary.py)
+    SKILL_SYNONYMS = SKILL_SYNONYMS
     
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -341,13 +133,6 @@ class UnifiedScorerService:
         self._embedding_service = None
         self._model = None
         
-        # Pre-build reverse synonym lookup for O(1) skill matching
-        self._reverse_synonym_map: Dict[str, str] = {}
-        for base_skill, synonyms in self.SKILL_SYNONYMS.items():
-            self._reverse_synonym_map[base_skill] = base_skill
-            for syn in synonyms:
-                self._reverse_synonym_map[syn] = base_skill
-        
         logger.info("UnifiedScorerService initialized (lazy-init for AI services)")
     
     @property
@@ -410,7 +195,11 @@ class UnifiedScorerService:
             job_skills = list(job_posting.skills) if job_posting.skills else []
             
             # 1. Calculate skill match (45%)
-            skill_result = self.calculate_skill_score(candidate_skills, job_skills)
+            skill_result = self.calculate_skill_score(
+                candidate_skills,
+                job_skills,
+                candidate_skill_ids=list(candidate.skill_ids) if candidate.skill_ids is not None else None
+            )
             
             # 2. Calculate experience match (20%)
             experience_score = self.calculate_experience_score(
@@ -599,19 +388,21 @@ class UnifiedScorerService:
     def calculate_skill_score(
         self,
         candidate_skills: List[str],
-        job_skills: List[str]
+        job_skills: List[str],
+        candidate_skill_ids: Optional[List[int]] = None
     ) -> SkillMatchResult:
         """
         Calculate skill match score (40% weight).
         
         Uses three matching strategies:
         1. Exact match (case-insensitive)
-        2. Synonym match (using SKILL_SYNONYMS dictionary)
+        2. Synonym match (same skill id in the shared skill vocabulary)
         3. Fuzzy match (85% similarity threshold)
         
         Args:
             candidate_skills: List of candidate's skills
             job_skills: List of required job skills
+            candidate_skill_ids: Candidate's stored skill ids (computed if not provided)
             
         Returns:
             SkillMatchResult with score, matched/missing skills
@@ -626,48 +417,13 @@ class UnifiedScorerService:
         candidate_skills_normalized = [str(s).lower().strip() for s in candidate_skills if s]
         job_skills_normalized = [str(s).lower().strip() for s in job_skills if s]
         
-        matched_skills = []
-        missing_skills = []
-        match_details = {}
-        
-        # Build set of candidate base skills using reverse synonym map for O(1) lookup
-        candidate_base_skills = set()
-        for cs in candidate_skills_normalized:
-            base = self._reverse_synonym_map.get(cs)
-            if base:
-                candidate_base_skills.add(base)
-            candidate_base_skills.add(cs)  # Always add the raw skill too
-        
-        for job_skill in job_skills_normalized:
-            is_matched = False
-            
-            # Strategy 1: Exact match
-            if job_skill in candidate_skills_normalized:
-                matched_skills.append(job_skill)
-                match_details[job_skill] = 'exact'
-                is_matched = True
-                continue
-            
-            # Strategy 2: Synonym match via reverse lookup (O(1) instead of O(N))
-            if not is_matched:
-                job_base = self._reverse_synonym_map.get(job_skill)
-                if job_base and job_base in candidate_base_skills:
-                    matched_skills.append(job_skill)
-                    match_details[job_skill] = 'synonym'
-                    is_matched = True
-            
-            # Strategy 3: Fuzzy match
-            if not is_matched:
-                for candidate_skill in candidate_skills_normalized:
-                    similarity = SequenceMatcher(None, job_skill, candidate_skill).ratio()
-                    if similarity >= self.FUZZY_MATCH_THRESHOLD:
-                        matched_skills.append(job_skill)
-                        match_details[job_skill] = 'fuzzy'
-                        is_matched = True
-                        break
-            
-            if not is_matched:
-                missing_skills.append(job_skill)
+        # Exact / synonym (skill id) / fuzzy matching over the shared vocabulary
+        matched_skills, missing_skills, match_details = SkillVocabulary.match_skills(
+            candidate_skills_normalized,
+            job_skills_normalized,
+            candidate_skill_ids=candidate_skill_ids,
+            fuzzy_threshold=self.FUZZY_MATCH_THRESHOLD
+        )
         
         # Calculate score
         score = (len(matched_skills) / len(job_skills_normalized)) * 100 if job_skills_normalized else 100
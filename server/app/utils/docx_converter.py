@@ -2,12 +2,15 @@
 DOCX to PDF Converter Utility
 Converts DOCX files to PDF for better text extraction accuracy
 """
+import hashlib
 import logging
 import os
 import platform
+import shutil
 import tempfile
 from typing import Optional
 
+from app.utils.libreoffice_pool import get_pool
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -21,8 +24,13 @@ class DocxToPdfConverter:
     
     Strategy:
     1. On Windows: Use docx2pdf (relies on Microsoft Word COM API)
-    2. On Linux/Mac: Use LibreOffice (requires installation)
+    2. On Linux/Mac: Use LibreOffice (requires installation); warm pooled
+       instances when the Python-UNO bridge is available, else one soffice
+       process per conversion
     3. Fallback: Use python-docx + reportlab (pure Python, lower quality)
+    
+    Converted PDFs are cached by DOCX content hash, so identical files are
+    converted once.
     """
     
     @staticmethod
@@ -82,6 +90,13 @@ class DocxToPdfConverter:
         logger.info(f"Converting DOCX to PDF: {docx_path} -> {output_path}")
         
         try:
+            digest = DocxToPdfConverter._content_hash(docx_path)
+            if DocxToPdfConverter._copy_from_cache(digest, output_path):
+                logger.info(f"DOCX conversion served from cache: {output_path}")
+                if cleanup_source and os.path.exists(docx_path):
+                    os.remove(docx_path)
+                return output_path
+            
             if SYSTEM_PLATFORM == "Windows":
                 pdf_path = DocxToPdfConverter._convert_with_docx2pdf(docx_path, output_path)
             elif SYSTEM_PLATFORM in ["Linux", "Darwin"]:
@@ -93,6 +108,7 @@ class DocxToPdfConverter:
                 raise RuntimeError(f"Conversion completed but output file not found: {pdf_path}")
             
             logger.info(f"DOCX converted successfully: {pdf_path}")
+            DocxToPdfConverter._store_in_cache(digest, pdf_path)
             
             # Cleanup source file if requested
             if cleanup_source and os.path.exists(docx_path):
@@ -105,6 +121,68 @@ class DocxToPdfConverter:
             logger.error(f"DOCX to PDF conversion failed: {e}")
             raise RuntimeError(f"Failed to convert DOCX to PDF: {str(e)}") from e
     
+    @staticmethod
+    def _cache_dir() -> Optional[str]:
+        """Directory of cached PDFs, or None when caching is disabled."""
+        if settings.docx_pdf_cache_max_entries <= 0:
+            return None
+        cache_dir = settings.docx_pdf_cache_dir or os.path.join(tempfile.gettempdir(), 'docx_pdf_cache')
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+    
+    @staticmethod
+    def _content_hash(docx_path: str) -> str:
+        """SHA-256 of the DOCX bytes."""
+        digest = hashlib.sha256()
+        with open(docx_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _copy_from_cache(digest: str, output_path: str) -> bool:
+        """
+        Copy a cached PDF for this content hash to output_path.
+        
+        Returns:
+            True on a cache hit
+        """
+        cache_dir = DocxToPdfConverter._cache_dir()
+        if not cache_dir:
+            return False
+        cached_path = os.path.join(cache_dir, f"{digest}.pdf")
+        try:
+            shutil.copyfile(cached_path, output_path)
+            os.utime(cached_path)  # Recently used entries survive pruning
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to read cached PDF {cached_path}: {e}")
+            return False
+    
+    @staticmethod
+    def _store_in_cache(digest: str, pdf_path: str) -> None:
+        """Cache a converted PDF under its DOCX content hash, pruning least recently used entries."""
+        cache_dir = DocxToPdfConverter._cache_dir()
+        if not cache_dir:
+            return
+        try:
+            # Write to a private temp file, then rename: readers never see partial PDFs
+            temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+            os.close(temp_fd)
+            shutil.copyfile(pdf_path, temp_path)
+            os.replace(temp_path, os.path.join(cache_dir, f"{digest}.pdf"))
+            
+            entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith('.pdf')]
+            excess = len(entries) - settings.docx_pdf_cache_max_entries
+            if excess > 0:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:excess]:
+                    os.remove(entry.path)
+        except OSError as e:
+            logger.warning(f"Failed to cache converted PDF: {e}")
+    
     @staticmethod
     def _convert_with_docx2pdf(docx_path: str, output_path: str) -> str:
         """
@@ -128,14 +206,20 @@ class DocxToPdfConverter:
     @staticmethod
     def _convert_with_libreoffice(docx_path: str, output_path: str) -> str:
         """
-        Convert using LibreOffice command-line (Linux/Mac)
+        Convert using LibreOffice (Linux/Mac)
+        
+        Uses the warm instance pool when available (see libreoffice_pool),
+        otherwise the LibreOffice command line.
         
         Requires LibreOffice to be installed:
         - Ubuntu/Debian: sudo apt-get install libreoffice
         - Mac: brew install libreoffice
         """
         import subprocess
-        import shutil
+        
+        pool = get_pool()
+        if pool is not None:
+            return pool.convert(docx_path, output_path)
         
         # Find LibreOffice binary
         libreoffice_bin = shutil.which('libreoffice') or shutil.which('soffice')
@@ -170,7 +254,7 @@ class DocxToPdfConverter:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=60  # 60 second timeout
+                timeout=settings.docx_pdf_conversion_timeout
             )
             
             if result.returncode != 0:
@@ -192,7 +276,7 @@ class DocxToPdfConverter:
             return output_path
         
         except subprocess.TimeoutExpired:
-            raise RuntimeError("LibreOffice conversion timed out after 60 seconds")
+            raise RuntimeError(f"LibreOffice conversion timed out after {settings.docx_pdf_conversion_timeout} seconds")
         except Exception as e:
             raise RuntimeError(f"LibreOffice conversion failed: {str(e)}") from e
     
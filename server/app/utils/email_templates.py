@@ -0,0 +1,53 @@
+"""Shared Jinja environment for transactional email templates."""
+
+import os
+from functools import lru_cache
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+
+EMAIL_TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "templates",
+    "email",
+)
+
+
+@lru_cache(maxsize=1)
+def get_email_template_env() -> Environment:
+    """Get the process-wide Jinja environment for email templates.
+
+    Templates are compiled on first use and kept in the environment's cache.
+    ``auto_reload`` is disabled so rendering never stats the template files.
+
+    Returns:
+        Shared Jinja environment
+    """
+    return Environment(
+        loader=FileSystemLoader(EMAIL_TEMPLATE_DIR),
+        autoescape=select_autoescape(enabled_extensions=("html",), default_for_string=False),
+        undefined=StrictUndefined,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+def render_email_template(template_name: str, **context) -> str:
+    """Render an email template with the shared environment.
+
+    Args:
+        template_name: Template file name relative to ``app/templates/email``
+        **context: Template variables
+
+    Returns:
+        Rendered template string
+    """
+    return get_email_template_env().get_template(template_name).render(**context)
+
+
+def preload_email_templates() -> None:
+    """Compile every email template up front (e.g. at worker start)."""
+    env = get_email_template_env()
+    for template_name in env.list_templates(extensions=("html", "txt")):
+        env.get_template(template_name)
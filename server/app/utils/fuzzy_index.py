@@ -0,0 +1,162 @@
+"""
+Fuzzy Index
+Character n-gram index for thresholded SequenceMatcher lookups.
+
+Finds the strings whose `SequenceMatcher(None, query, item).ratio()` is at or
+above a threshold without comparing the query against every item. Candidates
+are pruned with bounds that can never reject a true match, so results are
+identical to the pairwise scan:
+
+- Length:   ratio <= 2 * min(len_a, len_b) / (len_a + len_b)
+- Chars:    matched chars M <= multiset character overlap (difflib's quick_ratio)
+- N-grams:  matching blocks of total length M in k blocks share at least
+            M - (n - 1) * k n-grams, and k <= len_a + len_b - 2M + 1 because
+            consecutive blocks are separated by at least one unmatched char
+
+Only survivors are scored with SequenceMatcher, through an LRU memo of
+(a, b) -> ratio shared by all indexes.
+"""
+import math
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+@lru_cache(maxsize=131072)
+def sequence_ratio(a: str, b: str) -> float:
+    """Memoized SequenceMatcher(None, a, b).ratio()."""
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _ngrams(text: str, n: int) -> Counter:
+    """Multiset of the character n-grams in text (no padding)."""
+    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def _min_matches(total_length: int, threshold: float) -> int:
+    """Smallest matched-char count M with 2.0 * M / total_length >= threshold."""
+    matches = max(0, math.ceil(threshold * total_length / 2))
+    while matches > 0 and 2.0 * (matches - 1) / total_length >= threshold:
+        matches -= 1
+    while 2.0 * matches / total_length < threshold:
+        matches += 1
+    return matches
+
+
+class NGramIndex:
+    """Index over a fixed, ordered list of strings for thresholded fuzzy lookups."""
+
+    def __init__(self, items: Sequence[str], n: int = 2):
+        """
+        Build the index.
+
+        Args:
+            items: Strings to index; lookups report matches in this order
+            n: N-gram size. Bigrams give the tightest lossless bound at the
+                0.75-0.85 thresholds used for skills
+        """
+        self.items = list(items)
+        self.n = n
+        self._char_counts = [Counter(item) for item in self.items]
+        self._gram_counts = [_ngrams(item, n) for item in self.items]
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+        for idx, grams in enumerate(self._gram_counts):
+            for gram in grams:
+                self._postings[gram].append(idx)
+            self._by_length[len(self.items[idx])].append(idx)
+
+    def _required_shared_ngrams(self, total_length: int, threshold: float) -> int:
+        """Lower bound on shared n-grams for any pair of this total length that reaches threshold."""
+        matches = _min_matches(total_length, threshold)
+        if matches == 0:
+            return 0
+        max_blocks = min(matches, total_length - 2 * matches + 1)
+        return matches - (self.n - 1) * max_blocks
+
+    def _shortlist(self, query: str, threshold: float) -> List[int]:
+        """Indices (in item order) of items that may reach threshold against query."""
+        query_length = len(query)
+        if query_length == 0:
+            # ratio('', '') is 1.0; an empty query scores 0.0 against anything else
+            return list(self._by_length.get(0, []))
+        lengths = [
+            length for length in self._by_length
+            if 2.0 * min(query_length, length) / (query_length + length) >= threshold
+        ]
+        if not lengths:
+            return []
+
+        query_grams = _ngrams(query, self.n)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram, query_count in query_grams.items():
+            for idx in self._postings.get(gram, ()):
+                shared[idx] += min(query_count, self._gram_counts[idx][gram])
+
+        required_by_length = {
+            length: self._required_shared_ngrams(query_length + length, threshold) for length in lengths
+        }
+        if all(required > 0 for required in required_by_length.values()):
+            # Every viable item shares at least one n-gram: walk postings only
+            pool: Iterable[int] = sorted(shared)
+        else:
+            pool = sorted(idx for length in lengths for idx in self._by_length[length])
+
+        query_chars = Counter(query)
+        shortlist = []
+        for idx in pool:
+            length = len(self.items[idx])
+            required = required_by_length.get(length)
+            if required is None or shared.get(idx, 0) < required:
+                continue
+            total_length = query_length + length
+            char_overlap = sum((query_chars & self._char_counts[idx]).values())
+            if 2.0 * char_overlap / total_length < threshold:
+                continue
+            shortlist.append(idx)
+        return shortlist
+
+    def first_match(
+        self,
+        query: str,
+        threshold: float,
+        exclude: Optional[Iterable[str]] = None
+    ) -> Optional[int]:
+        """
+        Find the first item (in item order) whose ratio against query reaches threshold.
+
+        Args:
+            query: String compared as SequenceMatcher(None, query, item)
+            threshold: Minimum ratio
+            exclude: Items to skip
+
+        Returns:
+            Index of the matching item, or None
+        """
+        excluded = set(exclude) if exclude else ()
+        for idx in self._shortlist(query, threshold):
+            item = self.items[idx]
+            if item in excluded:
+                continue
+            if sequence_ratio(query, item) >= threshold:
+                return idx
+        return None
+
+    def matches(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Find every item whose ratio against query reaches threshold.
+
+        Args:
+            query: String compared as SequenceMatcher(None, query, item)
+            threshold: Minimum ratio
+
+        Returns:
+            List of (index, ratio) in item order
+        """
+        results = []
+        for idx in self._shortlist(query, threshold):
+            ratio = sequence_ratio(query, self.items[idx])
+            if ratio >= threshold:
+                results.append((idx, ratio))
+        return results
@@ -0,0 +1,115 @@
+"""
+HTML to Text
+Convert an HTML email body to readable plain text in one streaming parse.
+
+Compared with stripping tags by regex:
+
+- Entities are decoded (&amp;, &nbsp;, &#8217; ...)
+- <script>, <style>, <head> and other non-content elements are dropped with
+  their contents, as are HTML comments and conditional comments
+- Block elements (p, div, tr, li, br, headings) become line breaks and list
+  items get a "- " prefix, so requirement lists stay one item per line
+- Runs of whitespace inside a line are collapsed and blank lines squeezed
+- Output stops growing once max_chars is reached, so very large newsletters
+  are not fully materialised
+"""
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+# Elements whose contents are never shown
+_SKIPPED_TAGS = {"script", "style", "head", "title", "noscript", "template", "svg"}
+
+# Elements that start and end on their own line
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+    "section", "table", "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+
+# Block elements followed by a blank line
+_PARAGRAPH_TAGS = {"blockquote", "h1", "h2", "h3", "h4", "h5", "h6", "ol", "p", "table", "ul"}
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\r\f\v\u00a0]+")
+
+
+class _TextExtractor(HTMLParser):
+    """HTMLParser that collects visible text with line structure."""
+
+    def __init__(self, max_chars: Optional[int]):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.lines: List[str] = []
+        self._current: List[str] = []
+        self._length = 0
+        self._skip_depth = 0
+
+    @property
+    def full(self) -> bool:
+        return self.max_chars is not None and self._length >= self.max_chars
+
+    def _break_line(self, blank: bool = False) -> None:
+        line = _INLINE_WHITESPACE.sub(" ", "".join(self._current)).strip()
+        self._current = []
+        if line and line != "-":
+            self.lines.append(line)
+            self._length += len(line) + 1
+        if blank and self.lines and self.lines[-1] != "":
+            # One blank line between paragraphs at most
+            self.lines.append("")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "br":
+            self._break_line()
+        elif tag in _BLOCK_TAGS:
+            self._break_line()
+            if tag == "li":
+                self._current.append("- ")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br" or tag in _BLOCK_TAGS:
+            self._break_line()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._break_line(blank=tag in _PARAGRAPH_TAGS)
+
+    def handle_data(self, data):
+        if not self._skip_depth and not self.full:
+            self._current.append(data.replace("\n", " "))
+
+    def text(self) -> str:
+        self._break_line()
+        return "\n".join(self.lines).strip()
+
+
+def html_to_text(html: str, max_chars: Optional[int] = None) -> str:
+    """
+    Convert HTML to plain text.
+
+    Args:
+        html: HTML document or fragment
+        max_chars: Stop collecting text after roughly this many characters
+                   (the result is cut to exactly max_chars)
+
+    Returns:
+        Plain text with one line per block element
+    """
+    if not html:
+        return ""
+
+    parser = _TextExtractor(max_chars)
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        # HTMLParser is lenient; fall back to tag stripping for anything it rejects
+        return _INLINE_WHITESPACE.sub(" ", re.sub(r"<[^>]+>", " ", html)).strip()[:max_chars]
+
+    text = parser.text()
+    return text[:max_chars] if max_chars is not None else text
@@ -0,0 +1,279 @@
+"""
+LibreOffice Conversion Pool
+Warm headless LibreOffice instances for DOCX -> PDF conversion over UNO.
+
+Starting soffice costs seconds per conversion; the pool keeps
+settings.docx_pdf_pool_size instances running, each with its own profile
+directory and UNO pipe, and feeds them from one shared job queue:
+
+- One worker thread per instance takes conversions from the queue
+- A watchdog kills an instance whose conversion exceeds
+  settings.docx_pdf_conversion_timeout; the job fails with a timeout and the
+  instance is restarted before the worker's next job
+- A crashed instance (process exited, UNO bridge lost) is restarted and the
+  job retried once
+- Requires the LibreOffice Python-UNO bridge (`import uno`); without it
+  get_pool() returns None and callers start one soffice process per conversion
+"""
+import atexit
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a freshly started instance to accept UNO connections
+STARTUP_TIMEOUT = 60
+
+
+class LibreOfficeInstance:
+    """One headless soffice process with a private profile and UNO pipe."""
+
+    def __init__(self, binary: str, name: str):
+        self.binary = binary
+        self.name = name
+        self.pipe_name = f"docx_pdf_{os.getpid()}_{name}"
+        # Kept across restarts so only the first start pays for profile creation
+        self.profile_dir = tempfile.mkdtemp(prefix=f"lo_profile_{name}_")
+        self.process: Optional[subprocess.Popen] = None
+        self.desktop = None
+
+    def is_alive(self) -> bool:
+        """Whether the soffice process is running with a UNO connection."""
+        return self.desktop is not None and self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """
+        Start soffice and connect to it.
+
+        Raises:
+            RuntimeError: If the instance exits or does not accept connections in time
+        """
+        import uno
+
+        self.kill()
+        self.process = subprocess.Popen(
+            [
+                self.binary,
+                '--headless', '--invisible', '--nologo', '--nodefault', '--norestore', '--nolockcheck',
+                f'-env:UserInstallation={uno.systemPathToFileUrl(self.profile_dir)}',
+                f'--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext',
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"LibreOffice instance {self.name} exited during startup")
+                if time.monotonic() > deadline:
+                    self.kill()
+                    raise RuntimeError(f"LibreOffice instance {self.name} did not start within {STARTUP_TIMEOUT}s")
+                time.sleep(0.25)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+        logger.info(f"LibreOffice instance {self.name} started (pid {self.process.pid})")
+
+    def convert(self, docx_path: str, output_path: str) -> None:
+        """
+        Convert a document to PDF in this instance.
+
+        Args:
+            docx_path: Source DOCX path
+            output_path: Destination PDF path
+        """
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def properties(**values):
+            result = []
+            for name, value in values.items():
+                prop = PropertyValue()
+                prop.Name = name
+                prop.Value = value
+                result.append(prop)
+            return tuple(result)
+
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(docx_path)),
+            "_blank",
+            0,
+            properties(Hidden=True, ReadOnly=True)
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open {docx_path}")
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(output_path)),
+                properties(FilterName="writer_pdf_Export")
+            )
+        finally:
+            document.close(True)
+
+    def kill(self) -> None:
+        """Kill the soffice process (unblocks a conversion stuck in UNO)."""
+        self.desktop = None
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                logger.warning(f"LibreOffice instance {self.name} did not exit after kill")
+
+    def stop(self) -> None:
+        """Shut the instance down and remove its profile."""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+        self.kill()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class LibreOfficePool:
+    """Fixed-size pool of warm LibreOffice instances behind a job queue."""
+
+    def __init__(self, binary: str, size: int, timeout: int):
+        """
+        Start the worker threads (instances start on their first job).
+
+        Args:
+            binary: soffice/libreoffice executable
+            size: Number of instances
+            timeout: Per-conversion timeout in seconds
+        """
+        self.pid = os.getpid()
+        self.timeout = timeout
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._instances = [LibreOfficeInstance(binary, str(i)) for i in range(size)]
+        self._threads = [
+            threading.Thread(target=self._worker, args=(instance,), name=f"docx-pdf-{instance.name}", daemon=True)
+            for instance in self._instances
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def convert(self, docx_path: str, output_path: str) -> str:
+        """
+        Queue a conversion and wait for it.
+
+        Args:
+            docx_path: Source DOCX path
+            output_path: Destination PDF path
+
+        Returns:
+            output_path
+
+        Raises:
+            RuntimeError: If the conversion fails or times out
+        """
+        future: Future = Future()
+        self._jobs.put((docx_path, output_path, future))
+        return future.result()
+
+    def _worker(self, instance: LibreOfficeInstance) -> None:
+        """Serve queued conversions with one instance until shutdown."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                instance.stop()
+                return
+            docx_path, output_path, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self._run_job(instance, docx_path, output_path)
+                future.set_result(output_path)
+            except Exception as e:
+                future.set_exception(e)
+
+    def _run_job(self, instance: LibreOfficeInstance, docx_path: str, output_path: str) -> None:
+        """Convert one document, restarting the instance and retrying once if it crashed."""
+        for attempt in (1, 2):
+            if not instance.is_alive():
+                instance.start()
+
+            timed_out = threading.Event()
+
+            def on_timeout():
+                timed_out.set()
+                instance.kill()
+
+            watchdog = threading.Timer(self.timeout, on_timeout)
+            watchdog.start()
+            try:
+                instance.convert(docx_path, output_path)
+                return
+            except Exception as e:
+                if timed_out.is_set():
+                    raise RuntimeError(f"LibreOffice conversion timed out after {self.timeout} seconds") from e
+                if instance.is_alive() or attempt == 2:
+                    raise RuntimeError(f"LibreOffice conversion failed: {e}") from e
+                logger.warning(f"LibreOffice instance {instance.name} crashed during conversion, restarting: {e}")
+                instance.kill()
+            finally:
+                watchdog.cancel()
+
+    def shutdown(self) -> None:
+        """Stop all instances after the queued conversions finish."""
+        if os.getpid() != self.pid:
+            return
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=10)
+
+
+_pool: Optional[LibreOfficePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> Optional[LibreOfficePool]:
+    """
+    Get this process's conversion pool, starting it on first use.
+
+    Returns:
+        The pool, or None when disabled (settings.docx_pdf_pool_size = 0),
+        LibreOffice is not installed or the Python-UNO bridge is missing
+    """
+    global _pool
+
+    if settings.docx_pdf_pool_size <= 0:
+        return None
+    if _pool is not None and _pool.pid == os.getpid():
+        return _pool
+
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        return None
+    binary = shutil.which('soffice') or shutil.which('libreoffice')
+    if not binary:
+        return None
+
+    with _pool_lock:
+        # A pool inherited through fork has no worker threads in this process
+        if _pool is None or _pool.pid != os.getpid():
+            _pool = LibreOfficePool(binary, settings.docx_pdf_pool_size, settings.docx_pdf_conversion_timeout)
+            atexit.register(_pool.shutdown)
+            logger.info(f"Started LibreOffice conversion pool ({settings.docx_pdf_pool_size} instances)")
+    return _pool
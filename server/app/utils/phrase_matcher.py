@@ -0,0 +1,96 @@
+"""
+Phrase Matcher
+Find which of many fixed phrases occur in a text, in a single regex pass.
+
+Equivalent to running `re.search(r'\\b' + re.escape(phrase) + r'\\b', text, flags)`
+for every phrase, but with one pattern compiled once:
+
+- The phrases are folded into a character trie and emitted as one regex inside
+  a zero-width lookahead, so every start position is tried and overlapping
+  phrases are all seen; each phrase end is marked by an empty capturing group
+- At each position the regex reports the longest phrase that ends on a word
+  boundary; shorter phrases matching at the same position are prefixes of it,
+  and whether each one ends on a word boundary there is fixed by the longer
+  phrase's next character, so they are precomputed
+- With re.IGNORECASE the trie is built over lowercased phrases, and phrases
+  that differ only in case share one marker
+"""
+import re
+from typing import Dict, Iterable, List, Set
+
+
+class PhraseMatcher:
+    """Word-boundary matcher for a fixed set of literal phrases."""
+
+    def __init__(self, phrases: Iterable[str], flags: int = 0):
+        """
+        Compile the matcher.
+
+        Args:
+            phrases: Literal phrases to look for
+            flags: re flags, applied as in the per-phrase search (e.g. re.IGNORECASE)
+        """
+        self.phrases = sorted({phrase for phrase in phrases if phrase})
+        fold = str.lower if flags & re.IGNORECASE else str
+
+        # Trie key -> phrases ending there
+        self._by_key: Dict[str, List[str]] = {}
+        for phrase in self.phrases:
+            self._by_key.setdefault(fold(phrase), []).append(phrase)
+
+        trie: dict = {}
+        for key in self._by_key:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = key
+        # Marker group N reports self._group_keys[N - 1]
+        self._group_keys: List[str] = []
+        self._pattern = re.compile(r'\b(?=' + self._trie_pattern(trie) + ')', flags) if trie else None
+
+        # Trie key -> phrases that also match wherever the key's phrases match
+        self._matched_with: Dict[str, List[str]] = {}
+        for key in self._by_key:
+            same = self._by_key[key]
+            nested = [
+                phrase for other in self._by_key
+                if len(other) < len(key) and key.startswith(other)
+                and re.match(re.escape(other) + r'\b', key, flags)
+                for phrase in self._by_key[other]
+            ]
+            self._matched_with[key] = same + nested
+
+    def _trie_pattern(self, node: dict) -> str:
+        """Regex for a trie node: longer continuations first, then this node's phrase end."""
+        branches = []
+        for char in sorted(child for child in node if child):
+            branches.append(re.escape(char) + self._trie_pattern(node[char]))
+        if '' in node:
+            # Empty marker group: it is the last group closed when the match ends here
+            self._group_keys.append(node[''])
+            branches.append(r'()\b')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Find the phrases that occur in text as whole words.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matching phrases, as given to the constructor
+        """
+        if self._pattern is None:
+            return set()
+
+        found = set()
+        seen_keys = set()
+        for match in self._pattern.finditer(text):
+            key = self._group_keys[match.lastindex - 1]
+            if key not in seen_keys:
+                seen_keys.add(key)
+                found.update(self._matched_with[key])
+        return found
@@ -0,0 +1,547 @@
+"""
+Skill Vocabulary
+Single source of truth for skill synonyms and skill canonicalization.
+
+Every skill string is canonicalized once into a stable integer id:
+- A skill listed in SKILL_SYNONYMS (as a base skill or a synonym) gets the id of its base skill
+- Any other skill gets the id of its normalized (lowercased, stripped) string
+
+Candidate.skill_ids / JobPosting.skill_ids hold these ids (sorted, unique) and are
+set whenever `skills` is assigned, so scorers compare integer sets instead of
+re-normalizing strings per candidate/job pair. Ids are derived from the canonical
+string, so they are stable across processes and deploys; after changing
+SKILL_SYNONYMS run `scripts/backfill_skill_ids.py --all` so stored ids follow the
+new vocabulary.
+"""
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from app.utils.fuzzy_index import NGramIndex
+
+# Fuzzy match threshold (0-1, higher = stricter)
+FUZZY_MATCH_THRESHOLD = 0.85
+
+# ===========================================
+# Merged Skill Synonyms Dictionary
+# Combined from JobMatchingService (200+) and ResumeScorerService (~20)
+# ===========================================
+SKILL_SYNONYMS: Dict[str, List[str]] = {
+    # ===================
+    # CLOUD PLATFORMS
+    # ===================
+    'aws': [
+        'amazon web services', 'amazon aws', 'ec2', 's3', 'lambda', 
+        'cloudwatch', 'aws lambda', 'rds', 'cloudfront', 'route53'
+    ],
+    'gcp': [
+        'google cloud', 'google cloud platform', 'gce', 'bigquery', 
+        'google compute engine', 'cloud run', 'cloud functions'
+    ],
+    'azure': [
+        'microsoft azure', 'azure cloud', 'azure devops', 'azure functions',
+        'azure blob', 'azure sql'
+    ],
+
+    # ===================
+    # PROGRAMMING LANGUAGES
+    # ===================
+    'javascript': ['js', 'es6', 'es2015', 'ecmascript', 'es5', 'es7', 'es2020'],
+    'typescript': ['ts', 'typescript language'],
+    'python': ['py', 'python3', 'python2', 'cpython', 'python language'],
+    'golang': ['go', 'go lang', 'go-lang', 'google go'],
+    'c++': ['cpp', 'cplusplus', 'c plus plus', 'c++11', 'c++17', 'c++20'],
+    'c#': ['csharp', 'c sharp', 'c-sharp'],
+    '.net': ['dotnet', 'dot net', '.net core', 'dotnet core', '.net framework'],
+    'java': ['java8', 'java11', 'java17', 'jdk', 'jvm'],
+    'ruby': ['rb', 'ruby language'],
+    'rust': ['rustlang', 'rust language'],
+    'scala': ['scala lang', 'scala language'],
+    'kotlin': ['kt', 'kotlin language'],
+    'swift': ['swift lang', 'swiftui', 'swift ui'],
+    'objective-c': ['objc', 'objective c', 'obj-c'],
+    'php': ['php7', 'php8', 'php language'],
+    'perl': ['perl5', 'perl6', 'raku'],
+    'r': ['r language', 'r programming', 'rstats'],
+    'matlab': ['mat lab'],
+    'julia': ['julia lang'],
+
+    # ===================
+    # FRONTEND FRAMEWORKS
+    # ===================
+    'react': ['reactjs', 'react.js', 'react native', 'react-native', 'react hooks'],
+    'vue': ['vuejs', 'vue.js', 'vue3', 'nuxt', 'nuxtjs', 'vue 3'],
+    'angular': ['angularjs', 'angular.js', 'angular2', 'angular 2', 'angular 14'],
+    'svelte': ['sveltejs', 'sveltekit', 'svelte kit'],
+    'next.js': ['nextjs', 'next', 'next js'],
+    'gatsby': ['gatsbyjs', 'gatsby js'],
+    'ember': ['emberjs', 'ember.js'],
+    'backbone': ['backbonejs', 'backbone.js'],
+    'jquery': ['jq', 'j query'],
+    'redux': ['redux toolkit', 'rtk'],
+    'mobx': ['mob x'],
+
+    # ===================
+    # BACKEND FRAMEWORKS
+    # ===================
+    'node': ['nodejs', 'node.js', 'node js'],
+    'express': ['expressjs', 'express.js', 'express js'],
+    'django': ['django rest framework', 'drf', 'django-rest', 'django rest'],
+    'flask': ['flask api', 'flask python'],
+    'fastapi': ['fast api', 'fast-api', 'fast api python'],
+    'rails': ['ruby on rails', 'ror', 'ruby rails', 'ruby on rails'],
+    'spring': ['spring boot', 'springboot', 'spring framework', 'spring mvc'],
+    'laravel': ['laravel php'],
+    'asp.net': ['asp net', 'aspnet', 'asp.net core', 'asp.net mvc'],
+    'nestjs': ['nest.js', 'nest', 'nest js'],
+    'koa': ['koajs', 'koa.js'],
+    'hapi': ['hapijs', 'hapi.js'],
+    'gin': ['gin-gonic', 'gin golang'],
+    'fiber': ['gofiber', 'fiber golang'],
+    'echo': ['echo golang'],
+
+    # ===================
+    # DATABASES
+    # ===================
+    'postgresql': ['postgres', 'pg', 'psql', 'pgsql', 'postgre'],
+    'mysql': ['mariadb', 'maria db', 'mysql server'],
+    'mongodb': ['mongo', 'mongo db', 'mongoose'],
+    'redis': ['redis cache', 'redis db', 'in-memory cache'],
+    'elasticsearch': ['elastic search', 'elastic', 'es', 'opensearch'],
+    'cassandra': ['apache cassandra'],
+    'dynamodb': ['dynamo db', 'amazon dynamodb', 'aws dynamodb'],
+    'oracle': ['oracle db', 'oracle database', 'plsql', 'pl/sql'],
+    'sql server': ['mssql', 'ms sql', 'microsoft sql', 'tsql', 't-sql'],
+    'sqlite': ['sqlite3'],
+    'couchdb': ['couch db', 'apache couchdb'],
+    'neo4j': ['neo 4j', 'graph database'],
+    'firestore': ['firebase firestore', 'cloud firestore'],
+
+    # ===================
+    # DEVOPS & INFRASTRUCTURE
+    # ===================
+    'kubernetes': ['k8s', 'kube', 'kubectl', 'k8', 'kubernetes cluster'],
+    'docker': ['docker compose', 'docker-compose', 'containerization', 'containers', 'dockerfile'],
+    'terraform': ['tf', 'infrastructure as code', 'iac', 'hcl', 'terraform cloud'],
+    'ansible': ['ansible playbook', 'ansible automation'],
+    'puppet': ['puppet enterprise'],
+    'chef': ['chef infra'],
+    'jenkins': ['jenkins ci', 'jenkinsfile', 'jenkins pipeline'],
+    'gitlab ci': ['gitlab-ci', 'gitlab ci/cd', 'gitlab cicd'],
+    'github actions': ['gh actions', 'github action'],
+    'circle ci': ['circleci', 'circle-ci'],
+    'travis ci': ['travis-ci', 'travisci'],
+    'ci/cd': ['cicd', 'continuous integration', 'continuous delivery', 'continuous deployment'],
+    'nginx': ['nginx server', 'nginx proxy'],
+    'apache': ['apache server', 'httpd', 'apache httpd'],
+    'linux': ['unix', 'ubuntu', 'centos', 'debian', 'rhel', 'fedora'],
+    'bash': ['shell', 'shell script', 'sh', 'zsh', 'shell scripting'],
+    'prometheus': ['prometheus monitoring'],
+    'grafana': ['grafana dashboard'],
+    'datadog': ['data dog', 'datadog monitoring'],
+    'new relic': ['newrelic'],
+    'splunk': ['splunk logging'],
+    'elk': ['elk stack', 'elasticsearch logstash kibana'],
+
+    # ===================
+    # MESSAGE QUEUES
+    # ===================
+    'kafka': ['apache kafka', 'kafka streaming'],
+    'rabbitmq': ['rabbit mq', 'amqp', 'rabbit'],
+    'sqs': ['amazon sqs', 'aws sqs', 'simple queue service'],
+    'pubsub': ['google pubsub', 'gcp pubsub', 'pub/sub', 'pub sub'],
+    'celery': ['celery task queue'],
+
+    # ===================
+    # DATA & ML
+    # ===================
+    'machine learning': ['ml', 'ml engineer', 'ml engineering'],
+    'artificial intelligence': ['ai', 'ai engineer'],
+    'deep learning': ['dl', 'neural networks', 'nn'],
+    'natural language processing': ['nlp', 'text processing'],
+    'computer vision': ['cv', 'image processing'],
+    'tensorflow': ['tf', 'tf2', 'tensorflow 2'],
+    'pytorch': ['torch', 'py torch'],
+    'scikit-learn': ['sklearn', 'scikit learn', 'sk-learn'],
+    'pandas': ['pd', 'pandas python'],
+    'numpy': ['np', 'numpy python'],
+    'spark': ['apache spark', 'pyspark', 'spark sql'],
+    'hadoop': ['apache hadoop', 'hdfs', 'mapreduce'],
+    'data science': ['data analysis', 'analytics', 'data analytics'],
+    'llm': ['large language model', 'large language models', 'gpt', 'chatgpt'],
+    'langchain': ['lang chain'],
+
+    # ===================
+    # API & PROTOCOLS
+    # ===================
+    'rest api': ['restful', 'rest', 'restful api', 'rest apis'],
+    'graphql': ['graph ql', 'gql'],
+    'grpc': ['g rpc', 'google rpc'],
+    'websocket': ['websockets', 'ws', 'socket.io'],
+    'oauth': ['oauth2', 'oauth 2.0', 'oauth2.0'],
+    'jwt': ['json web token', 'json web tokens'],
+    'openapi': ['swagger', 'openapi spec'],
+
+    # ===================
+    # TESTING
+    # ===================
+    'unit testing': ['unit tests', 'unit test'],
+    'jest': ['jestjs', 'jest testing'],
+    'pytest': ['py.test', 'pytest testing'],
+    'mocha': ['mochajs', 'mocha testing'],
+    'cypress': ['cypress.io', 'cypress testing'],
+    'selenium': ['selenium webdriver', 'selenium testing'],
+    'playwright': ['playwright testing'],
+    'testing library': ['react testing library', 'rtl'],
+    'tdd': ['test driven development'],
+    'bdd': ['behavior driven development'],
+
+    # ===================
+    # VERSION CONTROL
+    # ===================
+    'git': ['github', 'gitlab', 'bitbucket', 'version control'],
+
+    # ===================
+    # AGILE & PROJECT
+    # ===================
+    'agile': ['scrum', 'kanban', 'agile methodology', 'agile development'],
+    'jira': ['atlassian jira'],
+    'confluence': ['atlassian confluence'],
+
+    # ===================
+    # FRONTEND TOOLS
+    # ===================
+    'html': ['html5', 'html 5'],
+    'css': ['css3', 'scss', 'sass', 'less', 'css 3'],
+    'tailwind': ['tailwindcss', 'tailwind css'],
+    'bootstrap': ['bootstrap css', 'bootstrap 5', 'bootstrap 4'],
+    'webpack': ['webpackjs', 'webpack bundler'],
+    'vite': ['vitejs', 'vite bundler'],
+    'babel': ['babeljs', 'babel transpiler'],
+    'eslint': ['es lint'],
+    'prettier': ['code formatter'],
+    'storybook': ['storybook js'],
+
+    # ===================
+    # MOBILE
+    # ===================
+    'react native': ['react-native', 'rn', 'react native mobile'],
+    'flutter': ['flutter dart', 'flutter mobile'],
+    'ionic': ['ionic framework'],
+    'xamarin': ['xamarin forms'],
+    'android': ['android sdk', 'android development'],
+    'ios': ['ios sdk', 'ios development', 'swift ios'],
+}
+
+
+# Skills that are not synonyms but count as a match for each other in job matching
+# (symmetric; any spelling of either side). Kept apart from SKILL_SYNONYMS so
+# they do not share a skill id.
+RELATED_SKILLS: Dict[str, List[str]] = {
+    'c#': ['.net'],
+    'node': ['express'],
+}
+
+
+# Display names used when normalizing imported job skills (raw skill -> display name)
+SKILL_DISPLAY_NAMES: Dict[str, str] = {
+    'aws': 'AWS',
+    'amazon web services': 'AWS',
+    'ec2': 'AWS EC2',
+    's3': 'AWS S3',
+    'kubernetes': 'Kubernetes',
+    'k8s': 'Kubernetes',
+    'docker': 'Docker',
+    'python': 'Python',
+    'java': 'Java',
+    'javascript': 'JavaScript',
+    'js': 'JavaScript',
+    'typescript': 'TypeScript',
+    'ts': 'TypeScript',
+    'react': 'React',
+    'reactjs': 'React',
+    'nodejs': 'Node.js',
+    'node': 'Node.js',
+    'angular': 'Angular',
+    'vue': 'Vue.js',
+    'vuejs': 'Vue.js',
+    'sql': 'SQL',
+    'mysql': 'MySQL',
+    'postgresql': 'PostgreSQL',
+    'postgres': 'PostgreSQL',
+    'mongodb': 'MongoDB',
+    'mongo': 'MongoDB',
+    'redis': 'Redis',
+    'jenkins': 'Jenkins',
+    'ci/cd': 'CI/CD',
+    'cicd': 'CI/CD',
+    'terraform': 'Terraform',
+    'ansible': 'Ansible',
+    'git': 'Git',
+    'github': 'GitHub',
+    'gitlab': 'GitLab',
+    'azure': 'Azure',
+    'gcp': 'Google Cloud',
+    'google cloud': 'Google Cloud',
+    'devops': 'DevOps',
+    'machine learning': 'Machine Learning',
+    'ml': 'Machine Learning',
+    'ai': 'Artificial Intelligence',
+    'rest': 'REST API',
+    'restful': 'REST API',
+    'api': 'API',
+    'graphql': 'GraphQL',
+    'kafka': 'Kafka',
+    'spark': 'Apache Spark',
+    'hadoop': 'Hadoop',
+    'linux': 'Linux',
+    'unix': 'Unix',
+    'bash': 'Bash',
+    'shell': 'Shell Script',
+    'powershell': 'PowerShell',
+    'c++': 'C++',
+    'c#': 'C#',
+    'csharp': 'C#',
+    '.net': '.NET',
+    'dotnet': '.NET',
+    'ruby': 'Ruby',
+    'rails': 'Ruby on Rails',
+    'php': 'PHP',
+    'go': 'Go',
+    'golang': 'Go',
+    'rust': 'Rust',
+    'swift': 'Swift',
+    'kotlin': 'Kotlin',
+    'scala': 'Scala',
+    'r': 'R',
+    'matlab': 'MATLAB',
+    'tableau': 'Tableau',
+    'power bi': 'Power BI',
+    'powerbi': 'Power BI',
+    'salesforce': 'Salesforce',
+    'sap': 'SAP',
+    'oracle': 'Oracle',
+    'agile': 'Agile',
+    'scrum': 'Scrum',
+    'jira': 'Jira',
+}
+
+
+def normalize_skill(skill) -> str:
+    """Normalize a skill string for comparison (lowercase, stripped)."""
+    return str(skill).lower().strip()
+
+
+def _build_canonical_map() -> Dict[str, str]:
+    """Map every base skill and synonym to its base skill (later entries win)."""
+    canonical: Dict[str, str] = {}
+    for base_skill, synonyms in SKILL_SYNONYMS.items():
+        canonical[base_skill] = base_skill
+        for synonym in synonyms:
+            canonical[synonym] = base_skill
+    return canonical
+
+
+# Normalized skill -> base skill, for every string in SKILL_SYNONYMS
+CANONICAL_SKILLS: Dict[str, str] = _build_canonical_map()
+
+
+def _base_skill(skill: str) -> str:
+    """Base skill of a vocabulary skill, else the normalized string."""
+    normalized = normalize_skill(skill)
+    return CANONICAL_SKILLS.get(normalized, normalized)
+
+
+def _build_related_map() -> Dict[str, FrozenSet[str]]:
+    """Map base skills to the base skills related to them (both directions)."""
+    related: Dict[str, set] = {}
+    for skill, others in RELATED_SKILLS.items():
+        for other in others:
+            related.setdefault(_base_skill(skill), set()).add(_base_skill(other))
+            related.setdefault(_base_skill(other), set()).add(_base_skill(skill))
+    return {base: frozenset(others) for base, others in related.items()}
+
+
+# Base skill -> related base skills
+RELATED_BASE_SKILLS: Dict[str, FrozenSet[str]] = _build_related_map()
+
+
+class SkillVocabulary:
+    """Canonicalization, integer ids and matching over the shared skill vocabulary."""
+
+    @staticmethod
+    def canonical(skill: str) -> Optional[str]:
+        """
+        Get the base skill for a skill string.
+
+        Args:
+            skill: Raw or normalized skill string
+
+        Returns:
+            Base skill name, or None if the skill is not in the vocabulary
+        """
+        return CANONICAL_SKILLS.get(normalize_skill(skill))
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def skill_id(skill: str) -> int:
+        """
+        Get the stable integer id of a skill (shared by all its synonyms).
+
+        Args:
+            skill: Raw or normalized skill string
+
+        Returns:
+            Non-negative 63-bit integer id
+        """
+        key = _base_skill(skill)
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big") >> 1
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def related_ids(skill: str) -> FrozenSet[int]:
+        """
+        Get the ids of skills related to a skill (RELATED_SKILLS).
+
+        Args:
+            skill: Raw or normalized skill string
+
+        Returns:
+            Ids of the related skills (empty for most skills)
+        """
+        return frozenset(SkillVocabulary.skill_id(other) for other in RELATED_BASE_SKILLS.get(_base_skill(skill), ()))
+
+    @staticmethod
+    def skill_ids(skills: Optional[Iterable[str]]) -> List[int]:
+        """
+        Canonicalize a skill list into sorted, unique integer ids.
+
+        Args:
+            skills: Raw skill strings (None and blank entries are ignored)
+
+        Returns:
+            Sorted list of unique skill ids
+        """
+        if not skills:
+            return []
+        return sorted({SkillVocabulary.skill_id(s) for s in skills if s is not None and str(s).strip()})
+
+    @staticmethod
+    def variants(skill: str) -> List[str]:
+        """
+        Get every spelling of a skill known to the vocabulary.
+
+        Args:
+            skill: Raw or normalized skill string
+
+        Returns:
+            [base skill, *synonyms] if the skill is in the vocabulary, else [normalized skill]
+        """
+        normalized = normalize_skill(skill)
+        base_skill = CANONICAL_SKILLS.get(normalized)
+        if base_skill is None:
+            return [normalized]
+        return [base_skill] + list(SKILL_SYNONYMS.get(base_skill, []))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def variant_pattern(skill: str) -> Pattern:
+        """
+        Get a regex matching any spelling of a skill as a whole word.
+
+        Not a plain substring test: short aliases ('go', 'es', 'sh', 'tf')
+        would otherwise match inside ordinary words. The boundaries are
+        lookarounds rather than \\b so skills ending or starting in
+        punctuation ('c#', 'c++', '.net') still match.
+        """
+        variants = sorted(SkillVocabulary.variants(skill), key=len, reverse=True)
+        return re.compile(r'(?<!\w)(' + '|'.join(re.escape(v) for v in variants) + r')(?!\w)')
+
+    @staticmethod
+    def find_variant(skill: str, text: str) -> Optional[str]:
+        """
+        Find a spelling of a skill in lowercased text.
+
+        Args:
+            skill: Raw or normalized skill string
+            text: Lowercased text to search
+
+        Returns:
+            The matching spelling, or None
+        """
+        match = SkillVocabulary.variant_pattern(normalize_skill(skill)).search(text)
+        return match.group(1) if match else None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def fuzzy_index(skills: Tuple[str, ...]) -> NGramIndex:
+        """
+        Get the n-gram index over a skill list (cached per distinct list).
+
+        A candidate's skill list is scored against many jobs in one matching
+        run, so its index is built once and reused.
+        """
+        return NGramIndex(skills)
+
+    @staticmethod
+    def match_skills(
+        candidate_skills: Sequence[str],
+        job_skills: Sequence[str],
+        candidate_skill_ids: Optional[Iterable[int]] = None,
+        fuzzy_threshold: float = FUZZY_MATCH_THRESHOLD,
+        include_related: bool = False
+    ) -> Tuple[List[str], List[str], Dict[str, str]]:
+        """
+        Match job skills against a candidate's skills.
+
+        Each job skill is matched, in order, by:
+        1. Exact match (normalized string)
+        2. Synonym match (same skill id), or with include_related a skill
+           related to it (RELATED_SKILLS)
+        3. Fuzzy match (SequenceMatcher ratio >= fuzzy_threshold) - only for
+           job skills the first two strategies did not resolve, via an n-gram
+           index over the candidate's skills
+
+        Args:
+            candidate_skills: Candidate skills, already normalized
+            job_skills: Job skills, already normalized
+            candidate_skill_ids: Stored Candidate.skill_ids (computed from
+                candidate_skills if not provided)
+            fuzzy_threshold: Minimum ratio for a fuzzy match
+            include_related: Also accept RELATED_SKILLS as a match ('related')
+
+        Returns:
+            Tuple of (matched_skills, missing_skills, match_details) where
+            match_details maps each matched job skill to 'exact', 'synonym',
+            'related' or 'fuzzy'
+        """
+        candidate_set = set(candidate_skills)
+        if candidate_skill_ids is None:
+            candidate_id_set = {SkillVocabulary.skill_id(s) for s in candidate_skills}
+        else:
+            candidate_id_set = set(candidate_skill_ids)
+
+        matched_skills: List[str] = []
+        missing_skills: List[str] = []
+        match_details: Dict[str, str] = {}
+
+        for job_skill in job_skills:
+            if job_skill in candidate_set:
+                match_type = 'exact'
+            elif SkillVocabulary.skill_id(job_skill) in candidate_id_set:
+                match_type = 'synonym'
+            elif include_related and not candidate_id_set.isdisjoint(SkillVocabulary.related_ids(job_skill)):
+                match_type = 'related'
+            elif SkillVocabulary.fuzzy_index(tuple(candidate_skills)).first_match(
+                job_skill, fuzzy_threshold
+            ) is not None:
+                match_type = 'fuzzy'
+            else:
+                missing_skills.append(job_skill)
+                continue
+
+            matched_skills.append(job_skill)
+            match_details[job_skill] = match_type
+
+        return matched_skills, missing_skills, match_details
@@ -3,8 +3,9 @@ Skills Matcher and Database
 Intelligent skill extraction and categorization
 """
 from typing import List, Dict, Set, Optional, Any
-from difflib import SequenceMatcher
-import re
+
+from app.utils.fuzzy_index import NGramIndex
+from app.utils.phrase_matcher import PhraseMatcher
 
 
 class SkillsMatcher:
@@ -142,6 +143,21 @@ class SkillsMatcher:
         ],
     }
     
+    # Single-pass word-boundary matcher over all lowercase skills, compiled at class load
+    _EXACT_MATCHER = PhraseMatcher(skill.lower() for skills in SKILLS_DATABASE.values() for skill in skills)
+    
+    # Process-wide n-gram indexes, keyed by the lowercase skill list they cover
+    _fuzzy_indexes: Dict[tuple, NGramIndex] = {}
+    
+    @classmethod
+    def _get_fuzzy_index(cls, skills_lower: List[str]) -> NGramIndex:
+        """Get the n-gram index for a skill list, built once per process."""
+        key = tuple(skills_lower)
+        index = cls._fuzzy_indexes.get(key)
+        if index is None:
+            index = cls._fuzzy_indexes[key] = NGramIndex(skills_lower)
+        return index
+    
     def __init__(self, fuzzy_threshold: float = 0.85):
         """
         Initialize skills matcher
@@ -158,6 +174,9 @@ class SkillsMatcher:
         
         # Create lowercase mapping for case-insensitive matching
         self.skills_lower = {skill.lower(): skill for skill in self.all_skills}
+        
+        # N-gram index over the lowercase skills (same order) for fuzzy lookups
+        self.fuzzy_index = self._get_fuzzy_index(list(self.skills_lower))
     
     def extract_skills(self, text: str) -> Dict[str, List[str]]:
         """
@@ -199,16 +218,10 @@ class SkillsMatcher:
         """
         Exact case-insensitive word matching
         """
-        matched = set()
         text_lower = text.lower()
         
-        for skill_lower, skill in self.skills_lower.items():
-            # Word boundary matching
-            pattern = r'\b' + re.escape(skill_lower) + r'\b'
-            if re.search(pattern, text_lower):
-                matched.add(skill)
-        
-        return list(matched)
+        # Word boundary matching for every skill in one regex pass
+        return list({self.skills_lower[skill_lower] for skill_lower in self._EXACT_MATCHER.find_all(text_lower)})
     
     def _fuzzy_match(self, text: str, exclude: List[str]) -> List[str]:
         """
@@ -224,23 +237,19 @@ class SkillsMatcher:
         matched = set()
         words = text.split()
         exclude_lower = {s.lower() for s in exclude}
+        seen_words = set()
         
         for word in words:
             word_clean = word.strip('.,;:()[]{}\"\'').lower()
             
-            if len(word_clean) < 3 or word_clean in exclude_lower:
+            if len(word_clean) < 3 or word_clean in exclude_lower or word_clean in seen_words:
                 continue
+            seen_words.add(word_clean)
             
-            # Find best matching skill
-            for skill_lower, skill in self.skills_lower.items():
-                if skill.lower() in exclude_lower:
-                    continue
-                
-                similarity = SequenceMatcher(None, word_clean, skill_lower).ratio()
-                
-                if similarity >= self.fuzzy_threshold:
-                    matched.add(skill)
-                    break
+            # First matching skill (in database order) via the n-gram index
+            idx = self.fuzzy_index.first_match(word_clean, self.fuzzy_threshold, exclude=exclude_lower)
+            if idx is not None:
+                matched.add(self.skills_lower[self.fuzzy_index.items[idx]])
         
         return list(matched)
     
@@ -321,11 +330,10 @@ class SkillsMatcher:
                 invalid.append(skill)
                 
                 # Find close matches
-                close_matches = []
-                for known_skill_lower, known_skill in self.skills_lower.items():
-                    similarity = SequenceMatcher(None, skill_lower, known_skill_lower).ratio()
-                    if similarity >= 0.75:
-                        close_matches.append((known_skill, similarity))
+                close_matches = [
+                    (self.skills_lower[self.fuzzy_index.items[idx]], similarity)
+                    for idx, similarity in self.fuzzy_index.matches(skill_lower, 0.75)
+                ]
                 
                 # Sort by similarity and take top 3
                 close_matches.sort(key=lambda x: x[1], reverse=True)
@@ -56,6 +56,7 @@ class Settings(BaseSettings):
     smtp_use_tls: bool = Field(default=True, env="SMTP_USE_TLS")
     smtp_from_email: str = Field(default="noreply@blacklight.io", env="SMTP_FROM_EMAIL")
     smtp_from_name: str = Field(default="Blacklight HR", env="SMTP_FROM_NAME")
+    email_smtp_config_cache_ttl: int = Field(default=300, env="EMAIL_SMTP_CONFIG_CACHE_TTL")  # Seconds; 0 disables caching
     
     # Invitation Settings
     invitation_expiry_hours: int = Field(default=168, env="INVITATION_EXPIRY_HOURS")  # 7 days
@@ -90,9 +91,29 @@ class Settings(BaseSettings):
     inngest_serve_host: str = Field(default="http://localhost:5000", env="INNGEST_SERVE_HOST")
     inngest_serve_path: str = Field(default="/api/inngest", env="INNGEST_SERVE_PATH")
     
+    # Scraper Import Fan-out
+    scraper_import_batch_max_bytes: int = Field(default=200_000, env="SCRAPER_IMPORT_BATCH_MAX_BYTES")  # Max serialized jobs per import batch
+    scraper_import_batch_max_jobs: int = Field(default=100, env="SCRAPER_IMPORT_BATCH_MAX_JOBS")  # Max jobs per import batch
+    scraper_import_send_max_bytes: int = Field(default=1_000_000, env="SCRAPER_IMPORT_SEND_MAX_BYTES")  # Max event bytes per Inngest send call
+    scraper_import_payload_ttl: int = Field(default=86400, env="SCRAPER_IMPORT_PAYLOAD_TTL")  # Redis job payload TTL (seconds), must outlive retries
+    scraper_session_completion_timeout: int = Field(default=1800, env="SCRAPER_SESSION_COMPLETION_TIMEOUT")  # Max wait for platform batches before finalizing (seconds)
+    scraper_session_completion_recheck_seconds: int = Field(default=60, env="SCRAPER_SESSION_COMPLETION_RECHECK_SECONDS")  # Max wait per done-event wait before re-reading the platform counters
+    scraper_platform_cache_ttl: int = Field(default=300, env="SCRAPER_PLATFORM_CACHE_TTL")  # Seconds the active platform list is cached in-process; 0 disables caching
+    scraper_stats_snapshot_max_age: int = Field(default=90, env="SCRAPER_STATS_SNAPSHOT_MAX_AGE")  # Seconds before a dashboard read refreshes the stats snapshot itself
+    scraper_job_log_level: str = Field(default="full", env="SCRAPER_JOB_LOG_LEVEL")  # session_job_logs detail: full (raw JSON per row), reference (hash + per-batch gzip blob in file storage), summary (no rows, platform counters only)
+    
     # AI/Resume Parsing Configuration
     ai_parsing_provider: str = Field(default="gemini", env="AI_PARSING_PROVIDER")  # 'gemini' or 'openai'
     enable_docx_to_pdf_conversion: bool = Field(default=True, env="ENABLE_DOCX_TO_PDF_CONVERSION")
+    docx_pdf_pool_size: int = Field(default=2, env="DOCX_PDF_POOL_SIZE")  # Warm LibreOffice instances per process (needs Python-UNO); 0 = one soffice process per conversion
+    docx_pdf_conversion_timeout: int = Field(default=60, env="DOCX_PDF_CONVERSION_TIMEOUT")  # Seconds per DOCX -> PDF conversion before the instance is killed
+    docx_pdf_cache_dir: str = Field(default="", env="DOCX_PDF_CACHE_DIR")  # Converted PDF cache directory (default: <tmp>/docx_pdf_cache)
+    docx_pdf_cache_max_entries: int = Field(default=500, env="DOCX_PDF_CACHE_MAX_ENTRIES")  # Cached PDFs kept by DOCX content hash; 0 disables caching
+    
+    # Resume Export
+    resume_export_cache_enabled: bool = Field(default=True, env="RESUME_EXPORT_CACHE_ENABLED")  # Serve tailored resume PDF/DOCX exports from rendered artifacts in file storage
+    resume_export_prerender_templates: str = Field(default="modern", env="RESUME_EXPORT_PRERENDER_TEMPLATES")  # Comma-separated templates rendered to PDF when tailoring completes; empty disables
+    resume_export_render_lock_timeout: int = Field(default=120, env="RESUME_EXPORT_RENDER_LOCK_TIMEOUT")  # Seconds a render holds its lock; waiters render themselves after this
     
     # Google Gemini API Configuration
     google_api_key: str = Field(default="", env="GOOGLE_API_KEY")
@@ -100,6 +121,17 @@ class Settings(BaseSettings):
     gemini_embedding_model: str = Field(default="gemini-embedding-001", env="GEMINI_EMBEDDING_MODEL")
     gemini_embedding_dimension: int = Field(default=768, env="GEMINI_EMBEDDING_DIMENSION")
     email_job_parsing_batch_size: int = Field(default=10, env="EMAIL_JOB_PARSING_BATCH_SIZE")
+    keyword_extraction_batch_token_budget: int = Field(default=12000, env="KEYWORD_EXTRACTION_BATCH_TOKEN_BUDGET")  # Estimated input tokens per batch prompt
+    keyword_extraction_batch_max_jobs: int = Field(default=15, env="KEYWORD_EXTRACTION_BATCH_MAX_JOBS")  # Max descriptions per batch prompt (bounds output size)
+    keyword_extraction_max_concurrency: int = Field(default=4, env="KEYWORD_EXTRACTION_MAX_CONCURRENCY")  # Batch prompts in flight at once
+    
+    # Role Normalization
+    role_title_cache_ttl: int = Field(default=600, env="ROLE_TITLE_CACHE_TTL")  # Seconds the normalized-title -> role map is cached in-process
+    role_backfill_batch_size: int = Field(default=300, env="ROLE_BACKFILL_BATCH_SIZE")  # Orphaned jobs normalized per backfill run
+    role_backfill_chunk_size: int = Field(default=50, env="ROLE_BACKFILL_CHUNK_SIZE")  # Orphaned jobs per normalization step (one LLM/embedding round trip each)
+    role_embedding_index_enabled: bool = Field(default=True, env="ROLE_EMBEDDING_INDEX_ENABLED")  # In-memory role similarity search (False = pgvector only)
+    role_embedding_index_version_check_interval: int = Field(default=5, env="ROLE_EMBEDDING_INDEX_VERSION_CHECK_INTERVAL")  # Seconds between shared version checks
+    role_embedding_index_max_age: int = Field(default=300, env="ROLE_EMBEDDING_INDEX_MAX_AGE")  # Seconds before the in-memory index is rebuilt regardless
     
     # OpenAI Configuration (optional alternative to Gemini)
     openai_api_key: str = Field(default="", env="OPENAI_API_KEY")
@@ -137,12 +169,28 @@ class Settings(BaseSettings):
     email_sync_email_chunk_size: int = Field(default=20, env="EMAIL_SYNC_EMAIL_CHUNK_SIZE")  # Emails per processing chunk
     email_sync_redis_ttl: int = Field(default=3600, env="EMAIL_SYNC_REDIS_TTL")  # Redis email data TTL (seconds)
     email_sync_candidate_match_page_size: int = Field(default=200, env="EMAIL_SYNC_CANDIDATE_MATCH_PAGE_SIZE")  # Candidates per matching page
+    email_sync_gmail_fetch_concurrency: int = Field(default=4, env="EMAIL_SYNC_GMAIL_FETCH_CONCURRENCY")  # Gmail batch requests in flight per inbox sync
+    email_sync_outlook_fetch_concurrency: int = Field(default=4, env="EMAIL_SYNC_OUTLOOK_FETCH_CONCURRENCY")  # Outlook body requests in flight per mailbox (Graph allows 4 concurrent per mailbox)
+    email_sync_processed_cache_days: int = Field(default=14, env="EMAIL_SYNC_PROCESSED_CACHE_DAYS")  # Days processed message IDs stay in the per-integration Redis set checked before the DB
+    
+    # Data Retention (chunked cleanup of log tables; days = 0 keeps rows forever)
+    retention_processed_emails_days: int = Field(default=90, env="RETENTION_PROCESSED_EMAILS_DAYS")  # Days processed_emails rows are kept
+    retention_processed_emails_archive: bool = Field(default=False, env="RETENTION_PROCESSED_EMAILS_ARCHIVE")  # Archive rows to gzipped JSONL in file storage before deleting
+    retention_session_job_logs_days: int = Field(default=30, env="RETENTION_SESSION_JOB_LOGS_DAYS")  # Days session_job_logs rows (incl. raw_job_data) are kept
+    retention_session_job_logs_archive: bool = Field(default=True, env="RETENTION_SESSION_JOB_LOGS_ARCHIVE")  # Archive raw scraped payloads before deleting
+    retention_chunk_size: int = Field(default=5000, env="RETENTION_CHUNK_SIZE")  # Id range deleted (and committed) per chunk
+    retention_chunk_pause_ms: int = Field(default=50, env="RETENTION_CHUNK_PAUSE_MS")  # Pause between chunks to let concurrent writers through
+    retention_max_seconds: int = Field(default=600, env="RETENTION_MAX_SECONDS")  # Time budget per table per run; the next run resumes
     
     # Circuit Breaker - Redis-based distributed settings
     circuit_breaker_redis_prefix: str = Field(default="cb:", env="CIRCUIT_BREAKER_REDIS_PREFIX")
     
     # Team Hierarchy Settings
     team_hierarchy_max_depth: int = Field(default=10, env="TEAM_HIERARCHY_MAX_DEPTH")  # Max recursion depth for hierarchy traversal
+    team_hierarchy_use_closure_table: bool = Field(default=False, env="TEAM_HIERARCHY_USE_CLOSURE_TABLE")  # Use portal_user_hierarchy instead of recursive CTEs
+    
+    # Submission Tracking (ATS)
+    submission_stats_cache_ttl: int = Field(default=30, env="SUBMISSION_STATS_CACHE_TTL")  # Seconds submission stats are cached in-process per (tenant, user, days_back); 0 disables caching
     
     class Config:
         """Pydantic configuration."""
@@ -884,6 +884,23 @@ def backfill_job_roles(app: Flask, batch_size: int = 10) -> None:
         sys.exit(1)
 
 
+def rebuild_team_hierarchy(app: Flask, tenant_id: int = None) -> None:
+    """
+    Rebuild the portal_user_hierarchy closure table from portal_users.manager_id.
+    
+    Run before enabling TEAM_HIERARCHY_USE_CLOSURE_TABLE, or to repair drift.
+    
+    Args:
+        tenant_id: Optional tenant ID to rebuild (default: all tenants)
+    """
+    from app.services.team_management_service import TeamManagementService
+    
+    with app.app_context():
+        rows = TeamManagementService.rebuild_hierarchy_closure(tenant_id)
+        scope = f"tenant {tenant_id}" if tenant_id else "all tenants"
+        print(f"✅ Rebuilt team hierarchy closure for {scope}: {rows} rows")
+
+
 def clean_all_db(app: Flask, confirm: bool = False) -> None:
     """
     Clean ALL data from the entire database by truncating all tables.
@@ -1058,6 +1075,10 @@ if __name__ == "__main__":
             app,
             batch_size=int(sys.argv[2]) if len(sys.argv) > 2 else 10
         ),
+        "rebuild-team-hierarchy": lambda: rebuild_team_hierarchy(
+            app,
+            tenant_id=int(sys.argv[2]) if len(sys.argv) > 2 else None
+        ),
     }
     
     if len(sys.argv) < 2:
@@ -1095,6 +1116,8 @@ if __name__ == "__main__":
         print("  fix-processing-candidates - Update stuck candidates from 'processing' to 'pending_review'")
         print("                        Usage: fix-processing-candidates [tenant_id]")
         print("                        Example: fix-processing-candidates 2")
+        print("  rebuild-team-hierarchy - Rebuild the team hierarchy closure table from manager_id")
+        print("                        Usage: rebuild-team-hierarchy [tenant_id]")
         print("  clean-data            - Clean candidate/tenant data, preserve jobs")
         print("                        Usage: clean-data [yes]")
         print("                        Pass 'yes' to skip confirmation prompt")
@@ -0,0 +1,59 @@
+"""add_job_posting_stat_counters
+
+Revision ID: a7d3e9c1f560
+Revises: f2c8a5e3b914
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9c1f560'
+down_revision: Union[str, Sequence[str], None] = 'f2c8a5e3b914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add incrementally maintained job posting statistics tables.
+
+    1. job_posting_stat_counters: job counts per visibility segment
+       (0 = scraped catalogue, N = tenant N's email jobs), platform and
+       sourcing user; incremented by the import paths.
+    2. job_posting_stat_snapshots: exact distinct company/location counts
+       from the last scheduled recompute.
+
+    Both are filled by the first recompute-job-posting-stats run; until then
+    statistics are aggregated from job_postings as before.
+    """
+    op.create_table(
+        'job_posting_stat_counters',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tenant_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('platform', sa.String(length=50), nullable=False),
+        sa.Column('sourced_by_user_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_jobs', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('active_jobs', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('remote_jobs', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tenant_id', 'platform', 'sourced_by_user_id', name='uq_job_posting_stat_counter_segment')
+    )
+    op.create_table(
+        'job_posting_stat_snapshots',
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.Column('unique_companies', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('unique_locations', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('tenant_id')
+    )
+
+
+def downgrade() -> None:
+    """Drop job posting statistics tables."""
+    op.drop_table('job_posting_stat_snapshots')
+    op.drop_table('job_posting_stat_counters')
@@ -0,0 +1,31 @@
+"""add_submission_stats_index
+
+Revision ID: b4f8d2a6c713
+Revises: a7d3e9c1f560
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f8d2a6c713'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e9c1f560'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index for the single-scan submission statistics query."""
+    op.create_index(
+        'idx_submission_tenant_user_submitted',
+        'submissions',
+        ['tenant_id', 'submitted_by_user_id', 'submitted_at']
+    )
+
+
+def downgrade() -> None:
+    """Drop submission statistics index."""
+    op.drop_index('idx_submission_tenant_user_submitted', table_name='submissions')
@@ -0,0 +1,73 @@
+"""add_portal_user_hierarchy_closure_table
+
+Revision ID: b7c1e4a92d10
+Revises: 9b5d6da3a341
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1e4a92d10'
+down_revision: Union[str, Sequence[str], None] = '9b5d6da3a341'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add portal_user_hierarchy closure table and backfill it from manager_id.
+
+    One row per (ancestor, descendant) pair with depth >= 1. Lets subtree
+    lookups and manager-cycle checks run as a single indexed query.
+    """
+    op.create_table(
+        'portal_user_hierarchy',
+        sa.Column('ancestor_id', sa.Integer(), nullable=False),
+        sa.Column('descendant_id', sa.Integer(), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['portal_users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['portal_users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+    )
+    op.create_index(
+        'idx_portal_user_hierarchy_descendant',
+        'portal_user_hierarchy',
+        ['descendant_id', 'depth']
+    )
+    op.create_index(
+        'idx_portal_user_hierarchy_tenant',
+        'portal_user_hierarchy',
+        ['tenant_id']
+    )
+
+    # Backfill from the existing manager_id tree (depth cap guards against bad data cycles)
+    op.execute(
+        """
+        WITH RECURSIVE closure (ancestor_id, descendant_id, depth, tenant_id) AS (
+            SELECT manager_id, id, 1, tenant_id
+            FROM portal_users
+            WHERE manager_id IS NOT NULL
+            UNION ALL
+            SELECT c.ancestor_id, u.id, c.depth + 1, c.tenant_id
+            FROM closure c
+            JOIN portal_users u ON u.manager_id = c.descendant_id
+            WHERE c.depth < 100
+        )
+        INSERT INTO portal_user_hierarchy (ancestor_id, descendant_id, depth, tenant_id)
+        SELECT ancestor_id, descendant_id, depth, tenant_id FROM closure
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop portal_user_hierarchy closure table."""
+    op.drop_index('idx_portal_user_hierarchy_tenant', table_name='portal_user_hierarchy')
+    op.drop_index('idx_portal_user_hierarchy_descendant', table_name='portal_user_hierarchy')
+    op.drop_table('portal_user_hierarchy')
@@ -0,0 +1,30 @@
+"""add_session_job_log_payload_reference
+
+Revision ID: c3a9e5f1d820
+Revises: b4f8d2a6c713
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9e5f1d820'
+down_revision: Union[str, Sequence[str], None] = 'b4f8d2a6c713'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add payload hash and blob key for reference-level session job logs."""
+    op.add_column('session_job_logs', sa.Column('payload_hash', sa.String(length=64), nullable=True))
+    op.add_column('session_job_logs', sa.Column('payload_key', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop session job log payload reference columns."""
+    op.drop_column('session_job_logs', 'payload_key')
+    op.drop_column('session_job_logs', 'payload_hash')
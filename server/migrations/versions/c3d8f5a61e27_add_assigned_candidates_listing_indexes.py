@@ -0,0 +1,45 @@
+"""add_assigned_candidates_listing_indexes
+
+Revision ID: c3d8f5a61e27
+Revises: b7c1e4a92d10
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d8f5a61e27'
+down_revision: Union[str, Sequence[str], None] = 'b7c1e4a92d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes backing the projection-based assigned-candidates listing.
+
+    1. candidate_assignments (assigned_to_user_id, status, assigned_at DESC):
+       explicit assignments for a user, already in display order.
+    2. candidates (tenant_id, updated_at DESC) WHERE is_visible_to_all_team:
+       broadcast-visible candidates for a tenant.
+    """
+    op.create_index(
+        'idx_assignment_assignee_status_assigned',
+        'candidate_assignments',
+        ['assigned_to_user_id', 'status', sa.text('assigned_at DESC')]
+    )
+    op.create_index(
+        'idx_candidates_tenant_broadcast_updated',
+        'candidates',
+        ['tenant_id', sa.text('updated_at DESC')],
+        postgresql_where=sa.text('is_visible_to_all_team = true')
+    )
+
+
+def downgrade() -> None:
+    """Drop assigned-candidates listing indexes."""
+    op.drop_index('idx_candidates_tenant_broadcast_updated', table_name='candidates')
+    op.drop_index('idx_assignment_assignee_status_assigned', table_name='candidate_assignments')
@@ -0,0 +1,36 @@
+"""add_skill_ids_columns
+
+Revision ID: d4a9e2b7c613
+Revises: c3d8f5a61e27
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a9e2b7c613'
+down_revision: Union[str, Sequence[str], None] = 'c3d8f5a61e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add canonical skill id arrays to candidates and job_postings.
+
+    Populated by the models whenever `skills` is assigned; existing rows are
+    filled by scripts/backfill_skill_ids.py (scorers compute ids on the fly
+    while a row's skill_ids is NULL).
+    """
+    op.add_column('candidates', sa.Column('skill_ids', postgresql.ARRAY(sa.BigInteger()), nullable=True))
+    op.add_column('job_postings', sa.Column('skill_ids', postgresql.ARRAY(sa.BigInteger()), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop canonical skill id arrays."""
+    op.drop_column('job_postings', 'skill_ids')
+    op.drop_column('candidates', 'skill_ids')
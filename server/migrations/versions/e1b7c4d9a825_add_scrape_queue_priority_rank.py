@@ -0,0 +1,64 @@
+"""add_scrape_queue_priority_rank
+
+Revision ID: e1b7c4d9a825
+Revises: d4a9e2b7c613
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b7c4d9a825'
+down_revision: Union[str, Sequence[str], None] = 'd4a9e2b7c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'urgent' THEN 4 WHEN 'high' THEN 3 "
+    "WHEN 'normal' THEN 2 WHEN 'low' THEN 1 END"
+)
+DEQUEUE_ORDER = [
+    sa.text('priority_rank DESC'),
+    sa.text('last_scraped_at ASC NULLS FIRST'),
+    sa.text('candidate_count DESC'),
+]
+
+
+def upgrade() -> None:
+    """Add a generated priority_rank and partial dequeue indexes to the scrape queues.
+
+    1. global_roles / role_location_queue.priority_rank: STORED generated column
+       (urgent=4, high=3, normal=2, low=1), replacing the CASE in ORDER BY.
+    2. (priority_rank DESC, last_scraped_at NULLS FIRST, candidate_count DESC)
+       WHERE queue_status = 'approved': the scraper dequeue order, so
+       FOR UPDATE SKIP LOCKED LIMIT 1 reads the first unlocked index entry.
+    """
+    for table in ('global_roles', 'role_location_queue'):
+        op.add_column(
+            table,
+            sa.Column('priority_rank', sa.Integer(), sa.Computed(PRIORITY_RANK_SQL, persisted=True), nullable=True)
+        )
+    op.create_index(
+        'idx_global_roles_dequeue',
+        'global_roles',
+        DEQUEUE_ORDER,
+        postgresql_where=sa.text("queue_status = 'approved'")
+    )
+    op.create_index(
+        'idx_role_location_queue_dequeue',
+        'role_location_queue',
+        DEQUEUE_ORDER,
+        postgresql_where=sa.text("queue_status = 'approved'")
+    )
+
+
+def downgrade() -> None:
+    """Drop dequeue indexes and priority_rank columns."""
+    op.drop_index('idx_role_location_queue_dequeue', table_name='role_location_queue')
+    op.drop_index('idx_global_roles_dequeue', table_name='global_roles')
+    op.drop_column('role_location_queue', 'priority_rank')
+    op.drop_column('global_roles', 'priority_rank')
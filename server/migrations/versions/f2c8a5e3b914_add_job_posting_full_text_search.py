@@ -0,0 +1,77 @@
+"""add_job_posting_full_text_search
+
+Revision ID: f2c8a5e3b914
+Revises: e1b7c4d9a825
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a5e3b914'
+down_revision: Union[str, Sequence[str], None] = 'e1b7c4d9a825'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def search_vector_sql(row: str) -> str:
+    """Weighted tsvector expression over a job_postings row reference (NEW or the table)."""
+    return (
+        f"setweight(to_tsvector('english', coalesce({row}title, '')), 'A') || "
+        f"setweight(to_tsvector('english', coalesce(array_to_string({row}skills, ' '), '')), 'B') || "
+        f"setweight(to_tsvector('english', coalesce({row}company, '')), 'C') || "
+        f"setweight(to_tsvector('english', coalesce({row}description, '')), 'D')"
+    )
+
+
+def upgrade() -> None:
+    """Add full-text and trigram search indexes to job_postings.
+
+    1. job_postings.search_vector: weighted tsvector (title A, skills B,
+       company C, description D) kept current by a BEFORE INSERT/UPDATE
+       trigger, backfilled for existing rows, with a GIN index.
+    2. pg_trgm GIN indexes on title, company and location so ILIKE '%term%'
+       filters and typeahead lookups use an index instead of a table scan.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('job_postings', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION job_postings_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {search_vector_sql('NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER job_postings_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, skills, company, description ON job_postings
+        FOR EACH ROW EXECUTE FUNCTION job_postings_search_vector_update()
+    """)
+    op.execute(f"UPDATE job_postings SET search_vector = {search_vector_sql('')}")
+
+    op.create_index('idx_job_posting_search_vector', 'job_postings', ['search_vector'], postgresql_using='gin')
+    for column in ('title', 'company', 'location'):
+        op.create_index(
+            f'idx_job_posting_{column}_trgm',
+            'job_postings',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Drop job posting search indexes, trigger and column (pg_trgm is left installed)."""
+    for column in ('location', 'company', 'title'):
+        op.drop_index(f'idx_job_posting_{column}_trgm', table_name='job_postings')
+    op.drop_index('idx_job_posting_search_vector', table_name='job_postings')
+    op.execute("DROP TRIGGER IF EXISTS job_postings_search_vector_trigger ON job_postings")
+    op.execute("DROP FUNCTION IF EXISTS job_postings_search_vector_update()")
+    op.drop_column('job_postings', 'search_vector')
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Script to fill candidates.skill_ids / job_postings.skill_ids from their skills.
+
+By default only rows with NULL skill_ids are processed. Pass --all after
+changing SKILL_SYNONYMS in app/utils/skill_vocabulary.py so every stored id
+follows the new vocabulary.
+
+Usage:
+    python scripts/backfill_skill_ids.py [--all] [batch_size]
+
+Example:
+    python scripts/backfill_skill_ids.py --all 2000
+"""
+import sys
+import os
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.models.candidate import Candidate
+from app.models.job_posting import JobPosting
+from app.utils.skill_vocabulary import SkillVocabulary
+from sqlalchemy import select, update
+
+
+def backfill(model, recompute_all: bool, batch_size: int) -> int:
+    """Recompute skill_ids for one table in id-ordered batches. Returns rows updated."""
+    updated = 0
+    last_id = 0
+    while True:
+        stmt = (
+            select(model.id, model.skills)
+            .where(model.id > last_id)
+            .order_by(model.id)
+            .limit(batch_size)
+        )
+        if not recompute_all:
+            stmt = stmt.where(model.skill_ids.is_(None))
+        rows = db.session.execute(stmt).all()
+        if not rows:
+            break
+
+        db.session.execute(
+            update(model),
+            [{"id": row_id, "skill_ids": SkillVocabulary.skill_ids(skills)} for row_id, skills in rows]
+        )
+        db.session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1][0]
+        print(f"    {model.__tablename__}: {updated} rows updated")
+    return updated
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--all"]
+    recompute_all = "--all" in sys.argv[1:]
+    batch_size = int(args[0]) if args else 1000
+
+    app = create_app()
+    with app.app_context():
+        for model in (Candidate, JobPosting):
+            print(f"Backfilling {model.__tablename__}.skill_ids ({'all rows' if recompute_all else 'NULL only'})")
+            total = backfill(model, recompute_all, batch_size)
+            print(f"Done: {total} {model.__tablename__} rows")
+
+
+if __name__ == "__main__":
+    main()
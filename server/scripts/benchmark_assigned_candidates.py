@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the "my candidates" listing for a recruiter with many assignments.
+
+Compares the legacy ORM path (CandidateAssignment rows + lazy `assignment.candidate`
+per row + full Candidate entities for broadcast candidates) with the projection
+query used by CandidateAssignmentService.get_user_assigned_candidates.
+
+Synthetic candidates/assignments are created inside a transaction that is rolled
+back at the end, so the database is left unchanged.
+
+Usage:
+    python scripts/benchmark_assigned_candidates.py <tenant_id> <user_id> [assigned] [broadcast] [runs]
+
+Example:
+    python scripts/benchmark_assigned_candidates.py 1 5 2000 200 10
+"""
+import os
+import statistics
+import sys
+import time
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert, select
+
+from app import create_app, db
+from app.models import Candidate, CandidateAssignment
+from app.services.candidate_assignment_service import CandidateAssignmentService
+
+
+def legacy_listing(user_id: int, tenant_id: int) -> list:
+    """Listing as implemented before the projection query (N+1 + full entities)."""
+    result = []
+    seen = set()
+    assignments = db.session.scalars(
+        select(CandidateAssignment)
+        .where(
+            CandidateAssignment.assigned_to_user_id == user_id,
+            CandidateAssignment.status.in_(['PENDING', 'ACCEPTED', 'ACTIVE'])
+        )
+        .order_by(CandidateAssignment.assigned_at.desc())
+    ).all()
+    for assignment in assignments:
+        if assignment.candidate:
+            seen.add(assignment.candidate.id)
+            result.append((assignment.candidate.id, assignment.candidate.first_name, assignment.id))
+
+    conditions = [Candidate.tenant_id == tenant_id, Candidate.is_visible_to_all_team == True]
+    if seen:
+        conditions.append(~Candidate.id.in_(seen))
+    for candidate in db.session.scalars(select(Candidate).where(*conditions).order_by(Candidate.updated_at.desc())):
+        result.append((candidate.id, candidate.first_name, None))
+    return result
+
+
+def measure(label: str, fn, runs: int) -> None:
+    """Run fn `runs` times with a cold identity map and print latency stats."""
+    engine = db.engine
+    statements = []
+
+    def count_statement(*_args, **_kwargs):
+        statements.append(1)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    timings = []
+    rows = 0
+    try:
+        for _ in range(runs):
+            db.session.expire_all()
+            statements.clear()
+            start = time.perf_counter()
+            rows = len(fn())
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))]
+    print(
+        f"{label:<28} rows={rows:<6} queries={len(statements):<6} "
+        f"p50={statistics.median(timings):8.1f} ms  p95={p95:8.1f} ms"
+    )
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    tenant_id = int(sys.argv[1])
+    user_id = int(sys.argv[2])
+    assigned_count = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+    broadcast_count = int(sys.argv[4]) if len(sys.argv) > 4 else 200
+    runs = int(sys.argv[5]) if len(sys.argv) > 5 else 10
+
+    app = create_app()
+    with app.app_context():
+        try:
+            print(f"Seeding {assigned_count} assigned + {broadcast_count} broadcast candidates (rolled back)...")
+            candidate_ids = db.session.scalars(
+                insert(Candidate).returning(Candidate.id),
+                [
+                    {
+                        'tenant_id': tenant_id,
+                        'first_name': f'Bench{i}',
+                        'last_name': 'Candidate',
+                        'email': f'bench{i}@example.invalid',
+                        'is_visible_to_all_team': i >= assigned_count,
+                        'work_experience': [{'title': 'Engineer', 'description': 'x' * 2000}],
+                        'embedding': [0.01] * 768,
+                    }
+                    for i in range(assigned_count + broadcast_count)
+                ]
+            ).all()
+            db.session.execute(
+                insert(CandidateAssignment),
+                [
+                    {
+                        'candidate_id': candidate_id,
+                        'assigned_to_user_id': user_id,
+                        'assigned_by_user_id': user_id,
+                        'status': 'ACCEPTED',
+                    }
+                    for candidate_id in candidate_ids[:assigned_count]
+                ]
+            )
+            db.session.flush()
+
+            measure("legacy ORM (N+1)", lambda: legacy_listing(user_id, tenant_id), runs)
+            measure(
+                "projection (full list)",
+                lambda: CandidateAssignmentService.get_user_assigned_candidates(user_id, tenant_id),
+                runs
+            )
+            measure(
+                "projection (page of 50)",
+                lambda: CandidateAssignmentService.get_user_assigned_candidates(
+                    user_id, tenant_id, limit=50, offset=0
+                ),
+                runs
+            )
+        finally:
+            db.session.rollback()
+
+
+if __name__ == "__main__":
+    main()
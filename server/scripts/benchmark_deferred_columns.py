@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Measure what deferring heavy Candidate/JobPosting columns saves.
+
+For each scenario the same query is run twice: once with every column loaded
+(the behaviour before the columns were deferred) and once with the default
+loading strategy plus only the loader options the code path opts into.
+Reports the estimated bytes the database returns (sum of pg_column_size of the
+selected rows), the Python heap allocated while materializing the ORM objects
+(tracemalloc peak) and the median wall time.
+
+Scenarios:
+    nightly candidates   - candidates loaded by the nightly match refresh
+    nightly jobs         - role-mapped ACTIVE jobs scored by the nightly refresh
+    candidate list page  - GET /api/candidates page (list_candidates)
+
+Usage:
+    python scripts/benchmark_deferred_columns.py <tenant_id> [runs] [per_page]
+
+Example:
+    python scripts/benchmark_deferred_columns.py 1 5 100
+"""
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Load
+
+from app import create_app, db
+from app.models import Candidate, CandidateGlobalRole, JobPosting
+from app.models.role_job_mapping import RoleJobMapping
+
+
+def transfer_bytes(stmt) -> int:
+    """Estimate bytes returned by stmt as the sum of pg_column_size over its rows."""
+    compiled = stmt.compile(dialect=db.engine.dialect, compile_kwargs={"literal_binds": True})
+    return int(db.session.scalar(
+        text(f"SELECT coalesce(sum(pg_column_size(q.*)), 0) FROM ({compiled.string}) AS q")
+    ) or 0)
+
+
+def load(stmt) -> tuple:
+    """Materialize stmt into ORM objects with an empty identity map.
+
+    Returns:
+        (row count, peak traced bytes, elapsed ms)
+    """
+    db.session.expunge_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = db.session.scalars(stmt).all()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(rows)
+    del rows
+    db.session.expunge_all()
+    return count, peak, elapsed
+
+
+def compare(label: str, full_stmt, deferred_stmt, runs: int) -> None:
+    """Print full-row vs deferred-column measurements for one scenario."""
+    print(f"\n{label}")
+    results = {}
+    for variant, stmt in (("all columns", full_stmt), ("deferred", deferred_stmt)):
+        samples = [load(stmt) for _ in range(runs)]
+        results[variant] = (
+            samples[-1][0],
+            transfer_bytes(stmt),
+            max(peak for _, peak, _ in samples),
+            statistics.median(elapsed for _, _, elapsed in samples),
+        )
+        rows, wire, heap, ms = results[variant]
+        print(
+            f"  {variant:<12} rows={rows:<6} transfer={wire / 1024:10.1f} KiB  "
+            f"heap={heap / 1024:10.1f} KiB  p50={ms:8.1f} ms"
+        )
+
+    full_wire, full_heap = results["all columns"][1:3]
+    new_wire, new_heap = results["deferred"][1:3]
+    if full_wire and full_heap:
+        print(
+            f"  reduction    transfer={100 * (1 - new_wire / full_wire):5.1f}%  "
+            f"heap={100 * (1 - new_heap / full_heap):5.1f}%"
+        )
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    tenant_id = int(sys.argv[1])
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    per_page = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    app = create_app()
+    with app.app_context():
+        # Nightly match refresh (process_tenant_matches_step): candidates
+        candidates_stmt = select(Candidate).where(
+            Candidate.tenant_id == tenant_id,
+            Candidate.status.in_(['approved', 'ready_for_assignment']),
+            Candidate.embedding.isnot(None),
+        )
+        compare(
+            "nightly candidates",
+            candidates_stmt.options(Load(Candidate).undefer("*")),
+            candidates_stmt.options(Candidate.with_embedding()),
+            runs,
+        )
+
+        # Nightly match refresh: jobs reachable from the tenant's candidate roles
+        role_ids = (
+            select(CandidateGlobalRole.global_role_id)
+            .join(Candidate, CandidateGlobalRole.candidate_id == Candidate.id)
+            .where(Candidate.tenant_id == tenant_id)
+        )
+        job_ids = select(RoleJobMapping.job_posting_id).where(RoleJobMapping.global_role_id.in_(role_ids))
+        jobs_stmt = select(JobPosting).where(
+            JobPosting.id.in_(job_ids),
+            JobPosting.embedding.isnot(None),
+            JobPosting.status == 'ACTIVE',
+        )
+        compare(
+            "nightly jobs",
+            jobs_stmt.options(Load(JobPosting).undefer("*")),
+            jobs_stmt.options(JobPosting.with_embedding()),
+            runs,
+        )
+
+        # Candidate list endpoint (CandidateService.list_candidates)
+        list_stmt = (
+            select(Candidate)
+            .where(Candidate.tenant_id == tenant_id)
+            .order_by(Candidate.created_at.desc())
+            .limit(per_page)
+        )
+        compare(
+            "candidate list page",
+            list_stmt.options(Load(Candidate).undefer("*")),
+            list_stmt,
+            runs,
+        )
+
+
+if __name__ == "__main__":
+    main()
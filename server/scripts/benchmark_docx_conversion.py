@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX -> PDF conversion latency: one soffice per file vs the warm pool.
+
+Scenarios (synthetic resumes generated with python-docx, no database needed):
+    process  - settings.docx_pdf_pool_size = 0: a fresh soffice per conversion
+    pool     - warm LibreOffice instances (requires the Python-UNO bridge)
+    cached   - the same files again, served from the content-hash cache
+
+Each scenario converts every file from `concurrency` threads (an onboarding
+burst) and prints p50/p95 per-conversion latency and wall time. The PDF cache
+is pointed at a temporary directory and only enabled for the cached run.
+
+Usage:
+    python scripts/benchmark_docx_conversion.py [files] [concurrency]
+
+Example:
+    python scripts/benchmark_docx_conversion.py 40 4
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from app.utils import libreoffice_pool
+from app.utils.docx_converter import DocxToPdfConverter
+from config.settings import settings
+
+
+def write_resume(path: str, index: int) -> None:
+    """Write a two-page resume-like DOCX, unique per index."""
+    document = Document()
+    document.add_heading(f"Candidate {index}", level=1)
+    document.add_paragraph(f"candidate{index}@example.com | +1 555 {index:04d}")
+    for section in ("Summary", "Experience", "Education", "Skills"):
+        document.add_heading(section, level=2)
+        for line in range(12):
+            document.add_paragraph(
+                f"{section} item {line}: delivered services in Python, SQL and cloud tooling "
+                f"for team {index}-{line}, improving reliability and throughput."
+            )
+    document.save(path)
+
+
+def run(label: str, files: list, out_dir: str, concurrency: int) -> None:
+    """Convert all files concurrently and print latency percentiles."""
+    def convert(path: str) -> float:
+        started = time.perf_counter()
+        DocxToPdfConverter.convert_to_pdf(path, os.path.join(out_dir, os.path.basename(path) + ".pdf"))
+        return (time.perf_counter() - started) * 1000
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(convert, files))
+    wall = time.perf_counter() - wall_start
+
+    p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+    print(
+        f"{label:<8} n={len(latencies):<4} p50={statistics.median(latencies):9.1f} ms  "
+        f"p95={p95:9.1f} ms  wall={wall:7.2f} s"
+    )
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    if not DocxToPdfConverter._check_libreoffice_installed():
+        sys.exit("LibreOffice (soffice) is not installed")
+
+    work_dir = tempfile.mkdtemp(prefix="docx_bench_")
+    try:
+        files = []
+        for i in range(file_count):
+            path = os.path.join(work_dir, f"resume_{i}.docx")
+            write_resume(path, i)
+            files.append(path)
+        out_dir = os.path.join(work_dir, "out")
+        os.makedirs(out_dir)
+
+        pool_size = settings.docx_pdf_pool_size
+        settings.docx_pdf_cache_dir = os.path.join(work_dir, "cache")
+        settings.docx_pdf_cache_max_entries = 0
+
+        print(f"{file_count} files, {concurrency} concurrent conversions")
+        settings.docx_pdf_pool_size = 0
+        run("process", files, out_dir, concurrency)
+
+        settings.docx_pdf_pool_size = pool_size or 2
+        if libreoffice_pool.get_pool() is None:
+            print("pool     skipped: Python-UNO bridge (import uno) not available")
+        else:
+            # Warm-up: start every instance before timing
+            run("warmup", files[:settings.docx_pdf_pool_size], out_dir, settings.docx_pdf_pool_size)
+            run("pool", files, out_dir, concurrency)
+
+        settings.docx_pdf_cache_max_entries = file_count
+        run("fill", files, out_dir, concurrency)
+        run("cached", files, out_dir, concurrency)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark fuzzy skill matching: pairwise SequenceMatcher vs the n-gram index.
+
+Scenarios (synthetic, no database needed):
+    resume parsing   - SkillsMatcher._fuzzy_match over resume-like text with typos
+    nightly scoring  - fuzzy pass of skill matching for candidates x jobs
+
+Each scenario runs the legacy pairwise scan and the indexed lookup, asserts the
+results are identical and prints the median wall time. The ratio memo is
+cleared before every indexed run so timings do not benefit from earlier runs.
+
+Usage:
+    python scripts/benchmark_fuzzy_skill_matching.py [runs] [candidates] [jobs]
+
+Example:
+    python scripts/benchmark_fuzzy_skill_matching.py 5 200 300
+"""
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.fuzzy_index import sequence_ratio
+from app.utils.skill_vocabulary import SKILL_SYNONYMS, SkillVocabulary
+from app.utils.skills_matcher import SkillsMatcher
+
+FUZZY_THRESHOLD = 0.85
+FILLER_WORDS = (
+    "designed implemented maintained services across teams delivering features "
+    "with strong ownership and customer focus using modern tooling"
+).split()
+
+
+def typo(word: str, rng: random.Random) -> str:
+    """Apply one random insert/delete/substitute edit to word."""
+    chars = list(word)
+    pos = rng.randrange(len(chars) + 1)
+    edit = rng.random()
+    if edit < 0.33 and len(chars) > 1:
+        chars.pop(min(pos, len(chars) - 1))
+    elif edit < 0.66:
+        chars.insert(pos, rng.choice(string.ascii_lowercase))
+    else:
+        chars[min(pos, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def legacy_fuzzy_match(matcher: SkillsMatcher, text: str, exclude: list) -> list:
+    """SkillsMatcher._fuzzy_match as implemented before the n-gram index."""
+    matched = set()
+    exclude_lower = {s.lower() for s in exclude}
+    for word in text.split():
+        word_clean = word.strip('.,;:()[]{}\"\'').lower()
+        if len(word_clean) < 3 or word_clean in exclude_lower:
+            continue
+        for skill_lower, skill in matcher.skills_lower.items():
+            if skill.lower() in exclude_lower:
+                continue
+            if SequenceMatcher(None, word_clean, skill_lower).ratio() >= matcher.fuzzy_threshold:
+                matched.add(skill)
+                break
+    return sorted(matched)
+
+
+def legacy_fuzzy_pass(candidate_skills: list, job_skills: list) -> list:
+    """Per-pair fuzzy pass as implemented before the n-gram index."""
+    return [
+        job_skill for job_skill in job_skills
+        if any(SequenceMatcher(None, job_skill, cs).ratio() >= FUZZY_THRESHOLD for cs in candidate_skills)
+    ]
+
+
+def indexed_fuzzy_pass(candidate_skills: list, job_skills: list) -> list:
+    """Fuzzy pass through the cached per-candidate n-gram index."""
+    index = SkillVocabulary.fuzzy_index(tuple(candidate_skills))
+    return [job_skill for job_skill in job_skills if index.first_match(job_skill, FUZZY_THRESHOLD) is not None]
+
+
+def clear_memos() -> None:
+    """Drop memoized ratios and per-candidate indexes."""
+    sequence_ratio.cache_clear()
+    SkillVocabulary.fuzzy_index.cache_clear()
+
+
+def timed(fn, runs: int, before=None):
+    """Run fn `runs` times; return (last result, median ms)."""
+    timings = []
+    result = None
+    for _ in range(runs):
+        if before:
+            before()
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(timings)
+
+
+def report(label: str, legacy_ms: float, indexed_ms: float) -> None:
+    """Print one scenario's timings."""
+    speedup = legacy_ms / indexed_ms if indexed_ms else float("inf")
+    print(f"{label:<18} pairwise={legacy_ms:10.1f} ms  indexed={indexed_ms:10.1f} ms  speedup={speedup:6.1f}x")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    candidate_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    job_count = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+
+    rng = random.Random(42)
+
+    # Resume parsing: ~800 words mixing filler, skills and misspelled skills
+    matcher = SkillsMatcher()
+    skill_words = [w.lower() for skill in matcher.all_skills for w in skill.split() if len(w) >= 3]
+    words = []
+    for _ in range(800):
+        roll = rng.random()
+        if roll < 0.6:
+            words.append(rng.choice(FILLER_WORDS))
+        elif roll < 0.8:
+            words.append(rng.choice(skill_words))
+        else:
+            words.append(typo(rng.choice(skill_words), rng))
+    resume_text = " ".join(words)
+    exact = matcher._exact_match(resume_text)
+
+    legacy, legacy_ms = timed(lambda: legacy_fuzzy_match(matcher, resume_text, exact), runs)
+    indexed, indexed_ms = timed(lambda: sorted(matcher._fuzzy_match(resume_text, exact)), runs, clear_memos)
+    assert legacy == indexed, "resume fuzzy matches differ"
+    report("resume parsing", legacy_ms, indexed_ms)
+
+    # Nightly scoring: every candidate against every job's unresolved skills
+    vocabulary = list(SKILL_SYNONYMS) + [syn for syns in SKILL_SYNONYMS.values() for syn in syns]
+    candidates = [
+        [typo(s, rng) if rng.random() < 0.2 else s for s in rng.sample(vocabulary, rng.randint(10, 40))]
+        for _ in range(candidate_count)
+    ]
+    jobs = [
+        [typo(s, rng) if rng.random() < 0.3 else s for s in rng.sample(vocabulary, rng.randint(5, 15))]
+        for _ in range(job_count)
+    ]
+
+    def run(fuzzy_pass):
+        return [fuzzy_pass(candidate, job) for candidate in candidates for job in jobs]
+
+    legacy, legacy_ms = timed(lambda: run(legacy_fuzzy_pass), runs)
+    indexed, indexed_ms = timed(lambda: run(indexed_fuzzy_pass), runs, clear_memos)
+    assert legacy == indexed, "skill score fuzzy matches differ"
+    report("nightly scoring", legacy_ms, indexed_ms)
+
+    print("results identical: yes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scraper dequeue query under many concurrent scrapers.
+
+Compares the legacy dequeue (ORDER BY a CASE on priority, no LIMIT, FOR UPDATE
+SKIP LOCKED) with the indexed one used by ScrapeQueueService
+(ORDER BY priority_rank ... LIMIT 1 served by idx_global_roles_dequeue).
+
+Each simulated scraper has its own connection and repeatedly claims the next
+approved role, holds the row lock for a while (as session creation does), then
+rolls back. Reported per strategy: dequeue latency, polls that found nothing to
+claim, and roles claimed by two scrapers at once (must be 0).
+
+Synthetic approved roles are committed before the run and deleted afterwards, so
+run this against a non-production database (existing approved roles are also
+visible to the benchmark, but nothing is modified).
+
+Usage:
+    python scripts/benchmark_scrape_queue_dequeue.py [scrapers] [roles] [polls] [hold_ms]
+
+Example:
+    python scripts/benchmark_scrape_queue_dequeue.py 32 20000 50 20
+"""
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add the server directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import case, create_engine, delete, insert, select
+
+from app import create_app, db
+from app.models.global_role import GlobalRole
+
+PRIORITIES = ['urgent', 'high', 'normal', 'low']
+
+LEGACY_DEQUEUE = select(GlobalRole.id).where(
+    GlobalRole.queue_status == "approved"
+).order_by(
+    case(
+        (GlobalRole.priority == "urgent", 4),
+        (GlobalRole.priority == "high", 3),
+        (GlobalRole.priority == "normal", 2),
+        (GlobalRole.priority == "low", 1),
+    ).desc(),
+    GlobalRole.last_scraped_at.asc().nulls_first(),
+    GlobalRole.candidate_count.desc()
+).with_for_update(skip_locked=True)
+
+INDEXED_DEQUEUE = select(GlobalRole.id).where(
+    GlobalRole.queue_status == "approved"
+).order_by(
+    GlobalRole.priority_rank.desc(),
+    GlobalRole.last_scraped_at.asc().nulls_first(),
+    GlobalRole.candidate_count.desc()
+).limit(1).with_for_update(skip_locked=True)
+
+
+def seed_roles(count: int, tag: str) -> None:
+    """Commit `count` approved synthetic roles named after tag."""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    for start in range(0, count, 1000):
+        db.session.execute(
+            insert(GlobalRole),
+            [
+                {
+                    'name': f'{tag}-{i}',
+                    'embedding': [0.0] * 768,
+                    'queue_status': 'approved',
+                    'priority': rng.choice(PRIORITIES),
+                    'candidate_count': rng.randint(0, 200),
+                    'last_scraped_at': None if rng.random() < 0.1 else now - timedelta(minutes=rng.randint(0, 100000)),
+                }
+                for i in range(start, min(start + 1000, count))
+            ]
+        )
+    db.session.commit()
+
+
+def run_scrapers(engine, stmt, scrapers: int, polls: int, hold_seconds: float) -> dict:
+    """Run `scrapers` threads each polling `polls` times; return latency and correctness stats."""
+    held = set()
+    held_lock = threading.Lock()
+    latencies = []
+    stats = {'empty': 0, 'duplicates': 0}
+    start_barrier = threading.Barrier(scrapers)
+
+    def scraper():
+        with engine.connect() as conn:
+            start_barrier.wait()
+            for _ in range(polls):
+                trans = conn.begin()
+                try:
+                    started = time.perf_counter()
+                    row = conn.execute(stmt).first()
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with held_lock:
+                        latencies.append(elapsed)
+                        if row is None:
+                            stats['empty'] += 1
+                        elif row[0] in held:
+                            stats['duplicates'] += 1
+                        else:
+                            held.add(row[0])
+                    time.sleep(hold_seconds)
+                    if row is not None:
+                        with held_lock:
+                            held.discard(row[0])
+                finally:
+                    trans.rollback()
+
+    threads = [threading.Thread(target=scraper) for _ in range(scrapers)]
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats['wall_seconds'] = time.perf_counter() - wall_start
+    stats['latencies'] = sorted(latencies)
+    return stats
+
+
+def report(label: str, stats: dict) -> None:
+    """Print one strategy's results."""
+    latencies = stats['latencies']
+    p95 = latencies[min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))]
+    print(
+        f"{label:<10} polls={len(latencies):<6} empty={stats['empty']:<6} duplicates={stats['duplicates']:<3} "
+        f"p50={statistics.median(latencies):8.2f} ms  p95={p95:8.2f} ms  wall={stats['wall_seconds']:6.1f} s"
+    )
+
+
+def main():
+    scrapers = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    role_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    polls = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    hold_seconds = (int(sys.argv[4]) if len(sys.argv) > 4 else 20) / 1000
+
+    app = create_app()
+    with app.app_context():
+        # One connection per scraper without waiting on the app's pool
+        engine = create_engine(db.engine.url, pool_size=scrapers, max_overflow=0)
+
+        tag = f'bench-dequeue-{uuid.uuid4().hex[:8]}'
+        print(f"Seeding {role_count} approved roles ({tag}-*)...")
+        seed_roles(role_count, tag)
+        try:
+            db.session.execute(db.text('ANALYZE global_roles'))
+            db.session.commit()
+            for label, stmt in (('legacy', LEGACY_DEQUEUE), ('indexed', INDEXED_DEQUEUE)):
+                compiled = stmt.compile(engine, compile_kwargs={'literal_binds': True})
+                plan = db.session.execute(db.text(f'EXPLAIN {compiled}')).scalars().all()
+                db.session.rollback()
+                print(f"\n{label} plan:\n    " + "\n    ".join(plan))
+
+            print(f"\n{scrapers} scrapers x {polls} polls, holding each claim {hold_seconds * 1000:.0f} ms")
+            report('legacy', run_scrapers(engine, LEGACY_DEQUEUE, scrapers, polls, hold_seconds))
+            report('indexed', run_scrapers(engine, INDEXED_DEQUEUE, scrapers, polls, hold_seconds))
+        finally:
+            db.session.rollback()
+            db.session.execute(delete(GlobalRole).where(GlobalRole.name.like(f'{tag}-%')))
+            db.session.commit()
+            engine.dispose()
+            print(f"Removed synthetic roles ({tag}-*)")
+
+
+if __name__ == "__main__":
+    main()
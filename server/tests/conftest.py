@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures.
+
+Tests run without PostgreSQL or a Redis server: database access is replaced
+per test (monkeypatching db.session or the service method that queries), and
+Redis is an in-memory fakeredis instance.
+"""
+import os
+import sys
+
+import fakeredis
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import app as app_module  # noqa: E402
+from config.settings import settings  # noqa: E402
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """In-memory Redis installed as app.redis_client (decode_responses like production)."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(app_module, "redis_client", client)
+    return client
+
+
+@pytest.fixture
+def no_redis(monkeypatch):
+    """Run with Redis unavailable (app.redis_client is None)."""
+    monkeypatch.setattr(app_module, "redis_client", None)
+
+
+@pytest.fixture
+def override_settings(monkeypatch):
+    """Set settings attributes for one test: override_settings(name=value, ...)."""
+    def apply(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(settings, name, value)
+    return apply
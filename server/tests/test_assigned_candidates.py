@@ -0,0 +1,75 @@
+"""Tests for the projection-based assigned-candidate listing."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import candidate_assignment_service as service_module
+from app.services.candidate_assignment_service import CandidateAssignmentService
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def listing_row(**overrides):
+    values = dict(
+        candidate_id=5, first_name="Ada", last_name="L", email="ada@example.com", phone=None,
+        onboarding_status="APPROVED", is_visible_to_all_team=False, assignment_id=9, assigned_to_user_id=2,
+        assigned_by_user_id=1, assignment_type="MANUAL", status="ACCEPTED", assignment_reason=None,
+        assigned_at=datetime(2026, 3, 1, 12, 0), completed_at=None, source_rank=0,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.parametrize("status_filter, include_completed", [(None, False), ("ACTIVE", False)])
+def test_active_listing_unions_broadcast_candidates(status_filter, include_completed):
+    sql = compile_sql(CandidateAssignmentService._assigned_candidates_query(2, 1, status_filter, include_completed))
+
+    assert "UNION ALL" in sql
+    assert "NOT (EXISTS" in sql
+    assert "embedding" not in sql
+    assert "ORDER BY assigned_candidates.source_rank" in sql
+
+
+@pytest.mark.parametrize("status_filter, include_completed", [(None, True), ("COMPLETED", False)])
+def test_completed_listing_has_no_broadcast_part(status_filter, include_completed):
+    sql = compile_sql(CandidateAssignmentService._assigned_candidates_query(2, 1, status_filter, include_completed))
+
+    assert "UNION ALL" not in sql
+
+
+def test_row_maps_active_statuses_for_frontend():
+    result = CandidateAssignmentService._assigned_candidate_row_to_dict(listing_row())
+
+    assert result["id"] == 5
+    assert result["current_assignment"]["status"] == "ACTIVE"
+    assert result["current_assignment"]["assigned_at"] == "2026-03-01T12:00:00"
+    assert CandidateAssignmentService._assigned_candidate_row_to_dict(
+        listing_row(status="COMPLETED")
+    )["current_assignment"]["status"] == "COMPLETED"
+
+
+def test_pagination_is_applied_in_sql(monkeypatch):
+    executed = []
+    session = SimpleNamespace(
+        get=lambda model, user_id: SimpleNamespace(id=user_id, tenant_id=1),
+        execute=lambda stmt: executed.append(stmt) or [listing_row()],
+    )
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=session))
+
+    result = CandidateAssignmentService.get_user_assigned_candidates(2, 1, limit=20, offset=40)
+
+    assert [candidate["id"] for candidate in result] == [5]
+    sql = str(executed[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert sql.endswith("LIMIT 20 OFFSET 40")
+
+
+def test_user_from_other_tenant_is_rejected(monkeypatch):
+    session = SimpleNamespace(get=lambda model, user_id: SimpleNamespace(id=user_id, tenant_id=99))
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=session))
+
+    with pytest.raises(ValueError):
+        CandidateAssignmentService.get_user_assigned_candidates(2, 1)
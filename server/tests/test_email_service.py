@@ -0,0 +1,89 @@
+"""Tests for EmailService SMTP config caching and email templates."""
+import pytest
+
+from app.services.email_service import EmailService
+from app.utils.email_templates import render_email_template
+
+
+@pytest.fixture
+def smtp_loads(monkeypatch):
+    """Count database loads of tenant SMTP config."""
+    calls = []
+
+    def load(tenant_id):
+        calls.append(tenant_id)
+        return {"host": f"smtp-{tenant_id}", "password": "secret"}
+
+    EmailService.invalidate_smtp_config_cache()
+    monkeypatch.setattr(EmailService, "_load_tenant_smtp_config", staticmethod(load))
+    yield calls
+    EmailService.invalidate_smtp_config_cache()
+
+
+class TestSmtpConfigCache:
+    def test_repeated_lookups_load_once(self, smtp_loads, override_settings):
+        override_settings(email_smtp_config_cache_ttl=300)
+
+        first = EmailService._get_tenant_smtp_config(1)
+        second = EmailService._get_tenant_smtp_config(1)
+
+        assert first == second == {"host": "smtp-1", "password": "secret"}
+        assert smtp_loads == [1]
+
+    def test_tenants_are_cached_separately(self, smtp_loads, override_settings):
+        override_settings(email_smtp_config_cache_ttl=300)
+
+        assert EmailService._get_tenant_smtp_config(1)["host"] == "smtp-1"
+        assert EmailService._get_tenant_smtp_config(2)["host"] == "smtp-2"
+        assert smtp_loads == [1, 2]
+
+    def test_invalidate_reloads_tenant(self, smtp_loads, override_settings):
+        override_settings(email_smtp_config_cache_ttl=300)
+        EmailService._get_tenant_smtp_config(1)
+        EmailService._get_tenant_smtp_config(2)
+
+        EmailService.invalidate_smtp_config_cache(1)
+        EmailService._get_tenant_smtp_config(1)
+        EmailService._get_tenant_smtp_config(2)
+
+        assert smtp_loads == [1, 2, 1]
+
+    def test_zero_ttl_disables_cache(self, smtp_loads, override_settings):
+        override_settings(email_smtp_config_cache_ttl=0)
+
+        EmailService._get_tenant_smtp_config(1)
+        EmailService._get_tenant_smtp_config(1)
+
+        assert smtp_loads == [1, 1]
+
+
+class TestEmailTemplates:
+    def test_invitation_text_renders_context(self):
+        body = render_email_template(
+            "invitation.txt",
+            greeting="Hi Sam",
+            company_name="Acme",
+            onboarding_url="https://example.com/onboard/abc",
+            expiry_date="January 1, 2027",
+        )
+
+        assert body.startswith("Hi Sam,")
+        assert "join Acme!" in body
+        assert "https://example.com/onboard/abc" in body
+        assert "January 1, 2027" in body
+
+    def test_html_templates_escape_values(self):
+        body = render_email_template(
+            "invitation.html",
+            greeting="Hi <b>Sam</b>",
+            company_name="Acme & Co",
+            onboarding_url="https://example.com/onboard/abc",
+            expiry_date="January 1, 2027",
+        )
+
+        assert "Hi &lt;b&gt;Sam&lt;/b&gt;" in body
+        assert "Acme &amp; Co" in body
+
+    def test_missing_variable_raises(self):
+        with pytest.raises(Exception):
+            render_email_template("invitation.txt", greeting="Hi")
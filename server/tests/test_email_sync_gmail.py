@@ -0,0 +1,275 @@
+"""Tests for the pipelined Gmail fetch (metadata prefilter, then full fetch of matches)."""
+import base64
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import email_sync_service as service_module
+from app.services.email_sync_service import GMAIL_BATCH_SIZE, EmailSyncService
+
+
+def _encode(text):
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _message(message_id, subject, message_format):
+    headers = [
+        {"name": "Subject", "value": subject},
+        {"name": "From", "value": "recruiter@example.com"},
+        {"name": "Date", "value": "Tue, 06 Oct 2026 09:30:00 +0000"},
+    ]
+    payload = {"headers": headers}
+    if message_format == "full":
+        payload["body"] = {"data": _encode(f"Body of {message_id}")}
+    return {"id": message_id, "threadId": f"t-{message_id}", "payload": payload}
+
+
+class FakeGmail:
+    """
+    Gmail client double: messages().list pages over `pages`, batched
+    messages().get answers from `subjects` and fails for IDs in `failing`.
+    """
+
+    def __init__(self, subjects, pages=(), failing=(), delay=0.0):
+        self.subjects = subjects
+        self.pages = list(pages)
+        self.failing = set(failing)
+        self.delay = delay
+        self.list_calls = []
+        self.batches = []
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def list(self, **params):
+        self.list_calls.append(params)
+        index = len(self.list_calls) - 1
+        result = {"messages": [{"id": mid} for mid in self.pages[index]]}
+        if index + 1 < len(self.pages):
+            result["nextPageToken"] = f"page-{index + 1}"
+        return SimpleNamespace(execute=lambda: result)
+
+    def get(self, **params):
+        return params
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+
+class FakeBatch:
+    def __init__(self, gmail, callback):
+        self.gmail = gmail
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        gmail = self.gmail
+        with gmail.lock:
+            gmail.batches.append([request for _, request in self.requests])
+            gmail.in_flight += 1
+            gmail.max_in_flight = max(gmail.max_in_flight, gmail.in_flight)
+        time.sleep(gmail.delay)
+        with gmail.lock:
+            gmail.in_flight -= 1
+        for request_id, request in self.requests:
+            if request_id in gmail.failing:
+                self.callback(request_id, None, RuntimeError("rate limited"))
+            else:
+                self.callback(
+                    request_id, _message(request_id, gmail.subjects[request_id], request["format"]), None
+                )
+
+
+@pytest.fixture
+def sync_service(monkeypatch):
+    """EmailSyncService that matches subjects containing 'engineer' and has no processed emails."""
+    service = EmailSyncService()
+    service.processed = set()
+    service.checked = []
+
+    def matches(subject, sender, preferred_roles):
+        if "engineer" in subject.lower():
+            return True, "role:engineer", preferred_roles.get("engineer")
+        return False, None, None
+
+    def check_processed(integration_id, email_ids):
+        service.checked.append(list(email_ids))
+        return {mid for mid in email_ids if mid in service.processed}
+
+    monkeypatch.setattr(service, "_matches_job_criteria", matches)
+    monkeypatch.setattr(service, "_batch_check_processed", check_processed)
+    return service
+
+
+@pytest.fixture
+def install_gmail(monkeypatch):
+    """Make build_gmail_service return the given fake; records how many clients were built."""
+    built = []
+
+    def install(gmail):
+        def build(access_token):
+            built.append(access_token)
+            return gmail
+        monkeypatch.setattr(service_module.gmail_oauth_service, "build_gmail_service", build)
+        return built
+
+    return install
+
+
+def test_only_matching_unprocessed_messages_are_fetched_in_full(sync_service, install_gmail):
+    subjects = {
+        "m1": "Senior Engineer role",
+        "m2": "Your weekly newsletter",
+        "m3": "Data Engineer opening",
+        "m4": "Backend Engineer",
+    }
+    gmail = FakeGmail(subjects)
+    install_gmail(gmail)
+    sync_service.processed = {"m3"}
+
+    emails, stats = sync_service._fetch_gmail_messages_pipelined(
+        "token", [["m1", "m2"], ["m3", "m4"]], 5, {"engineer": 42}
+    )
+
+    assert stats == {"listed": 4, "prefiltered": 1, "already_processed": 1, "full_fetched": 2}
+    full_ids = sorted(r["id"] for batch in gmail.batches for r in batch if r["format"] == "full")
+    assert full_ids == ["m1", "m4"]
+    metadata_requests = [r for batch in gmail.batches for r in batch if r["format"] == "metadata"]
+    assert len(metadata_requests) == 4
+    assert all(r["metadataHeaders"] == ["Subject", "From", "Date"] for r in metadata_requests)
+
+    by_id = {email["id"]: email for email in emails}
+    assert sorted(by_id) == ["m1", "m4"]
+    assert by_id["m1"]["match_reason"] == "role:engineer"
+    assert by_id["m1"]["global_role_id"] == 42
+    assert by_id["m1"]["body"] == "Body of m1"
+    assert by_id["m1"]["thread_id"] == "t-m1"
+
+
+def test_pages_are_split_into_gmail_batches(sync_service, install_gmail):
+    ids = [f"m{i}" for i in range(GMAIL_BATCH_SIZE * 2 + 5)]
+    gmail = FakeGmail({mid: "newsletter" for mid in ids})
+    install_gmail(gmail)
+
+    emails, stats = sync_service._fetch_gmail_messages_pipelined("token", [ids], 5, {})
+
+    assert emails == []
+    assert stats["listed"] == len(ids)
+    assert stats["prefiltered"] == len(ids)
+    assert sorted(len(batch) for batch in gmail.batches) == [5, GMAIL_BATCH_SIZE, GMAIL_BATCH_SIZE]
+
+
+def test_batches_in_flight_are_bounded_by_concurrency(sync_service, install_gmail, override_settings):
+    override_settings(email_sync_gmail_fetch_concurrency=2)
+    pages = [[f"p{page}-{i}" for i in range(3)] for page in range(6)]
+    gmail = FakeGmail({mid: "newsletter" for page in pages for mid in page}, delay=0.02)
+    built = install_gmail(gmail)
+
+    _, stats = sync_service._fetch_gmail_messages_pipelined("token", pages, 5, {})
+
+    assert stats["listed"] == 18
+    assert len(gmail.batches) == 6
+    assert gmail.max_in_flight == 2
+    # One Gmail client per worker thread, not per batch
+    assert 1 <= len(built) <= 2
+
+
+def test_listing_continues_while_batches_are_fetched(sync_service, install_gmail, override_settings):
+    override_settings(email_sync_gmail_fetch_concurrency=2)
+    gmail = FakeGmail({"a": "newsletter", "b": "newsletter"})
+    install_gmail(gmail)
+    next_page_listed = threading.Event()
+    overlapped = []
+    execute = FakeBatch.execute
+
+    def blocking_execute(batch):
+        if batch.requests[0][0] == "a":
+            # The first batch is still in flight when the next page is requested
+            overlapped.append(next_page_listed.wait(timeout=2))
+        execute(batch)
+
+    def pages():
+        yield ["a"]
+        next_page_listed.set()
+        yield ["b"]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FakeBatch, "execute", blocking_execute)
+        _, stats = sync_service._fetch_gmail_messages_pipelined("token", pages(), 5, {})
+
+    assert overlapped == [True]
+    assert stats["listed"] == 2
+    assert len(gmail.batches) == 2
+
+
+def test_per_message_errors_do_not_fail_the_sync(sync_service, install_gmail):
+    gmail = FakeGmail({"m1": "Engineer", "m2": "Engineer"}, failing={"m2"})
+    install_gmail(gmail)
+
+    emails, stats = sync_service._fetch_gmail_messages_pipelined("token", [["m1", "m2"]], 5, {})
+
+    assert [email["id"] for email in emails] == ["m1"]
+    assert stats["full_fetched"] == 1
+    assert sync_service.checked == [["m1"]]
+
+
+def test_batch_fetch_paginates_the_message_listing(sync_service, install_gmail):
+    subjects = {"m1": "Engineer", "m2": "newsletter", "m3": "Engineer"}
+    gmail = FakeGmail(subjects, pages=[["m1", "m2"], [], ["m3"]])
+    install_gmail(gmail)
+    integration = SimpleNamespace(id=5, last_synced_at=datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc))
+
+    emails, stats = EmailSyncService._fetch_gmail_emails_batch.__wrapped__(
+        sync_service, gmail, "token", integration, {}
+    )
+
+    assert sorted(email["id"] for email in emails) == ["m1", "m3"]
+    assert stats["listed"] == 3
+    assert [call.get("pageToken") for call in gmail.list_calls] == [None, "page-1", "page-2"]
+    # 15 minute buffer before the last sync
+    expected_after = int(datetime(2026, 10, 1, 11, 45, tzinfo=timezone.utc).timestamp())
+    assert gmail.list_calls[0]["q"] == f"after:{expected_after}"
+
+
+def test_extract_body_prefers_plain_text_and_falls_back_to_html():
+    service = EmailSyncService()
+    plain_and_html = {
+        "mimeType": "multipart/alternative",
+        "parts": [
+            {"mimeType": "text/html", "body": {"data": _encode("<p>Hello <b>there</b></p>")}},
+            {"mimeType": "text/plain", "body": {"data": _encode("Hello plain")}},
+        ],
+    }
+    html_only = {
+        "parts": [
+            {
+                "mimeType": "multipart/related",
+                "parts": [{"mimeType": "text/html", "body": {"data": _encode("<div>Only html</div>")}}],
+            }
+        ]
+    }
+
+    assert service._extract_gmail_body(plain_and_html) == "Hello plain"
+    assert service._extract_gmail_body(html_only) == "Only html"
+    assert service._extract_gmail_body({}) == ""
+
+
+def test_parse_gmail_date():
+    service = EmailSyncService()
+
+    assert service._parse_gmail_date("Tue, 06 Oct 2026 09:30:00 +0000") == datetime(
+        2026, 10, 6, 9, 30, tzinfo=timezone.utc
+    )
+    assert service._parse_gmail_date("not a date") is None
@@ -0,0 +1,57 @@
+"""Tests for the n-gram fuzzy index (must agree with a pairwise SequenceMatcher scan)."""
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from app.utils.fuzzy_index import NGramIndex, _min_matches
+
+SKILLS = [
+    "python", "pytorch", "java", "javascript", "typescript", "react", "react native", "kubernetes",
+    "postgresql", "mysql", "go", "c", "c#", "c++", "node.js", "next.js", "docker", "terraform", "",
+]
+
+
+def pairwise_matches(items, query, threshold):
+    results = []
+    for idx, item in enumerate(items):
+        ratio = SequenceMatcher(None, query, item).ratio()
+        if ratio >= threshold:
+            results.append((idx, ratio))
+    return results
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.75, 0.85, 1.0])
+@pytest.mark.parametrize("query", ["pyhton", "javscript", "postgres", "reac", "kubernetes", "go", "c", "", "zzz"])
+def test_matches_equal_pairwise_scan(query, threshold):
+    index = NGramIndex(SKILLS)
+
+    assert index.matches(query, threshold) == pairwise_matches(SKILLS, query, threshold)
+
+
+def test_matches_equal_pairwise_scan_on_random_strings():
+    rng = random.Random(42)
+    items = ["".join(rng.choice("abcde ") for _ in range(rng.randint(0, 12))) for _ in range(300)]
+    index = NGramIndex(items)
+
+    for _ in range(200):
+        query = "".join(rng.choice("abcde ") for _ in range(rng.randint(0, 12)))
+        for threshold in (0.6, 0.8):
+            assert index.matches(query, threshold) == pairwise_matches(items, query, threshold)
+
+
+def test_first_match_respects_item_order_and_exclusions():
+    index = NGramIndex(["javascript", "java", "javascripts"])
+
+    assert index.first_match("javascrpt", 0.85) == 0
+    assert index.first_match("javascrpt", 0.85, exclude=["javascript"]) == 2
+    assert index.first_match("ruby", 0.85) is None
+
+
+@pytest.mark.parametrize("total_length", range(1, 40))
+@pytest.mark.parametrize("threshold", [0.75, 0.8, 0.85])
+def test_min_matches_is_smallest_count_reaching_threshold(total_length, threshold):
+    matches = _min_matches(total_length, threshold)
+
+    assert 2.0 * matches / total_length >= threshold
+    assert matches == 0 or 2.0 * (matches - 1) / total_length < threshold
@@ -0,0 +1,37 @@
+"""Tests for HTML email body to text conversion."""
+from app.utils.html_to_text import html_to_text
+
+
+def test_blocks_become_lines_and_lists_keep_items():
+    html = (
+        "<html><head><title>Job</title><style>p {color: red}</style></head><body>"
+        "<h2>Senior&nbsp;Engineer</h2><p>We&#8217;re hiring &amp; growing.</p>"
+        "<ul><li>Python</li><li>  AWS   and\n GCP </li></ul>"
+        "<script>track()</script><!-- hidden --><div>Apply<br>today</div></body></html>"
+    )
+
+    assert html_to_text(html) == (
+        "Senior Engineer\n"
+        "\n"
+        "We’re hiring & growing.\n"
+        "\n"
+        "- Python\n"
+        "- AWS and GCP\n"
+        "\n"
+        "Apply\n"
+        "today"
+    )
+
+
+def test_max_chars_cuts_output():
+    html = "".join(f"<p>Paragraph number {i}</p>" for i in range(1000))
+
+    text = html_to_text(html, max_chars=50)
+
+    assert len(text) == 50
+    assert text.startswith("Paragraph number 0")
+
+
+def test_empty_input():
+    assert html_to_text("") == ""
+    assert html_to_text(None) == ""
@@ -0,0 +1,45 @@
+"""Tests for the bulk job upsert in JobImportService."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import job_import_service as import_module
+from app.services.job_import_service import JobImportService
+from app.utils.skill_vocabulary import SkillVocabulary
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    """Statements sent to db.session.execute (every row reports as a conflict update)."""
+    statements = []
+    session = SimpleNamespace(
+        execute=lambda stmt: statements.append(stmt) or [],
+        commit=lambda: None,
+        rollback=lambda: None,
+    )
+    monkeypatch.setattr(import_module, "db", SimpleNamespace(session=session))
+    monkeypatch.setattr(
+        import_module.JobPostingStatsService, "record_imported_jobs", staticmethod(lambda delta: None)
+    )
+    return statements
+
+
+def test_upsert_refreshes_skill_ids_with_skills(executed):
+    service = JobImportService()
+    raw_job = {"jobId": "42", "title": "Backend Engineer", "company": "Acme", "skills": ["Postgres"]}
+    batch = SimpleNamespace(platform="indeed")
+
+    service.bulk_upsert_jobs([service.transform_job_data(raw_job, "indeed")], batch)
+    updated_job = service.transform_job_data({**raw_job, "skills": ["Postgres", "k8s"]}, "indeed")
+    new_count, updated_count, failed_count = service.bulk_upsert_jobs([updated_job], batch)
+
+    assert (new_count, updated_count, failed_count) == (0, 1, 0)
+    assert updated_job["skill_ids"] == SkillVocabulary.skill_ids(updated_job["skills"])
+    assert SkillVocabulary.skill_id("kubernetes") in updated_job["skill_ids"]
+
+    compiled = executed[1].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "skills = excluded.skills" in sql
+    assert "skill_ids = excluded.skill_ids" in sql
+    assert updated_job["skill_ids"] in compiled.params.values()
@@ -0,0 +1,55 @@
+"""Tests for the jobs/imported matching workflow."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.inngest.functions import job_matching_tasks
+
+
+class StopWorkflow(Exception):
+    """Raised by FakeStep once the step under test has run."""
+
+
+class FakeStep:
+    """Runs one step for real and stops the workflow after it; earlier steps return canned results."""
+
+    def __init__(self, step_under_test, canned):
+        self.step_under_test = step_under_test
+        self.canned = canned
+        self.result = None
+
+    async def run(self, step_id, handler, *args):
+        if step_id == self.step_under_test:
+            self.result = handler(*args)
+            raise StopWorkflow
+        return self.canned[step_id]
+
+
+def test_find_matching_candidates_filters_in_one_query(monkeypatch):
+    statements = []
+    rows = [SimpleNamespace(id=11, tenant_id=2, first_name="Ada", last_name="L")]
+
+    def execute(stmt):
+        statements.append(stmt)
+        return SimpleNamespace(all=lambda: rows)
+
+    monkeypatch.setattr(job_matching_tasks, "db", SimpleNamespace(session=SimpleNamespace(execute=execute)))
+    step = FakeStep("find-matching-candidates", {
+        "ensure-job-embeddings": {"jobs_processed": 1, "embeddings_generated": 0},
+    })
+    ctx = SimpleNamespace(
+        event=SimpleNamespace(data={"job_ids": [1], "global_role_id": 5, "role_name": "Engineer"}),
+        step=step,
+    )
+
+    with pytest.raises(StopWorkflow):
+        asyncio.run(job_matching_tasks.match_jobs_to_candidates_workflow._handler(ctx))
+
+    assert step.result == [{"id": 11, "tenant_id": 2, "first_name": "Ada", "last_name": "L"}]
+    assert len(statements) == 1
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "JOIN candidate_global_roles" in sql
+    assert "candidates.embedding IS NOT NULL" in sql
+    assert "candidates.embedding," not in sql
@@ -0,0 +1,54 @@
+"""Tests for full-text job posting search."""
+from types import SimpleNamespace
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.job_posting import JobPosting
+from app.services import job_posting_service as service_module
+from app.services.job_posting_service import JobPostingService
+
+
+def compile_sql(clause):
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_search_filter_uses_tsquery_and_indexed_substrings():
+    sql = compile_sql(JobPostingService.search_filter('"data engineer" -intern'))
+
+    assert "job_postings.search_vector @@ websearch_to_tsquery(" in sql
+    assert "job_postings.title ILIKE" in sql
+    assert "job_postings.location ILIKE" in sql
+    assert "description" not in sql
+    assert "array_to_string" not in sql
+
+
+def test_search_rank_orders_by_ts_rank():
+    stmt = select(JobPosting.id).order_by(
+        JobPostingService.search_rank(JobPostingService.search_tsquery("python")).desc()
+    )
+
+    assert "ORDER BY ts_rank(job_postings.search_vector, websearch_to_tsquery(" in compile_sql(stmt)
+
+
+def test_highlights_are_escaped_and_marked(monkeypatch):
+    start, stop = JobPostingService._HIGHLIGHT_START, JobPostingService._HIGHLIGHT_STOP
+    rows = [(1, f"Senior {start}Python{stop} <Dev>", f"Use {start}Python{stop} & Go")]
+    executed = []
+    session = SimpleNamespace(execute=lambda stmt: executed.append(stmt) or SimpleNamespace(all=lambda: rows))
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=session))
+
+    highlights = JobPostingService.get_search_highlights([1], "python")
+
+    assert highlights == {1: {
+        "title": "Senior <mark>Python</mark> &lt;Dev&gt;",
+        "description": "Use <mark>Python</mark> &amp; Go",
+    }}
+    assert "ts_headline" in compile_sql(executed[0])
+
+
+def test_no_highlight_query_without_ids_or_search(monkeypatch):
+    monkeypatch.setattr(service_module, "db", None)
+
+    assert JobPostingService.get_search_highlights([], "python") == {}
+    assert JobPostingService.get_search_highlights([1], "") == {}
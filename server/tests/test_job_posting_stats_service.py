@@ -0,0 +1,56 @@
+"""Tests for incrementally maintained job posting statistics."""
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.job_posting_stats import GLOBAL_SEGMENT
+from app.services.job_posting_stats_service import JobPostingStatsService, JobStatsDelta
+
+
+def counter(tenant_id, platform, user_id, total, active, remote):
+    return {
+        "tenant_id": tenant_id, "platform": platform, "sourced_by_user_id": user_id,
+        "total_jobs": total, "active_jobs": active, "remote_jobs": remote,
+    }
+
+
+def test_counter_corrections_are_deltas_to_exact_counts():
+    exact = [counter(0, "linkedin", 0, 10, 8, 2), counter(3, "email", 7, 4, 4, 0)]
+    current = [counter(0, "linkedin", 0, 12, 9, 2), counter(3, "email", 7, 4, 4, 0), counter(3, "email", 9, 1, 1, 1)]
+
+    corrections = JobPostingStatsService._counter_corrections(exact, current)
+
+    assert corrections == [
+        counter(0, "linkedin", 0, -2, -1, 0),
+        counter(3, "email", 9, -1, -1, -1),
+    ]
+
+
+def test_counter_corrections_add_missing_segments():
+    corrections = JobPostingStatsService._counter_corrections([counter(5, "email", 0, 3, 2, 1)], [])
+
+    assert corrections == [counter(5, "email", 0, 3, 2, 1)]
+
+
+def test_increment_statement_adds_to_existing_counters():
+    stmt = JobPostingStatsService._increment_counters_stmt([counter(0, "indeed", 0, 1, 1, 0)], datetime(2026, 1, 1))
+
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT ON CONSTRAINT uq_job_posting_stat_counter_segment DO UPDATE" in sql
+    assert "total_jobs = (job_posting_stat_counters.total_jobs + excluded.total_jobs)" in sql
+
+
+def test_stats_delta_segments_jobs_by_visibility():
+    delta = JobStatsDelta()
+    delta.add({"platform": "linkedin", "status": "ACTIVE", "is_remote": True, "company": "Acme", "location": "NYC"})
+    delta.add({"platform": "email", "is_email_sourced": True, "source_tenant_id": 4, "sourced_by_user_id": 9,
+               "status": "CLOSED", "company": "Beta"})
+    delta.add({"platform": "email", "is_email_sourced": True, "source_tenant_id": None, "company": "Hidden"})
+
+    assert delta.counters == {
+        (GLOBAL_SEGMENT, "linkedin", GLOBAL_SEGMENT): [1, 1, 1],
+        (4, "email", 9): [1, 0, 0],
+    }
+    assert delta.values["companies"] == {GLOBAL_SEGMENT: {"Acme"}, 4: {"Beta"}}
+    assert delta.values["locations"] == {GLOBAL_SEGMENT: {"NYC"}}
@@ -0,0 +1,98 @@
+"""Tests for batched LLM keyword extraction (the model is replaced by a scripted fake)."""
+import re
+
+import pytest
+
+from app.services.resume_tailor.keyword_extractor import (
+    BatchJobKeywords,
+    JobKeywords,
+    JobKeywordsItem,
+    KeywordExtractorService,
+)
+
+
+class FakeStructuredModel:
+    """Answers batch prompts by echoing each JOB section's first word as its keyword."""
+
+    def __init__(self, schema, log, drop_ids=(), fail_batches=False):
+        self.schema = schema
+        self.log = log
+        self.drop_ids = drop_ids
+        self.fail_batches = fail_batches
+
+    def batch(self, prompts, config=None, return_exceptions=False):
+        self.log.append((self.schema.__name__, len(prompts)))
+        responses = []
+        for messages in prompts:
+            prompt = messages[0].content
+            if self.schema is JobKeywords:
+                first_word = prompt.split("JOB DESCRIPTION:\n", 1)[1].split()[0]
+                responses.append(JobKeywords(technical_keywords=[first_word]))
+            elif self.fail_batches:
+                responses.append(RuntimeError("quota exceeded"))
+            else:
+                sections = re.findall(r"=== JOB (\d+) ===\n(\S+)", prompt)
+                responses.append(BatchJobKeywords(items=[
+                    JobKeywordsItem(id=job_id, technical_keywords=[word])
+                    for job_id, word in sections if word not in self.drop_ids
+                ]))
+        return responses
+
+
+class FakeModel:
+    def __init__(self, **options):
+        self.calls = []
+        self.options = options
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(schema, self.calls, **self.options)
+
+
+@pytest.fixture
+def extractor(override_settings):
+    override_settings(
+        keyword_extraction_batch_token_budget=1000,
+        keyword_extraction_batch_max_jobs=3,
+        keyword_extraction_max_concurrency=2,
+    )
+    service = KeywordExtractorService(api_key="test-key")
+    service.model = FakeModel()
+    return service
+
+
+def test_descriptions_are_deduplicated_and_batched(extractor):
+    descriptions = {i: f"skill{i % 5} developer role" for i in range(10)}
+    descriptions[99] = "   "
+
+    results = extractor.extract_keywords_batch(descriptions)
+
+    assert {key: kw.technical_keywords for key, kw in results.items() if key != 99} == {
+        i: [f"skill{i % 5}"] for i in range(10)
+    }
+    assert results[99] == JobKeywords()
+    assert extractor.model.calls == [("BatchJobKeywords", 2)]
+
+
+def test_items_missing_from_batch_response_fall_back_to_single_calls(extractor):
+    extractor.model = FakeModel(drop_ids={"beta"})
+
+    results = extractor.extract_keywords_batch({1: "alpha role", 2: "beta role"})
+
+    assert results[1].technical_keywords == ["alpha"]
+    assert results[2].technical_keywords == ["beta"]
+    assert extractor.model.calls == [("BatchJobKeywords", 1), ("JobKeywords", 1)]
+
+
+def test_failed_batch_falls_back_per_item(extractor):
+    extractor.model = FakeModel(fail_batches=True)
+
+    results = extractor.extract_keywords_batch({1: "alpha role", 2: "beta role"})
+
+    assert [results[key].technical_keywords for key in (1, 2)] == [["alpha"], ["beta"]]
+
+
+def test_batches_respect_token_budget(extractor, override_settings):
+    override_settings(keyword_extraction_batch_token_budget=KeywordExtractorService.BATCH_PROMPT_OVERHEAD_TOKENS + 60)
+    texts = {f"h{i}": "x" * 100 for i in range(4)}  # 26 estimated tokens each
+
+    assert extractor._plan_keyword_batches(texts) == [["h0", "h1"], ["h2", "h3"]]
@@ -0,0 +1,90 @@
+"""Tests for the LibreOffice conversion pool's job handling (soffice replaced by a fake instance)."""
+import threading
+
+import pytest
+
+from app.utils import libreoffice_pool as pool_module
+from app.utils.libreoffice_pool import LibreOfficePool, get_pool
+
+
+class FakeInstance:
+    """Stands in for one soffice process; behaviour scripted per conversion."""
+
+    script = []
+
+    def __init__(self, binary, name):
+        self.name = name
+        self.alive = False
+        self.starts = 0
+        self.killed = threading.Event()
+
+    def is_alive(self):
+        return self.alive
+
+    def start(self):
+        self.starts += 1
+        self.alive = True
+        self.killed.clear()
+
+    def convert(self, docx_path, output_path):
+        action = FakeInstance.script.pop(0) if FakeInstance.script else "ok"
+        if action == "crash":
+            self.alive = False
+            raise RuntimeError("bridge lost")
+        if action == "hang":
+            self.killed.wait(5)
+            raise RuntimeError("disposed")
+        if action == "bad document":
+            raise RuntimeError("could not open")
+
+    def kill(self):
+        self.alive = False
+        self.killed.set()
+
+    def stop(self):
+        self.kill()
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(pool_module, "LibreOfficeInstance", FakeInstance)
+    FakeInstance.script = []
+    pool = LibreOfficePool("soffice", size=1, timeout=0.2)
+    yield pool
+    pool.shutdown()
+
+
+def test_conversion_starts_instance_once(pool):
+    assert pool.convert("a.docx", "a.pdf") == "a.pdf"
+    assert pool.convert("b.docx", "b.pdf") == "b.pdf"
+    assert pool._instances[0].starts == 1
+
+
+def test_crashed_instance_is_restarted_and_job_retried(pool):
+    FakeInstance.script = ["crash", "ok"]
+
+    assert pool.convert("a.docx", "a.pdf") == "a.pdf"
+    assert pool._instances[0].starts == 2
+
+
+def test_conversion_error_on_live_instance_is_not_retried(pool):
+    FakeInstance.script = ["bad document", "ok"]
+
+    with pytest.raises(RuntimeError, match="conversion failed"):
+        pool.convert("a.docx", "a.pdf")
+    assert FakeInstance.script == ["ok"]
+
+
+def test_hung_conversion_times_out_and_instance_restarts(pool):
+    FakeInstance.script = ["hang"]
+
+    with pytest.raises(RuntimeError, match="timed out"):
+        pool.convert("a.docx", "a.pdf")
+    assert pool.convert("b.docx", "b.pdf") == "b.pdf"
+    assert pool._instances[0].starts == 2
+
+
+def test_get_pool_disabled_by_size(override_settings):
+    override_settings(docx_pdf_pool_size=0)
+
+    assert get_pool() is None
@@ -0,0 +1,42 @@
+"""Tests for the single-pass phrase matcher (must agree with per-phrase word-boundary searches)."""
+import re
+
+import pytest
+
+from app.utils.phrase_matcher import PhraseMatcher
+
+PHRASES = [
+    "c", "c++", "c#", "go", "java", "javascript", "react", "react native", "node.js", "machine learning",
+    "machine", "sql", "no-sql", ".net", "ci/cd",
+]
+
+TEXTS = [
+    "Senior Java developer with JavaScript and React Native experience",
+    "We use C, C++ and C# on .NET; CI/CD via GitHub Actions",
+    "Go, golang and Django; machine learning and machine vision",
+    "No-SQL stores and SQL databases; node.js backends",
+    "nothing relevant here",
+    "",
+]
+
+
+def per_phrase(phrases, text, flags):
+    return {phrase for phrase in phrases if re.search(r'\b' + re.escape(phrase) + r'\b', text, flags)}
+
+
+@pytest.mark.parametrize("flags", [0, re.IGNORECASE])
+@pytest.mark.parametrize("text", TEXTS)
+def test_find_all_equals_per_phrase_search(text, flags):
+    matcher = PhraseMatcher(PHRASES, flags)
+
+    assert matcher.find_all(text) == per_phrase(PHRASES, text, flags)
+
+
+def test_case_variants_share_one_marker():
+    matcher = PhraseMatcher(["React", "react"], re.IGNORECASE)
+
+    assert matcher.find_all("REACT developer") == {"React", "react"}
+
+
+def test_empty_matcher_finds_nothing():
+    assert PhraseMatcher([]).find_all("python java") == set()
@@ -0,0 +1,71 @@
+"""Tests for the cached active platform registry and bulk session checklist creation."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.scraper_platform import ScraperPlatform
+from app.services import scrape_queue_service as queue_module
+from app.services.platform_service import REDIS_VERSION_KEY, PlatformService
+from app.services.scrape_queue_service import ScrapeQueueService
+
+
+@pytest.fixture
+def platform_rows(monkeypatch, override_settings):
+    """Active platforms 'in the database'; counts registry queries."""
+    override_settings(scraper_platform_cache_ttl=300)
+    monkeypatch.setattr(PlatformService, "_active_platforms_cache", None)
+    state = SimpleNamespace(queries=0, rows=[
+        SimpleNamespace(id=1, name="linkedin", display_name="LinkedIn"),
+        SimpleNamespace(id=2, name="indeed", display_name="Indeed"),
+    ])
+
+    def get_active_platforms():
+        state.queries += 1
+        return list(state.rows)
+
+    monkeypatch.setattr(ScraperPlatform, "get_active_platforms", staticmethod(get_active_platforms))
+    return state
+
+
+def test_registry_is_cached_and_returned_as_copies(platform_rows, fake_redis):
+    platforms = PlatformService.get_active_platforms_cached()
+    platforms[0]["name"] = "changed"
+
+    assert [p["name"] for p in PlatformService.get_active_platforms_cached()] == ["linkedin", "indeed"]
+    assert platform_rows.queries == 1
+
+
+def test_version_bump_from_another_worker_reloads(platform_rows, fake_redis):
+    PlatformService.get_active_platforms_cached()
+    platform_rows.rows = platform_rows.rows[:1]
+
+    fake_redis.incr(REDIS_VERSION_KEY)
+
+    assert [p["name"] for p in PlatformService.get_active_platforms_cached()] == ["linkedin"]
+    assert platform_rows.queries == 2
+
+
+def test_invalidate_drops_local_cache_without_redis(platform_rows, no_redis):
+    PlatformService.get_active_platforms_cached()
+    PlatformService.invalidate_platform_cache()
+    PlatformService.get_active_platforms_cached()
+
+    assert platform_rows.queries == 2
+
+
+def test_session_and_checklist_are_two_inserts(monkeypatch):
+    executed = []
+    monkeypatch.setattr(queue_module, "db", SimpleNamespace(session=SimpleNamespace(execute=executed.append)))
+
+    session_id = ScrapeQueueService._create_session_with_platforms(
+        {"scraper_key_id": 3, "scraper_name": "s", "global_role_id": 4, "role_name": "Engineer"},
+        [{"id": 1, "name": "linkedin"}, {"id": 2, "name": "indeed"}],
+    )
+
+    assert len(executed) == 2
+    session_insert, checklist_insert = (stmt.compile(dialect=postgresql.dialect()) for stmt in executed)
+    assert session_insert.params["session_id"] == session_id
+    assert session_insert.params["platforms_total"] == 2
+    assert "INSERT INTO session_platform_status" in str(checklist_insert)
+    assert checklist_insert.params["platform_name_m1"] == "indeed"
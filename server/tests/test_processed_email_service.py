@@ -0,0 +1,83 @@
+"""Tests for processed-email deduplication (Redis front, database fallback)."""
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import processed_email_service as service_module
+from app.services.processed_email_service import ProcessedEmailService, _processed_key
+
+
+@pytest.fixture
+def db_ids(monkeypatch):
+    """Message IDs 'in processed_emails'; records the statements that reached the database."""
+    state = SimpleNamespace(ids=set(), statements=[])
+
+    def scalars(stmt):
+        state.statements.append(stmt)
+        requested = stmt.compile(dialect=postgresql.dialect()).params["message_ids"]
+        return SimpleNamespace(all=lambda: [mid for mid in requested if mid in state.ids])
+
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=SimpleNamespace(scalars=scalars)))
+    return state
+
+
+def test_database_hits_are_written_back_to_redis(fake_redis, db_ids):
+    db_ids.ids = {"m1", "m3"}
+
+    assert ProcessedEmailService.filter_processed(7, ["m1", "m2", "m3", "m1", ""]) == {"m1", "m3"}
+    assert db_ids.statements[0].compile(dialect=postgresql.dialect()).params["message_ids"] == ["m1", "m2", "m3"]
+    assert set(fake_redis.zrange(_processed_key(7), 0, -1)) == {"m1", "m3"}
+
+    db_ids.statements.clear()
+    assert ProcessedEmailService.filter_processed(7, ["m1", "m2", "m3"]) == {"m1", "m3"}
+    assert db_ids.statements[0].compile(dialect=postgresql.dialect()).params["message_ids"] == ["m2"]
+
+
+def test_fully_cached_batch_skips_database(fake_redis, db_ids):
+    ProcessedEmailService.remember(7, ["a", "b"])
+
+    assert ProcessedEmailService.filter_processed(7, ["a", "b"]) == {"a", "b"}
+    assert db_ids.statements == []
+
+
+def test_entries_older_than_window_fall_back_to_database(fake_redis, db_ids, override_settings):
+    override_settings(email_sync_processed_cache_days=1)
+    fake_redis.zadd(_processed_key(7), {"old": time.time() - 2 * 86400})
+
+    assert ProcessedEmailService.filter_processed(7, ["old"]) == set()
+    assert len(db_ids.statements) == 1
+
+
+def test_without_redis_database_answers(no_redis, db_ids):
+    db_ids.ids = {"x"}
+
+    assert ProcessedEmailService.filter_processed(1, ["x", "y"]) == {"x"}
+
+
+def test_forget_integration_drops_its_set(fake_redis):
+    ProcessedEmailService.remember(7, ["a"])
+    ProcessedEmailService.remember(8, ["a"])
+
+    ProcessedEmailService.forget_integration(7)
+
+    assert not fake_redis.exists(_processed_key(7))
+    assert fake_redis.exists(_processed_key(8))
+
+
+def test_record_inserts_with_on_conflict_do_nothing(monkeypatch):
+    executed = []
+    session = SimpleNamespace(execute=lambda stmt: executed.append(stmt) or SimpleNamespace(rowcount=2))
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=session))
+
+    rows = [
+        {"integration_id": 1, "tenant_id": 1, "email_message_id": mid, "processing_result": "skipped"}
+        for mid in ("a", "b")
+    ]
+    assert ProcessedEmailService.record(rows) == 2
+    assert ProcessedEmailService.record([]) == 0
+
+    sql = str(executed[0].compile(dialect=postgresql.dialect()))
+    assert len(executed) == 1
+    assert "ON CONFLICT ON CONSTRAINT uq_processed_email_integration_message DO NOTHING" in sql
@@ -0,0 +1,106 @@
+"""Tests for the rendered resume export cache."""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.export import render_cache as cache_module
+from app.services.export.render_cache import REDIS_RENDER_LOCK_PREFIX, ResumeRenderCache
+
+
+class FakeExportService:
+    """Renders markdown to bytes, counting renders."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.renders = 0
+
+    def resolve_template(self, template_id):
+        template_id = template_id if template_id in ("modern", "classic") else "modern"
+        return SimpleNamespace(metadata=SimpleNamespace(id=template_id), template_version=2)
+
+    def export(self, markdown_content, template="modern", export_format="pdf"):
+        self.renders += 1
+        time.sleep(self.delay)
+        return f"{template}:{export_format}:{markdown_content}".encode()
+
+
+class FakeStorage:
+    def __init__(self):
+        self.blobs = {}
+
+    def upload_bytes(self, file_key, content, mime_type):
+        self.blobs[file_key] = content
+        return {"success": True}
+
+    def download_file(self, file_key):
+        if file_key not in self.blobs:
+            return None, None, "not found"
+        return self.blobs[file_key], None, None
+
+
+@pytest.fixture
+def cache(fake_redis, override_settings):
+    override_settings(resume_export_cache_enabled=True, resume_export_render_lock_timeout=5)
+    cache = ResumeRenderCache(FakeExportService())
+    cache._storage = FakeStorage()
+    return cache
+
+
+def test_second_request_is_served_from_storage(cache):
+    first = cache.get(1, "# Resume", template="classic")
+    second = cache.get(1, "# Resume", template="classic")
+
+    assert first == second == b"classic:pdf:# Resume"
+    assert cache.export_service.renders == 1
+    assert list(cache._storage.blobs) == [cache.cache_key(1, "# Resume", "classic", "pdf")]
+
+
+def test_key_changes_with_content_template_and_version(cache):
+    key = cache.cache_key(1, "# Resume", "modern", "pdf")
+
+    assert key.startswith("tenants/1/rendered_resumes/modern/v2/") and key.endswith(".pdf")
+    assert cache.cache_key(1, "# Resume!", "modern", "pdf") != key
+    assert cache.cache_key(1, "# Resume", "unknown", "pdf") == key
+    assert cache.cache_key(1, "# Resume", "classic", "pdf") != key
+
+
+def test_concurrent_misses_render_once(cache):
+    cache.export_service.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(1, "# Resume"))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [b"modern:pdf:# Resume"] * 5
+    assert cache.export_service.renders == 1
+
+
+def test_waits_for_other_process_holding_the_lock(cache, fake_redis, monkeypatch):
+    monkeypatch.setattr(cache_module, "POLL_INTERVAL", 0.01)
+    key = cache.cache_key(1, "# Resume", "modern", "pdf")
+    fake_redis.set(f"{REDIS_RENDER_LOCK_PREFIX}{key}", "other")
+    threading.Timer(0.05, lambda: cache._storage.blobs.__setitem__(key, b"rendered elsewhere")).start()
+
+    assert cache.get(1, "# Resume") == b"rendered elsewhere"
+    assert cache.export_service.renders == 0
+
+
+def test_disabled_cache_always_renders(cache, override_settings):
+    override_settings(resume_export_cache_enabled=False)
+
+    cache.get(1, "# Resume")
+    cache.get(1, "# Resume")
+
+    assert cache.export_service.renders == 2
+    assert cache._storage.blobs == {}
+
+
+def test_rejects_unknown_format_and_empty_content(cache):
+    with pytest.raises(ValueError):
+        cache.get(1, "# Resume", export_format="odt")
+    with pytest.raises(ValueError):
+        cache.get(1, "")
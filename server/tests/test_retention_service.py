@@ -0,0 +1,111 @@
+"""Tests for chunked retention of log tables."""
+import gzip
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.services import retention_service as retention_module
+from app.services.retention_service import RetentionPolicy, RetentionService
+
+metadata = MetaData()
+log_table = Table(
+    "test_logs", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("message", String(50)),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+@pytest.fixture
+def logs(monkeypatch, override_settings):
+    """SQLite log table behind a 'test_logs' policy: ids 1-25 are 100 days old, 26-30 are new."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    session = Session(engine)
+    now = datetime.utcnow()
+    session.execute(insert(log_table), [
+        {"id": i, "message": f"log {i}", "created_at": now - timedelta(days=100 if i <= 25 else 1)}
+        for i in range(1, 31)
+    ])
+    session.commit()
+
+    monkeypatch.setattr(retention_module, "db", SimpleNamespace(session=session))
+    monkeypatch.setattr(retention_module, "RETENTION_POLICIES", {
+        "test_logs": RetentionPolicy(
+            name="test_logs",
+            model=SimpleNamespace(__table__=log_table),
+            days_setting="retention_processed_emails_days",
+            archive_setting="retention_processed_emails_archive",
+        )
+    })
+    override_settings(
+        retention_processed_emails_days=30,
+        retention_processed_emails_archive=False,
+        retention_chunk_size=10,
+        retention_chunk_pause_ms=0,
+        retention_max_seconds=600,
+    )
+    yield session
+    session.close()
+
+
+def remaining_ids(session):
+    return session.scalars(select(log_table.c.id).order_by(log_table.c.id)).all()
+
+
+def test_purge_deletes_expired_rows_in_chunks(logs):
+    summary = RetentionService.purge("test_logs")
+
+    assert remaining_ids(logs) == list(range(26, 31))
+    assert summary["deleted"] == 25
+    assert summary["chunks"] == 3
+    assert summary["complete"] is True
+
+
+def test_purge_archives_each_chunk_before_deleting(logs, monkeypatch, override_settings):
+    override_settings(retention_processed_emails_archive=True)
+    uploads = {}
+
+    class Storage:
+        def upload_bytes(self, file_key, content, mime_type):
+            uploads[file_key] = [json.loads(line) for line in gzip.decompress(content).splitlines()]
+            return {"success": True}
+
+    monkeypatch.setattr("app.services.file_storage.FileStorageService", Storage)
+
+    summary = RetentionService.purge("test_logs")
+
+    assert summary["archived"] == 25
+    assert len(summary["archive_keys"]) == 3
+    assert summary["archive_keys"][0].endswith("/test_logs_1-10.jsonl.gz")
+    assert [row["id"] for rows in uploads.values() for row in rows] == list(range(1, 26))
+
+
+def test_failed_archive_keeps_the_chunk(logs, monkeypatch, override_settings):
+    override_settings(retention_processed_emails_archive=True)
+
+    class Storage:
+        def upload_bytes(self, file_key, content, mime_type):
+            return {"success": False, "error": "bucket unavailable"}
+
+    monkeypatch.setattr("app.services.file_storage.FileStorageService", Storage)
+
+    with pytest.raises(RuntimeError):
+        RetentionService.purge("test_logs")
+    assert len(remaining_ids(logs)) == 30
+
+
+def test_disabled_policy_is_skipped(logs, override_settings):
+    override_settings(retention_processed_emails_days=0)
+
+    assert RetentionService.purge("test_logs")["skipped"] is True
+    assert len(remaining_ids(logs)) == 30
+
+
+def test_unknown_policy_raises():
+    with pytest.raises(ValueError):
+        RetentionService.purge("nope")
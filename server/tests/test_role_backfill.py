@@ -0,0 +1,55 @@
+"""Tests for the orphaned job role backfill workflow."""
+import asyncio
+from types import SimpleNamespace
+
+from app.inngest.functions import scheduled_tasks
+
+
+class FakeStep:
+    """Runs steps inline, recording step IDs and arguments."""
+
+    def __init__(self):
+        self.ran = []
+
+    async def run(self, step_id, handler, *args):
+        self.ran.append((step_id, args))
+        return handler(*args)
+
+
+def run_backfill(monkeypatch, override_settings, orphaned_jobs, chunk_size):
+    override_settings(role_backfill_chunk_size=chunk_size)
+    monkeypatch.setattr(scheduled_tasks, "find_orphaned_jobs_step", lambda: orphaned_jobs)
+
+    def normalize(chunk):
+        failed = [job for job in chunk if not job["title"].strip()]
+        return {
+            "normalized": len(chunk) - len(failed),
+            "failed": len(failed),
+            "methods": {"cache": len(chunk) - len(failed)},
+        }
+
+    monkeypatch.setattr(scheduled_tasks, "normalize_orphaned_jobs_step", normalize)
+    step = FakeStep()
+    result = asyncio.run(scheduled_tasks.backfill_orphaned_job_roles_workflow._handler(SimpleNamespace(step=step)))
+    return step, result
+
+
+def test_backfill_normalizes_in_chunks(monkeypatch, override_settings):
+    jobs = [{"id": i, "title": "Engineer" if i != 4 else " "} for i in range(120)]
+
+    step, result = run_backfill(monkeypatch, override_settings, jobs, chunk_size=50)
+
+    normalize_steps = [(step_id, args[0]) for step_id, args in step.ran if step_id != "find-orphaned-jobs"]
+    assert [step_id for step_id, _ in normalize_steps] == [
+        "normalize-orphaned-jobs-0", "normalize-orphaned-jobs-1", "normalize-orphaned-jobs-2",
+    ]
+    assert [len(chunk) for _, chunk in normalize_steps] == [50, 50, 20]
+    assert [job["id"] for _, chunk in normalize_steps for job in chunk] == list(range(120))
+    assert result == {"orphaned_found": 120, "normalized": 119, "failed": 1, "methods": {"cache": 119}}
+
+
+def test_backfill_without_orphans_runs_no_normalize_step(monkeypatch, override_settings):
+    step, result = run_backfill(monkeypatch, override_settings, [], chunk_size=50)
+
+    assert [step_id for step_id, _ in step.ran] == ["find-orphaned-jobs"]
+    assert result == {"orphaned_found": 0, "normalized": 0, "failed": 0}
@@ -0,0 +1,116 @@
+"""Tests for the in-memory role embedding index."""
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.services import role_embedding_index as index_module
+from app.services.role_embedding_index import REDIS_VERSION_KEY, RoleEmbeddingIndex
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """A real (SQLite) session installed as the index's db.session, with a 2-role snapshot at version 5."""
+    session = Session(create_engine("sqlite://"))
+    monkeypatch.setattr(index_module, "db", SimpleNamespace(session=lambda: session))
+    monkeypatch.setattr(
+        RoleEmbeddingIndex, "_index", (np.asarray([1, 2], dtype=np.int64), np.eye(2, dtype=np.float32))
+    )
+    monkeypatch.setattr(RoleEmbeddingIndex, "_version", 5)
+    session.execute(text("SELECT 1"))
+    yield session
+    session.close()
+
+
+def test_add_role_bumps_version_only_after_commit(session, fake_redis):
+    fake_redis.set(REDIS_VERSION_KEY, 5)
+
+    RoleEmbeddingIndex.add_role(3, [1.0, 1.0])
+
+    assert fake_redis.get(REDIS_VERSION_KEY) == "5"
+    assert RoleEmbeddingIndex._index[0].tolist() == [1, 2, 3]
+    assert RoleEmbeddingIndex._version == 5
+
+    session.commit()
+
+    assert fake_redis.get(REDIS_VERSION_KEY) == "6"
+    assert RoleEmbeddingIndex._version == 6
+    assert RoleEmbeddingIndex._index[0].tolist() == [1, 2, 3]
+
+
+def test_roles_added_in_one_transaction_bump_once(session, fake_redis):
+    fake_redis.set(REDIS_VERSION_KEY, 5)
+
+    RoleEmbeddingIndex.add_role(3, [1.0, 0.0])
+    RoleEmbeddingIndex.add_role(4, [0.0, 1.0])
+    session.commit()
+    session.execute(text("SELECT 1"))
+    session.commit()
+
+    assert fake_redis.get(REDIS_VERSION_KEY) == "6"
+    assert RoleEmbeddingIndex._version == 6
+
+
+def test_rollback_drops_local_rows_without_bump(session, fake_redis):
+    fake_redis.set(REDIS_VERSION_KEY, 5)
+
+    RoleEmbeddingIndex.add_role(3, [1.0, 1.0])
+    session.rollback()
+
+    assert fake_redis.get(REDIS_VERSION_KEY) == "5"
+    assert RoleEmbeddingIndex._index is None
+    assert RoleEmbeddingIndex._version is None
+
+
+def test_concurrent_change_invalidates_snapshot_on_commit(session, fake_redis):
+    fake_redis.set(REDIS_VERSION_KEY, 5)
+
+    RoleEmbeddingIndex.add_role(3, [1.0, 1.0])
+    fake_redis.incr(REDIS_VERSION_KEY)  # another process changed roles
+    session.commit()
+
+    assert fake_redis.get(REDIS_VERSION_KEY) == "7"
+    assert RoleEmbeddingIndex._index is None
+
+
+def test_add_role_without_redis_keeps_local_row(session, no_redis):
+    RoleEmbeddingIndex.add_role(3, [3.0, 4.0])
+    session.commit()
+
+    assert RoleEmbeddingIndex._index[0].tolist() == [1, 2, 3]
+    np.testing.assert_allclose(RoleEmbeddingIndex._index[1][-1], [0.6, 0.8], rtol=1e-6)
+
+
+def test_add_role_replaces_snapshot_instead_of_mutating_it(session, no_redis, override_settings, monkeypatch):
+    override_settings(
+        role_embedding_index_enabled=True,
+        role_embedding_index_max_age=3600,
+        role_embedding_index_version_check_interval=3600,
+    )
+    monkeypatch.setattr(RoleEmbeddingIndex, "_built_at", time.monotonic())
+    monkeypatch.setattr(RoleEmbeddingIndex, "_checked_at", time.monotonic())
+    before = RoleEmbeddingIndex._snapshot()
+
+    RoleEmbeddingIndex.add_role(3, [1.0, 1.0])
+    after = RoleEmbeddingIndex._snapshot()
+
+    # A search holding the old snapshot still sees matching ids and rows
+    assert before[0].tolist() == [1, 2]
+    assert before[1].shape == (2, 2)
+    assert after[0].tolist() == [1, 2, 3]
+    assert after[1].shape == (3, 2)
+
+
+def test_search_top_k_orders_by_similarity(monkeypatch, override_settings):
+    override_settings(role_embedding_index_enabled=True)
+    snapshot = (np.asarray([10, 20, 30], dtype=np.int64), np.asarray([[1, 0], [0, 1], [0.6, 0.8]], dtype=np.float32))
+    monkeypatch.setattr(RoleEmbeddingIndex, "_snapshot", classmethod(lambda cls: snapshot))
+
+    matches = RoleEmbeddingIndex.search_top_k([0.0, 2.0], limit=2)
+
+    assert [role_id for role_id, _ in matches] == [20, 30]
+    assert matches[0][1] == pytest.approx(1.0)
+    assert matches[1][1] == pytest.approx(0.8)
@@ -0,0 +1,147 @@
+"""Tests for batched job title normalization in AIRoleNormalizationService."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import ai_role_normalization_service as normalization_module
+from app.services.ai_role_normalization_service import AIRoleNormalizationService
+
+
+class FakeEmbeddingService:
+    """Embeds a title as [len(title), 1.0]; the batch call can be made to fail."""
+
+    def __init__(self, batch_fails=False, failing_titles=()):
+        self.batch_fails = batch_fails
+        self.failing_titles = set(failing_titles)
+        self.batch_calls = []
+        self.single_calls = []
+
+    def generate_batch_embeddings(self, titles, task_type):
+        self.batch_calls.append(list(titles))
+        if self.batch_fails:
+            raise RuntimeError("quota exceeded")
+        return [[float(len(title)), 1.0] for title in titles]
+
+    def generate_embedding(self, title, task_type):
+        self.single_calls.append(title)
+        if title in self.failing_titles:
+            raise RuntimeError("embedding failed")
+        return [float(len(title)), 1.0]
+
+
+def _role(role_id, name):
+    return SimpleNamespace(id=role_id, name=name, aliases=[])
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """
+    Service whose cache knows "Java Developer", whose embedding index matches
+    15-character titles (e.g. "Python Engineer") to "Python Developer", and
+    whose AI path creates a role named after the title.
+    """
+    savepoints = []
+
+    def begin_nested():
+        savepoint = SimpleNamespace(committed=False, rolled_back=False)
+        savepoint.commit = lambda: setattr(savepoint, "committed", True)
+        savepoint.rollback = lambda: setattr(savepoint, "rolled_back", True)
+        savepoints.append(savepoint)
+        return savepoint
+
+    monkeypatch.setattr(normalization_module, "db", SimpleNamespace(session=SimpleNamespace(begin_nested=begin_nested)))
+
+    service = AIRoleNormalizationService.__new__(AIRoleNormalizationService)
+    service.embedding_service = FakeEmbeddingService()
+    service.savepoints = savepoints
+    service.java = _role(1, "Java Developer")
+    service.python = _role(2, "Python Developer")
+    service.attached = []
+    service.ai_titles = []
+
+    cached = {"java developer": service.java}
+    monkeypatch.setattr(service, "_lookup_cached_role", lambda title: cached.get(service._title_key(title)))
+    monkeypatch.setattr(
+        service, "_match_embeddings_to_roles",
+        lambda embeddings, threshold: [(service.python, 0.9) if e[0] == 15 else None for e in embeddings],
+    )
+    monkeypatch.setattr(service, "_remember_titles", lambda role, *titles: None)
+    monkeypatch.setattr(service, "_get_existing_role_names", lambda: ["Java Developer", "Python Developer"])
+
+    def resolve_new(title, existing_roles):
+        service.ai_titles.append(title)
+        return _role(100 + len(service.ai_titles), title.title()), 0.0
+
+    monkeypatch.setattr(service, "_resolve_new_job_title", resolve_new)
+    monkeypatch.setattr(service, "_attach_job_to_role", lambda job_id, role: service.attached.append((job_id, role.id)))
+    return service
+
+
+def test_titles_are_grouped_and_embedded_in_one_batch(service):
+    results = service.normalize_job_titles_batch([
+        (1, "Java Developer"),
+        (2, "Python Engineer"),
+        (3, "  python ENGINEER. "),
+        (4, "Rust Wizard"),
+        (5, "java developer"),
+        (6, "   "),
+    ])
+
+    # Cache hits and duplicate spellings never reach the embedding service
+    assert service.embedding_service.batch_calls == [["Python Engineer", "Rust Wizard"]]
+    assert service.embedding_service.single_calls == []
+    assert service.ai_titles == ["Rust Wizard"]
+
+    assert results[1] == (service.java, 1.0, "cache_match")
+    assert results[5] == (service.java, 1.0, "cache_match")
+    assert results[2] == (service.python, 0.9, "embedding_match")
+    assert results[3] == (service.python, 0.9, "embedding_match")
+    assert results[4][0].name == "Rust Wizard"
+    assert results[4][2] == "ai_created"
+    assert results[6] == (None, 0.0, "error")
+    assert service.python.aliases == ["Python Engineer"]
+
+
+def test_results_map_back_to_the_right_jobs(service):
+    results = service.normalize_job_titles_batch([
+        (10, "Python Engineer"),
+        (11, "Java Developer"),
+        (12, "Python Engineer"),
+    ])
+
+    assert sorted(service.attached) == [(10, 2), (11, 1), (12, 2)]
+    assert {job_id: result[0].id for job_id, result in results.items()} == {10: 2, 11: 1, 12: 2}
+
+
+def test_failed_batch_embedding_falls_back_to_per_title_calls(service):
+    service.embedding_service = FakeEmbeddingService(batch_fails=True, failing_titles={"Go Guru"})
+
+    results = service.normalize_job_titles_batch([
+        (1, "Python Engineer"),
+        (2, "Go Guru"),
+        (3, "Rust Wizard"),
+        (4, "Java Developer"),
+    ])
+
+    assert service.embedding_service.single_calls == ["Python Engineer", "Go Guru", "Rust Wizard"]
+    assert results[1] == (service.python, 0.9, "embedding_match")
+    assert results[2] == (None, 0.0, "error")
+    assert results[3][2] == "ai_created"
+    assert results[4] == (service.java, 1.0, "cache_match")
+    assert service.ai_titles == ["Rust Wizard"]
+
+
+def test_failure_to_link_one_title_does_not_affect_others(service, monkeypatch):
+    def attach(job_id, role):
+        if role is service.java:
+            raise RuntimeError("constraint violation")
+        service.attached.append((job_id, role.id))
+
+    monkeypatch.setattr(service, "_attach_job_to_role", attach)
+
+    results = service.normalize_job_titles_batch([(1, "Java Developer"), (2, "Python Engineer")])
+
+    assert results[1] == (None, 0.0, "error")
+    assert results[2] == (service.python, 0.9, "embedding_match")
+    assert service.attached == [(2, 2)]
+    assert [(s.committed, s.rolled_back) for s in service.savepoints] == [(False, True), (True, False)]
@@ -0,0 +1,35 @@
+"""Tests for the scrape queue dequeue ordering and its supporting indexes."""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.models.global_role import PRIORITY_RANK_SQL, GlobalRole
+from app.models.role_location_queue import RoleLocationQueue
+
+
+@pytest.mark.parametrize("priority, rank", [("urgent", 4), ("high", 3), ("normal", 2), ("low", 1), ("other", None)])
+def test_priority_rank_expression(priority, rank):
+    with create_engine("sqlite://").connect() as conn:
+        assert conn.execute(text(f"SELECT {PRIORITY_RANK_SQL} FROM (SELECT :p AS priority)"), {"p": priority}).scalar() == rank
+
+
+@pytest.mark.parametrize("model, index_name", [
+    (GlobalRole, "idx_global_roles_dequeue"),
+    (RoleLocationQueue, "idx_role_location_queue_dequeue"),
+])
+def test_dequeue_index_matches_dequeue_order(model, index_name):
+    index = next(index for index in model.__table__.indexes if index.name == index_name)
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert "(priority_rank DESC, last_scraped_at ASC NULLS FIRST, candidate_count DESC)" in ddl
+    assert "WHERE queue_status = 'approved'" in ddl
+
+
+@pytest.mark.parametrize("model", [GlobalRole, RoleLocationQueue])
+def test_priority_rank_is_a_stored_generated_column(model):
+    ddl = str(CreateTable(model.__table__).compile(dialect=postgresql.dialect()))
+
+    assert "priority_rank INTEGER GENERATED ALWAYS AS (CASE priority WHEN 'urgent' THEN 4" in ddl
+    assert "STORED" in ddl
@@ -0,0 +1,75 @@
+"""Tests for batched scraper import event fan-out."""
+import pytest
+
+from app.services import scraper_import_publisher as publisher_module
+from app.services.scraper_import_publisher import PLATFORM_IMPORT_EVENT, ScraperImportPublisher
+
+
+def job(i, size=10):
+    return {"jobId": str(i), "description": "x" * size}
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Event lists passed to inngest_client.send_sync."""
+    calls = []
+    monkeypatch.setattr(publisher_module.inngest_client, "send_sync", calls.append)
+    return calls
+
+
+def test_batches_bounded_by_bytes_and_count():
+    jobs = [job(i, size=100) for i in range(7)]
+
+    batches = ScraperImportPublisher.plan_batches(jobs, max_bytes=400, max_jobs=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+    assert [j["jobId"] for batch in batches for j in batch] == [str(i) for i in range(7)]
+    assert [len(batch) for batch in ScraperImportPublisher.plan_batches(jobs, max_bytes=300, max_jobs=10)] == [2] * 3 + [1]
+
+
+def test_oversized_job_gets_its_own_batch_and_empty_input_one_batch():
+    batches = ScraperImportPublisher.plan_batches([job(1), job(2, size=5000), job(3)], max_bytes=1000, max_jobs=10)
+
+    assert [[j["jobId"] for j in batch] for batch in batches] == [["1"], ["2"], ["3"]]
+    assert ScraperImportPublisher.plan_batches([]) == [[]]
+
+
+def test_payloads_round_trip_through_redis(fake_redis, override_settings):
+    override_settings(scraper_import_payload_ttl=60)
+    batches = [[job(1)], [job(2), job(3)]]
+
+    refs = ScraperImportPublisher.store_batch_payloads("sess", "linkedin", batches)
+
+    assert len(refs) == 2 and all(ref.startswith("scraper_import:jobs:sess:linkedin:") for ref in refs)
+    assert 0 < fake_redis.ttl(refs[0]) <= 60
+    assert ScraperImportPublisher.load_batch_payload(refs[1]) == batches[1]
+    assert ScraperImportPublisher.release_batch_payload(refs[1]) is True
+    assert ScraperImportPublisher.load_batch_payload(refs[1]) is None
+
+
+def test_without_redis_payloads_are_not_stored(no_redis):
+    assert ScraperImportPublisher.store_batch_payloads("sess", "linkedin", [[job(1)]]) is None
+
+
+def test_referenced_events_are_sent_in_one_call(sent):
+    batches = [[job(1)], [job(2), job(3)]]
+
+    calls = ScraperImportPublisher.publish_platform_import("sess", 7, "linkedin", 11, batches, ["ref0", "ref1"])
+
+    assert calls == 1
+    events = sent[0]
+    assert [event.name for event in events] == [PLATFORM_IMPORT_EVENT] * 2
+    assert events[1].data["jobs_ref"] == "ref1"
+    assert "jobs" not in events[1].data
+    assert (events[1].data["batch_index"], events[1].data["total_batches"], events[1].data["total_jobs_in_platform"]) == (1, 2, 3)
+
+
+def test_inline_events_split_by_send_budget(sent, override_settings):
+    override_settings(scraper_import_send_max_bytes=2500)
+    batches = [[job(i, size=1000)] for i in range(4)]
+
+    calls = ScraperImportPublisher.publish_platform_import("sess", 7, "indeed", 11, batches)
+
+    assert calls == 2
+    assert [len(events) for events in sent] == [2, 2]
+    assert sent[0][0].data["jobs"] == batches[0]
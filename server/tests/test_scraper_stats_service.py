@@ -0,0 +1,66 @@
+"""Tests for the scraper monitoring stats snapshot."""
+import json
+import time
+
+import pytest
+
+from app.services.scraper_stats_service import REDIS_REFRESH_LOCK_KEY, REDIS_SNAPSHOT_KEY, ScraperStatsService
+
+
+@pytest.fixture
+def computed(monkeypatch, override_settings):
+    """Replace the database aggregates with a counter of snapshot computations."""
+    override_settings(scraper_stats_snapshot_max_age=90)
+    monkeypatch.setattr(ScraperStatsService, "_local_snapshot", None)
+    calls = []
+
+    def compute_snapshot():
+        calls.append(1)
+        return {
+            "queue": {"pending": len(calls)},
+            "location_queue": {"pending": 0},
+            "scraper": {"active_scrapers": 1},
+            "computed_at": time.time(),
+        }
+
+    monkeypatch.setattr(ScraperStatsService, "compute_snapshot", staticmethod(compute_snapshot))
+    monkeypatch.setattr(
+        ScraperStatsService, "compute_scraper_stats", staticmethod(lambda hours=24: {"hours": hours})
+    )
+    return calls
+
+
+def test_fresh_snapshot_is_shared_between_reads(computed, fake_redis):
+    first = ScraperStatsService.get_section("queue")
+    second = ScraperStatsService.get_section("queue")
+
+    assert first["pending"] == second["pending"] == 1
+    assert len(computed) == 1
+    assert json.loads(fake_redis.get(REDIS_SNAPSHOT_KEY))["queue"] == {"pending": 1}
+    assert first["stats_age_seconds"] == 0 and first["stats_as_of"].endswith("Z")
+
+
+def test_stale_snapshot_refreshed_by_lock_holder_only(computed, fake_redis):
+    stale = {"queue": {"pending": 0}, "location_queue": {}, "scraper": {}, "computed_at": time.time() - 300}
+    fake_redis.set(REDIS_SNAPSHOT_KEY, json.dumps(stale))
+    fake_redis.set(REDIS_REFRESH_LOCK_KEY, "1")
+
+    assert ScraperStatsService.get_section("queue")["pending"] == 0
+    assert computed == []
+
+    fake_redis.delete(REDIS_REFRESH_LOCK_KEY)
+    assert ScraperStatsService.get_section("queue")["pending"] == 1
+
+
+def test_without_redis_snapshot_is_kept_in_process(computed, no_redis):
+    ScraperStatsService.get_section("scraper")
+    ScraperStatsService.get_section("location_queue")
+
+    assert len(computed) == 1
+
+
+def test_other_windows_are_computed_on_demand(computed, fake_redis):
+    stats = ScraperStatsService.get_scraper_stats(hours=6)
+
+    assert stats["hours"] == 6
+    assert computed == []
@@ -0,0 +1,81 @@
+"""Tests for the event-driven scrape session completion workflow."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.inngest.functions import job_import
+
+SESSION_ID = "5b0c1c1e-7d0e-4c1f-9d7a-2b6f3c4d5e6f"
+
+
+class FakeStep:
+    """Runs steps inline and answers wait_for_event from a script."""
+
+    def __init__(self, events):
+        self.events = list(events)
+        self.ran = []
+        self.waits = []
+
+    async def run(self, step_id, handler):
+        self.ran.append(step_id)
+        return handler()
+
+    async def wait_for_event(self, step_id, **kwargs):
+        self.waits.append((step_id, kwargs["timeout"].total_seconds()))
+        return self.events.pop(0) if self.events else None
+
+
+@pytest.fixture
+def workflow(monkeypatch, override_settings):
+    """Run complete_scrape_session_fn with scripted platform progress and events."""
+    override_settings(scraper_session_completion_timeout=1800, scraper_session_completion_recheck_seconds=60)
+    finalized = []
+    stats = {
+        "global_role_id": 1, "role_name": "Engineer", "total_imported": 0, "job_ids": [],
+        "successful_platforms": 1, "total_platforms": 1, "failed_platforms": 0,
+    }
+    monkeypatch.setattr(job_import, "aggregate_session_stats", lambda session_id: stats)
+    monkeypatch.setattr(job_import, "finalize_session", lambda *args: finalized.append(args))
+    monkeypatch.setattr(job_import, "update_role_status", lambda *args: None)
+    monkeypatch.setattr(job_import, "update_role_location_queue_status", lambda *args: None)
+
+    def run(progress_sequence, events=()):
+        progress = iter(progress_sequence)
+        monkeypatch.setattr(
+            job_import, "get_session_platform_progress",
+            lambda session_id: {"platforms_completed": 0, "platforms_total": 2, "all_done": next(progress)},
+        )
+        step = FakeStep(events)
+        ctx = SimpleNamespace(event=SimpleNamespace(data={"session_id": SESSION_ID, "scraper_key_id": 7}), step=step)
+        result = asyncio.run(job_import.complete_scrape_session_fn._handler(ctx))
+        assert finalized, "session was not finalized"
+        return step, result
+
+    return run
+
+
+def test_all_done_finalizes_without_waiting(workflow):
+    step, result = workflow([True])
+    assert step.waits == []
+    assert result["status"] == "success"
+
+
+def test_done_event_ends_wait(workflow):
+    step, _ = workflow([False], events=[{"name": "done"}])
+    assert step.waits == [("wait-platform-batches-done-0", 60)]
+    assert "check-platforms-done-1" not in step.ran
+
+
+def test_missed_event_is_recovered_by_recheck(workflow):
+    # Last batch finished between the first check and the wait: no event ever arrives
+    step, _ = workflow([False, True])
+    assert step.waits == [("wait-platform-batches-done-0", 60)]
+    assert step.ran[:3] == ["check-platforms-done", "check-platforms-done-1", "aggregate-stats"]
+
+
+def test_gives_up_after_completion_timeout(workflow):
+    step, _ = workflow([False] * 31)
+    assert len(step.waits) == 30
+    assert sum(timeout for _, timeout in step.waits) == 1800
+    assert len({step_id for step_id, _ in step.waits}) == 30
@@ -0,0 +1,112 @@
+"""Tests for bulk session job logging and payload references."""
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.services import session_job_log_service as log_module
+from app.services.session_job_log_service import SessionJobLogBatch, SessionJobLogService
+
+SESSION_ID = UUID("5b0c1c1e-7d0e-4c1f-9d7a-2b6f3c4d5e6f")
+
+
+@pytest.fixture
+def inserted(monkeypatch):
+    """Rows passed to the bulk INSERT."""
+    rows = []
+    session = SimpleNamespace(execute=lambda stmt, params: rows.extend(params))
+    monkeypatch.setattr(log_module, "db", SimpleNamespace(session=session))
+    return rows
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    """In-memory FileStorageService (set storage.fail to make uploads fail)."""
+    state = SimpleNamespace(blobs={}, fail=False)
+
+    class Storage:
+        def upload_bytes(self, file_key, content, mime_type):
+            if state.fail:
+                return {"success": False, "error": "unavailable"}
+            state.blobs[file_key] = content
+            return {"success": True}
+
+        def download_file(self, file_key):
+            if file_key not in state.blobs:
+                return None, None, "not found"
+            return state.blobs[file_key], "application/gzip", None
+
+    monkeypatch.setattr("app.services.file_storage.FileStorageService", Storage)
+    return state
+
+
+def fill(batch):
+    batch.entry(1, {"jobId": "b", "title": "Backend"}).mark_skipped("duplicate", "same URL", duplicate_job_id=9)
+    batch.entry(0, {"jobId": "a", "title": "Frontend", "company": "Acme"}).mark_imported(42)
+    batch.entry(2, {"jobId": "c"}).mark_error("boom")
+
+
+def test_full_level_writes_raw_json_inline(inserted, storage):
+    batch = SessionJobLogBatch(SESSION_ID, "linkedin", level="full")
+    fill(batch)
+
+    assert batch.write() == 3
+    assert [row["job_index"] for row in inserted] == [0, 1, 2]
+    assert [row["status"] for row in inserted] == ["imported", "skipped", "error"]
+    assert inserted[0]["raw_job_data"] == {"jobId": "a", "title": "Frontend", "company": "Acme"}
+    assert inserted[0]["imported_job_id"] == 42 and inserted[0]["company"] == "Acme"
+    assert inserted[1]["duplicate_job_id"] == 9 and inserted[1]["imported_job_id"] is None
+    assert all(row["payload_key"] is None and len(row["payload_hash"]) == 64 for row in inserted)
+    assert storage.blobs == {}
+
+
+def test_reference_level_round_trips_through_blob(inserted, storage):
+    batch = SessionJobLogBatch(SESSION_ID, "linkedin", batch_index=3, level="reference")
+    fill(batch)
+    batch.write()
+
+    key = f"session_job_payloads/{SESSION_ID}/linkedin/batch_0003.jsonl.gz"
+    assert list(storage.blobs) == [key]
+    assert all(row["payload_key"] == key and row["raw_job_data"] == {} for row in inserted)
+
+    logs = [SimpleNamespace(id=100 + row["job_index"], **row) for row in inserted]
+    payloads = SessionJobLogService.load_payloads(logs)
+    assert payloads[100] == {"jobId": "a", "title": "Frontend", "company": "Acme"}
+    assert payloads[102] == {"jobId": "c"}
+
+
+def test_tampered_hash_or_missing_blob_yields_none(inserted, storage):
+    batch = SessionJobLogBatch(SESSION_ID, "indeed", level="reference")
+    fill(batch)
+    batch.write()
+    logs = [SimpleNamespace(id=row["job_index"], **row) for row in inserted]
+    logs[0].payload_hash = "0" * 64
+    logs[1].payload_key = "session_job_payloads/missing.jsonl.gz"
+
+    payloads = SessionJobLogService.load_payloads(logs)
+
+    assert payloads[0] is None
+    assert payloads[1] is None
+    assert payloads[2] == {"jobId": "c"}
+
+
+def test_failed_upload_falls_back_to_inline(inserted, storage):
+    storage.fail = True
+    batch = SessionJobLogBatch(SESSION_ID, "linkedin", level="reference")
+    fill(batch)
+    batch.write()
+
+    assert all(row["payload_key"] is None for row in inserted)
+    assert inserted[2]["raw_job_data"] == {"jobId": "c"}
+
+
+def test_summary_level_writes_nothing(inserted):
+    batch = SessionJobLogBatch(SESSION_ID, "linkedin", level="summary")
+    fill(batch)
+
+    assert batch.write() == 0
+    assert inserted == []
+
+
+def test_unknown_level_falls_back_to_full():
+    assert SessionJobLogBatch(SESSION_ID, "linkedin", level="verbose").level == "full"
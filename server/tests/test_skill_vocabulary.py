@@ -0,0 +1,102 @@
+"""Tests for the shared skill vocabulary and the scorers built on it."""
+import pytest
+
+from app.services.job_matching_service import JobMatchingService
+from app.services.resume_tailor.keyword_extractor import JobRequirements
+from app.services.resume_tailor.resume_scorer import ResumeScorerService
+from app.utils.skill_vocabulary import SkillVocabulary
+
+SALES_RESUME = (
+    "Regional sales manager. Goes the extra mile for clients, pushes shared "
+    "goals, turned around underperforming territories and grew news and "
+    "media accounts. Handles CVs of new hires, knows good negotiation "
+    "tactics, tracks sales on spreadsheets and answers customer emails."
+).lower()
+
+
+class TestSkillIds:
+    def test_synonyms_share_an_id(self):
+        assert SkillVocabulary.skill_id("PostgreSQL") == SkillVocabulary.skill_id("postgres")
+        assert SkillVocabulary.skill_id("k8s") == SkillVocabulary.skill_id("kubernetes")
+
+    def test_unknown_skills_get_distinct_stable_ids(self):
+        assert SkillVocabulary.skill_id("cobol") == SkillVocabulary.skill_id(" COBOL ")
+        assert SkillVocabulary.skill_id("cobol") != SkillVocabulary.skill_id("fortran")
+
+    def test_skill_ids_are_sorted_and_unique(self):
+        ids = SkillVocabulary.skill_ids(["aws", "Amazon Web Services", "python", None, " "])
+        assert ids == sorted(ids)
+        assert len(ids) == 2
+
+
+class TestFindVariant:
+    @pytest.mark.parametrize("skill", [
+        "golang", "elasticsearch", "bash", "react native", "websocket",
+        "deep learning", "computer vision", "pandas", "numpy", "tensorflow",
+    ])
+    def test_short_aliases_do_not_match_inside_words(self, skill):
+        assert SkillVocabulary.find_variant(skill, SALES_RESUME) is None
+
+    def test_matches_whole_word_alias(self):
+        assert SkillVocabulary.find_variant("golang", "backend services in go and python") == "go"
+        assert SkillVocabulary.find_variant("kubernetes", "ran k8s clusters") == "k8s"
+
+    def test_matches_skills_with_punctuation(self):
+        text = "built apis in c# on .net, c++ tooling"
+        assert SkillVocabulary.find_variant("csharp", text) == "c#"
+        assert SkillVocabulary.find_variant("dotnet", text) == ".net"
+        assert SkillVocabulary.find_variant("cpp", text) == "c++"
+
+    def test_dotted_skill_inside_another_name_does_not_match(self):
+        assert SkillVocabulary.find_variant(".net", "asp.net mvc") is None
+
+
+class TestMatchSkills:
+    def test_exact_synonym_and_fuzzy(self):
+        matched, missing, details = SkillVocabulary.match_skills(
+            ["python", "postgres", "kubernetess"],
+            ["python", "postgresql", "kubernetes", "rust"],
+        )
+        assert matched == ["python", "postgresql", "kubernetes"]
+        assert missing == ["rust"]
+        assert details == {"python": "exact", "postgresql": "synonym", "kubernetes": "fuzzy"}
+
+    def test_related_skills_only_when_requested(self):
+        assert SkillVocabulary.match_skills(["dotnet"], ["c#"])[0] == []
+        matched, _, details = SkillVocabulary.match_skills(["dotnet"], ["c#"], include_related=True)
+        assert matched == ["c#"]
+        assert details == {"c#": "related"}
+
+    @pytest.mark.parametrize("candidate_skill, job_skill", [
+        ("dotnet", "c#"),
+        ("c#", "dotnet"),
+        ("express", "node"),
+        ("expressjs", "node"),
+        ("nodejs", "express"),
+    ])
+    def test_job_matching_keeps_old_equivalences(self, candidate_skill, job_skill):
+        score, matched, missing = JobMatchingService(tenant_id=1).calculate_skill_match([candidate_skill], [job_skill])
+        assert score == 100.0
+        assert matched == [job_skill]
+        assert missing == []
+
+
+class TestResumeSkillsScore:
+    @staticmethod
+    def score(required, resume_text):
+        scorer = ResumeScorerService.__new__(ResumeScorerService)
+        return scorer._calculate_skills_score(JobRequirements(required_skills=required), resume_text)
+
+    def test_sales_resume_gets_no_tech_skills(self):
+        result = self.score(
+            ["Golang", "Elasticsearch", "Bash", "TensorFlow", "Pandas", "NumPy", "WebSocket"],
+            SALES_RESUME,
+        )
+        assert result["matched"] == []
+        assert result["score"] == 0.0
+
+    def test_synonym_found_as_whole_word(self):
+        result = self.score(["Golang", "Kubernetes"], "Wrote Go services deployed on K8s")
+        assert result["matched"] == ["Golang", "Kubernetes"]
+        assert {m.match_type for m in result["detailed_matches"]} == {"synonym"}
+        assert result["score"] == 100.0
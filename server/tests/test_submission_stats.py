@@ -0,0 +1,95 @@
+"""Tests for single-scan submission statistics and their cache."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services import submission_service as service_module
+from app.services.submission_service import SubmissionService
+
+
+def group(status, total, this_week=0, this_month=0, interviews=0, placements_month=0, days_sum=None, days_count=0):
+    return SimpleNamespace(
+        status=status, total=total, this_week=this_week, this_month=this_month, interviews=interviews,
+        placements_month=placements_month, placement_days_sum=days_sum, placement_days_count=days_count,
+    )
+
+
+@pytest.fixture
+def stats_db(monkeypatch, override_settings):
+    """Status groups returned by the stats query; counts and records executed statements."""
+    override_settings(submission_stats_cache_ttl=60)
+    monkeypatch.setattr(SubmissionService, "_stats_cache", {})
+    state = SimpleNamespace(statements=[], rows=[
+        group("SUBMITTED", 5, this_week=2, this_month=4),
+        group("INTERVIEW_SCHEDULED", 2, this_month=2, interviews=2),
+        group("PLACED", 3, this_month=1, placements_month=1, days_sum=30.0, days_count=3),
+    ])
+
+    def execute(stmt):
+        state.statements.append(stmt)
+        return SimpleNamespace(all=lambda: state.rows)
+
+    monkeypatch.setattr(service_module, "db", SimpleNamespace(session=SimpleNamespace(execute=execute)))
+    return state
+
+
+def test_stats_are_combined_from_status_groups(stats_db, no_redis):
+    stats = SubmissionService(tenant_id=1).get_stats()
+
+    assert stats == {
+        "total": 10,
+        "by_status": {"SUBMITTED": 5, "INTERVIEW_SCHEDULED": 2, "PLACED": 3},
+        "submitted_this_week": 2,
+        "submitted_this_month": 7,
+        "interviews_scheduled": 2,
+        "placements_this_month": 1,
+        "average_days_to_placement": 10.0,
+        "interview_rate": 50.0,
+        "placement_rate": 30.0,
+    }
+    sql = str(stats_db.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.count("\nFROM ") == 1
+    assert "GROUP BY submissions.status" in sql
+
+
+def test_stats_are_cached_until_invalidated(stats_db, fake_redis):
+    service = SubmissionService(tenant_id=1)
+    first = service.get_stats()
+    first["by_status"]["SUBMITTED"] = 999
+    assert service.get_stats()["by_status"]["SUBMITTED"] == 5
+    assert len(stats_db.statements) == 1
+
+    SubmissionService.invalidate_stats_cache(1)
+    service.get_stats()
+    assert len(stats_db.statements) == 2
+
+
+def test_version_bump_from_another_worker_invalidates(stats_db, fake_redis):
+    service = SubmissionService(tenant_id=1)
+    service.get_stats()
+
+    fake_redis.incr(f"{service_module.REDIS_STATS_VERSION_PREFIX}:1")
+    service.get_stats()
+    SubmissionService(tenant_id=2).get_stats()
+
+    assert len(stats_db.statements) == 3
+
+
+def test_user_filter_is_part_of_query_and_cache_key(stats_db, no_redis):
+    service = SubmissionService(tenant_id=1)
+    service.get_stats()
+    service.get_stats(user_id=7)
+
+    assert len(stats_db.statements) == 2
+    assert "submitted_by_user_id" in str(stats_db.statements[1].compile(dialect=postgresql.dialect()))
+
+
+def test_empty_tenant_has_zero_rates(stats_db, no_redis):
+    stats_db.rows = []
+
+    stats = SubmissionService(tenant_id=1).get_stats()
+
+    assert stats["total"] == 0
+    assert stats["interview_rate"] == stats["placement_rate"] == 0.0
+    assert stats["average_days_to_placement"] is None
@@ -0,0 +1,127 @@
+"""Tests for team hierarchy lookups in TeamManagementService."""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.services import team_management_service as team_module
+from app.services.team_management_service import TeamManagementService
+
+
+def compile_sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture
+def scalar_statements(monkeypatch):
+    """Capture statements passed to db.session.scalar (every lookup answers False)."""
+    statements = []
+
+    def scalar(stmt):
+        statements.append(stmt)
+        return False
+
+    monkeypatch.setattr(team_module, "db", SimpleNamespace(session=SimpleNamespace(scalar=scalar)))
+    return statements
+
+
+def test_unbounded_ancestor_walk_uses_union():
+    ancestors = TeamManagementService._ancestors_cte(7, tenant_id=1)
+
+    sql = compile_sql(select(ancestors.c.user_id))
+
+    assert "UNION SELECT" in sql
+    assert "depth" not in sql
+
+
+def test_bounded_ancestor_walk_stops_at_max_depth():
+    ancestors = TeamManagementService._ancestors_cte(7, tenant_id=1, max_depth=3)
+
+    sql = compile_sql(select(ancestors.c.user_id))
+
+    assert "UNION ALL" in sql
+    assert "manager_chain.depth < 3" in sql
+
+
+def test_is_ancestor_closure_table_honours_max_depth(scalar_statements, override_settings):
+    override_settings(team_hierarchy_use_closure_table=True)
+
+    assert TeamManagementService._is_ancestor(1, 2, tenant_id=3, max_depth=4) is False
+
+    sql = compile_sql(scalar_statements[0])
+    assert "portal_user_hierarchy.depth <= 4" in sql
+    assert "portal_user_hierarchy.tenant_id = 3" in sql
+
+
+def test_is_in_hierarchy_bounds_lookup_by_setting(monkeypatch, override_settings):
+    override_settings(team_hierarchy_max_depth=5)
+    calls = []
+    monkeypatch.setattr(
+        team_module, "db",
+        SimpleNamespace(session=SimpleNamespace(get=lambda model, user_id: SimpleNamespace(roles=[]))),
+    )
+    monkeypatch.setattr(
+        TeamManagementService, "_is_ancestor",
+        staticmethod(lambda *args, **kwargs: calls.append((args, kwargs)) or True),
+    )
+
+    assert TeamManagementService._is_in_hierarchy(1, 2, 3) is True
+    assert calls == [((1, 2, 3), {"max_depth": 5})]
+
+
+def test_cycle_check_is_not_depth_bounded(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        TeamManagementService, "_is_ancestor",
+        staticmethod(lambda *args, **kwargs: calls.append((args, kwargs)) or False),
+    )
+
+    assert TeamManagementService._would_create_cycle(1, 1) is True
+    assert TeamManagementService._would_create_cycle(1, 2) is False
+    assert calls == [((1, 2), {})]
+
+
+def _fake_user(user_id, manager_id):
+    return SimpleNamespace(
+        id=user_id,
+        manager_id=manager_id,
+        to_dict=lambda include_roles, include_team: {"id": user_id},
+    )
+
+
+def _install_subtree(monkeypatch, depths, users):
+    monkeypatch.setattr(
+        TeamManagementService, "_get_descendant_depths",
+        staticmethod(lambda manager_id, tenant_id: dict(depths)),
+    )
+    monkeypatch.setattr(
+        team_module, "db",
+        SimpleNamespace(session=SimpleNamespace(scalars=lambda stmt: list(users))),
+    )
+
+
+def test_descendants_are_emitted_depth_first(monkeypatch):
+    # 1 -> (2 -> 4, 3)
+    _install_subtree(
+        monkeypatch,
+        {2: 1, 3: 1, 4: 2},
+        [_fake_user(2, 1), _fake_user(3, 1), _fake_user(4, 2)],
+    )
+
+    members = TeamManagementService._get_all_descendants(1, tenant_id=9)
+
+    assert [(m["id"], m["hierarchy_level"]) for m in members] == [(2, 1), (4, 2), (3, 1)]
+
+
+def test_descendants_terminate_on_cycle_through_manager(monkeypatch):
+    # manager_id data loops 1 -> 2 -> 3 -> 1; the recursive query returns 1 as well
+    _install_subtree(
+        monkeypatch,
+        {2: 1, 3: 2, 1: 3},
+        [_fake_user(1, 3), _fake_user(2, 1), _fake_user(3, 2)],
+    )
+
+    members = TeamManagementService._get_all_descendants(1, tenant_id=9)
+
+    assert [(m["id"], m["hierarchy_level"]) for m in members] == [(2, 1), (3, 2)]